@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for DatasetSerializer encodings: chunked columnar Arrow
+tables and raw tensor vectors vs. the legacy one-block-per-column and JSON
+vector encodings.
+
+Storage is an in-memory content-addressed block store that counts bytes read,
+so the report isolates encode/decode cost and shows how much data a partial
+read (one column, a narrow row range) has to fetch under each layout. Both
+round trips are checked for equality.
+
+Usage
+-----
+    PYTHONPATH=. python benchmarks/bench_dataset_serializer_columnar.py --rows 500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ipfs_datasets_py.processors.serialization.dataset_serialization import (  # noqa: E402
+    DEFAULT_CHUNK_BYTES,
+    DatasetSerializer,
+)
+
+
+class _MemoryStorage:
+    def __init__(self):
+        self.blocks: dict = {}
+        self.bytes_read = 0
+
+    def store(self, data: bytes) -> str:
+        cid = "bafk" + hashlib.sha256(data).hexdigest()[:40]
+        self.blocks[cid] = data
+        return cid
+
+    def get(self, cid: str) -> bytes:
+        data = self.blocks[cid]
+        self.bytes_read += len(data)
+        return data
+
+    def store_json(self, obj) -> str:
+        return self.store(json.dumps(obj).encode("utf-8"))
+
+    def get_json(self, cid: str):
+        return json.loads(self.get(cid).decode("utf-8"))
+
+
+def _legacy_serialize_table(serializer: DatasetSerializer, table: pa.Table) -> str:
+    """The pre-chunking layout: one block per whole column."""
+    storage = serializer.storage
+    return storage.store_json(
+        {
+            "type": "arrow_table",
+            "num_rows": table.num_rows,
+            "schema": storage.store_json(serializer._schema_to_dict(table.schema)),
+            "columns": {
+                name: storage.store(serializer._serialize_column(table.column(name)))
+                for name in table.column_names
+            },
+        }
+    )
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000.0
+
+
+def _block_stats(storage: _MemoryStorage) -> dict:
+    sizes = [len(b) for b in storage.blocks.values()]
+    return {
+        "blocks": len(sizes),
+        "total_mb": round(sum(sizes) / 2**20, 2),
+        "max_block_kb": round(max(sizes) / 1024, 1),
+    }
+
+
+def _bench_table(table: pa.Table, chunk_bytes: int, partial_rows: int) -> dict:
+    report = {}
+    start_row = table.num_rows // 2
+    row_range = (start_row, start_row + partial_rows)
+    for layout in ("legacy", "chunked"):
+        storage = _MemoryStorage()
+        serializer = DatasetSerializer(storage=storage)
+        if layout == "legacy":
+            cid, encode_ms = _timed(lambda: _legacy_serialize_table(serializer, table))
+        else:
+            cid, encode_ms = _timed(
+                lambda: serializer.serialize_arrow_table(table, max_chunk_bytes=chunk_bytes)
+            )
+        storage.bytes_read = 0
+        restored, decode_ms = _timed(lambda: serializer.deserialize_arrow_table(cid))
+        full_read_mb = storage.bytes_read / 2**20
+        storage.bytes_read = 0
+        partial, partial_ms = _timed(
+            lambda: serializer.deserialize_arrow_table(cid, columns=["id"], row_range=row_range)
+        )
+        report[layout] = {
+            **_block_stats(storage),
+            "encode_ms": round(encode_ms, 1),
+            "decode_ms": round(decode_ms, 1),
+            "full_read_mb": round(full_read_mb, 2),
+            "partial_read_ms": round(partial_ms, 2),
+            "partial_read_kb": round(storage.bytes_read / 1024, 1),
+            "round_trip_equal": restored.equals(table)
+            and partial.equals(table.select(["id"]).slice(start_row, partial_rows)),
+        }
+    return report
+
+
+def _bench_vectors(vectors: np.ndarray, chunk_bytes: int) -> dict:
+    report = {}
+    for layout in ("legacy_json", "tensor"):
+        storage = _MemoryStorage()
+        serializer = DatasetSerializer(storage=storage)
+        if layout == "legacy_json":
+            cid, encode_ms = _timed(lambda: serializer._serialize_vectors_json(vectors, None))
+        else:
+            cid, encode_ms = _timed(
+                lambda: serializer.serialize_vectors(vectors, max_chunk_bytes=chunk_bytes)
+            )
+        (restored, _), decode_ms = _timed(lambda: serializer.deserialize_vectors(cid))
+        report[layout] = {
+            **_block_stats(storage),
+            "bytes_per_float": round(sum(map(len, storage.blocks.values())) / vectors.size, 2),
+            "encode_ms": round(encode_ms, 1),
+            "decode_ms": round(decode_ms, 1),
+            "encode_mb_per_s": round(vectors.nbytes / 2**20 / max(encode_ms / 1000.0, 1e-9), 1),
+            "decode_mb_per_s": round(vectors.nbytes / 2**20 / max(decode_ms / 1000.0, 1e-9), 1),
+            "round_trip_equal": bool(np.array_equal(np.vstack(restored), vectors)),
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500000)
+    parser.add_argument("--vectors", type=int, default=50000)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--partial-rows", type=int, default=1000)
+    parser.add_argument("--chunk-bytes", type=int, default=DEFAULT_CHUNK_BYTES)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    table = pa.table(
+        {
+            "id": pa.array(np.arange(args.rows, dtype=np.int64)),
+            "score": pa.array(rng.random(args.rows)),
+            "label": pa.array([f"label-{i % 1000}" for i in range(args.rows)]),
+        }
+    )
+    vectors = rng.standard_normal((args.vectors, args.dimension)).astype(np.float32)
+
+    report = {
+        "rows": args.rows,
+        "vectors": args.vectors,
+        "dimension": args.dimension,
+        "chunk_bytes": args.chunk_bytes,
+        "arrow_table": _bench_table(table, args.chunk_bytes, args.partial_rows),
+        "vectors_encoding": _bench_vectors(vectors, args.chunk_bytes),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
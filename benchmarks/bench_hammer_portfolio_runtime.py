@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Throughput benchmark for hammer solver portfolios: the long-lived
+``SolverPortfolioRuntime`` vs. per-call ``SolverPortfolio.run``.
+
+Two stub SMT solvers are written to a temporary directory as ``/bin/sh``
+scripts: ``cvc5`` answers ``unsat`` at once and ``z3`` sleeps for
+``--slow-ms`` before answering ``unknown``, so every goal is decided by the
+fast solver and the slow one has to be cancelled. ``--clients`` threads then
+push ``--goals`` goals (one z3 and one cvc5 attempt each) through one shared
+``SolverPortfolio`` and through one ``SolverPortfolioRuntime``; the script
+reports steady-state goals/sec for both, the peak number of solver
+processes alive at once, and checks that both produce the same verdicts.
+
+Usage
+-----
+    PYTHONPATH=. python benchmarks/bench_hammer_portfolio_runtime.py --goals 200 --clients 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import stat
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ipfs_datasets_py.logic.hammers.models import (  # noqa: E402
+    HammerPolicy,
+    TranslationRecord,
+    TranslationStatus,
+    TranslationTarget,
+)
+from ipfs_datasets_py.logic.hammers.policy import PortfolioPolicy  # noqa: E402
+from ipfs_datasets_py.logic.hammers.portfolio import (  # noqa: E402
+    PortfolioAttemptSpec,
+    SolverPortfolio,
+    SolverPortfolioRuntime,
+    run_bounded_solver_process,
+)
+
+
+def _stub(directory: str, name: str, body: str) -> str:
+    path = os.path.join(directory, name)
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write(f"#!/bin/sh\n{body}\n")
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+    return path
+
+
+def _goal(i: int) -> list:
+    translation = TranslationRecord(
+        translation_id=f"goal-{i}",
+        request_id=f"req-{i}",
+        target=TranslationTarget.SMTLIB,
+        status=TranslationStatus.SUPPORTED,
+        source_construct="goal",
+        translated_text=f"(declare-fun p{i} () Bool)\n(assert (and p{i} (not p{i})))",
+    )
+    return [PortfolioAttemptSpec(translation=translation, solver_name=s) for s in ("z3", "cvc5")]
+
+
+class _PeakCounter:
+    """Wraps the bounded runner to count solver processes alive at once."""
+
+    def __init__(self) -> None:
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, command, *, budget, cancel_event=None):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        try:
+            return run_bounded_solver_process(command, budget=budget, cancel_event=cancel_event)
+        finally:
+            with self._lock:
+                self.current -= 1
+
+
+def _drive(portfolio, goals: int, clients: int) -> tuple:
+    # One untimed goal first, so the once-per-executable version probe (which
+    # runs the slow stub too) is not charged to either implementation.
+    portfolio.run("warmup", _goal(-1))
+    verdicts = {}
+    next_goal = iter(range(goals))
+    lock = threading.Lock()
+
+    def client() -> None:
+        while True:
+            with lock:
+                i = next(next_goal, None)
+            if i is None:
+                return
+            result = portfolio.run(f"req-{i}", _goal(i))
+            verdicts[i] = sorted((a.solver_name, a.verdict.value) for a in result.attempts)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, verdicts
+
+
+def _report(elapsed: float, goals: int, counter: _PeakCounter) -> dict:
+    return {
+        "goals_per_s": round(goals / max(elapsed, 1e-9), 1),
+        "mean_ms_per_goal": round(elapsed * 1000 / max(goals, 1), 2),
+        "peak_solver_processes": counter.peak,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--goals", type=int, default=200)
+    parser.add_argument("--clients", type=int, default=4, help="threads calling run at once")
+    parser.add_argument("--max-concurrent", type=int, default=4, help="runtime process bound")
+    parser.add_argument("--slow-ms", type=int, default=2000, help="losing solver's run time")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_portfolio_") as stubs:
+        policy = PortfolioPolicy(
+            hammer_policy=HammerPolicy(timeout_seconds=30.0, allowed_solvers=["z3", "cvc5"]),
+            executable_overrides={
+                "z3": _stub(stubs, "z3", f"sleep {args.slow_ms / 1000.0}; echo unknown"),
+                "cvc5": _stub(stubs, "cvc5", "echo unsat"),
+            },
+        )
+
+        baseline_counter = _PeakCounter()
+        baseline = SolverPortfolio(policy, process_runner=baseline_counter)
+        baseline_s, baseline_verdicts = _drive(baseline, args.goals, args.clients)
+
+        runtime_counter = _PeakCounter()
+        with SolverPortfolioRuntime(
+            policy, max_concurrent_processes=args.max_concurrent, process_runner=runtime_counter
+        ) as runtime:
+            runtime_s, runtime_verdicts = _drive(runtime, args.goals, args.clients)
+
+    report = {
+        "goals": args.goals,
+        "clients": args.clients,
+        "max_concurrent": args.max_concurrent,
+        "slow_ms": args.slow_ms,
+        "per_call": _report(baseline_s, args.goals, baseline_counter),
+        "runtime": _report(runtime_s, args.goals, runtime_counter),
+        "speedup": round(baseline_s / max(runtime_s, 1e-9), 2),
+        "verdicts_match": baseline_verdicts == runtime_verdicts,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for hammer premise selection through the inverted
+``PremiseIndex`` vs. the scan-everything ``score_candidates`` baseline.
+
+A synthetic Lean-flavoured corpus is generated per size: every premise
+mentions a few symbols drawn from a Zipf-like vocabulary (so a handful of
+symbols are ubiquitous and most are rare, as in real libraries), one or two
+types from a small pool (each carried by a large share of the corpus, like
+``Nat``) and imports its own module plus that module's hub. Goals are drawn
+from the same distribution. For each size the script reports the index
+build and incremental update cost, the per-goal latency of
+``PremiseIndex.score`` (every premise sharing a feature with the goal) and
+of the pruned ``PremiseIndex.top_candidates`` under both weightings,
+checks that the pruned top-k equals the exhaustive one, and, up to
+``--baseline-max`` premises, times the ``score_candidates`` scan and checks
+it agrees with the index.
+
+Usage
+-----
+    PYTHONPATH=. python benchmarks/bench_hammer_premise_index.py --sizes 1000 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ipfs_datasets_py.logic.hammers.corpus import CorpusManifest, CorpusSource  # noqa: E402
+from ipfs_datasets_py.logic.hammers.models import ITPKind  # noqa: E402
+from ipfs_datasets_py.logic.hammers.premise_selection import (  # noqa: E402
+    GoalFeatures,
+    PremiseIndex,
+    score_candidates,
+)
+
+VOCABULARY = 20000
+TYPES = ("Nat", "Int", "List", "Set", "Real", "Finset", "Matrix", "Group", "Ring", "Field")
+MODULES = 400
+
+
+def _statement(rng: random.Random, name: str) -> tuple:
+    symbols = {f"f{int(rng.paretovariate(1.1)) % VOCABULARY}" for _ in range(rng.randint(3, 8))}
+    types = rng.sample(TYPES, rng.randint(1, 2))
+    body = " ".join(f"{symbol} (x : {types[0]})" for symbol in sorted(symbols))
+    module = rng.randrange(MODULES)
+    imports = [f"Mathlib.M{module}", f"Mathlib.Hub{module // 20}"]
+    return f"theorem {name} : forall a : {' '.join(types)}, {body}", imports
+
+
+def build_manifest(size: int, seed: int) -> CorpusManifest:
+    rng = random.Random(seed)
+    manifest = CorpusManifest(manifest_id="bench-premise-index")
+    manifest.register_source(
+        CorpusSource(
+            corpus_id="synthetic",
+            name="Synthetic",
+            source_itp=ITPKind.LEAN,
+            version_ref="bench",
+            license_id="Apache-2.0",
+        )
+    )
+    for i in range(size):
+        statement, imports = _statement(rng, f"thm_{i}")
+        manifest.add_theorem(
+            theorem_id=f"T{i:06d}", corpus_id="synthetic", statement=statement, imports=imports
+        )
+    return manifest
+
+
+def build_goals(count: int, seed: int) -> list:
+    rng = random.Random(seed + 1)
+    goals = []
+    for i in range(count):
+        statement, imports = _statement(rng, f"goal_{i}")
+        goals.append(GoalFeatures.from_statement(statement, imports=imports))
+    return goals
+
+
+def _median_ms(samples: list) -> float:
+    return round(statistics.median(samples) * 1000, 4)
+
+
+def _timed(fn, goals: list) -> tuple:
+    samples, results = [], []
+    for goal in goals:
+        start = time.perf_counter()
+        results.append(fn(goal))
+        samples.append(time.perf_counter() - start)
+    return samples, results
+
+
+def _bench(args, size: int, goals: list) -> dict:
+    manifest = build_manifest(size, args.seed)
+    entries = manifest.iter_theorems()
+
+    start = time.perf_counter()
+    index = PremiseIndex(entries)
+    build_s = time.perf_counter() - start
+    idf_index = PremiseIndex(entries, weighting="idf")
+
+    start = time.perf_counter()
+    index.remove(entries[0].theorem_id)
+    index.add(entries[0])
+    update_s = time.perf_counter() - start
+
+    score_s, scored = _timed(index.score, goals)
+    top_s, top = _timed(lambda goal: index.top_candidates(goal, args.top_k), goals)
+    idf_top_s, idf_top = _timed(lambda goal: idf_index.top_candidates(goal, args.top_k), goals)
+    row = {
+        "premises": size,
+        "index_build_s": round(build_s, 3),
+        "index_update_ms": round(update_s * 1000, 4),
+        "touched_median": int(statistics.median(len(ranked) for ranked in scored)),
+        "index_score_ms": _median_ms(score_s),
+        "top_k_ms": _median_ms(top_s),
+        "idf_top_k_ms": _median_ms(idf_top_s),
+        "top_k_exact": all(ranked[: args.top_k] == best for ranked, best in zip(scored, top))
+        and all(
+            idf_index.score(goal)[: args.top_k] == best for goal, best in zip(goals, idf_top)
+        ),
+    }
+    if size <= args.baseline_max:
+        baseline_s, baseline_ranked = _timed(lambda goal: score_candidates(goal, manifest), goals)
+        row["baseline_ms"] = _median_ms(baseline_s)
+        row["top_k_speedup"] = round(statistics.median(baseline_s) / statistics.median(top_s), 1)
+        row["matches_baseline"] = all(
+            ranked[: args.top_k] == best for ranked, best in zip(baseline_ranked, top)
+        )
+    return row
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--goals", type=int, default=50)
+    parser.add_argument("--top-k", type=int, default=16)
+    parser.add_argument(
+        "--baseline-max", type=int, default=10000, help="largest corpus to run the scan on"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    goals = build_goals(args.goals, args.seed)
+    report = {
+        "goals": args.goals,
+        "top_k": args.top_k,
+        "results": [_bench(args, size, goals) for size in args.sizes],
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for knowledge_graphs.indexing B+tree: wide-fanout bulk-loaded
+tree vs. the legacy configuration (max_keys=4, one-at-a-time inserts).
+
+Both trees index the same synthetic property values; the report records build
+time, point-lookup and range-lookup latency for each, and whether lookups
+return the same entity sets.
+
+Usage
+-----
+    PYTHONPATH=. python benchmarks/bench_kg_btree_index.py --nodes 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from statistics import mean, median
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ipfs_datasets_py.knowledge_graphs.indexing import (  # noqa: E402
+    BTreeIndex,
+    IndexDefinition,
+    IndexType,
+)
+from ipfs_datasets_py.knowledge_graphs.indexing.btree import DEFAULT_MAX_KEYS  # noqa: E402
+
+LEGACY_MAX_KEYS = 4
+
+
+def _definition() -> IndexDefinition:
+    return IndexDefinition(name="idx_bench", index_type=IndexType.RANGE, properties=["value"])
+
+
+def _build(items: list, max_keys: int, bulk: bool) -> tuple[BTreeIndex, float]:
+    start = time.perf_counter()
+    index = BTreeIndex(_definition(), max_keys=max_keys)
+    if bulk:
+        index.bulk_load(items)
+    else:
+        for key, entity_id in items:
+            index.insert(key, entity_id)
+    return index, (time.perf_counter() - start) * 1000.0
+
+
+def _summary(samples_ms: list) -> dict:
+    return {
+        "queries": len(samples_ms),
+        "avg_ms": round(mean(samples_ms), 4),
+        "median_ms": round(median(samples_ms), 4),
+        "max_ms": round(max(samples_ms), 4),
+    }
+
+
+def _time_lookups(index: BTreeIndex, points: list, ranges: list) -> tuple[dict, list]:
+    point_ms, range_ms, results = [], [], []
+    for key in points:
+        start = time.perf_counter()
+        hits = index.search(key)
+        point_ms.append((time.perf_counter() - start) * 1000.0)
+        results.append(sorted(hits))
+    for low, high in ranges:
+        start = time.perf_counter()
+        hits = index.range_search(low, high)
+        range_ms.append((time.perf_counter() - start) * 1000.0)
+        results.append(sorted(hits))
+    return {"point": _summary(point_ms), "range": _summary(range_ms)}, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=200000)
+    parser.add_argument("--distinct", type=int, default=50000, help="distinct key values")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--range-width", type=int, default=2000)
+    parser.add_argument("--max-keys", type=int, default=DEFAULT_MAX_KEYS)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    items = [(rng.randrange(args.distinct), f"n{i}") for i in range(args.nodes)]
+    points = [rng.randrange(args.distinct) for _ in range(args.queries)]
+    ranges = []
+    for _ in range(args.queries):
+        low = rng.randrange(args.distinct)
+        ranges.append((low, low + args.range_width))
+
+    legacy, legacy_build_ms = _build(items, LEGACY_MAX_KEYS, bulk=False)
+    bplus, bplus_build_ms = _build(items, args.max_keys, bulk=True)
+    legacy_stats, legacy_results = _time_lookups(legacy, points, ranges)
+    bplus_stats, bplus_results = _time_lookups(bplus, points, ranges)
+
+    report = {
+        "nodes": args.nodes,
+        "distinct_keys": args.distinct,
+        "range_width": args.range_width,
+        "legacy": {
+            "max_keys": LEGACY_MAX_KEYS,
+            "build": "insert",
+            "build_ms": round(legacy_build_ms, 1),
+            **legacy_stats,
+        },
+        "bplus": {
+            "max_keys": args.max_keys,
+            "build": "bulk_load",
+            "build_ms": round(bplus_build_ms, 1),
+            **bplus_stats,
+        },
+        "build_speedup": round(legacy_build_ms / max(bplus_build_ms, 1e-9), 2),
+        "point_speedup_median": round(
+            legacy_stats["point"]["median_ms"] / max(bplus_stats["point"]["median_ms"], 1e-9), 2
+        ),
+        "range_speedup_median": round(
+            legacy_stats["range"]["median_ms"] / max(bplus_stats["range"]["median_ms"], 1e-9), 2
+        ),
+        "results_identical": legacy_results == bplus_results,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
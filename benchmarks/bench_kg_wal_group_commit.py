@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for knowledge-graph WriteAheadLog appends: group commit vs.
+one storage block per entry, at 1, 8 and 64 concurrent writers.
+
+Storage is an in-memory content-addressed store with a fixed per-block write
+latency (``--block-latency-ms``) standing in for an IPLD round trip. The
+per-entry baseline serializes appends with a lock, since appends to one chain
+cannot overlap. The report records commits/sec for both modes, the number of
+blocks written, and whether read() sees every entry.
+
+Usage
+-----
+    PYTHONPATH=. python benchmarks/bench_kg_wal_group_commit.py --entries 512
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ipfs_datasets_py.knowledge_graphs.transactions.types import (  # noqa: E402
+    Operation,
+    OperationType,
+    TransactionState,
+    WALEntry,
+)
+from ipfs_datasets_py.knowledge_graphs.transactions.wal import WriteAheadLog  # noqa: E402
+
+
+class _LatencyStorage:
+    def __init__(self, latency_s: float):
+        self.latency_s = latency_s
+        self.blocks: dict = {}
+        self.writes = 0
+        self._lock = threading.Lock()
+
+    def store_json(self, data: dict) -> str:
+        payload = json.dumps(data, sort_keys=True).encode()
+        time.sleep(self.latency_s)
+        cid = "bafy" + hashlib.sha256(payload).hexdigest()[:32]
+        with self._lock:
+            self.blocks[cid] = payload
+            self.writes += 1
+        return cid
+
+    def retrieve_json(self, cid: str) -> dict:
+        return json.loads(self.blocks[cid].decode())
+
+
+def _entry(txn_id: str) -> WALEntry:
+    return WALEntry(
+        txn_id=txn_id,
+        timestamp=time.time(),
+        operations=[
+            Operation(
+                type=OperationType.WRITE_NODE,
+                node_id=txn_id,
+                data={"labels": ["Bench"], "properties": {"n": txn_id}},
+            )
+        ],
+        txn_state=TransactionState.COMMITTED,
+    )
+
+
+def _run(writers: int, entries: int, latency_s: float, group: bool) -> dict:
+    storage = _LatencyStorage(latency_s)
+    wal = WriteAheadLog(storage, group_commit=group)
+    serial = threading.Lock()
+    per_writer = max(1, entries // writers)
+    barrier = threading.Barrier(writers + 1)
+
+    def writer(w: int) -> None:
+        barrier.wait()
+        for i in range(per_writer):
+            entry = _entry(f"txn-{w}-{i}")
+            if group:
+                wal.append(entry)
+            else:
+                with serial:
+                    wal.append(entry)
+
+    threads = [threading.Thread(target=writer, args=(w,)) for w in range(writers)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    total = per_writer * writers
+    return {
+        "commits": total,
+        "seconds": round(elapsed, 3),
+        "commits_per_sec": round(total / max(elapsed, 1e-9), 1),
+        "blocks_written": storage.writes,
+        "read_complete": sum(1 for _ in wal.read()) == total,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=512, help="total appends per run")
+    parser.add_argument("--writers", type=int, nargs="+", default=[1, 8, 64])
+    parser.add_argument("--block-latency-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    latency_s = args.block_latency_ms / 1000.0
+    runs = []
+    for writers in args.writers:
+        per_entry = _run(writers, args.entries, latency_s, group=False)
+        grouped = _run(writers, args.entries, latency_s, group=True)
+        runs.append(
+            {
+                "writers": writers,
+                "per_entry": per_entry,
+                "group_commit": grouped,
+                "speedup": round(
+                    grouped["commits_per_sec"] / max(per_entry["commits_per_sec"], 1e-9), 2
+                ),
+            }
+        )
+
+    report = {
+        "entries": args.entries,
+        "block_latency_ms": args.block_latency_ms,
+        "runs": runs,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Memory and throughput benchmark for logic batch processing: the
+backpressured ``BatchProcessor.stream`` vs. the materialising
+``BatchProcessor.process_batch_async``.
+
+For each input size a lazy generator yields ``--payload-bytes`` documents
+that an async function turns into results of the same size (standing in for
+FOL conversion of a long text). ``process_batch_async`` needs the whole input
+as a list and keeps every result until the batch ends; ``stream`` pulls at
+most ``--window`` items ahead of the consumer, which here only counts bytes
+and drops each result. The script reports items/sec and the tracemalloc
+peak for both; the streaming peak should stay flat as the input grows.
+
+Usage
+-----
+    PYTHONPATH=. python benchmarks/bench_logic_batch_streaming.py --sizes 1000 10000 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import anyio
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ipfs_datasets_py.logic.batch_processing import BatchProcessor  # noqa: E402
+
+
+def _documents(count: int, payload_bytes: int):
+    for i in range(count):
+        yield f"{i:08d}" + "x" * payload_bytes
+
+
+async def _convert(document: str) -> str:
+    await anyio.sleep(0)
+    return document.upper()
+
+
+async def _materialised(processor: BatchProcessor, count: int, payload_bytes: int) -> int:
+    result = await processor.process_batch_async(
+        list(_documents(count, payload_bytes)), _convert
+    )
+    return sum(len(r) for r in result.results)
+
+
+async def _streamed(processor: BatchProcessor, count: int, payload_bytes: int, window: int) -> int:
+    total = 0
+    async with processor.stream(_documents(count, payload_bytes), _convert, window=window) as out:
+        async for outcome in out:
+            total += len(outcome["result"])
+    return total
+
+
+def _measure(run) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    total = anyio.run(run)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, total
+
+
+def _report(count: int, elapsed: float, peak: int) -> dict:
+    return {
+        "items_per_s": round(count / max(elapsed, 1e-9), 1),
+        "peak_mib": round(peak / 2**20, 2),
+    }
+
+
+def _bench(args, count: int) -> dict:
+    processor = BatchProcessor(max_concurrency=args.concurrency, show_progress=False)
+    batch_s, batch_peak, batch_total = _measure(
+        lambda: _materialised(processor, count, args.payload_bytes)
+    )
+    stream_s, stream_peak, stream_total = _measure(
+        lambda: _streamed(processor, count, args.payload_bytes, args.window)
+    )
+    return {
+        "items": count,
+        "process_batch_async": _report(count, batch_s, batch_peak),
+        "stream": _report(count, stream_s, stream_peak),
+        "peak_reduction": round(batch_peak / max(stream_peak, 1), 1),
+        "totals_match": batch_total == stream_total,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--payload-bytes", type=int, default=2048)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--window", type=int, default=64, help="stream in-flight bound")
+    args = parser.parse_args()
+
+    report = {
+        "payload_bytes": args.payload_bytes,
+        "concurrency": args.concurrency,
+        "window": args.window,
+        "results": [_bench(args, count) for count in args.sizes],
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
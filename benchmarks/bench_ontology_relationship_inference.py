@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Scaling benchmark for OntologyGenerator relationship inference and
+``batch_extract``: the one-pass verb-frame scan and windowed co-occurrence
+candidates vs. the previous per-pattern scans and all-pairs loop, and worker
+processes vs. threads for corpus extraction.
+
+For each size a synthetic document of that many sentences is generated;
+every sentence names two entities from a pool that grows with the document
+(so entity count grows linearly with length) around a verb-frame or filler
+phrase. The script times the verb-frame pass both ways (the legacy pass runs
+``re.finditer`` once per pattern), candidate-pair generation both ways (the
+legacy loop is reproduced here as it was: ``str.find`` for both entities of
+every pair, then the 200-character distance check; run up to
+``--legacy-max`` entities) and the full ``infer_relationships`` call, and
+checks that both verb passes and both pair sets agree. Finally ``--docs``
+documents are extracted with ``batch_extract`` on threads and on worker
+processes.
+
+Usage
+-----
+    PYTHONPATH=. python benchmarks/bench_ontology_relationship_inference.py --sizes 200 1000 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ipfs_datasets_py.optimizers.graphrag.ontology_generator import (  # noqa: E402
+    Entity,
+    OntologyGenerationContext,
+    OntologyGenerator,
+)
+
+FRAMES = (
+    "{a} must pay {b} on time.",
+    "{a} owns {b} outright.",
+    "{a} employs {b} in Paris.",
+    "{a} manages {b} daily.",
+    "{a} met {b} at the office.",
+    "{a} and {b} signed the contract.",
+)
+TYPES = ("Person", "Organization", "Location", "Product")
+
+
+def build_document(sentences: int, seed: int) -> tuple:
+    """Return ``(text, entities)`` with about one new entity per two sentences."""
+    rng = random.Random(seed)
+    pool = max(2, sentences // 2)
+    names = [f"Name{i}" for i in range(pool)]
+    parts = []
+    for i in range(sentences):
+        # Draw from a band around the current sentence so mentions stay local.
+        lo = max(0, i // 2 - 4)
+        a, b = rng.sample(names[lo : min(pool, lo + 8)], 2)
+        parts.append(rng.choice(FRAMES).format(a=a, b=b))
+    entities = [
+        Entity(id=f"e{i}", type=TYPES[i % len(TYPES)], text=name) for i, name in enumerate(names)
+    ]
+    return " ".join(parts), entities
+
+
+def legacy_verb_pass(text: str) -> list:
+    return [
+        (rel_type, m.span())
+        for pattern, rel_type in OntologyGenerator._get_verb_patterns()
+        for m in re.finditer(pattern, text, re.IGNORECASE)
+    ]
+
+
+def legacy_pairs(entities: list, text_lower: str) -> list:
+    pairs = []
+    for i, e1 in enumerate(entities):
+        pos1 = text_lower.find(e1.text.lower())
+        if pos1 < 0:
+            continue
+        for j in range(i + 1, len(entities)):
+            pos2 = text_lower.find(entities[j].text.lower())
+            if pos2 >= 0 and abs(pos1 - pos2) <= 200:
+                pairs.append((i, j))
+    return pairs
+
+
+def _timed(fn, *args) -> tuple:
+    start = time.perf_counter()
+    result = fn(*args)
+    return round((time.perf_counter() - start) * 1000, 2), result
+
+
+def _bench(args, generator: OntologyGenerator, context, sentences: int) -> dict:
+    text, entities = build_document(sentences, args.seed)
+    text_lower = text.lower()
+
+    scan_ms, scanned = _timed(
+        lambda: [(rel, m.span()) for rel, m in generator._iter_verb_frame_matches(text)]
+    )
+    legacy_scan_ms, legacy_scanned = _timed(legacy_verb_pass, text)
+    pairs_ms, (_, pairs) = _timed(generator._cooccurrence_candidates, entities, text_lower)
+    infer_ms, relationships = _timed(generator.infer_relationships, entities, context, text)
+
+    row = {
+        "sentences": sentences,
+        "chars": len(text),
+        "entities": len(entities),
+        "verb_scan_ms": scan_ms,
+        "legacy_verb_scan_ms": legacy_scan_ms,
+        "verb_scans_match": sorted(scanned) == sorted(legacy_scanned),
+        "candidate_pairs": len(pairs),
+        "candidate_pairs_ms": pairs_ms,
+        "infer_relationships_ms": infer_ms,
+        "relationships": len(relationships),
+    }
+    if len(entities) <= args.legacy_max:
+        legacy_pairs_ms, expected = _timed(legacy_pairs, entities, text_lower)
+        row["legacy_pairs_ms"] = legacy_pairs_ms
+        row["pairs_match"] = pairs == expected
+    return row
+
+
+def _bench_batch_extract(args, generator: OntologyGenerator, context) -> dict:
+    docs = [build_document(args.doc_sentences, args.seed + i)[0] for i in range(args.docs)]
+    report = {"docs": args.docs, "workers": args.workers, "cpus": os.cpu_count()}
+    for label, use_processes in (("threads", False), ("processes", True)):
+        start = time.perf_counter()
+        generator.batch_extract(docs, context, args.workers, use_processes=use_processes)
+        elapsed = time.perf_counter() - start
+        report[f"{label}_docs_per_s"] = round(args.docs / max(elapsed, 1e-9), 1)
+    report["speedup"] = round(report["processes_docs_per_s"] / report["threads_docs_per_s"], 2)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 1000, 5000])
+    parser.add_argument(
+        "--legacy-max", type=int, default=500, help="largest entity count for the pairs loop"
+    )
+    parser.add_argument("--docs", type=int, default=64, help="documents for batch_extract")
+    parser.add_argument("--doc-sentences", type=int, default=80)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Extraction logs a warning per document; keep the report readable.
+    logging.disable(logging.WARNING)
+    generator = OntologyGenerator(use_ipfs_accelerate=False)
+    context = OntologyGenerationContext(
+        data_source="bench", data_type="text", domain="general", extraction_strategy="rule_based"
+    )
+    report = {
+        "inference": [_bench(args, generator, context, n) for n in args.sizes],
+        "batch_extract": _bench_batch_extract(args, generator, context),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
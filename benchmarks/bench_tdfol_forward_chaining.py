@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for TDFOL forward chaining: the semi-naive, rule-indexed
+ForwardChainingStrategy vs. the previous naive loop, on knowledge bases built
+from the logic-pipeline benchmark corpus.
+
+Each FOL, deontic or temporal case of ``tests/fixtures/logic_pipeline_benchmark``
+becomes one KB: an implication chain through the case's required predicates
+(padded to ``--depth`` links) about its first entity, wrapped in O(...) for
+deontic cases and □(...) for temporal ones, plus ``--distractors`` unrelated
+facts and implications. The goal is the last predicate of the chain, or its
+negation for cases expected to be disproved. The naive loop is reproduced
+here as it was: every rule against every formula each iteration, string
+dedup, binary rules paired with the first 20 formulas only, and at most 200
+new formulas per iteration.
+
+Usage
+-----
+    PYTHONPATH=. python benchmarks/bench_tdfol_forward_chaining.py --depth 8 --distractors 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ipfs_datasets_py.logic.TDFOL import (  # noqa: E402
+    Constant,
+    DeonticFormula,
+    DeonticOperator,
+    Predicate,
+    TDFOLKnowledgeBase,
+    TemporalFormula,
+    TemporalOperator,
+    create_implication,
+    create_negation,
+)
+from ipfs_datasets_py.logic.TDFOL.inference_rules import get_all_tdfol_rules  # noqa: E402
+from ipfs_datasets_py.logic.TDFOL.strategies.forward_chaining import (  # noqa: E402
+    ForwardChainingStrategy,
+)
+
+CORPUS = (
+    Path(__file__).resolve().parents[1]
+    / "tests"
+    / "fixtures"
+    / "logic_pipeline_benchmark"
+    / "corpus.jsonl"
+)
+
+
+def _wrap(logic: str, formula):
+    if logic == "deontic":
+        return DeonticFormula(DeonticOperator.OBLIGATION, formula)
+    if logic == "temporal":
+        return TemporalFormula(TemporalOperator.ALWAYS, formula)
+    return formula
+
+
+def build_cases(depth: int, distractors: int) -> list:
+    """One ``(case_id, kb, goal)`` per FOL/deontic/temporal corpus case."""
+    cases = []
+    for line in CORPUS.read_text(encoding="utf-8").splitlines():
+        case = json.loads(line)
+        obligation = case.get("proof_obligation") or {}
+        logic = obligation.get("logic")
+        if logic not in ("fol", "deontic", "temporal") or not case["required_entities"]:
+            continue
+        entity = (Constant(case["required_entities"][0]),)
+        names = list(case["required_predicates"])
+        names += [f"{names[-1]}_{i}" for i in range(max(0, depth + 1 - len(names)))]
+        chain = [Predicate(name, entity) for name in names]
+
+        kb = TDFOLKnowledgeBase()
+        kb.add_axiom(_wrap(logic, chain[0]))
+        for left, right in zip(chain, chain[1:]):
+            kb.add_axiom(_wrap(logic, create_implication(left, right)))
+        for i in range(distractors):
+            noise = Predicate(f"noise_{i}", entity)
+            if i % 2:
+                kb.add_axiom(noise)
+            else:
+                kb.add_axiom(create_implication(noise, Predicate(f"noise_{i}_x", entity)))
+
+        goal = _wrap(logic, chain[-1])
+        if case["expected_class"] == "disproved":
+            goal = create_negation(goal)
+        cases.append((case["case_id"], kb, goal))
+    return cases
+
+
+def legacy_prove(rules, goal, kb, max_iterations: int, timeout_ms: int):
+    """The pre-semi-naive loop; returns ``(proved, derivations)``."""
+    start = time.time()
+    deadline = start + timeout_ms / 1000.0
+    derived = list(kb.axioms) + list(kb.theorems)
+    derived_strs = {str(f) for f in derived}
+    steps = 0
+    for _ in range(max_iterations):
+        if time.time() > deadline or str(goal) in derived_strs:
+            break
+        new = []
+        for current in list(derived):
+            if time.time() > deadline or len(new) >= 200:
+                break
+            for rule in rules:
+                if len(new) >= 200:
+                    break
+                pairs = [(current,)]
+                pairs += [(current, other) for other in derived[:20] if other != current]
+                for premises in pairs:
+                    try:
+                        if rule.can_apply(*premises):
+                            formula = rule.apply(*premises)
+                            if str(formula) not in derived_strs:
+                                new.append(formula)
+                                derived_strs.add(str(formula))
+                                steps += 1
+                    except (AttributeError, TypeError, ValueError, IndexError):
+                        continue
+        if not new:
+            break
+        derived.extend(new)
+    return str(goal) in derived_strs, steps
+
+
+def _report(results: list, elapsed: float) -> dict:
+    proved = sum(1 for _, ok, _ in results if ok)
+    return {
+        "proofs_per_s": round(len(results) / max(elapsed, 1e-9), 2),
+        "mean_ms_per_goal": round(elapsed * 1000 / max(len(results), 1), 2),
+        "proved": proved,
+        "derivations": sum(steps for _, _, steps in results),
+        "proved_case_ids": sorted(case_id for case_id, ok, _ in results if ok),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--depth", type=int, default=8, help="implication links per KB")
+    parser.add_argument("--distractors", type=int, default=20, help="unrelated axioms per KB")
+    parser.add_argument("--max-iterations", type=int, default=100)
+    parser.add_argument("--timeout-ms", type=int, default=2000)
+    args = parser.parse_args()
+
+    cases = build_cases(args.depth, args.distractors)
+    rules = get_all_tdfol_rules()
+    strategy = ForwardChainingStrategy(max_iterations=args.max_iterations, rules=rules)
+
+    semi_naive = []
+    start = time.perf_counter()
+    for case_id, kb, goal in cases:
+        result = strategy.prove(goal, kb, timeout_ms=args.timeout_ms)
+        semi_naive.append((case_id, result.is_proved(), len(result.proof_steps)))
+    semi_naive_s = time.perf_counter() - start
+
+    legacy = []
+    start = time.perf_counter()
+    for case_id, kb, goal in cases:
+        ok, steps = legacy_prove(rules, goal, kb, args.max_iterations, args.timeout_ms)
+        legacy.append((case_id, ok, steps))
+    legacy_s = time.perf_counter() - start
+
+    report = {
+        "cases": len(cases),
+        "depth": args.depth,
+        "distractors": args.distractors,
+        "rules": len(rules),
+        "semi_naive": _report(semi_naive, semi_naive_s),
+        "legacy": _report(legacy, legacy_s),
+    }
+    report["speedup"] = round(legacy_s / max(semi_naive_s, 1e-9), 2)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
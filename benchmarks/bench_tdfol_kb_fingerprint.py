@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for TDFOL proof-cache lookups keyed on the incremental
+knowledge-base fingerprint vs. the previous key built from every axiom.
+
+For each KB size the script adds one axiom between lookups (so the KB keeps
+changing, as it does while a session grows) and measures the cost of a
+cache hit both ways: ``ProofCache.get(goal, kb_fingerprint=kb.fingerprint)``
+and the legacy ``ProofCache.get(goal, axioms + theorems)``, which stringifies
+the whole KB on every call. Lookup latency should stay flat with the
+fingerprint and grow linearly with the legacy key.
+
+Usage
+-----
+    PYTHONPATH=. python benchmarks/bench_tdfol_kb_fingerprint.py --sizes 100 1000 10000 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ipfs_datasets_py.logic.common.proof_cache import ProofCache  # noqa: E402
+from ipfs_datasets_py.logic.TDFOL import (  # noqa: E402
+    Constant,
+    Predicate,
+    TDFOLKnowledgeBase,
+    create_implication,
+)
+
+
+def _axiom(i: int):
+    subject = (Constant(f"c{i % 97}"),)
+    return create_implication(Predicate(f"p{i}", subject), Predicate(f"q{i}", subject))
+
+
+def _median_us(samples: list) -> float:
+    return round(statistics.median(samples) * 1e6, 2)
+
+
+def _timed_lookups(kb: TDFOLKnowledgeBase, lookups: int, size: int, key) -> tuple:
+    """Add an axiom, cache a result under ``key(kb)`` and time the hit."""
+    goal = Predicate("goal", (Constant("c0"),))
+    cache = ProofCache(maxsize=lookups + 16)
+    add_s, lookup_s = [], []
+    for step in range(lookups):
+        start = time.perf_counter()
+        kb.add_axiom(_axiom(size + step))
+        add_s.append(time.perf_counter() - start)
+
+        cache.set(goal, "proved", **key(kb))
+        start = time.perf_counter()
+        hit = cache.get(goal, **key(kb))
+        lookup_s.append(time.perf_counter() - start)
+        assert hit == "proved"
+    return add_s, lookup_s
+
+
+def _build_kb(size: int) -> TDFOLKnowledgeBase:
+    kb = TDFOLKnowledgeBase()
+    for i in range(size):
+        kb.add_axiom(_axiom(i))
+    return kb
+
+
+def _bench(size: int, lookups: int) -> dict:
+    # Separate KBs and loops so the legacy key's large strings do not evict
+    # the fingerprint path's working set from the CPU caches.
+    add_s, fingerprint_s = _timed_lookups(
+        _build_kb(size), lookups, size, lambda kb: {"kb_fingerprint": kb.fingerprint}
+    )
+    _, legacy_s = _timed_lookups(
+        _build_kb(size), lookups, size, lambda kb: {"axioms": kb.axioms + kb.theorems}
+    )
+    return {
+        "kb_size": size,
+        "add_axiom_us": _median_us(add_s),
+        "fingerprint_lookup_us": _median_us(fingerprint_s),
+        "legacy_lookup_us": _median_us(legacy_s),
+        "speedup": round(statistics.median(legacy_s) / statistics.median(fingerprint_s), 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 50000])
+    parser.add_argument("--lookups", type=int, default=20, help="lookups per KB size")
+    args = parser.parse_args()
+
+    report = {"lookups": args.lookups, "results": [_bench(n, args.lookups) for n in args.sizes]}
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for UnixFS content-defined chunking: FastCDCChunker
+throughput and the dedup ratio it keeps across edited versions of a file,
+compared with FixedSizeChunker at the same average chunk size.
+
+Each version applies a few random inserts and deletes to the previous one.
+Dedup ratio is the fraction of a version's bytes that live in chunks already
+present in the original, so 1.0 means every chunk was reused.
+
+Usage
+-----
+    PYTHONPATH=. python benchmarks/bench_unixfs_fastcdc.py --size-mb 64 --versions 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ipfs_datasets_py.processors.ipfs.unixfs import (  # noqa: E402
+    FastCDCChunker,
+    FixedSizeChunker,
+)
+
+
+def _edit(data: bytes, rng: np.random.Generator, edits: int) -> bytes:
+    """Apply ``edits`` random small inserts or deletes."""
+    for _ in range(edits):
+        position = int(rng.integers(0, len(data)))
+        length = int(rng.integers(1, 512))
+        if rng.random() < 0.5:
+            data = data[:position] + rng.bytes(length) + data[position:]
+        else:
+            data = data[:position] + data[position + length :]
+    return data
+
+
+def _chunk_digests(chunker, data: bytes) -> dict:
+    lengths = chunker.cut(None, data, end=True)
+    digests = {}
+    offset = 0
+    view = memoryview(data)
+    for length in lengths:
+        digests[hashlib.sha256(view[offset : offset + length]).digest()] = length
+        offset += length
+    return digests
+
+
+def _bench(chunker, versions: list) -> dict:
+    start = time.perf_counter()
+    lengths = chunker.cut(None, versions[0], end=True)
+    elapsed = time.perf_counter() - start
+
+    base = _chunk_digests(chunker, versions[0])
+    ratios = []
+    for data in versions[1:]:
+        chunks = _chunk_digests(chunker, data)
+        shared = sum(length for digest, length in chunks.items() if digest in base)
+        ratios.append(round(shared / len(data), 4))
+    return {
+        "throughput_mb_per_s": round(len(versions[0]) / 2**20 / max(elapsed, 1e-9), 1),
+        "chunks": len(lengths),
+        "mean_chunk_bytes": int(np.mean(lengths)),
+        "min_chunk_bytes": int(min(lengths)),
+        "max_chunk_bytes": int(max(lengths)),
+        "dedup_ratio_per_version": ratios,
+        "mean_dedup_ratio": round(float(np.mean(ratios)), 4) if ratios else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--versions", type=int, default=5)
+    parser.add_argument("--edits", type=int, default=10, help="edits per version")
+    parser.add_argument("--min-size", type=int, default=64 * 1024)
+    parser.add_argument("--avg-size", type=int, default=256 * 1024)
+    parser.add_argument("--max-size", type=int, default=1024 * 1024)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    versions = [rng.bytes(args.size_mb * 2**20)]
+    for _ in range(args.versions):
+        versions.append(_edit(versions[-1], rng, args.edits))
+
+    report = {
+        "size_mb": args.size_mb,
+        "versions": args.versions,
+        "edits_per_version": args.edits,
+        "fastcdc": _bench(FastCDCChunker(args.min_size, args.avg_size, args.max_size), versions),
+        "fixed_size": _bench(FixedSizeChunker(args.avg_size), versions),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for search.vector_tools.VectorStore: matrix-backed search vs.
+the legacy per-vector Python loop, from 1k to 1M stored vectors.
+
+For each collection size the report records per-query latency of the legacy
+loop (only up to ``--legacy-max`` vectors; it is linear in Python calls),
+``search_similar``, batched ``search_many``, and ``search_many`` over float16
+storage, plus float16 recall@k against float32 and the result parity of the
+float32 path with the legacy loop.
+
+Usage
+-----
+    PYTHONPATH=. python benchmarks/bench_vector_tools_search.py --sizes 1000 10000 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ipfs_datasets_py.search.vector_tools import (  # noqa: E402
+    VectorSimilarityCalculator,
+    VectorStore,
+)
+
+
+def _legacy_search(store: VectorStore, query: list, top_k: int) -> list:
+    """The pre-matrix search_similar: one cosine_similarity call per vector."""
+    calculator = VectorSimilarityCalculator()
+    similarities = []
+    for vector_id, vector in store.vectors.items():
+        similarity = calculator.cosine_similarity(query, vector.tolist())
+        similarities.append({"id": vector_id, "similarity": similarity})
+    similarities.sort(key=lambda x: x["similarity"], reverse=True)
+    return similarities[:top_k]
+
+
+def _build(vectors: np.ndarray, storage_dtype: str) -> tuple[VectorStore, float]:
+    start = time.perf_counter()
+    store = VectorStore(dimension=vectors.shape[1], storage_dtype=storage_dtype)
+    for i, vector in enumerate(vectors):
+        store.add_vector(f"v{i}", vector)
+    return store, time.perf_counter() - start
+
+
+def _per_query_ms(fn, queries: list) -> tuple[float, list]:
+    start = time.perf_counter()
+    results = fn(queries)
+    return (time.perf_counter() - start) * 1000.0 / len(queries), results
+
+
+def _ids(results: list) -> list:
+    return [[hit["id"] for hit in hits] for hits in results]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000, 1000000])
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=32)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--legacy-max", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    queries = rng.standard_normal((args.queries, args.dimension)).astype(np.float32).tolist()
+    runs = []
+    for size in args.sizes:
+        vectors = rng.standard_normal((size, args.dimension)).astype(np.float32)
+        store32, build32_s = _build(vectors, "float32")
+        store16, build16_s = _build(vectors, "float16")
+        del vectors
+
+        single_ms, single = _per_query_ms(
+            lambda qs: [store32.search_similar(q, args.top_k) for q in qs], queries
+        )
+        many_ms, many = _per_query_ms(lambda qs: store32.search_many(qs, args.top_k), queries)
+        half_ms, half = _per_query_ms(lambda qs: store16.search_many(qs, args.top_k), queries)
+
+        exact = _ids(many)
+        recall = np.mean(
+            [len(set(a) & set(b)) / max(len(a), 1) for a, b in zip(exact, _ids(half))]
+        )
+        run = {
+            "vectors": size,
+            "build_s": {"float32": round(build32_s, 2), "float16": round(build16_s, 2)},
+            "matrix_mb": {
+                "float32": round(store32._matrix.nbytes / 2**20, 1),
+                "float16": round(store16._matrix.nbytes / 2**20, 1),
+            },
+            "search_similar_ms": round(single_ms, 3),
+            "search_many_ms": round(many_ms, 3),
+            "search_many_float16_ms": round(half_ms, 3),
+            "float16_recall_at_k": round(float(recall), 4),
+            "single_and_batched_identical": _ids(single) == exact,
+        }
+        if size <= args.legacy_max:
+            legacy_ms, legacy = _per_query_ms(
+                lambda qs: [_legacy_search(store32, q, args.top_k) for q in qs], queries
+            )
+            run["legacy_ms"] = round(legacy_ms, 3)
+            run["speedup_search_many"] = round(legacy_ms / max(many_ms, 1e-9), 1)
+            run["legacy_results_identical"] = _ids(legacy) == exact
+        runs.append(run)
+
+    report = {
+        "dimension": args.dimension,
+        "queries": args.queries,
+        "top_k": args.top_k,
+        "runs": runs,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
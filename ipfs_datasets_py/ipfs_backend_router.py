@@ -3,6 +3,7 @@
 This module provides a stable entrypoint for basic IPFS operations with a
 pluggable backend strategy:
 - Optional providers (ipfs_accelerate_py, ipfs_kit_py) when explicitly enabled.
+- Kubo RPC over pooled HTTP connections when `IPFS_DATASETS_PY_KUBO_API` is set.
 - Default fallback to local Kubo via the `ipfs` CLI.
 
 Design goals:
@@ -14,18 +15,29 @@ Environment variables:
 - `IPFS_DATASETS_PY_ENABLE_IPFS_ACCELERATE`: enable ipfs_accelerate_py backend (best-effort)
 - `IPFS_DATASETS_PY_ENABLE_IPFS_KIT`: enable ipfs_kit_py backend (best-effort)
 - `IPFS_DATASETS_PY_KUBO_CMD`: override ipfs CLI command (default: "ipfs")
+- `IPFS_DATASETS_PY_KUBO_API`: Kubo RPC address (URL or multiaddr); selects `KuboHTTPBackend`
 """
 
 from __future__ import annotations
 
-import os
+import http.client
 import importlib
+import io
+import json
+import os
+import queue
+import shutil
 import subprocess
+import tarfile
 import tempfile
+import threading
+import urllib.parse
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from shutil import which
 from dataclasses import dataclass
 from functools import lru_cache
-from typing import Callable, Dict, Optional, Protocol, runtime_checkable
+from typing import Callable, Dict, Iterator, Optional, Protocol, Union, runtime_checkable
 
 from .router_deps import RouterDeps, get_default_router_deps
 
@@ -99,6 +111,7 @@ def _backend_cache_key() -> tuple:
         os.getenv("IPFS_HOST", "").strip(),
         os.getenv("IPFS_DATASETS_PY_ENABLE_IPFS_ACCELERATE", "").strip(),
         os.getenv("IPFS_DATASETS_PY_KUBO_CMD", "").strip(),
+        os.getenv("IPFS_DATASETS_PY_KUBO_API", "").strip(),
         os.getenv("IPFS_DATASETS_PY_IPFS_CACHE_DIR", "").strip(),
     )
 
@@ -277,6 +290,339 @@ class KuboCLIBackend:
         )
 
 
+def _kubo_api_url(api: Optional[str] = None) -> str:
+    """Normalize a Kubo RPC address (URL or ``/ip4/.../tcp/...`` multiaddr) to a URL."""
+    value = (api or os.getenv("IPFS_DATASETS_PY_KUBO_API") or "").strip()
+    if not value:
+        value = os.getenv("IPFS_HOST", "").strip() or "http://127.0.0.1:5001"
+    if value.startswith("/"):
+        parts = value.strip("/").split("/")
+        host, port = "127.0.0.1", "5001"
+        for proto, arg in zip(parts[::2], parts[1::2]):
+            if proto in {"ip4", "dns", "dns4", "dns6"}:
+                host = arg
+            elif proto == "ip6":
+                host = f"[{arg}]"
+            elif proto == "tcp":
+                port = arg
+        value = f"http://{host}:{port}"
+    elif "://" not in value:
+        value = f"http://{value}"
+    return value.rstrip("/")
+
+
+class _MultipartBody:
+    """A multipart/form-data request body streamed from bytes and files.
+
+    Each part is ``(filename, source, content_type)``; ``source`` is either
+    bytes or a path that is read in ``chunk_size`` pieces while the request is
+    sent, so uploading a directory never holds its files in memory. The body
+    can be iterated again, which re-opens the files, so a request can be
+    retried on a fresh connection.
+    """
+
+    def __init__(
+        self, parts: list[tuple[str, Union[bytes, str], str]], chunk_size: int = 1 << 20
+    ) -> None:
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self._chunk_size = chunk_size
+        self._parts: list[tuple[bytes, Union[bytes, str], int]] = []
+        for filename, source, part_type in parts:
+            header = (
+                f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="file"; '
+                f'filename="{urllib.parse.quote(filename, safe="")}"\r\n'
+                f"Content-Type: {part_type}\r\n\r\n"
+            ).encode("ascii")
+            size = len(source) if isinstance(source, bytes) else os.path.getsize(source)
+            self._parts.append((header, source, size))
+        self._closing = f"--{boundary}--\r\n".encode("ascii")
+
+    def __len__(self) -> int:
+        return sum(len(header) + size + 2 for header, _, size in self._parts) + len(self._closing)
+
+    def __iter__(self) -> Iterator[bytes]:
+        for header, source, size in self._parts:
+            yield header
+            if isinstance(source, bytes):
+                yield source
+            else:
+                with open(source, "rb") as handle:
+                    remaining = size
+                    while remaining:
+                        chunk = handle.read(min(self._chunk_size, remaining))
+                        if not chunk:
+                            raise RuntimeError(f"{source} shrank while it was being uploaded")
+                        remaining -= len(chunk)
+                        yield chunk
+            yield b"\r\n"
+        yield self._closing
+
+
+class KuboHTTPBackend:
+    """Kubo RPC backend over pooled keep-alive HTTP connections.
+
+    Unlike :class:`KuboCLIBackend`, no process is spawned per call. Each
+    thread borrows a persistent connection from a small pool, so
+    ``block_get_many`` can keep ``pool_size`` requests in flight, and
+    ``block_put_many`` uploads up to ``batch_size`` blocks in one multipart
+    ``block/put`` request.
+    """
+
+    def __init__(
+        self,
+        api_url: Optional[str] = None,
+        *,
+        pool_size: int = 8,
+        batch_size: int = 256,
+        timeout_s: float = 60.0,
+    ) -> None:
+        if pool_size < 1 or batch_size < 1:
+            raise ValueError("pool_size and batch_size must be positive")
+        self.api_url = _kubo_api_url(api_url)
+        parsed = urllib.parse.urlsplit(self.api_url)
+        self._https = parsed.scheme == "https"
+        self._host = parsed.hostname or "127.0.0.1"
+        self._port = parsed.port or (443 if self._https else 5001)
+        self._base_path = parsed.path.rstrip("/") + "/api/v0/"
+        self.pool_size = pool_size
+        self.batch_size = batch_size
+        self.timeout_s = timeout_s
+        self._pool: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    # ---- connection pool ----
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        cls = http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+        return cls(self._host, self._port, timeout=self.timeout_s)
+
+    def _acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        try:
+            return self._pool.get_nowait(), True
+        except queue.Empty:
+            return self._new_connection(), False
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        if self._pool.qsize() < self.pool_size:
+            self._pool.put(conn)
+        else:
+            conn.close()
+
+    def _request(
+        self,
+        command: str,
+        params: Optional[list[tuple[str, str]]] = None,
+        *,
+        body: Union[bytes, _MultipartBody] = b"",
+        content_type: Optional[str] = None,
+    ) -> bytes:
+        url = self._base_path + command
+        if params:
+            url += "?" + urllib.parse.urlencode(params)
+        headers = {"Content-Length": str(len(body))}
+        if content_type:
+            headers["Content-Type"] = content_type
+
+        conn, reused = self._acquire()
+        try:
+            try:
+                conn.request("POST", url, body=body, headers=headers)
+                resp = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if not reused:
+                    raise
+                # The daemon closed an idle keep-alive connection; retry once.
+                conn.close()
+                conn = self._new_connection()
+                conn.request("POST", url, body=body, headers=headers)
+                resp = conn.getresponse()
+            data = resp.read()
+        except Exception:
+            conn.close()
+            raise
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(conn)
+
+        if resp.status != 200:
+            message = data.decode("utf-8", errors="replace").strip()
+            try:
+                message = json.loads(message).get("Message") or message
+            except (ValueError, AttributeError):
+                pass
+            raise RuntimeError(message or f"Kubo RPC {command} failed with HTTP {resp.status}")
+        return data
+
+    @staticmethod
+    def _multipart(parts: list[tuple[str, bytes, str]]) -> tuple[bytes, str]:
+        """Encode ``(filename, data, content_type)`` parts as multipart/form-data."""
+        body = _MultipartBody(parts)
+        return b"".join(body), body.content_type
+
+    @staticmethod
+    def _json_lines(data: bytes) -> list[dict]:
+        return [json.loads(line) for line in data.decode("utf-8").splitlines() if line.strip()]
+
+    def _map(self, fn: Callable, items: list) -> list:
+        if len(items) <= 1 or self.pool_size == 1:
+            return [fn(item) for item in items]
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.pool_size, thread_name_prefix="kubo-http"
+                )
+        return list(self._executor.map(fn, items))
+
+    def close(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    # ---- IPFSBackend ----
+
+    def add_bytes(self, data: bytes, *, pin: bool = True) -> str:
+        body, content_type = self._multipart([("data.bin", bytes(data), "application/octet-stream")])
+        out = self._request(
+            "add",
+            [("pin", "true" if pin else "false"), ("quieter", "true")],
+            body=body,
+            content_type=content_type,
+        )
+        return str(self._json_lines(out)[-1]["Hash"])
+
+    def cat(self, cid: str) -> bytes:
+        return self._request("cat", [("arg", cid)])
+
+    def pin(self, cid: str) -> None:
+        self._request("pin/add", [("arg", cid)])
+
+    def unpin(self, cid: str) -> None:
+        self._request("pin/rm", [("arg", cid)])
+
+    def block_put(self, data: bytes, *, codec: str = "raw") -> str:
+        return self.block_put_many([data], codec=codec)[0]
+
+    def block_get(self, cid: str) -> bytes:
+        return self._request("block/get", [("arg", cid)])
+
+    def block_put_many(self, blocks: list[bytes], *, codec: str = "raw") -> list[str]:
+        """Store blocks with one multipart ``block/put`` request per batch."""
+        blocks = list(blocks)
+        params = [("cid-codec", str(codec)), ("mhtype", "sha2-256")]
+
+        def put_batch(batch: list[bytes]) -> list[str]:
+            body, content_type = self._multipart(
+                [(f"block{i}", bytes(data), "application/octet-stream") for i, data in enumerate(batch)]
+            )
+            out = self._request("block/put", params, body=body, content_type=content_type)
+            cids = [str(entry["Key"]) for entry in self._json_lines(out)]
+            if len(cids) != len(batch):
+                raise RuntimeError(
+                    f"Kubo block/put returned {len(cids)} CIDs for {len(batch)} blocks"
+                )
+            return cids
+
+        batches = [blocks[i : i + self.batch_size] for i in range(0, len(blocks), self.batch_size)]
+        return [cid for cids in self._map(put_batch, batches) for cid in cids]
+
+    def block_get_many(self, cids: list[str]) -> list[bytes]:
+        """Fetch blocks concurrently over the connection pool, preserving order."""
+        return self._map(self.block_get, list(cids))
+
+    def add_path(
+        self,
+        path: str,
+        *,
+        recursive: bool = True,
+        pin: bool = True,
+        chunker: Optional[str] = None,
+    ) -> str:
+        root_name = os.path.basename(os.path.normpath(path))
+        # File parts carry their path and are streamed while the request is sent
+        parts: list[tuple[str, Union[bytes, str], str]] = []
+        if os.path.isdir(path):
+            parts.append((root_name, b"", "application/x-directory"))
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                rel = os.path.relpath(dirpath, path)
+                prefix = root_name if rel == "." else f"{root_name}/{rel.replace(os.sep, '/')}"
+                if not recursive:
+                    dirnames[:] = []
+                for name in dirnames:
+                    parts.append((f"{prefix}/{name}", b"", "application/x-directory"))
+                for name in sorted(filenames):
+                    parts.append(
+                        (f"{prefix}/{name}", os.path.join(dirpath, name), "application/octet-stream")
+                    )
+        else:
+            parts.append((root_name, path, "application/octet-stream"))
+        params = [("pin", "true" if pin else "false")]
+        if chunker:
+            params.append(("chunker", str(chunker)))
+        body = _MultipartBody(parts)
+        entries = self._json_lines(
+            self._request("add", params, body=body, content_type=body.content_type)
+        )
+        for entry in entries:
+            if entry.get("Name") == root_name:
+                return str(entry["Hash"])
+        return str(entries[-1]["Hash"])
+
+    def get_to_path(self, cid: str, *, output_path: str) -> None:
+        data = self._request("get", [("arg", cid)])
+        root = os.path.realpath(output_path)
+        with tarfile.open(fileobj=io.BytesIO(data), mode="r|*") as archive:
+            for member in archive:
+                name = member.name.split("/", 1)[1] if "/" in member.name else ""
+                target = os.path.realpath(os.path.join(root, name)) if name else root
+                # Absolute names, ".." and symlinked parents could escape root
+                if os.path.isabs(name) or os.path.commonpath([root, target]) != root:
+                    raise ValueError(
+                        f"Refusing to extract {member.name!r} outside {output_path!r}"
+                    )
+                if member.isdir():
+                    os.makedirs(target, exist_ok=True)
+                elif member.isfile():
+                    os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+                    source = archive.extractfile(member)
+                    with open(target, "wb") as handle:
+                        shutil.copyfileobj(source, handle)
+
+    def ls(self, cid: str) -> list[str]:
+        listing = json.loads(self._request("ls", [("arg", cid)]))
+        objects = listing.get("Objects") or []
+        if not objects:
+            return []
+        return [str(link["Name"]) for link in objects[0].get("Links") or [] if link.get("Name")]
+
+    def dag_export(self, cid: str) -> bytes:
+        return self._request("dag/export", [("arg", cid)])
+
+    # ---- Optional: IPNS (best-effort) ----
+
+    def name_publish(
+        self, cid: str, *, key: Optional[str] = None, allow_offline: bool = True
+    ) -> str:
+        params = [("arg", f"/ipfs/{cid}"), ("allow-offline", "true" if allow_offline else "false")]
+        if key:
+            params.append(("key", str(key)))
+        return str(json.loads(self._request("name/publish", params)).get("Name"))
+
+    def name_resolve(self, name: str, *, timeout_s: float = 10.0) -> str:
+        params = [("arg", str(name)), ("timeout", f"{float(timeout_s):.3f}s")]
+        return str(json.loads(self._request("name/resolve", params)).get("Path"))
+
+
 def _get_httpapi_backend() -> Optional[IPFSBackend]:
     if not _truthy(os.getenv("IPFS_DATASETS_PY_ENABLE_IPFS_HTTPAPI")):
         return None
@@ -720,6 +1066,9 @@ def _resolve_backend(preferred: Optional[str] = None) -> IPFSBackend:
     if httpapi is not None:
         return httpapi
 
+    if os.getenv("IPFS_DATASETS_PY_KUBO_API", "").strip():
+        return KuboHTTPBackend()
+
     accel = _get_accelerate_backend()
     if accel is not None:
         return accel
@@ -839,6 +1188,37 @@ def block_get(
     return (backend_instance or get_ipfs_backend(backend, deps=deps)).block_get(cid)
 
 
+def block_put_many(
+    blocks: list[bytes],
+    *,
+    codec: str = "raw",
+    backend: Optional[str] = None,
+    backend_instance: Optional[IPFSBackend] = None,
+    deps: Optional[RouterDeps] = None,
+) -> list[str]:
+    """Store several blocks, batched when the backend supports it."""
+    b = backend_instance or get_ipfs_backend(backend, deps=deps)
+    fn = getattr(b, "block_put_many", None)
+    if callable(fn):
+        return list(fn(blocks, codec=codec))
+    return [b.block_put(data, codec=codec) for data in blocks]
+
+
+def block_get_many(
+    cids: list[str],
+    *,
+    backend: Optional[str] = None,
+    backend_instance: Optional[IPFSBackend] = None,
+    deps: Optional[RouterDeps] = None,
+) -> list[bytes]:
+    """Fetch several blocks in order, concurrently when the backend supports it."""
+    b = backend_instance or get_ipfs_backend(backend, deps=deps)
+    fn = getattr(b, "block_get_many", None)
+    if callable(fn):
+        return list(fn(cids))
+    return [b.block_get(cid) for cid in cids]
+
+
 def add_path(
     path: str,
     *,
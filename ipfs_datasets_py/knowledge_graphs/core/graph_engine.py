@@ -10,9 +10,16 @@ Design notes:
 - `storage_backend` is optional; when absent the engine is in-memory only.
 - Persistence uses the IPLD backend API (`store`, `retrieve_json`, `store_graph`,
   `retrieve_graph`) when available.
+- Relationship lookups go through per-node outgoing/incoming adjacency lists
+  keyed by relationship type, so `get_relationships` costs O(degree) instead of
+  a scan of every relationship.
+- `find_nodes` intersects a label index (always maintained) and opt-in
+  property equality indexes (`create_property_index`) smallest-first, and only
+  scans for predicates no index covers.
 """
 
 import logging
+from collections import deque
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 from ..neo4j_compat.types import Node, Relationship
@@ -58,6 +65,21 @@ class GraphEngine:
         self._relationship_cache = {}
         self._node_id_counter = 0
         self._rel_id_counter = 0
+        # node_id -> rel_type -> {rel_id: Relationship}
+        self._out_adjacency: Dict[Any, Dict[str, Dict[Any, Relationship]]] = {}
+        self._in_adjacency: Dict[Any, Dict[str, Dict[Any, Relationship]]] = {}
+        # rel_id -> insertion sequence, used to merge buckets in creation order
+        self._rel_order: Dict[Any, int] = {}
+        self._rel_seq = 0
+        # label -> node ids; always maintained
+        self._label_index: Dict[str, set] = {}
+        # property name -> value -> node ids; only for opted-in properties
+        self._property_indexes: Dict[str, Dict[Any, set]] = {}
+        # node_id -> insertion sequence, so indexed lookups keep scan order
+        self._node_order: Dict[Any, int] = {}
+        self._node_seq = 0
+        # Bumped on index DDL so query-plan caches can detect schema changes
+        self.schema_version = 0
         self._enable_persistence = storage_backend is not None
         self._shadow_authority = shadow_authority
         logger.debug("GraphEngine initialized (persistence=%s)", self._enable_persistence)
@@ -134,7 +156,7 @@ class GraphEngine:
         )
 
         # Store in cache
-        self._node_cache[node_id] = node
+        self._put_node(node)
 
         # Persist to IPLD storage if available
         content_cid = ""
@@ -147,7 +169,7 @@ class GraphEngine:
                 }
                 cid = self.storage.store(node_data, pin=True, codec="dag-json")
                 # Store CID mapping for retrieval
-                self._node_cache[f"cid:{node_id}"] = cid
+                self._set_node_cid(node_id, cid)
                 content_cid = str(cid) if cid is not None else ""
                 logger.debug("Node %s persisted with CID: %s", node_id, cid)
             except StorageError as e:
@@ -196,7 +218,7 @@ class GraphEngine:
                         properties=node_data.get("properties", {})
                     )
                     # Cache the loaded node
-                    self._node_cache[node_id] = node
+                    self._put_node(node)
                     logger.debug("Node %s loaded from IPLD (CID: %s)", node_id, cid)
                     return node
             except (StorageError, KeyError, TypeError, ValueError) as e:
@@ -225,9 +247,10 @@ class GraphEngine:
             logger.warning("Node not found: %s", node_id)
             return None
 
-        # Update properties
+        # Update properties (re-indexing any indexed property that changes)
+        self._unindex_node(node)
         node._properties.update(properties)
-        self._node_cache[node_id] = node
+        self._put_node(node)
 
         # Update in IPLD storage if persistence is enabled
         content_cid = ""
@@ -239,7 +262,7 @@ class GraphEngine:
                     "properties": node._properties
                 }
                 cid = self.storage.store(node_data, pin=True, codec="dag-json")
-                self._node_cache[f"cid:{node_id}"] = cid
+                self._set_node_cid(node_id, cid)
                 content_cid = str(cid) if cid is not None else ""
                 logger.debug("Node %s updated in storage (CID: %s)", node_id, cid)
             except StorageError as e:
@@ -258,6 +281,46 @@ class GraphEngine:
         logger.info("Updated node: %s", node_id)
         return node
 
+    def remove_node_property(self, node_id: str, property_name: str) -> Optional[Node]:
+        """
+        Remove one property from a node, keeping property indexes current.
+
+        Args:
+            node_id: Node identifier
+            property_name: Property to remove
+
+        Returns:
+            Updated Node object or None if not found
+        """
+        node = self.get_node(node_id)
+        if not node:
+            return None
+        if property_name in node._properties:
+            self._unindex_node(node)
+            del node._properties[property_name]
+            self._index_node(node)
+        return node
+
+    def remove_node_label(self, node_id: str, label: str) -> Optional[Node]:
+        """
+        Remove one label from a node, keeping the label index current.
+
+        Args:
+            node_id: Node identifier
+            label: Label to remove
+
+        Returns:
+            Updated Node object or None if not found
+        """
+        node = self.get_node(node_id)
+        if not node:
+            return None
+        if label in node._labels:
+            self._unindex_node(node)
+            node._labels = frozenset(node._labels - {label})
+            self._index_node(node)
+        return node
+
     def delete_node(self, node_id: str) -> bool:
         """
         Delete a node.
@@ -271,12 +334,8 @@ class GraphEngine:
         if node_id not in self._node_cache:
             return False
 
-        del self._node_cache[node_id]
-
-        # Also delete CID mapping if exists
-        cid_key = f"cid:{node_id}"
-        if cid_key in self._node_cache:
-            del self._node_cache[cid_key]
+        # Drops the node, its CID mapping and its index postings.
+        self._drop_node(node_id)
 
         # Note: We don't unpin from IPFS as other references may exist
         self._emit_shadow(
@@ -316,7 +375,7 @@ class GraphEngine:
             properties=properties or {}
         )
 
-        self._relationship_cache[rel_id] = relationship
+        self._put_relationship(relationship)
 
         # Persist to IPLD storage if available
         content_cid = ""
@@ -330,7 +389,7 @@ class GraphEngine:
                     "properties": properties or {}
                 }
                 cid = self.storage.store(rel_data, pin=True, codec="dag-json")
-                self._relationship_cache[f"cid:{rel_id}"] = cid
+                self._set_relationship_cid(rel_id, cid)
                 content_cid = str(cid) if cid is not None else ""
                 logger.debug("Relationship %s persisted with CID: %s", rel_id, cid)
             except StorageError as e:
@@ -361,12 +420,8 @@ class GraphEngine:
         if rel_id not in self._relationship_cache:
             return False
 
-        del self._relationship_cache[rel_id]
-
-        # Also delete CID mapping if exists
-        cid_key = f"cid:{rel_id}"
-        if cid_key in self._relationship_cache:
-            del self._relationship_cache[cid_key]
+        # Drops the relationship, its CID mapping and its adjacency entries.
+        self._drop_relationship(rel_id)
 
         self._emit_shadow(
             "delete_relationship",
@@ -382,15 +437,45 @@ class GraphEngine:
         properties: Optional[Dict[str, Any]] = None,
         limit: Optional[int] = None
     ) -> List[Node]:
-        """Find nodes matching criteria."""
-        results = []
+        """Find nodes matching criteria.
 
-        # Filter only Node objects (exclude CID mappings)
-        for key, value in self._node_cache.items():
-            if key.startswith("cid:"):
-                continue  # Skip CID mapping entries
+        Label and indexed-property postings are intersected smallest-first;
+        predicates without an index are checked on the surviving candidates,
+        so the cost is O(matches) when every predicate is indexed. With no
+        usable index the whole node cache is scanned.
+        """
+        postings: List[set] = []
+        if labels:
+            matched: set = set()
+            for label in labels:
+                matched |= self._label_index.get(label, set())
+            postings.append(matched)
+        for key, value in (properties or {}).items():
+            index = self._property_indexes.get(key)
+            # ``None`` also matches nodes lacking the property; unhashable values
+            # cannot be posted. Both fall back to the per-candidate check below.
+            if index is None or value is None or not _is_hashable(value):
+                continue
+            postings.append(index.get(value, set()))
+
+        if postings:
+            postings.sort(key=len)
+            candidate_ids = set(postings[0])
+            for posting in postings[1:]:
+                if not candidate_ids:
+                    break
+                candidate_ids &= posting
+            ordered = sorted(candidate_ids, key=lambda nid: self._node_order.get(nid, 0))
+            candidates = [self._node_cache.get(nid) for nid in ordered]
+        else:
+            candidates = [
+                value
+                for key, value in self._node_cache.items()
+                if not (isinstance(key, str) and key.startswith("cid:"))
+            ]
 
-            node = value
+        results = []
+        for node in candidates:
             if not isinstance(node, Node):
                 continue
 
@@ -455,7 +540,7 @@ class GraphEngine:
                     labels=labels,
                     properties=properties,
                 )
-                self._node_cache[external_id] = node
+                self._put_node(node)
                 self._persist_imported_node(node)
                 node_id_map[external_id] = external_id
             else:
@@ -492,7 +577,7 @@ class GraphEngine:
                     end_node=end_node,
                     properties=properties,
                 )
-                self._relationship_cache[external_rel_id] = relationship
+                self._put_relationship(relationship)
                 self._persist_imported_relationship(relationship)
             else:
                 self.create_relationship(
@@ -510,6 +595,172 @@ class GraphEngine:
         )
         return report
 
+    # ------------------------------------------------------------------
+    # Node secondary indexes
+    # ------------------------------------------------------------------
+
+    def create_property_index(self, property_name: str) -> bool:
+        """Opt into an equality index on ``property_name`` for ``find_nodes``.
+
+        Args:
+            property_name: Property to index
+
+        Returns:
+            True if the index was created, False if it already existed
+        """
+        if property_name in self._property_indexes:
+            return False
+        index: Dict[Any, set] = {}
+        for node in self._iter_nodes():
+            value = node._properties.get(property_name)
+            if value is not None and _is_hashable(value):
+                index.setdefault(value, set()).add(node._id)
+        self._property_indexes[property_name] = index
+        self.schema_version += 1
+        logger.info("Created property index on %s (%d values)", property_name, len(index))
+        return True
+
+    def drop_property_index(self, property_name: str) -> bool:
+        """Drop an opt-in property index; returns False if it did not exist."""
+        if self._property_indexes.pop(property_name, None) is None:
+            return False
+        self.schema_version += 1
+        return True
+
+    def list_property_indexes(self) -> List[str]:
+        """Names of properties with an equality index."""
+        return sorted(self._property_indexes)
+
+    def _iter_nodes(self):
+        for key, value in self._node_cache.items():
+            if isinstance(key, str) and key.startswith("cid:"):
+                continue
+            if isinstance(value, Node):
+                yield value
+
+    def _index_node(self, node: Node) -> None:
+        """Post ``node`` into the label and property indexes."""
+        if node._id not in self._node_order:
+            self._node_seq += 1
+            self._node_order[node._id] = self._node_seq
+        for label in node._labels:
+            self._label_index.setdefault(label, set()).add(node._id)
+        for prop, index in self._property_indexes.items():
+            value = node._properties.get(prop)
+            if value is not None and _is_hashable(value):
+                index.setdefault(value, set()).add(node._id)
+
+    def _unindex_node(self, node: Node, *, forget: bool = False) -> None:
+        """Remove ``node``'s postings; ``forget`` also drops its order slot."""
+        for label in node._labels:
+            posting = self._label_index.get(label)
+            if posting is not None:
+                posting.discard(node._id)
+                if not posting:
+                    del self._label_index[label]
+        for prop, index in self._property_indexes.items():
+            value = node._properties.get(prop)
+            if value is None or not _is_hashable(value):
+                continue
+            posting = index.get(value)
+            if posting is not None:
+                posting.discard(node._id)
+                if not posting:
+                    del index[value]
+        if forget:
+            self._node_order.pop(node._id, None)
+
+    def _rebuild_node_indexes(self) -> None:
+        """Re-derive label/property indexes from ``_node_cache``."""
+        self._label_index.clear()
+        for index in self._property_indexes.values():
+            index.clear()
+        self._node_order.clear()
+        for node in self._iter_nodes():
+            self._index_node(node)
+
+    def _put_node(self, node: Node) -> None:
+        """Store ``node`` in the cache and indexes (replacing by ID)."""
+        previous = self._node_cache.get(node._id)
+        if isinstance(previous, Node) and previous is not node:
+            self._unindex_node(previous)
+        self._node_cache[node._id] = node
+        self._index_node(node)
+
+    def _drop_node(self, node_id: Any) -> None:
+        """Remove a node, its CID mapping and its index postings."""
+        node = self._node_cache.pop(node_id, None)
+        self._node_cache.pop(f"cid:{node_id}", None)
+        if isinstance(node, Node):
+            self._unindex_node(node, forget=True)
+
+    def _set_node_cid(self, node_id: Any, cid: Any) -> None:
+        """Record the storage CID for a node."""
+        self._node_cache[f"cid:{node_id}"] = cid
+
+    # ------------------------------------------------------------------
+    # Relationship adjacency maintenance
+    # ------------------------------------------------------------------
+
+    def _index_relationship(self, rel: Relationship) -> None:
+        """Add ``rel`` to the outgoing/incoming adjacency lists."""
+        self._rel_seq += 1
+        self._rel_order[rel._id] = self._rel_seq
+        for table, node_id in (
+            (self._out_adjacency, rel._start_node),
+            (self._in_adjacency, rel._end_node),
+        ):
+            table.setdefault(node_id, {}).setdefault(rel._type, {})[rel._id] = rel
+
+    def _unindex_relationship(self, rel: Relationship) -> None:
+        """Remove ``rel`` from the adjacency lists, pruning empty buckets."""
+        self._rel_order.pop(rel._id, None)
+        for table, node_id in (
+            (self._out_adjacency, rel._start_node),
+            (self._in_adjacency, rel._end_node),
+        ):
+            by_type = table.get(node_id)
+            if not by_type:
+                continue
+            bucket = by_type.get(rel._type)
+            if bucket is None:
+                continue
+            bucket.pop(rel._id, None)
+            if not bucket:
+                del by_type[rel._type]
+            if not by_type:
+                del table[node_id]
+
+    def _rebuild_adjacency(self) -> None:
+        """Re-derive the adjacency lists from ``_relationship_cache``."""
+        self._out_adjacency.clear()
+        self._in_adjacency.clear()
+        self._rel_order.clear()
+        for key, rel in self._relationship_cache.items():
+            if isinstance(key, str) and key.startswith("cid:"):
+                continue
+            if isinstance(rel, Relationship):
+                self._index_relationship(rel)
+
+    def _put_relationship(self, rel: Relationship) -> None:
+        """Store ``rel`` in the cache and adjacency lists (replacing by ID)."""
+        previous = self._relationship_cache.get(rel._id)
+        if isinstance(previous, Relationship):
+            self._unindex_relationship(previous)
+        self._relationship_cache[rel._id] = rel
+        self._index_relationship(rel)
+
+    def _drop_relationship(self, rel_id: Any) -> None:
+        """Remove a relationship, its CID mapping and its adjacency entries."""
+        rel = self._relationship_cache.pop(rel_id, None)
+        self._relationship_cache.pop(f"cid:{rel_id}", None)
+        if isinstance(rel, Relationship):
+            self._unindex_relationship(rel)
+
+    def _set_relationship_cid(self, rel_id: Any, cid: Any) -> None:
+        """Record the storage CID for a relationship."""
+        self._relationship_cache[f"cid:{rel_id}"] = cid
+
     def _generate_node_id(self) -> str:
         """Generate a unique node ID."""
         import uuid
@@ -531,7 +782,7 @@ class GraphEngine:
                 "properties": node.properties,
             }
             cid = self.storage.store(node_data, pin=True, codec="dag-json")
-            self._node_cache[f"cid:{node.id}"] = cid
+            self._set_node_cid(node.id, cid)
         except StorageError as e:
             logger.warning("Failed to persist imported node %s: %s", node.id, e)
 
@@ -548,7 +799,7 @@ class GraphEngine:
                 "properties": relationship.properties,
             }
             cid = self.storage.store(rel_data, pin=True, codec="dag-json")
-            self._relationship_cache[f"cid:{relationship.id}"] = cid
+            self._set_relationship_cid(relationship.id, cid)
         except StorageError as e:
             logger.warning(
                 "Failed to persist imported relationship %s: %s",
@@ -616,6 +867,8 @@ class GraphEngine:
             # Clear current caches
             self._node_cache.clear()
             self._relationship_cache.clear()
+            self._rebuild_adjacency()
+            self._rebuild_node_indexes()
 
             # Load nodes
             for node_data in graph_data.get("nodes", []):
@@ -624,7 +877,7 @@ class GraphEngine:
                     labels=node_data.get("labels", []),
                     properties=node_data.get("properties", {})
                 )
-                self._node_cache[node.id] = node
+                self._put_node(node)
 
             # Load relationships
             for rel_data in graph_data.get("relationships", []):
@@ -635,7 +888,7 @@ class GraphEngine:
                     end_node=rel_data["end_node"],
                     properties=rel_data.get("properties", {})
                 )
-                self._relationship_cache[rel.id] = rel
+                self._put_relationship(rel)
 
             logger.info(
                 "Graph loaded from CID: %s (%d nodes, %d relationships)",
@@ -657,32 +910,41 @@ class GraphEngine:
         direction: str = "out",
         rel_type: Optional[str] = None
     ) -> List[Relationship]:
-        """Get relationships for a node with optional filtering."""
-        results = []
-
-        for key, rel in self._relationship_cache.items():
-            if key.startswith("cid:"):
-                continue  # Skip CID mappings
-
-            if not isinstance(rel, Relationship):
-                continue
+        """Get relationships for a node with optional filtering.
 
-            match = False
-            if direction == "out" and rel._start_node == node_id:
-                match = True
-            elif direction == "in" and rel._end_node == node_id:
-                match = True
-            elif direction == "both":
-                if rel._start_node == node_id or rel._end_node == node_id:
-                    match = True
-
-            if not match:
-                continue
-
-            if rel_type and rel._type != rel_type:
+        Served from the adjacency lists in O(degree); results keep relationship
+        creation order.
+        """
+        if direction == "out":
+            tables = (self._out_adjacency,)
+        elif direction == "in":
+            tables = (self._in_adjacency,)
+        elif direction == "both":
+            tables = (self._out_adjacency, self._in_adjacency)
+        else:
+            tables = ()
+
+        buckets: List[Dict[Any, Relationship]] = []
+        for table in tables:
+            by_type = table.get(node_id)
+            if not by_type:
                 continue
-
-            results.append(rel)
+            if rel_type:
+                bucket = by_type.get(rel_type)
+                if bucket:
+                    buckets.append(bucket)
+            else:
+                buckets.extend(by_type.values())
+
+        if len(buckets) == 1:
+            results = list(buckets[0].values())
+        else:
+            # Merging across types/directions: de-duplicate self-loops and
+            # restore creation order.
+            merged: Dict[Any, Relationship] = {}
+            for bucket in buckets:
+                merged.update(bucket)
+            results = sorted(merged.values(), key=lambda r: self._rel_order.get(r._id, 0))
 
         logger.debug(
             "Found %d relationships for node %s (direction=%s, type=%s)",
@@ -764,10 +1026,10 @@ class GraphEngine:
         """Find paths between two nodes."""
         paths = []
 
-        queue = [(start_node_id, [], {start_node_id})]
+        queue = deque([(start_node_id, [], {start_node_id})])
 
         while queue:
-            current_id, path, visited = queue.pop(0)
+            current_id, path, visited = queue.popleft()
 
             if len(path) >= max_depth:
                 continue
@@ -795,6 +1057,14 @@ class GraphEngine:
         return paths
 
 
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
 def _graph_items(graph_data: Any, name: str) -> List[Any]:
     if isinstance(graph_data, dict):
         return list(graph_data.get(name, []) or [])
@@ -14,6 +14,7 @@ import itertools
 from typing import Any, Callable, Dict, List, Optional
 
 from ..neo4j_compat.result import Record
+from ..neo4j_compat.types import Relationship
 
 
 logger = logging.getLogger(__name__)
@@ -496,7 +497,7 @@ def execute_ir_operations(
                 for item in result_set[variable]:
                     node = graph_engine.get_node(item.id)
                     if node and property_name in node._properties:
-                        del node._properties[property_name]
+                        graph_engine.remove_node_property(item.id, property_name)
                         logger.debug(
                             "RemoveProperty: removed %s from node %s", property_name, item.id
                         )
@@ -509,7 +510,7 @@ def execute_ir_operations(
                 for item in result_set[variable]:
                     node = graph_engine.get_node(item.id)
                     if node and label in node._labels:
-                        node._labels = frozenset(node._labels - {label})
+                        graph_engine.remove_node_label(item.id, label)
                         logger.debug("RemoveLabel: removed label %s from node %s", label, item.id)
 
         elif op_type == "Merge":
@@ -522,6 +523,19 @@ def execute_ir_operations(
             on_create_set = op.get("on_create_set", [])
             on_match_set = op.get("on_match_set", [])
 
+            def apply_merge_set(set_items: List[Dict[str, Any]]) -> None:
+                # Node writes go through the engine so its indexes stay current.
+                for set_item in set_items:
+                    parts = set_item["property"].split(".", 1)
+                    if len(parts) == 2:
+                        var_name, prop_name = parts
+                        val = resolve_value(set_item["value"], parameters)
+                        for item in result_set.get(var_name, []):
+                            if isinstance(item, Relationship):
+                                item._properties[prop_name] = val
+                            elif hasattr(item, "_properties"):
+                                graph_engine.update_node(item.id, {prop_name: val})
+
             # ------------------------------------------------------------------
             # Run the match sub-program on a fresh temporary result_set.
             # Because match_ops typically end with ScanLabel+Filter (no Project),
@@ -572,14 +586,7 @@ def execute_ir_operations(
                 for key, vals in merged_result_set.items():
                     result_set.setdefault(key, []).extend(vals)
                 # Apply ON MATCH SET
-                for set_item in on_match_set:
-                    parts = set_item["property"].split(".", 1)
-                    if len(parts) == 2:
-                        var_name, prop_name = parts
-                        val = resolve_value(set_item["value"], parameters)
-                        for node in result_set.get(var_name, []):
-                            if hasattr(node, "_properties"):
-                                node._properties[prop_name] = val
+                apply_merge_set(on_match_set)
             else:
                 # No match — execute CREATE ops
                 logger.debug("Merge: pattern not found, creating")
@@ -616,14 +623,7 @@ def execute_ir_operations(
                                 result_set[c_var] = [rel]
                                 logger.debug("Merge(create): created rel %s", rel.id)
                 # Apply ON CREATE SET
-                for set_item in on_create_set:
-                    parts = set_item["property"].split(".", 1)
-                    if len(parts) == 2:
-                        var_name, prop_name = parts
-                        val = resolve_value(set_item["value"], parameters)
-                        for node in result_set.get(var_name, []):
-                            if hasattr(node, "_properties"):
-                                node._properties[prop_name] = val
+                apply_merge_set(on_create_set)
 
         elif op_type == "Unwind":
             # UNWIND <expr> AS <variable>
@@ -1,27 +1,33 @@
 """
 B-tree Index Implementation
 
-This module provides B-tree indexes for fast property lookups.
+This module provides B+tree indexes for fast property lookups. Entries live
+only in the leaves, and leaves are linked to their right sibling so a range
+scan is a single descent followed by a sequential leaf walk.
 """
 
 import bisect
 import logging
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from .types import IndexDefinition, IndexEntry, IndexStats, IndexType
 
 logger = logging.getLogger(__name__)
 
+# Default fanout; wide nodes keep the tree shallow for large graphs
+DEFAULT_MAX_KEYS = 256
+
 
 class BTreeNode:
     """
-    A node in the B-tree.
+    A node in the B+tree.
 
     Attributes:
-        keys: Sorted list of keys
+        keys: Sorted list of keys (separators for internal nodes)
         children: Child nodes (for internal nodes)
         entries: Index entries (for leaf nodes)
         is_leaf: Whether this is a leaf node
+        next: Right sibling leaf (for leaf nodes)
     """
 
     def __init__(self, is_leaf: bool = True, max_keys: int = 4):
@@ -37,6 +43,7 @@ class BTreeNode:
         self.entries: Dict[Any, List[IndexEntry]] = {}
         self.is_leaf = is_leaf
         self.max_keys = max_keys
+        self.next: Optional["BTreeNode"] = None
 
     def is_full(self) -> bool:
         """Check if node is full."""
@@ -50,9 +57,8 @@ class BTreeNode:
             key: Key to insert
             entry: Entry to insert
         """
-        i = bisect.bisect_left(self.keys, key)
-
         if self.is_leaf:
+            i = bisect.bisect_left(self.keys, key)
             # Insert into leaf node
             if i < len(self.keys) and self.keys[i] == key:
                 # Key exists - add to entries list
@@ -64,10 +70,11 @@ class BTreeNode:
                 self.keys.insert(i, key)
                 self.entries[key] = [entry]
         else:
-            # Recurse to child
+            # Keys equal to a separator live in its right subtree
+            i = bisect.bisect_right(self.keys, key)
             if self.children[i].is_full():
                 self._split_child(i)
-                if key > self.keys[i]:
+                if key >= self.keys[i]:
                     i += 1
             self.children[i].insert_non_full(key, entry)
 
@@ -83,7 +90,7 @@ class BTreeNode:
         1. Create a new sibling node with same properties (leaf/internal)
         2. Find the middle key (mid = max_keys // 2)
         3. Move second half of keys (mid+1 onwards) to new sibling
-        4. If leaf node: move corresponding entries
+        4. If leaf node: move corresponding entries and link the new sibling
         5. If internal node: move corresponding children pointers
         6. Promote middle key to parent at the specified index
         7. Insert new sibling as next child after promoted key
@@ -125,7 +132,10 @@ class BTreeNode:
             new_child.keys = full_child.keys[mid:]  # includes mid
             full_child.keys = full_child.keys[:mid]  # excludes mid
             for key in new_child.keys:
-                new_child.entries[key] = full_child.entries.pop(key)
+                if key in full_child.entries:
+                    new_child.entries[key] = full_child.entries.pop(key)
+            new_child.next = full_child.next
+            full_child.next = new_child
         else:
             # Internal node split: mid key is promoted; it leaves neither child.
             new_child.keys = full_child.keys[mid + 1 :]
@@ -137,6 +147,21 @@ class BTreeNode:
         self.keys.insert(index, mid_key)
         self.children.insert(index + 1, new_child)
 
+    def find_leaf(self, key: Any) -> "BTreeNode":
+        """
+        Descend to the leaf that holds (or would hold) ``key``.
+
+        Args:
+            key: Key to locate
+
+        Returns:
+            Leaf node
+        """
+        node = self
+        while not node.is_leaf:
+            node = node.children[bisect.bisect_right(node.keys, key)]
+        return node
+
     def search(self, key: Any) -> List[IndexEntry]:
         """
         Search for a key in the tree.
@@ -147,24 +172,20 @@ class BTreeNode:
         Returns:
             List of matching index entries
         """
-        i = bisect.bisect_left(self.keys, key)
-
-        if self.is_leaf:
-            if i < len(self.keys) and self.keys[i] == key:
-                return self.entries.get(key, [])
-            return []
-        else:
-            # Recurse to child
-            if i < len(self.keys) and self.keys[i] == key:
-                # Found in internal node, go to right child
-                return self.children[i + 1].search(key)
-            else:
-                return self.children[i].search(key)
+        leaf = self.find_leaf(key)
+        i = bisect.bisect_left(leaf.keys, key)
+        if i < len(leaf.keys) and leaf.keys[i] == key:
+            return leaf.entries.get(key, [])
+        return []
 
     def range_search(self, start: Any, end: Any) -> List[IndexEntry]:
         """
         Search for keys in a range.
 
+        Descends once to the leaf containing ``start`` and then follows the
+        sibling links until a key past ``end`` is seen, so results come back
+        in key order.
+
         Args:
             start: Start of range (inclusive)
             end: End of range (inclusive)
@@ -172,29 +193,36 @@ class BTreeNode:
         Returns:
             List of matching index entries
         """
-        result = []
+        result: List[IndexEntry] = []
+        leaf: Optional[BTreeNode] = self.find_leaf(start)
+        i = bisect.bisect_left(leaf.keys, start)
+        while leaf is not None:
+            keys = leaf.keys
+            while i < len(keys):
+                key = keys[i]
+                if key > end:
+                    return result
+                result.extend(leaf.entries.get(key, []))
+                i += 1
+            leaf = leaf.next
+            i = 0
+        return result
 
-        if self.is_leaf:
-            for key in self.keys:
-                if start <= key <= end:
-                    result.extend(self.entries.get(key, []))
-        else:
-            for i, key in enumerate(self.keys):
-                if key < start:
-                    continue
-                elif key > end:
-                    break
-                else:
-                    # Key in range - check both sides
-                    result.extend(self.children[i].range_search(start, end))
-                    result.extend(self.children[i + 1].range_search(start, end))
-                    break
-            else:
-                # Check last child
-                if len(self.children) > 0:
-                    result.extend(self.children[-1].range_search(start, end))
+    def iter_leaves(self):
+        """Yield leaves left to right, starting from this subtree's leftmost leaf."""
+        node = self
+        while not node.is_leaf:
+            node = node.children[0]
+        while node is not None:
+            yield node
+            node = node.next
 
-        return result
+
+def _chunk_sizes(total: int, capacity: int) -> List[int]:
+    """Split ``total`` items into the fewest groups of at most ``capacity``, evenly."""
+    groups = max(1, -(-total // capacity))
+    size, extra = divmod(total, groups)
+    return [size + 1 if g < extra else size for g in range(groups)]
 
 
 class BTreeIndex:
@@ -203,11 +231,12 @@ class BTreeIndex:
 
     Supports:
     - Point lookups (exact match)
-    - Range queries
+    - Range queries (single descent + leaf walk)
     - Multiple values per key
+    - Bulk loading from (optionally pre-sorted) input
     """
 
-    def __init__(self, definition: IndexDefinition, max_keys: int = 4):
+    def __init__(self, definition: IndexDefinition, max_keys: int = DEFAULT_MAX_KEYS):
         """
         Initialize B-tree index.
 
@@ -243,6 +272,98 @@ class BTreeIndex:
         self._entry_count += 1
         self._unique_keys.add(key)
 
+    def bulk_load(
+        self,
+        items: Iterable[Tuple[Any, ...]],
+        presorted: bool = False,
+    ) -> int:
+        """
+        Build the tree bottom-up from ``(key, entity_id[, metadata])`` tuples.
+
+        Leaves are packed one key short of full and the internal levels are
+        built over them, so loading n entries costs one sort plus O(n)
+        rather than n root-to-leaf inserts. Existing entries are kept.
+
+        Args:
+            items: Tuples of key, entity ID and optional metadata dict
+            presorted: Skip sorting when ``items`` are already in key order
+
+        Returns:
+            Number of entries loaded
+        """
+        new_entries = [
+            IndexEntry(
+                key=item[0],
+                entity_id=item[1],
+                metadata=(item[2] if len(item) > 2 and item[2] else {}),
+            )
+            for item in items
+        ]
+        loaded = len(new_entries)
+        if not loaded:
+            return 0
+        if not presorted:
+            new_entries.sort(key=lambda entry: entry.key)
+
+        keys: List[Any] = []
+        grouped: List[List[IndexEntry]] = []
+        if self._entry_count:
+            # Merge with the current contents; both sides are key-ordered
+            merged = [
+                entry
+                for leaf in self.root.iter_leaves()
+                for key in leaf.keys
+                for entry in leaf.entries.get(key, [])
+            ]
+            merged.extend(new_entries)
+            merged.sort(key=lambda entry: entry.key)
+            new_entries = merged
+        for entry in new_entries:
+            if keys and keys[-1] == entry.key:
+                grouped[-1].append(entry)
+            else:
+                keys.append(entry.key)
+                grouped.append([entry])
+
+        # Leaf level
+        capacity = max(1, self.max_keys - 1)
+        level: List[BTreeNode] = []
+        low_keys: List[Any] = []
+        pos = 0
+        previous: Optional[BTreeNode] = None
+        for size in _chunk_sizes(len(keys), capacity):
+            leaf = BTreeNode(is_leaf=True, max_keys=self.max_keys)
+            leaf.keys = keys[pos : pos + size]
+            leaf.entries = dict(zip(leaf.keys, grouped[pos : pos + size]))
+            if previous is not None:
+                previous.next = leaf
+            previous = leaf
+            level.append(leaf)
+            low_keys.append(leaf.keys[0])
+            pos += size
+
+        # Internal levels; each node gets at most max_keys children so it
+        # has room for one more separator before the next insert splits it
+        fanout = max(2, self.max_keys)
+        while len(level) > 1:
+            parents: List[BTreeNode] = []
+            parent_low: List[Any] = []
+            pos = 0
+            for size in _chunk_sizes(len(level), fanout):
+                node = BTreeNode(is_leaf=False, max_keys=self.max_keys)
+                node.children = level[pos : pos + size]
+                node.keys = low_keys[pos + 1 : pos + size]
+                parents.append(node)
+                parent_low.append(low_keys[pos])
+                pos += size
+            level, low_keys = parents, parent_low
+
+        self.root = level[0]
+        self._entry_count = len(new_entries)
+        self._unique_keys = set(keys)
+        logger.debug("Bulk-loaded %d entries into %s", loaded, self.definition.name)
+        return loaded
+
     def search(self, key: Any) -> List[str]:
         """
         Search for entities with the given key.
@@ -268,7 +389,7 @@ class BTreeIndex:
             List of entity IDs
         """
         entries = self.root.range_search(start, end)
-        return list(set(entry.entity_id for entry in entries))
+        return list(dict.fromkeys(entry.entity_id for entry in entries))
 
     def get_stats(self) -> IndexStats:
         """
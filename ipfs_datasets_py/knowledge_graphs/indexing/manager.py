@@ -5,7 +5,7 @@ This module manages all indexes for the knowledge graph.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 from .types import IndexDefinition, IndexStats, IndexType
 from .btree import BTreeIndex, PropertyIndex, LabelIndex, CompositeIndex
@@ -32,35 +32,51 @@ class IndexManager:
         self.label_index = LabelIndex()
         self.indexes["idx_labels"] = self.label_index
 
-    def create_property_index(self, property_name: str, label: Optional[str] = None) -> str:
+    def create_property_index(
+        self,
+        property_name: str,
+        label: Optional[str] = None,
+        entities: Optional[Iterable[Dict[str, Any]]] = None,
+    ) -> str:
         """
         Create index on a property.
 
         Args:
             property_name: Property to index
             label: Optional label filter
+            entities: Optional existing entities to bulk-load into the index
 
         Returns:
             Index name
         """
         index = PropertyIndex(property_name, label)
         self.indexes[index.definition.name] = index
+        if entities is not None:
+            self.build_index(index.definition.name, entities)
         logger.info(f"Created property index: {index.definition.name}")
         return index.definition.name
 
-    def create_composite_index(self, property_names: List[str], label: Optional[str] = None) -> str:
+    def create_composite_index(
+        self,
+        property_names: List[str],
+        label: Optional[str] = None,
+        entities: Optional[Iterable[Dict[str, Any]]] = None,
+    ) -> str:
         """
         Create composite index on multiple properties.
 
         Args:
             property_names: Properties to index
             label: Optional label filter
+            entities: Optional existing entities to bulk-load into the index
 
         Returns:
             Index name
         """
         index = CompositeIndex(property_names, label)
         self.indexes[index.definition.name] = index
+        if entities is not None:
+            self.build_index(index.definition.name, entities)
         logger.info(f"Created composite index: {index.definition.name}")
         return index.definition.name
 
@@ -112,19 +128,27 @@ class IndexManager:
         logger.info(f"Created vector index: {index.definition.name}")
         return index.definition.name
 
-    def create_range_index(self, property_name: str, label: Optional[str] = None) -> str:
+    def create_range_index(
+        self,
+        property_name: str,
+        label: Optional[str] = None,
+        entities: Optional[Iterable[Dict[str, Any]]] = None,
+    ) -> str:
         """
         Create range index.
 
         Args:
             property_name: Property to index
             label: Optional label filter
+            entities: Optional existing entities to bulk-load into the index
 
         Returns:
             Index name
         """
         index = RangeIndex(property_name, label)
         self.indexes[index.definition.name] = index
+        if entities is not None:
+            self.build_index(index.definition.name, entities)
         logger.info(f"Created range index: {index.definition.name}")
         return index.definition.name
 
@@ -149,6 +173,40 @@ class IndexManager:
 
         return False
 
+    def build_index(self, name: str, entities: Iterable[Dict[str, Any]]) -> int:
+        """
+        Populate an index from existing entities.
+
+        B-tree family indexes are bulk-loaded bottom-up (one sort, no
+        per-entity root-to-leaf inserts); other index types fall back to
+        inserting entity by entity.
+
+        Args:
+            name: Index name
+            entities: Entity dictionaries with id, type, and properties
+
+        Returns:
+            Number of index entries added
+
+        Raises:
+            KeyError: If no index with that name exists
+        """
+        index = self.indexes[name]
+        if isinstance(index, BTreeIndex):
+            items = (
+                (key, entity["id"])
+                for entity in entities
+                if self._matches_label(index, entity)
+                for key in self._btree_keys(index, entity)
+            )
+            return index.bulk_load(items)
+
+        before = index.get_stats().entry_count
+        for entity in entities:
+            if self._matches_label(index, entity):
+                self._insert_into(index, entity)
+        return index.get_stats().entry_count - before
+
     def get_index(self, name: str) -> Optional[Any]:
         """
         Get an index by name.
@@ -197,7 +255,6 @@ class IndexManager:
         """
         entity_id = entity["id"]
         entity_type = entity.get("type", "Thing")
-        properties = entity.get("properties", {})
 
         # Insert into label index
         self.label_index.insert(entity_type, entity_id)
@@ -208,53 +265,74 @@ class IndexManager:
                 continue
 
             # Check if entity matches index label filter
-            if index.definition.label and index.definition.label != entity_type:
+            if not self._matches_label(index, entity):
                 continue
 
-            if isinstance(index, PropertyIndex):
-                # Single property index
-                prop_name = index.property_name
-                if prop_name in properties:
-                    value = properties[prop_name]
-                    index.insert(value, entity_id)
-
-            elif isinstance(index, CompositeIndex):
-                # Composite index
-                values = []
-                for prop_name in index.property_names:
-                    if prop_name not in properties:
-                        break
-                    values.append(properties[prop_name])
-                else:
-                    # All properties present
-                    index.insert_composite(values, entity_id)
-
-            elif isinstance(index, FullTextIndex):
-                # Full-text index
-                prop_name = index.property_name
-                if prop_name in properties:
-                    text = str(properties[prop_name])
-                    index.insert(text, entity_id)
-
-            elif isinstance(index, SpatialIndex):
-                # Spatial index
-                prop_name = index.property_name
-                if prop_name in properties:
-                    coords = properties[prop_name]
-                    if isinstance(coords, (list, tuple)) and len(coords) == 2:
-                        index.insert(tuple(coords), entity_id)
-
-            elif isinstance(index, VectorIndex):
-                # Vector index
-                prop_name = index.property_name
-                if prop_name in properties:
-                    vector = properties[prop_name]
-                    if isinstance(vector, list):
-                        index.insert(vector, entity_id)
-
-            elif isinstance(index, (RangeIndex, BTreeIndex)):
-                # Range or B-tree index
-                for prop_name in index.definition.properties:
-                    if prop_name in properties:
-                        value = properties[prop_name]
-                        index.insert(value, entity_id)
+            self._insert_into(index, entity)
+
+    @staticmethod
+    def _matches_label(index: Any, entity: Dict[str, Any]) -> bool:
+        """Whether ``entity`` passes the index's optional label filter."""
+        label = index.definition.label
+        return not label or label == entity.get("type", "Thing")
+
+    def _btree_keys(self, index: BTreeIndex, entity: Dict[str, Any]) -> List[Any]:
+        """Keys ``entity`` contributes to a B-tree family index."""
+        properties = entity.get("properties", {})
+
+        if index is self.label_index:
+            return [entity.get("type", "Thing")]
+
+        if isinstance(index, PropertyIndex):
+            # Single property index
+            if index.property_name in properties:
+                return [properties[index.property_name]]
+            return []
+
+        if isinstance(index, CompositeIndex):
+            # Composite index: only when all properties are present
+            values = []
+            for prop_name in index.property_names:
+                if prop_name not in properties:
+                    return []
+                values.append(properties[prop_name])
+            return [tuple(values)]
+
+        # Range or plain B-tree index
+        return [
+            properties[prop_name]
+            for prop_name in index.definition.properties
+            if prop_name in properties
+        ]
+
+    def _insert_into(self, index: Any, entity: Dict[str, Any]):
+        """Insert ``entity`` into a single index (label filter already applied)."""
+        entity_id = entity["id"]
+        properties = entity.get("properties", {})
+
+        if isinstance(index, BTreeIndex):
+            for key in self._btree_keys(index, entity):
+                index.insert(key, entity_id)
+
+        elif isinstance(index, FullTextIndex):
+            # Full-text index
+            prop_name = index.property_name
+            if prop_name in properties:
+                text = str(properties[prop_name])
+                index.insert(text, entity_id)
+
+        elif isinstance(index, SpatialIndex):
+            # Spatial index
+            prop_name = index.property_name
+            if prop_name in properties:
+                coords = properties[prop_name]
+                if isinstance(coords, (list, tuple)) and len(coords) == 2:
+                    index.insert(tuple(coords), entity_id)
+
+        elif isinstance(index, VectorIndex):
+            # Vector index
+            prop_name = index.property_name
+            if prop_name in properties:
+                vector = properties[prop_name]
+                if isinstance(vector, list):
+                    index.insert(vector, entity_id)
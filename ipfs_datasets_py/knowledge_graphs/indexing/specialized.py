@@ -8,6 +8,7 @@ This module provides specialized index types:
 - Range indexes
 """
 
+import heapq
 import logging
 import math
 from typing import Any, Dict, List, Optional, Set, Tuple
@@ -15,23 +16,40 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 from .types import IndexDefinition, IndexEntry, IndexStats, IndexType
 from .btree import BTreeIndex
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
 class FullTextIndex:
     """
-    Full-text search index using inverted index.
+    Full-text search index using an inverted index with BM25 ranking.
 
-    Tokenizes text and creates term-to-entity mappings.
+    Postings store per-entity term frequencies alongside document lengths,
+    so scoring never re-reads the source text. Multi-term queries use
+    MaxScore-style pruning: once the current top-k threshold exceeds what
+    the remaining terms could add, documents not already in contention
+    are skipped and hopeless candidates are dropped.
     """
 
-    def __init__(self, property_name: str, label: Optional[str] = None):
+    def __init__(
+        self,
+        property_name: str,
+        label: Optional[str] = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
         """
         Initialize full-text index.
 
         Args:
             property_name: Property to index
             label: Optional label filter
+            k1: BM25 term-frequency saturation
+            b: BM25 document-length normalization (0 disables it)
         """
         self.definition = IndexDefinition(
             name=f"idx_fulltext_{property_name}",
@@ -40,36 +58,88 @@ class FullTextIndex:
             label=label,
         )
         self.property_name = property_name
+        self.k1 = k1
+        self.b = b
+
+        # Postings: term -> {entity_id: term frequency}
+        self.postings: Dict[str, Dict[str, int]] = {}
+
+        # Document lengths (in tokens) and the distinct terms of each document
+        self.doc_lengths: Dict[str, int] = {}
+        self._doc_terms: Dict[str, Tuple[str, ...]] = {}
+        self._total_length = 0
 
-        # Inverted index: term -> set of entity IDs
-        self.inverted_index: Dict[str, Set[str]] = {}
+        # Largest term frequency per term, for score upper bounds; a term is
+        # dropped from here (and recomputed lazily) when its max is removed
+        self._max_tf: Dict[str, int] = {}
 
-        # Document frequencies for TF-IDF
-        self.doc_frequencies: Dict[str, int] = {}
-        self.total_docs = 0
+    @property
+    def inverted_index(self) -> Dict[str, Set[str]]:
+        """Term to entity-ID set view of the postings."""
+        return {term: set(docs) for term, docs in self.postings.items()}
+
+    @property
+    def doc_frequencies(self) -> Dict[str, int]:
+        """Number of indexed entities containing each term."""
+        return {term: len(docs) for term, docs in self.postings.items()}
+
+    @property
+    def total_docs(self) -> int:
+        """Number of indexed entities."""
+        return len(self.doc_lengths)
 
     def insert(self, text: str, entity_id: str):
         """
-        Index text for an entity.
+        Index text for an entity, replacing any text indexed for it before.
 
         Args:
             text: Text to index
             entity_id: Entity ID
         """
+        if entity_id in self.doc_lengths:
+            self.remove(entity_id)
+
         # Tokenize
         tokens = self._tokenize(text)
+        counts: Dict[str, int] = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
 
-        # Add to inverted index
-        for token in set(tokens):
-            if token not in self.inverted_index:
-                self.inverted_index[token] = set()
-                self.doc_frequencies[token] = 0
+        # Add to postings
+        for token, tf in counts.items():
+            self.postings.setdefault(token, {})[entity_id] = tf
+            if token in self._max_tf and tf > self._max_tf[token]:
+                self._max_tf[token] = tf
 
-            if entity_id not in self.inverted_index[token]:
-                self.inverted_index[token].add(entity_id)
-                self.doc_frequencies[token] += 1
+        self.doc_lengths[entity_id] = len(tokens)
+        self._doc_terms[entity_id] = tuple(counts)
+        self._total_length += len(tokens)
 
-        self.total_docs += 1
+    def remove(self, entity_id: str) -> bool:
+        """
+        Remove an entity from the index.
+
+        Args:
+            entity_id: Entity ID
+
+        Returns:
+            True if removed, False if it was not indexed
+        """
+        length = self.doc_lengths.pop(entity_id, None)
+        if length is None:
+            return False
+
+        for token in self._doc_terms.pop(entity_id):
+            docs = self.postings[token]
+            tf = docs.pop(entity_id)
+            if not docs:
+                del self.postings[token]
+                self._max_tf.pop(token, None)
+            elif self._max_tf.get(token) == tf:
+                del self._max_tf[token]
+
+        self._total_length -= length
+        return True
 
     def search(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
         """
@@ -85,27 +155,80 @@ class FullTextIndex:
         # Tokenize query
         query_tokens = self._tokenize(query)
 
-        if not query_tokens:
+        if not query_tokens or limit <= 0:
             return []
 
-        # Find candidate documents
-        candidates: Set[str] = set()
+        # Query-term weights; repeated query terms count repeatedly
+        weights: Dict[str, float] = {}
         for token in query_tokens:
-            if token in self.inverted_index:
-                candidates.update(self.inverted_index[token])
+            if token in self.postings:
+                weights[token] = weights.get(token, 0.0) + self._idf(token)
 
-        if not candidates:
+        if not weights:
             return []
 
-        # Score candidates using TF-IDF
-        scores: Dict[str, float] = {}
-        for entity_id in candidates:
-            score = self._calculate_score(entity_id, query_tokens)
-            scores[entity_id] = score
+        avgdl = self._total_length / len(self.doc_lengths) or 1.0
+        bounds = {term: weight * self._tf_bound(term) for term, weight in weights.items()}
+        terms = sorted(weights, key=lambda term: bounds[term], reverse=True)
+        remaining = sum(bounds.values())
 
-        # Sort by score and return top results
-        results = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        return results[:limit]
+        scores: Dict[str, float] = {}
+        for term in terms:
+            remaining -= bounds[term]
+            weight = weights[term]
+            docs = self.postings[term]
+
+            threshold = self._threshold(scores, limit)
+            if threshold > bounds[term] + remaining:
+                # No unseen document can reach the top-k any more: only
+                # update current candidates and drop the hopeless ones
+                for entity_id in list(scores):
+                    tf = docs.get(entity_id)
+                    if tf is not None:
+                        scores[entity_id] += weight * self._tf_norm(tf, entity_id, avgdl)
+                    if scores[entity_id] + remaining < threshold:
+                        del scores[entity_id]
+            else:
+                # Inlined _tf_norm: this loop touches every posting of the term
+                lengths = self.doc_lengths
+                scale = weight * (self.k1 + 1.0)
+                base = self.k1 * (1.0 - self.b)
+                per_token = self.k1 * self.b / avgdl
+                get = scores.get
+                for entity_id, tf in docs.items():
+                    scores[entity_id] = get(entity_id, 0.0) + scale * tf / (
+                        tf + base + per_token * lengths[entity_id]
+                    )
+
+        # Highest score first; ties break on entity ID for stable results
+        return heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+
+    @staticmethod
+    def _threshold(scores: Dict[str, float], limit: int) -> float:
+        """Score of the current k-th best candidate (-inf with fewer than k)."""
+        if len(scores) < limit:
+            return float("-inf")
+        return heapq.nlargest(limit, scores.values())[-1]
+
+    def _idf(self, token: str) -> float:
+        """BM25 inverse document frequency (non-negative variant)."""
+        df = len(self.postings.get(token, ()))
+        n = len(self.doc_lengths)
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+    def _tf_norm(self, tf: int, entity_id: str, avgdl: float) -> float:
+        """BM25 saturated, length-normalized term frequency."""
+        norm = 1.0 - self.b + self.b * self.doc_lengths[entity_id] / avgdl
+        return tf * (self.k1 + 1.0) / (tf + self.k1 * norm)
+
+    def _tf_bound(self, token: str) -> float:
+        """Upper bound of ``_tf_norm`` over every posting of ``token``."""
+        max_tf = self._max_tf.get(token)
+        if max_tf is None:
+            max_tf = max(self.postings[token].values())
+            self._max_tf[token] = max_tf
+        # Document length only shrinks the value, so assume length zero
+        return max_tf * (self.k1 + 1.0) / (max_tf + self.k1 * (1.0 - self.b))
 
     def _tokenize(self, text: str) -> List[str]:
         """
@@ -133,76 +256,46 @@ class FullTextIndex:
 
     def _calculate_score(self, entity_id: str, query_tokens: List[str]) -> float:
         """
-        Calculate TF-IDF relevance score for an entity given query tokens.
-
-        Uses the classic TF-IDF (Term Frequency-Inverse Document Frequency) ranking
-        function to measure how relevant an entity's indexed text is to a query.
+        Calculate the BM25 relevance score for an entity given query tokens.
 
         Formula:
-            score = Σ (TF(term) × IDF(term)) for each query term
+            score = Σ IDF(term) × tf × (k1 + 1) / (tf + k1 × (1 - b + b × |d| / avgdl))
 
         Where:
-        - TF (Term Frequency): 1.0 if term appears in entity (simplified binary)
-        - IDF (Inverse Document Frequency): log((N + 1) / (df + 1))
-          - N = total number of indexed documents
-          - df = number of documents containing the term
+        - tf: stored frequency of the term in the entity's text
+        - |d|: entity's text length in tokens; avgdl: mean length over the index
+        - IDF: log(1 + (N - df + 0.5) / (df + 0.5)), N indexed entities and
+          df entities containing the term
 
-        Higher scores indicate better matches. Rare terms that appear in few documents
-        contribute more to the score (higher IDF), while common terms contribute less.
+        Repeated query tokens contribute repeatedly. ``search`` computes the
+        same score for every candidate, with pruning.
 
         Args:
             entity_id: ID of the entity being scored
             query_tokens: Tokenized query terms (lowercased, stop words removed)
 
         Returns:
-            Non-negative float score. Typical range: 0.0 to 10.0 for single-term queries,
-            higher for multi-term queries. Zero means no matching terms found.
-
-        Example:
-            >>> # Entity "Python" indexed with text "Python programming language"
-            >>> score = self._calculate_score(
-            ...     entity_id="entity_python",
-            ...     query_tokens=["python", "programming"]
-            ... )
-            >>> print(f"Score: {score:.2f}")
-            Score: 8.45
-            >>>
-            >>> # Query with no matches
-            >>> score = self._calculate_score(
-            ...     entity_id="entity_python",
-            ...     query_tokens=["javascript", "node"]
-            ... )
-            >>> print(f"Score: {score:.2f}")
-            Score: 0.00
-
-        Note:
-            This is a simplified TF-IDF implementation. Production systems might use:
-            - Sublinear TF scaling: 1 + log(term_freq)
-            - Length normalization: divide by document length
-            - BM25 algorithm for better ranking
+            Non-negative float score; zero means no matching terms found.
         """
-        score = 0.0
+        if entity_id not in self.doc_lengths:
+            return 0.0
 
+        avgdl = self._total_length / len(self.doc_lengths) or 1.0
+        score = 0.0
         for token in query_tokens:
-            if token in self.inverted_index and entity_id in self.inverted_index[token]:
-                # TF: term frequency (simplified - just presence)
-                tf = 1.0
-
-                # IDF: inverse document frequency
-                df = self.doc_frequencies.get(token, 1)
-                idf = math.log((self.total_docs + 1) / (df + 1))
-
-                score += tf * idf
+            tf = self.postings.get(token, {}).get(entity_id)
+            if tf:
+                score += self._idf(token) * self._tf_norm(tf, entity_id, avgdl)
 
         return score
 
     def get_stats(self) -> IndexStats:
         """Get index statistics."""
-        total_entries = sum(len(docs) for docs in self.inverted_index.values())
+        total_entries = sum(len(docs) for docs in self.postings.values())
         return IndexStats(
             name=self.definition.name,
             entry_count=total_entries,
-            unique_keys=len(self.inverted_index),
+            unique_keys=len(self.postings),
             memory_bytes=total_entries * 50,  # Rough estimate
         )
 
@@ -329,16 +422,32 @@ class VectorIndex:
     """
     Vector index for similarity search on embeddings.
 
-    Uses simple cosine similarity for now (can be extended to HNSW/FAISS).
+    With NumPy available, vectors live in a growable float32 matrix of
+    pre-normalized rows, so cosine similarity is a single matrix-vector
+    product and top-k uses ``argpartition``. Deleted rows go on a free list
+    and are reused by later inserts. Passing ``storage_path`` backs the
+    matrix with a memory-mapped scratch file instead of RAM; the file is
+    not a persistence format and any existing contents are overwritten. Without NumPy
+    the index falls back to pure-Python cosine similarity over a dict.
     """
 
-    def __init__(self, property_name: str, dimension: int):
+    _INITIAL_CAPACITY = 64
+
+    def __init__(
+        self,
+        property_name: str,
+        dimension: int,
+        storage_path: Optional[str] = None,
+    ):
         """
         Initialize vector index.
 
         Args:
             property_name: Property containing vectors
             dimension: Vector dimension
+            storage_path: Optional file to memory-map the vector matrix onto
+                (requires NumPy; used as scratch space, so an existing
+                file is overwritten rather than loaded)
         """
         self.definition = IndexDefinition(
             name=f"idx_vector_{property_name}",
@@ -348,24 +457,133 @@ class VectorIndex:
         )
         self.property_name = property_name
         self.dimension = dimension
-
-        # Store vectors
-        self.vectors: Dict[str, List[float]] = {}
+        self.storage_path = storage_path
+
+        if storage_path is not None and np is None:
+            raise ImportError("numpy is required for a memory-mapped VectorIndex")
+
+        # Pure-Python fallback store (only used without NumPy)
+        self._vectors: Dict[str, List[float]] = {}
+
+        # Matrix store: row -> entity id, entity id -> row, reusable rows
+        self._ids: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._matrix = None
+        self._norms = None
+        self._live = None
+        if np is not None:
+            self._allocate(self._INITIAL_CAPACITY)
+
+    def __len__(self) -> int:
+        return len(self._rows) if np is not None else len(self._vectors)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in (self._rows if np is not None else self._vectors)
+
+    @property
+    def vectors(self) -> Dict[str, List[float]]:
+        """Indexed vectors by entity ID (materialized copy when matrix-backed)."""
+        if np is None:
+            return self._vectors
+        return {entity_id: self.get_vector(entity_id) for entity_id in self._rows}
+
+    def _allocate(self, capacity: int):
+        """Grow (or create) the backing matrix to hold ``capacity`` rows."""
+        used = len(self._ids)
+        if self.storage_path is None:
+            matrix = np.zeros((capacity, self.dimension), dtype=np.float32)
+            if self._matrix is not None:
+                matrix[:used] = self._matrix[:used]
+        else:
+            if self._matrix is not None:
+                self._matrix.flush()
+            self._matrix = None
+            # The file is scratch space owned by this index: created (or
+            # overwritten) on first allocation, then grown in place
+            mode = "r+" if used else "w+"
+            if used:
+                with open(self.storage_path, "r+b") as handle:
+                    handle.truncate(capacity * self.dimension * 4)
+            matrix = np.memmap(
+                self.storage_path, dtype=np.float32, mode=mode, shape=(capacity, self.dimension)
+            )
+        norms = np.zeros(capacity, dtype=np.float32)
+        live = np.zeros(capacity, dtype=bool)
+        if self._norms is not None:
+            norms[:used] = self._norms[:used]
+            live[:used] = self._live[:used]
+        self._matrix, self._norms, self._live = matrix, norms, live
+
+    def _check_dimension(self, vector: Any):
+        if len(vector) != self.dimension:
+            raise ValueError(
+                f"Vector dimension mismatch: expected {self.dimension}, got {len(vector)}"
+            )
 
     def insert(self, vector: List[float], entity_id: str):
         """
-        Index vector for an entity.
+        Index vector for an entity, replacing any previous vector.
 
         Args:
             vector: Embedding vector
             entity_id: Entity ID
         """
-        if len(vector) != self.dimension:
-            raise ValueError(
-                f"Vector dimension mismatch: expected {self.dimension}, got {len(vector)}"
-            )
+        self._check_dimension(vector)
+
+        if np is None:
+            self._vectors[entity_id] = vector
+            return
+
+        row = self._rows.get(entity_id)
+        if row is None:
+            if self._free:
+                row = self._free.pop()
+                self._ids[row] = entity_id
+            else:
+                row = len(self._ids)
+                if row >= self._matrix.shape[0]:
+                    self._allocate(self._matrix.shape[0] * 2)
+                self._ids.append(entity_id)
+            self._rows[entity_id] = row
+
+        values = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(values))
+        self._matrix[row] = values / norm if norm > 0 else 0.0
+        self._norms[row] = norm
+        self._live[row] = True
+
+    def remove(self, entity_id: str) -> bool:
+        """
+        Remove an entity's vector.
 
-        self.vectors[entity_id] = vector
+        Args:
+            entity_id: Entity ID
+
+        Returns:
+            True if removed, False if it was not indexed
+        """
+        if np is None:
+            return self._vectors.pop(entity_id, None) is not None
+
+        row = self._rows.pop(entity_id, None)
+        if row is None:
+            return False
+        self._ids[row] = None
+        self._live[row] = False
+        self._matrix[row] = 0.0
+        self._norms[row] = 0.0
+        self._free.append(row)
+        return True
+
+    def get_vector(self, entity_id: str) -> Optional[List[float]]:
+        """Return the vector indexed for ``entity_id`` (None if absent)."""
+        if np is None:
+            return self._vectors.get(entity_id)
+        row = self._rows.get(entity_id)
+        if row is None:
+            return None
+        return (self._matrix[row] * self._norms[row]).tolist()
 
     def search(self, query_vector: List[float], k: int = 10) -> List[Tuple[str, float]]:
         """
@@ -378,20 +596,71 @@ class VectorIndex:
         Returns:
             List of (entity_id, similarity) tuples
         """
-        if len(query_vector) != self.dimension:
-            raise ValueError(
-                f"Vector dimension mismatch: expected {self.dimension}, got {len(query_vector)}"
-            )
+        self._check_dimension(query_vector)
+
+        if np is None:
+            # Calculate similarities
+            similarities = []
+            for entity_id, vector in self._vectors.items():
+                sim = self._cosine_similarity(query_vector, vector)
+                similarities.append((entity_id, sim))
+
+            # Sort by similarity and return top k
+            similarities.sort(key=lambda x: x[1], reverse=True)
+            return similarities[:k]
+
+        return self.search_batch([query_vector], k=k)[0]
+
+    def search_batch(
+        self, query_vectors: List[List[float]], k: int = 10
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Find k nearest neighbors for many queries with one matrix product.
+
+        Args:
+            query_vectors: Query vectors
+            k: Number of neighbors to return per query
+
+        Returns:
+            One list of (entity_id, similarity) tuples per query
+        """
+        for query_vector in query_vectors:
+            self._check_dimension(query_vector)
 
-        # Calculate similarities
-        similarities = []
-        for entity_id, vector in self.vectors.items():
-            sim = self._cosine_similarity(query_vector, vector)
-            similarities.append((entity_id, sim))
+        if np is None:
+            return [self.search(query_vector, k=k) for query_vector in query_vectors]
 
-        # Sort by similarity and return top k
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:k]
+        n_queries = len(query_vectors)
+        used = len(self._ids)
+        k = min(k, len(self._rows))
+        if n_queries == 0:
+            return []
+        if k <= 0 or used == 0:
+            return [[] for _ in range(n_queries)]
+
+        queries = np.asarray(query_vectors, dtype=np.float32).reshape(n_queries, self.dimension)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries = np.divide(queries, norms, out=np.zeros_like(queries), where=norms > 0)
+
+        scores = queries @ self._matrix[:used].T
+        scores[:, ~self._live[:used]] = -np.inf
+
+        if k < used:
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            top = np.broadcast_to(np.arange(used), (n_queries, used))
+
+        results: List[List[Tuple[str, float]]] = []
+        for q in range(n_queries):
+            rows = top[q]
+            row_scores = scores[q, rows]
+            # Highest similarity first; ties resolve to the lower row, which
+            # is not insertion order once removed rows have been reused
+            order = np.lexsort((rows, -row_scores))
+            results.append(
+                [(self._ids[rows[i]], float(row_scores[i])) for i in order]
+            )
+        return results
 
     def _cosine_similarity(self, v1: List[float], v2: List[float]) -> float:
         """Calculate cosine similarity between two vectors."""
@@ -406,11 +675,15 @@ class VectorIndex:
 
     def get_stats(self) -> IndexStats:
         """Get index statistics."""
+        if np is None:
+            memory_bytes = len(self._vectors) * self.dimension * 8  # 8 bytes per float
+        else:
+            memory_bytes = int(self._matrix.nbytes + self._norms.nbytes + self._live.nbytes)
         return IndexStats(
             name=self.definition.name,
-            entry_count=len(self.vectors),
-            unique_keys=len(self.vectors),
-            memory_bytes=len(self.vectors) * self.dimension * 8,  # 8 bytes per float
+            entry_count=len(self),
+            unique_keys=len(self),
+            memory_bytes=memory_bytes,
         )
 
 
@@ -435,6 +708,5 @@ class RangeIndex(BTreeIndex):
             properties=[property_name],
             label=label,
         )
-        # Initialize with larger branching factor for better range performance
-        super().__init__(definition, max_keys=8)
+        super().__init__(definition)
         self.property_name = property_name
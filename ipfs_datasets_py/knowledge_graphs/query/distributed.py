@@ -716,7 +716,7 @@ class FederatedQueryExecutor:
                 properties=dict(entity.properties or {}),
             )
             node._properties["name"] = entity.name
-            engine._node_cache[entity.entity_id] = node
+            engine._put_node(node)  # noqa: SLF001 — keeps the node indexes current
 
         # Load relationships as compat Relationship objects
         for rel in partition_kg.relationships.values():
@@ -731,7 +731,7 @@ class FederatedQueryExecutor:
                 end_node=tgt_node,
                 properties=dict(rel.properties or {}),
             )
-            engine._relationship_cache[rel.relationship_id] = compat_rel
+            engine._put_relationship(compat_rel)  # noqa: SLF001 — keeps adjacency current
 
         executor = QueryExecutor(graph_engine=engine)
         try:
@@ -54,8 +54,11 @@ Usage:
 
 from ipfs_datasets_py.utils import anyio_compat as asyncio
 import logging
+import re
+import threading
 import anyio
-from typing import Any, Dict, List, Optional, Union
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
 
 
@@ -78,6 +81,55 @@ from ..exceptions import QueryError, QueryParseError, QueryExecutionError, Query
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PLAN_CACHE_SIZE = 256
+
+# String literals and backtick identifiers are kept verbatim when normalizing;
+# comments are matched the way CypherLexer skips them and dropped.
+_CYPHER_LITERAL_RE = re.compile(
+    r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`[^`]*`"
+    r"|(?P<comment>//[^\n]*|/\*.*?(?:\*/|\Z))",
+    re.DOTALL,
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize_cypher(query: str) -> str:
+    """Drop comments and collapse insignificant whitespace so equivalent
+    query texts share a plan."""
+    parts: List[str] = []
+    code: List[str] = []
+    pos = 0
+    for match in _CYPHER_LITERAL_RE.finditer(query):
+        code.append(query[pos : match.start()])
+        if match.group("comment") is not None:
+            code.append(" ")
+        else:
+            parts.append(_WHITESPACE_RE.sub(" ", "".join(code)))
+            parts.append(match.group(0))
+            code = []
+        pos = match.end()
+    code.append(query[pos:])
+    parts.append(_WHITESPACE_RE.sub(" ", "".join(code)))
+    return "".join(parts).strip()
+
+
+def _bind_parameters(ir: Any, params: Dict[str, Any]) -> Any:
+    """Return a copy of compiled IR with ``{"param": name}`` nodes bound.
+
+    Containers are copied on the way down so the cached plan is never
+    mutated (with empty ``params`` this is just that copy); unknown
+    parameters are left for the executor to resolve.
+    """
+    if isinstance(ir, dict):
+        if len(ir) == 1 and "param" in ir and ir["param"] in params:
+            return params[ir["param"]]
+        return {key: _bind_parameters(value, params) for key, value in ir.items()}
+    if isinstance(ir, list):
+        return [_bind_parameters(item, params) for item in ir]
+    if isinstance(ir, tuple):
+        return tuple(_bind_parameters(item, params) for item in ir)
+    return ir
+
 
 @dataclass
 class QueryResult:
@@ -145,8 +197,10 @@ class UnifiedQueryEngine:
         backend: Graph backend for storage/retrieval
         vector_store: Optional vector store for similarity search
         llm_processor: Optional LLM processor for reasoning
-        enable_caching: Whether to enable query caching
+        enable_caching: Whether to enable query caching (including compiled
+            Cypher plans)
         default_budgets: Default budget preset ('strict', 'moderate', 'permissive')
+        plan_cache_size: Maximum number of compiled Cypher plans kept (LRU)
 
     Example:
         engine = UnifiedQueryEngine(backend=ipld_backend)
@@ -166,6 +220,7 @@ class UnifiedQueryEngine:
         llm_processor: Optional[Any] = None,
         enable_caching: bool = True,
         default_budgets: str = "safe",
+        plan_cache_size: int = DEFAULT_PLAN_CACHE_SIZE,
     ):
         self.backend = backend
         self.vector_store = vector_store
@@ -183,6 +238,15 @@ class UnifiedQueryEngine:
         self._ir_executor = None
         self._graph_engine = None
 
+        # Compiled Cypher plans: (normalized query, compiler version) -> IR
+        self._plan_cache: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._plan_cache_size = max(0, int(plan_cache_size))
+        self._plan_cache_lock = threading.Lock()
+        self._plan_cache_schema: Optional[Tuple[int, Any]] = None
+        self._plan_epoch = 0
+        self._plan_cache_hits = 0
+        self._plan_cache_misses = 0
+
         logger.info("UnifiedQueryEngine initialized")
 
     @property
@@ -299,9 +363,10 @@ class UnifiedQueryEngine:
 
         with self.budget_manager.track(budgets) as tracker:
             try:
-                # Compile Cypher to IR
-                ast = self.cypher_parser.parse(query)
-                ir = self.cypher_compiler.compile(ast)
+                # Compile Cypher to IR (or reuse a cached plan)
+                # Always bind into a fresh copy so execution never touches
+                # the cached plan, with or without parameters
+                ir = _bind_parameters(self._get_plan(query), params or {})
 
                 # Execute IR
                 result = self.ir_executor.execute(ir, budgets=budgets)
@@ -341,6 +406,74 @@ class UnifiedQueryEngine:
                     },
                 ) from e
 
+    def _compiler_version(self) -> str:
+        """Version tag of the active compiler, part of the plan cache key."""
+        version = getattr(self.cypher_compiler, "VERSION", None)
+        if isinstance(version, str):
+            return version
+        try:
+            from ipfs_datasets_py.knowledge_graphs.cypher import __version__
+        except ImportError:
+            return type(self.cypher_compiler).__name__
+        return f"{type(self.cypher_compiler).__name__}/{__version__}"
+
+    def _schema_token(self) -> Tuple[int, Any]:
+        """Snapshot of everything a change to which must drop cached plans.
+
+        Plans run against ``backend`` (through ``ir_executor``), so that is
+        the graph whose ``schema_version`` is watched.
+        """
+        backend = self.backend
+        if self._ir_executor is not None:
+            backend = getattr(self._ir_executor, "backend", backend)
+        engine_version = getattr(backend, "schema_version", None)
+        if not isinstance(engine_version, int):
+            engine_version = None
+        return (self._plan_epoch, engine_version)
+
+    def _get_plan(self, query: str) -> Any:
+        """Return compiled IR for ``query``, compiling on a plan-cache miss.
+
+        The returned plan may be shared with the cache; callers copy it
+        (see ``_bind_parameters``) before handing it to the executor.
+        """
+        if not self.enable_caching or self._plan_cache_size == 0:
+            return self.cypher_compiler.compile(self.cypher_parser.parse(query))
+
+        key = (_normalize_cypher(query), self._compiler_version())
+        schema = self._schema_token()
+        with self._plan_cache_lock:
+            if schema != self._plan_cache_schema:
+                self._plan_cache.clear()
+                self._plan_cache_schema = schema
+            plan = self._plan_cache.get(key)
+            if plan is not None:
+                self._plan_cache.move_to_end(key)
+                self._plan_cache_hits += 1
+                return plan
+            self._plan_cache_misses += 1
+
+        plan = self.cypher_compiler.compile(self.cypher_parser.parse(query))
+
+        with self._plan_cache_lock:
+            if schema == self._plan_cache_schema:
+                self._plan_cache[key] = plan
+                self._plan_cache.move_to_end(key)
+                while len(self._plan_cache) > self._plan_cache_size:
+                    self._plan_cache.popitem(last=False)
+        return plan
+
+    def invalidate_plan_cache(self) -> None:
+        """Drop all compiled Cypher plans.
+
+        Call after schema or index changes the engine cannot observe itself;
+        property-index DDL on a GraphEngine used as ``backend`` is detected
+        automatically.
+        """
+        with self._plan_cache_lock:
+            self._plan_epoch += 1
+            self._plan_cache.clear()
+
     def execute_ir(self, ir: Any, budgets: Optional[ExecutionBudgets] = None) -> QueryResult:
         """
         Execute an IR (Intermediate Representation) query.
@@ -627,6 +760,10 @@ class UnifiedQueryEngine:
             "caching_enabled": self.enable_caching,
             "default_budgets_preset": self.default_budgets_preset,
             "hybrid_search_cache_size": len(self.hybrid_search._cache),
+            "plan_cache_size": len(self._plan_cache),
+            "plan_cache_capacity": self._plan_cache_size,
+            "plan_cache_hits": self._plan_cache_hits,
+            "plan_cache_misses": self._plan_cache_misses,
         }
 
     async def execute_async(
@@ -1152,6 +1152,36 @@ class RouterBlockBackend:
         except Exception as exc:
             raise map_kubo_error(exc, operation="block_get", cid=cid) from exc
 
+    def put_blocks(self, blocks: Sequence[bytes], *, codec: str) -> List[str]:
+        """Store many blocks of one codec; batched when the router backend allows."""
+        codec_n = normalize_codec(codec)
+        payloads = [bytes(data) for data in blocks]
+        put_many = getattr(self._backend, "block_put_many", None)
+        if not callable(put_many):
+            return [self.put_block(data, codec=codec_n) for data in payloads]
+        try:
+            cids = [str(cid) for cid in put_many(payloads, codec=codec_n)]
+        except Exception as exc:
+            raise map_kubo_error(exc, operation="block_put_many") from exc
+        out: List[str] = []
+        for cid, data in zip(cids, payloads):
+            try:
+                verify_bytes_against_cid(cid, data, expected_codec=codec_n)
+                out.append(cid)
+            except GraphStoreError:
+                out.append(compute_cid_v1(data, codec=codec_n))
+        return out
+
+    def get_blocks(self, cids: Sequence[str]) -> List[bytes]:
+        """Fetch many blocks in order; concurrent when the router backend allows."""
+        get_many = getattr(self._backend, "block_get_many", None)
+        if not callable(get_many):
+            return [self.get_block(cid) for cid in cids]
+        try:
+            return [bytes(data) for data in get_many(list(cids))]
+        except Exception as exc:
+            raise map_kubo_error(exc, operation="block_get_many") from exc
+
     def has_block(self, cid: str) -> bool:
         try:
             self.get_block(cid)
@@ -1186,7 +1216,9 @@ class RouterBlockBackend:
         return sorted(self._pins)
 
     def close(self) -> None:
-        return None
+        close = getattr(self._backend, "close", None)
+        if callable(close):
+            close()
 
 
 # ---------------------------------------------------------------------------
@@ -1265,6 +1297,21 @@ class IPLDGraphStore:
             )
         return cls(KuboBlockBackend(cmd=cmd), **kwargs)
 
+    @classmethod
+    def open_kubo_http(cls, api_url: Optional[str] = None, **kwargs: Any) -> "IPLDGraphStore":
+        """Open a store on the Kubo RPC API over pooled HTTP connections."""
+        try:
+            from ipfs_datasets_py.ipfs_backend_router import KuboHTTPBackend
+        except Exception as exc:
+            raise GraphStoreError(
+                "STORAGE",
+                "ipfs_backend_router unavailable",
+                retryable=False,
+                details={"error": str(exc)[:300]},
+                cause_code="ROUTER_UNAVAILABLE",
+            ) from exc
+        return cls(RouterBlockBackend(KuboHTTPBackend(api_url)), **kwargs)
+
     @classmethod
     def open_auto(cls, **kwargs: Any) -> "IPLDGraphStore":
         """Prefer Kubo when available; otherwise deterministic memory backend."""
@@ -1509,6 +1556,7 @@ class IPLDGraphStore:
         """Import a CARv1 archive into the backend; return root CIDs."""
         self._check_cancelled()
         roots, blocks = decode_car(car_bytes)
+        by_codec: Dict[str, List[Tuple[str, bytes]]] = {}
         for cid, data in blocks:
             # Infer codec from CID when possible.
             try:
@@ -1517,18 +1565,25 @@ class IPLDGraphStore:
                 codec = "raw"
             # Verify block identity before accepting.
             verify_bytes_against_cid(cid, data, expected_codec=codec)
+            by_codec.setdefault(codec, []).append((cid, data))
+
+        # Backends with batched puts (e.g. Kubo over HTTP) store each codec
+        # group in a few requests instead of one round trip per block.
+        put_blocks = getattr(self._backend, "put_blocks", None)
+        for codec, group in by_codec.items():
             try:
-                stored = self._backend.put_block(data, codec=codec)
+                if callable(put_blocks):
+                    put_blocks([data for _, data in group], codec=codec)
+                else:
+                    for cid, data in group:
+                        self._backend.put_block(data, codec=codec)
             except GraphStoreError:
                 raise
             except Exception as exc:
-                raise map_kubo_error(exc, operation="import_car", cid=cid) from exc
-            # Ensure stored under the CAR's CID identity when possible.
-            if stored != cid:
-                # Some backends recompute; re-verify under our CID form.
-                verify_bytes_against_cid(cid, data, expected_codec=codec)
+                raise map_kubo_error(exc, operation="import_car", cid=group[0][0]) from exc
             with self._lock:
-                self._local_index[cid] = codec
+                for cid, _ in group:
+                    self._local_index[cid] = codec
 
         if pin_roots:
             for root in roots:
@@ -1724,7 +1779,7 @@ def create_ipld_graph_store(
     Parameters
     ----------
     mode:
-        ``auto`` | ``memory`` | ``directory`` | ``kubo`` | ``router``
+        ``auto`` | ``memory`` | ``directory`` | ``kubo`` | ``kubo_http`` | ``router``
     root_dir:
         Required for ``directory`` mode; ignored otherwise.
     backend:
@@ -1758,6 +1813,11 @@ def create_ipld_graph_store(
             pin_by_default=pin_by_default,
             cancel_check=cancel_check,
         )
+    if mode_n == "kubo_http":
+        return IPLDGraphStore.open_kubo_http(
+            pin_by_default=pin_by_default,
+            cancel_check=cancel_check,
+        )
     if mode_n == "router":
         return IPLDGraphStore(
             RouterBlockBackend(),
@@ -741,14 +741,18 @@ class DuckDBTransactionState:
         """
         After a successful IPLD WAL append, record head/keys without mutation.
 
-        The ``cid`` must be the exact CID returned by the IPLD store.
+        The ``cid`` must be the exact CID returned by the IPLD store. The
+        durable head is taken from ``wal.wal_head_cid`` when available: after
+        a segment seal it is the segment block, which still reaches ``cid``
+        but also carries the footer index and checkpoint position.
         """
+        head = getattr(wal, "wal_head_cid", None) or cid
         with self._txn() as conn:
             self._require_owner(conn)
             conn.execute(
                 "UPDATE wal_control SET wal_head_cid = ?, "
                 "entry_count = entry_count + 1, updated_at = ? WHERE singleton = 1",
-                [cid, time.time()],
+                [head, time.time()],
             )
             if entry is not None:
                 key = None
@@ -476,6 +476,7 @@ class WALEntry:
         lease_id / lease_epoch: Graph-scoped fencing token
         idempotency_key: Key for idempotent replay across retries
         record_seq: Monotonic sequence within a transaction
+        checkpoint: True for the checkpoint markers written by WAL compaction
     """
 
     txn_id: str
@@ -497,6 +498,7 @@ class WALEntry:
     lease_epoch: Optional[int] = None
     idempotency_key: Optional[str] = None
     record_seq: int = 0
+    checkpoint: bool = False
 
     def resolved_phase(self) -> WALPhase:
         """Resolve durable phase from explicit phase or txn_state."""
@@ -546,6 +548,8 @@ class WALEntry:
             d["idempotency_key"] = self.idempotency_key
         if self.record_seq:
             d["record_seq"] = self.record_seq
+        if self.checkpoint:
+            d["checkpoint"] = True
         return d
 
     @classmethod
@@ -584,6 +588,7 @@ class WALEntry:
             lease_epoch=int(lease_epoch) if lease_epoch is not None else None,
             idempotency_key=data.get("idempotency_key"),
             record_seq=int(data.get("record_seq") or 0),
+            checkpoint=bool(data.get("checkpoint", False)),
         )
 
 
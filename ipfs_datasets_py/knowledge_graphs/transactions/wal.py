@@ -8,9 +8,12 @@ deterministic recovery actions at every durable boundary.
 """
 
 from ipfs_datasets_py.utils import anyio_compat as asyncio
+import asyncio as stdlib_asyncio
 import anyio
 import json
 import logging
+import threading
+import time
 from typing import Dict, Iterator, List, Optional, Any, Tuple
 from datetime import datetime
 from collections import defaultdict
@@ -19,12 +22,12 @@ from collections import defaultdict
 def _cancelled_exc_class() -> type:
     """Return the current async framework's cancellation exception class.
 
-    Falls back to asyncio.CancelledError when called outside an async context.
+    Falls back to stdlib asyncio when called outside an async context.
     """
     try:
         return anyio.get_cancelled_exc_class()
     except anyio.NoEventLoopError:
-        return asyncio.CancelledError
+        return stdlib_asyncio.CancelledError
 
 
 from .types import (
@@ -57,6 +60,69 @@ from ..exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Group-commit defaults: how long a batch leader waits for in-flight
+# appenders, and the most entries one batch block may carry.
+DEFAULT_GROUP_COMMIT_WINDOW = 0.002
+DEFAULT_GROUP_COMMIT_MAX_ENTRIES = 64
+
+# Marker key of a batch block holding several WAL entries
+WAL_BATCH_KEY = "wal_batch"
+
+# Entries per sealed segment; a sealed segment is a small block in the chain
+# that indexes the already-written entries before it by txn id and phase
+DEFAULT_WAL_SEGMENT_SIZE = 256
+WAL_SEGMENT_KEY = "wal_segment"
+
+
+def _split_position(position: str) -> Tuple[str, Optional[int]]:
+    """Split a WAL position into block CID and index within a batch block."""
+    cid, sep, index = str(position).rpartition("#")
+    if sep and index.isdigit():
+        return cid, int(index)
+    return str(position), None
+
+
+class _PendingAppend:
+    """A WAL entry queued for the next group-commit batch."""
+
+    __slots__ = ("entry", "key", "position", "error", "done")
+
+    def __init__(self, entry: WALEntry, key: Optional[str]):
+        self.entry = entry
+        self.key = key
+        self.position: Optional[str] = None
+        self.error: Optional[BaseException] = None
+        self.done = False
+
+
+class _CycleGuard:
+    """
+    Detect cycles while walking positions backwards.
+
+    Positions inside one block only ever move to lower indexes, so only
+    block CIDs are remembered: memory grows with blocks (segments), not
+    entries.
+    """
+
+    __slots__ = ("_blocks", "_cid", "_index")
+
+    def __init__(self):
+        self._blocks: set = set()
+        self._cid: Optional[str] = None
+        self._index: Optional[int] = None
+
+    def step(self, position: str) -> bool:
+        """Record a step to ``position``; False if it closes a cycle."""
+        cid, index = _split_position(position)
+        if cid == self._cid:
+            if index is None or self._index is None or index >= self._index:
+                return False
+        elif cid in self._blocks:
+            return False
+        self._blocks.add(cid)
+        self._cid, self._index = cid, index
+        return True
+
 
 class WriteAheadLog:
     """
@@ -73,8 +139,30 @@ class WriteAheadLog:
     - Compaction for old entries
     - Recovery with exact per-boundary actions
     - Idempotent replay tracking
+    - Optional group commit: concurrent appends share one batch block
+    - Fixed-size sealed segments with a txn-id footer index
     - IPLD-native storage
 
+    With ``group_commit=True``, appends from concurrent threads are gathered
+    (for at most ``group_commit_window`` seconds, and only while other
+    appenders are still in flight) into a single batch block of up to
+    ``group_commit_max_entries`` entries. Each entry in a batch gets the
+    position ``"<batch cid>#<index>"``; a batch of one is stored as a plain
+    entry, so its position is a bare CID as before.
+
+    Every ``segment_size`` entries, a segment block is linked into the chain
+    after them. It holds no entries, only a footer of ``(txn_id, phase,
+    position, txn_state)`` referencing the blocks already written since the last seal,
+    plus the previous segment and the latest checkpoint position, so each
+    entry is stored once. ``read`` steps over segment blocks; building the
+    txn-id index costs one storage round trip per segment instead of per
+    entry. ``recover`` uses the footers the same way: it skips from segment
+    to segment back to the latest checkpoint and only fetches entries whose
+    footer row says they are committed. Sealing is an optimisation: entries
+    are durable as soon as ``append`` returns, and a failed seal is retried
+    on the next append. Persist :attr:`wal_head_cid` (which may be a segment
+    block) rather than the position returned by ``append``.
+
     Attributes:
         storage: IPLDBackend for storing WAL entries
         wal_head_cid: CID of most recent WAL entry
@@ -92,6 +180,10 @@ class WriteAheadLog:
         max_entry_bytes: int = MAX_WAL_ENTRY_BYTES,
         max_write_set_size: int = MAX_WRITE_SET_SIZE,
         max_read_set_size: int = MAX_READ_SET_SIZE,
+        group_commit: bool = False,
+        group_commit_window: float = DEFAULT_GROUP_COMMIT_WINDOW,
+        group_commit_max_entries: int = DEFAULT_GROUP_COMMIT_MAX_ENTRIES,
+        segment_size: int = DEFAULT_WAL_SEGMENT_SIZE,
     ):
         """
         Initialize Write-Ahead Log.
@@ -103,9 +195,13 @@ class WriteAheadLog:
             max_entry_bytes: Hard bound on serialized JSON bytes
             max_write_set_size: Hard bound on write_set length
             max_read_set_size: Hard bound on read_set length
+            group_commit: Batch concurrent appends into shared blocks
+            group_commit_window: Max seconds a batch waits for in-flight appends
+            group_commit_max_entries: Max entries per batch block
+            segment_size: Entries per sealed segment (0 disables sealing)
         """
         self.storage = storage
-        self.wal_head_cid = wal_head_cid
+        self._wal_head_cid = wal_head_cid
         self.compaction_threshold = 1000  # Entries before compaction
         self._entry_count = 0
         self.max_operations_per_entry = int(max_operations_per_entry)
@@ -115,8 +211,50 @@ class WriteAheadLog:
         # Idempotent replay: (idempotency_key or txn_id+phase) → wal cid
         self._applied_keys: Dict[str, str] = {}
 
+        # Group commit state; _group_cond guards everything below it
+        self.group_commit = bool(group_commit)
+        self.group_commit_window = max(0.0, float(group_commit_window))
+        self.group_commit_max_entries = max(1, int(group_commit_max_entries))
+        self._group_cond = threading.Condition()
+        self._group_queue: List[_PendingAppend] = []
+        self._group_pending_keys: Dict[str, _PendingAppend] = {}
+        self._group_leader_active = False
+        self._last_batch_size = 1
+        self._batches_written = 0
+        self._batched_entries = 0
+
+        # Segments: entries appended since the last seal, as footer rows
+        # (txn_id, phase, position), and the position the first links back to
+        self.segment_size = max(0, int(segment_size))
+        self._tail: List[List[Any]] = []
+        self._tail_prev: Optional[str] = wal_head_cid
+        self._last_segment_cid: Optional[str] = None
+        self._segments_written = 0
+        # Latest checkpoint marker position (learned from appends/footers)
+        self.checkpoint_cid: Optional[str] = None
+        # txn_id -> positions, oldest first; complete once the chain is indexed
+        self._txn_index: Dict[str, List[str]] = {}
+        self._txn_index_complete = wal_head_cid is None
+
         logger.info(f"WriteAheadLog initialized with head: {wal_head_cid}")
 
+    @property
+    def wal_head_cid(self) -> Optional[str]:
+        """Position of the most recent WAL entry."""
+        return self._wal_head_cid
+
+    @wal_head_cid.setter
+    def wal_head_cid(self, position: Optional[str]) -> None:
+        # Re-pointing the head (e.g. restoring a persisted head) invalidates
+        # what this instance knows about the unsealed tail and the index
+        self._wal_head_cid = position
+        self._tail = []
+        self._tail_prev = position
+        self._last_segment_cid = None
+        self.checkpoint_cid = None
+        self._txn_index = {}
+        self._txn_index_complete = position is None
+
     # ------------------------------------------------------------------
     # Bounds enforcement
     # ------------------------------------------------------------------
@@ -215,7 +353,9 @@ class WriteAheadLog:
 
         Returns:
             CID of the appended entry (new WAL head), or prior CID if
-            this phase was already applied (idempotent replay)
+            this phase was already applied (idempotent replay). In group
+            commit mode this is the entry's position, which is
+            ``"<batch cid>#<index>"`` when it shared a batch block.
 
         Raises:
             WALBoundExceededError: if entry exceeds configured bounds
@@ -234,6 +374,9 @@ class WriteAheadLog:
             # Bound check before linking/storing
             self._check_bounds(entry)
 
+            if self.group_commit:
+                return self._group_append(entry, key)
+
             # Set previous WAL CID to current head
             entry.prev_wal_cid = self.wal_head_cid
 
@@ -244,13 +387,16 @@ class WriteAheadLog:
             cid = self.storage.store_json(entry_dict)
 
             # Update WAL head
-            self.wal_head_cid = cid
+            self._wal_head_cid = cid
             self._entry_count += 1
             if key is not None:
                 self._applied_keys[key] = cid
 
             logger.debug(f"WAL entry appended: {cid} (txn: {entry.txn_id})")
 
+            if self._note_appended([(cid, entry)]):
+                self._seal_segment()
+
             # Check if compaction needed
             if self._entry_count >= self.compaction_threshold:
                 logger.info(
@@ -298,6 +444,228 @@ class WriteAheadLog:
                 },
             ) from e
 
+    def _group_append(self, entry: WALEntry, key: Optional[str]) -> str:
+        """
+        Queue ``entry`` for group commit and wait for its batch to land.
+
+        The first waiting appender becomes the batch leader: it gathers
+        queued entries, writes them as one block outside the lock, then
+        hands leadership to the next waiter. Entries are bound-checked by
+        the caller; storage errors are re-raised in every affected caller.
+        """
+        with self._group_cond:
+            if key is not None:
+                if key in self._applied_keys:
+                    return self._applied_keys[key]
+                in_flight = self._group_pending_keys.get(key)
+                if in_flight is not None:
+                    # Same phase already queued by another caller: share it
+                    while not in_flight.done:
+                        self._group_cond.wait()
+                    if in_flight.error is not None:
+                        raise in_flight.error
+                    return in_flight.position
+
+            pending = _PendingAppend(entry, key)
+            self._group_queue.append(pending)
+            if key is not None:
+                self._group_pending_keys[key] = pending
+            self._group_cond.notify_all()
+            while not pending.done:
+                if self._group_leader_active:
+                    self._group_cond.wait()
+                else:
+                    self._lead_group_commit()
+
+        if pending.error is not None:
+            raise pending.error
+        return pending.position
+
+    def _lead_group_commit(self) -> None:
+        """Gather and write one batch; caller holds ``_group_cond``."""
+        self._group_leader_active = True
+        try:
+            # Expect about as many concurrent appenders as last time; a lone
+            # writer (last batch of one) never waits for the window
+            target = min(self.group_commit_max_entries, self._last_batch_size)
+            deadline = time.monotonic() + self.group_commit_window
+            while len(self._group_queue) < target:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._group_cond.wait(remaining)
+
+            batch = self._group_queue[: self.group_commit_max_entries]
+            del self._group_queue[: self.group_commit_max_entries]
+            # Keep the chain in timestamp order within the batch
+            batch.sort(key=lambda pending: pending.entry.timestamp)
+            self._last_batch_size = len(batch)
+            prev_head = self.wal_head_cid
+
+            self._group_cond.release()
+            try:
+                positions, error = self._write_batch(batch, prev_head)
+            finally:
+                self._group_cond.acquire()
+
+            seal_due = False
+            if error is None:
+                self._wal_head_cid = positions[-1]
+                self._entry_count += len(batch)
+                self._batches_written += 1
+                self._batched_entries += len(batch)
+                seal_due = self._note_appended(
+                    [(position, pending.entry) for pending, position in zip(batch, positions)]
+                )
+            for pending, position in zip(batch, positions or [None] * len(batch)):
+                pending.position = position
+                pending.error = error
+                pending.done = True
+                if pending.key is not None:
+                    self._group_pending_keys.pop(pending.key, None)
+                    if error is None:
+                        self._applied_keys[pending.key] = position
+
+            if error is None and self._entry_count >= self.compaction_threshold:
+                logger.info(
+                    f"Compaction threshold reached: {self._entry_count} entries"
+                )
+
+            if seal_due:
+                # Still leader, so nothing else moves the head meanwhile
+                self._group_cond.notify_all()
+                self._group_cond.release()
+                try:
+                    self._seal_segment()
+                finally:
+                    self._group_cond.acquire()
+        finally:
+            self._group_leader_active = False
+            self._group_cond.notify_all()
+
+    def _write_batch(
+        self, batch: List[_PendingAppend], prev_head: Optional[str]
+    ) -> Tuple[Optional[List[str]], Optional[BaseException]]:
+        """Store a batch as one block; returns (positions, error)."""
+        entries = [pending.entry for pending in batch]
+        try:
+            entries[0].prev_wal_cid = prev_head
+            if len(entries) == 1:
+                cid = self.storage.store_json(entries[0].to_dict())
+                logger.debug(f"WAL entry appended: {cid} (txn: {entries[0].txn_id})")
+                return [cid], None
+
+            for entry in entries[1:]:
+                entry.prev_wal_cid = None  # resolved from the batch on read
+            entry_dicts = [entry.to_dict() for entry in entries]
+            cid = self.storage.store_json(
+                {
+                    WAL_BATCH_KEY: 1,
+                    "prev_wal_cid": prev_head,
+                    "entries": entry_dicts,
+                }
+            )
+            positions = [f"{cid}#{i}" for i in range(len(entries))]
+            for entry, prev in zip(entries[1:], positions):
+                entry.prev_wal_cid = prev
+            logger.debug(f"WAL batch appended: {cid} ({len(entries)} entries)")
+            return positions, None
+        except BaseException as e:
+            # Handed to every caller in the batch (including cancellation),
+            # so no follower is left waiting on an entry that never lands
+            return None, e
+
+    # ------------------------------------------------------------------
+    # Segments and the txn-id index
+    # ------------------------------------------------------------------
+
+    def _note_appended(self, appended: List[Tuple[str, WALEntry]]) -> bool:
+        """Track newly durable entries; returns True when a seal is due."""
+        for position, entry in appended:
+            phase = entry.phase.value if entry.phase is not None else None
+            self._tail.append(
+                [entry.txn_id, phase, position, entry.txn_state.value]
+            )
+            if self._txn_index_complete:
+                self._txn_index.setdefault(entry.txn_id, []).append(position)
+            if entry.checkpoint:
+                self.checkpoint_cid = position
+        return bool(self.segment_size) and len(self._tail) >= self.segment_size
+
+    def _seal_segment(self) -> Optional[str]:
+        """
+        Link a segment block indexing the unsealed tail and move the head to it.
+
+        The block references the tail entries by position rather than copying
+        them, so sealing writes only the footer.
+
+        Returns:
+            CID of the segment block, or None if there was nothing to seal or
+            the write failed (the tail is kept and sealing retried later)
+        """
+        tail = self._tail
+        if not tail or self.wal_head_cid != tail[-1][2]:
+            return None
+
+        try:
+            segment_cid = self.storage.store_json(
+                {
+                    WAL_SEGMENT_KEY: 1,
+                    "prev_wal_cid": self.wal_head_cid,
+                    "base_wal_cid": self._tail_prev,
+                    "prev_segment_cid": self._last_segment_cid,
+                    "checkpoint_cid": self.checkpoint_cid,
+                    "index": tail,
+                }
+            )
+        except _cancelled_exc_class():
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to seal WAL segment (will retry): {e}")
+            return None
+
+        self._wal_head_cid = segment_cid
+        self._tail = []
+        self._tail_prev = segment_cid
+        self._last_segment_cid = segment_cid
+        self._segments_written += 1
+        logger.debug(f"WAL segment sealed: {segment_cid} ({len(tail)} entries)")
+        return segment_cid
+
+    def _build_txn_index(self) -> None:
+        """
+        Index every reachable entry by txn_id, using segment footers.
+
+        Segments contribute their footer without decoding entries, so this
+        costs one fetch per segment plus one per unsealed entry.
+        """
+        index: Dict[str, List[str]] = {}
+        newest_first: List[Tuple[str, str]] = []
+        for position, txn_id in self._walk_txn_ids(self.wal_head_cid):
+            newest_first.append((txn_id, position))
+        for txn_id, position in reversed(newest_first):
+            index.setdefault(txn_id, []).append(position)
+        self._txn_index = index
+        self._txn_index_complete = True
+
+    def _walk_txn_ids(self, start: Optional[str]) -> Iterator[Tuple[str, str]]:
+        """Yield (position, txn_id) newest first, reading footers for segments."""
+        block_cache: Dict[str, Any] = {}
+        guard = _CycleGuard()
+        current = start
+        while current and guard.step(current):
+            segment = self._segment_block(current, block_cache)
+            if segment is not None:
+                if self.checkpoint_cid is None and segment.get("checkpoint_cid"):
+                    self.checkpoint_cid = segment["checkpoint_cid"]
+                for row in reversed(segment["index"]):
+                    yield row[2], row[0]
+                current = segment.get("base_wal_cid")
+                continue
+            entry = self._load_entry(current, block_cache)
+            yield current, entry.txn_id
+            current = entry.prev_wal_cid
+
     def append_phase(
         self,
         *,
@@ -365,19 +733,24 @@ class WriteAheadLog:
             logger.debug("WAL is empty, no entries to read")
             return
 
-        visited = set()  # Prevent infinite loops
+        guard = _CycleGuard()  # Prevent infinite loops
+        block_cache: Dict[str, Any] = {}
 
         while current_cid:
             # Prevent loops in WAL chain
-            if current_cid in visited:
+            if not guard.step(current_cid):
                 logger.warning(f"Cycle detected in WAL chain at: {current_cid}")
                 break
-            visited.add(current_cid)
 
             try:
+                # Segment blocks only index the entries before them
+                segment = self._segment_block(current_cid, block_cache)
+                if segment is not None:
+                    current_cid = segment.get("prev_wal_cid")
+                    continue
+
                 # Retrieve entry from IPLD
-                entry_dict = self.storage.retrieve_json(current_cid)
-                entry = WALEntry.from_dict(entry_dict)
+                entry = self._load_entry(current_cid, block_cache)
 
                 yield entry
 
@@ -410,6 +783,48 @@ class WriteAheadLog:
                     },
                 ) from e
 
+    def _fetch_block(self, cid: str, block_cache: Dict[str, Any]) -> Any:
+        """
+        Retrieve the block ``cid``, reusing ``block_cache``.
+
+        ``block_cache`` holds the most recently fetched block so walking
+        back through a batch costs one storage round trip.
+        """
+        block = block_cache.get(cid)
+        if block is None:
+            block = self.storage.retrieve_json(cid)
+            block_cache.clear()
+            block_cache[cid] = block
+        return block
+
+    def _segment_block(
+        self, position: str, block_cache: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Return the block at ``position`` if it is a segment, else None."""
+        cid, index = _split_position(position)
+        if index is not None:
+            return None
+        block = self._fetch_block(cid, block_cache)
+        if isinstance(block, dict) and WAL_SEGMENT_KEY in block:
+            return block
+        return None
+
+    def _load_entry(self, position: str, block_cache: Dict[str, Any]) -> WALEntry:
+        """Load the entry at ``position``, resolving batch-block positions."""
+        cid, index = _split_position(position)
+        block = self._fetch_block(cid, block_cache)
+
+        if index is None:
+            return WALEntry.from_dict(block)
+
+        if not isinstance(block, dict) or WAL_BATCH_KEY not in block:
+            raise ValueError(f"WAL position {position} does not point into a batch block")
+        if index >= len(block["entries"]):
+            raise ValueError(f"WAL position {position} is past the end of its batch block")
+        entry = WALEntry.from_dict(block["entries"][index])
+        entry.prev_wal_cid = f"{cid}#{index - 1}" if index > 0 else block.get("prev_wal_cid")
+        return entry
+
     def compact(self, checkpoint_cid: str) -> str:
         """
         Compact WAL by creating checkpoint and pruning old entries.
@@ -434,6 +849,7 @@ class WriteAheadLog:
                 prev_wal_cid=checkpoint_cid,
                 txn_state=TransactionState.COMMITTED,
                 phase=WALPhase.COMPLETE,
+                checkpoint=True,
             )
 
             # Store checkpoint
@@ -473,6 +889,10 @@ class WriteAheadLog:
         Replays all operations from committed / complete transactions to
         restore graph state after a crash. PREPARE/PUBLISH-without-COMPLETE
         transactions are intentionally excluded (see :meth:`plan_recovery`).
+        The walk stops at the newest checkpoint marker written by
+        :meth:`compact`: state before it is already consolidated. Sealed
+        segments are crossed by their footers, so only entries after the
+        checkpoint that may be committed are fetched.
 
         Args:
             wal_head_cid: CID to recover from (defaults to current head)
@@ -497,7 +917,7 @@ class WriteAheadLog:
                 TransactionState.COMPLETE,
             }
 
-            for entry in self.read(start_cid):
+            for entry in self._replay_candidates(start_cid, committed_states):
                 entries_processed += 1
                 phase = entry.resolved_phase()
 
@@ -543,6 +963,60 @@ class WriteAheadLog:
                 },
             ) from e
 
+    def _replay_candidates(
+        self, start: str, committed_states: set
+    ) -> Iterator[WALEntry]:
+        """
+        Yield entries after the newest checkpoint, newest first.
+
+        Segments are read by footer only and their ``checkpoint_cid`` tells
+        the walk where to stop; entries behind a footer row are fetched only
+        if the row's phase or state could be committed. Unsealed entries
+        (the tail, or chains written before segments) are read one by one.
+        """
+        pending: List[Any] = []
+        checkpoint: Optional[str] = None
+        block_cache: Dict[str, Any] = {}
+        guard = _CycleGuard()
+        current: Optional[str] = start
+        while current and guard.step(current):
+            segment = self._segment_block(current, block_cache)
+            if segment is not None:
+                if checkpoint is None:
+                    checkpoint = segment.get("checkpoint_cid")
+                rows = segment["index"]
+                if checkpoint is not None and any(row[2] == checkpoint for row in rows):
+                    rows = rows[[row[2] for row in rows].index(checkpoint) + 1:]
+                    pending.extend(reversed(rows))
+                    break
+                pending.extend(reversed(rows))
+                current = segment.get("base_wal_cid")
+                continue
+            entry = self._load_entry(current, block_cache)
+            if entry.checkpoint:
+                break
+            pending.append(entry)
+            current = entry.prev_wal_cid
+
+        committed_values = {state.value for state in committed_states}
+        block_cache = {}
+        for item in pending:
+            if isinstance(item, WALEntry):
+                yield item
+                continue
+            phase, position = item[1], item[2]
+            state = item[3] if len(item) > 3 else None
+            if (
+                state is not None
+                and state not in committed_values
+                and phase != WALPhase.COMPLETE.value
+            ):
+                continue
+            entry = self._load_entry(position, block_cache)
+            if entry.checkpoint:
+                break
+            yield entry
+
     def plan_recovery(
         self, wal_head_cid: Optional[str] = None
     ) -> List[RecoveryDecision]:
@@ -577,7 +1051,7 @@ class WriteAheadLog:
         for entry in self.read(start_cid):
             txn_id = entry.txn_id
             # Skip pure checkpoint markers
-            if str(txn_id).startswith("checkpoint-"):
+            if entry.checkpoint:
                 continue
             phase = entry.resolved_phase()
             if txn_id not in by_txn:
@@ -698,24 +1172,29 @@ class WriteAheadLog:
         """
         Get all WAL entries for a specific transaction.
 
+        Served from the txn-id index (built once from segment footers on
+        first use), so only the matching entries are fetched.
+
         Args:
             txn_id: Transaction ID to search for
 
         Returns:
             List of WAL entries for the transaction
         """
+        entries: List[WALEntry] = []
         try:
-            entries: List[WALEntry] = []
+            if not self._txn_index_complete:
+                self._build_txn_index()
 
-            for entry in self.read():
-                if entry.txn_id == txn_id:
-                    entries.append(entry)
+            block_cache: Dict[str, Any] = {}
+            for position in reversed(self._txn_index.get(txn_id, [])):
+                entries.append(self._load_entry(position, block_cache))
 
             logger.debug(f"Found {len(entries)} WAL entries for txn: {txn_id}")
 
             return entries
 
-        except DeserializationError as e:
+        except (DeserializationError, StorageError) as e:
             logger.warning(
                 f"Deserialization error in transaction history (returning partial): {e}"
             )
@@ -743,6 +1222,13 @@ class WriteAheadLog:
             "max_write_set_size": self.max_write_set_size,
             "max_read_set_size": self.max_read_set_size,
             "applied_keys": len(self._applied_keys),
+            "group_commit": self.group_commit,
+            "batches_written": self._batches_written,
+            "batched_entries": self._batched_entries,
+            "segment_size": self.segment_size,
+            "segments_written": self._segments_written,
+            "unsealed_entries": len(self._tail),
+            "checkpoint_cid": self.checkpoint_cid,
             "recovery_matrix": {
                 phase.value: action.value
                 for phase, action in RECOVERY_ACTION_MATRIX.items()
@@ -14,7 +14,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Optional, Set, Tuple
+from typing import Any, List, Optional, Set, Tuple
 
 from ..tdfol_core import Formula
 
@@ -38,6 +38,19 @@ class TDFOLInferenceRule(ABC):
     Attributes:
         name: Rule name (e.g., "ModusPonens", "TemporalKAxiom")
         description: Human-readable rule description
+        premise_shapes: One entry per premise giving its required top-level
+            shape (see formula_shape), None meaning any formula; the tuple
+            length is the rule's arity. Forward chaining uses it to index
+            rules. Rules that leave it unset are tried against every
+            formula and every pair.
+        introduction: Whether the rule builds a larger formula out of
+            arbitrary premises (e.g. conjunction introduction). Forward
+            chaining only keeps such conclusions when they occur in the
+            goal or knowledge base.
+        premises_in_conclusion: Whether every premise of an introduction
+            rule occurs unchanged in its conclusion (e.g. φ, ψ ⊢ φ ∧ ψ but
+            not P(φ) ⊢ P(φ ∨ ψ)). Forward chaining then only offers the
+            rule formulas that occur in the goal or knowledge base.
 
     Example:
         >>> class MyCustomRule(TDFOLInferenceRule):
@@ -51,6 +64,10 @@ class TDFOLInferenceRule(ABC):
         ...         return formulas[0]
     """
 
+    premise_shapes: Optional[Tuple[Any, ...]] = None
+    introduction: bool = False
+    premises_in_conclusion: bool = False
+
     def __init__(self, name: str, description: str):
         """
         Initialize inference rule.
@@ -108,5 +125,19 @@ class TDFOLInferenceRule(ABC):
         return self.name
 
 
+def formula_shape(formula: Formula) -> Any:
+    """
+    Top-level shape of a formula, used to index rule premises.
+
+    Returns the formula's connective or operator (a LogicOperator,
+    Quantifier, DeonticOperator or TemporalOperator), or its class for
+    formulas without one such as predicates.
+    """
+    operator = getattr(formula, "operator", None)
+    if operator is None:
+        operator = getattr(formula, "quantifier", None)
+    return operator if operator is not None else type(formula)
+
+
 # Export all
-__all__ = ["TDFOLInferenceRule"]
+__all__ = ["TDFOLInferenceRule", "formula_shape"]
@@ -24,6 +24,8 @@ from ..tdfol_core import (
 class DeonticKAxiomRule(TDFOLInferenceRule):
     """K Axiom for Deontic Logic: O(φ → ψ) → (O(φ) → O(ψ))"""
 
+    premise_shapes = (DeonticOperator.OBLIGATION, DeonticOperator.OBLIGATION)
+
     def __init__(self):
         super().__init__("DeonticKAxiom", "Distribution axiom for O: O(φ → ψ), O(φ) ⊢ O(ψ)")
 
@@ -61,6 +63,8 @@ class DeonticKAxiomRule(TDFOLInferenceRule):
 class DeonticDAxiomRule(TDFOLInferenceRule):
     """D Axiom for Deontic Logic: O(φ) ⊢ P(φ)"""
 
+    premise_shapes = (DeonticOperator.OBLIGATION,)
+
     def __init__(self):
         super().__init__("DeonticDAxiom", "D axiom: obligation implies permission")
 
@@ -80,6 +84,8 @@ class DeonticDAxiomRule(TDFOLInferenceRule):
 class ProhibitionEquivalenceRule(TDFOLInferenceRule):
     """Prohibition Equivalence: F(φ) ⊢ O(¬φ)"""
 
+    premise_shapes = (DeonticOperator.PROHIBITION,)
+
     def __init__(self):
         super().__init__("ProhibitionEquivalence", "Forbidden is equivalent to obligatory not")
 
@@ -101,6 +107,8 @@ class ProhibitionEquivalenceRule(TDFOLInferenceRule):
 class PermissionNegationRule(TDFOLInferenceRule):
     """Permission Negation: P(φ) ⊢ ¬O(¬φ)"""
 
+    premise_shapes = (DeonticOperator.PERMISSION,)
+
     def __init__(self):
         super().__init__("PermissionNegation", "Permission is equivalent to not obligatory not")
 
@@ -123,6 +131,8 @@ class PermissionNegationRule(TDFOLInferenceRule):
 class ObligationConsistencyRule(TDFOLInferenceRule):
     """Obligation Consistency: O(φ) ⊢ ¬O(¬φ)"""
 
+    premise_shapes = (DeonticOperator.OBLIGATION,)
+
     def __init__(self):
         super().__init__(
             "ObligationConsistency", "Obligations are consistent: cannot oblige contradictions"
@@ -147,6 +157,10 @@ class ObligationConsistencyRule(TDFOLInferenceRule):
 class PermissionIntroductionRule(TDFOLInferenceRule):
     """Permission Introduction: φ ⊢ P(φ)"""
 
+    premise_shapes = (None,)
+    introduction = True
+    premises_in_conclusion = True
+
     def __init__(self):
         super().__init__("PermissionIntroduction", "What is true is permitted")
 
@@ -160,6 +174,10 @@ class PermissionIntroductionRule(TDFOLInferenceRule):
 class DeonticNecessitationRule(TDFOLInferenceRule):
     """Deontic Necessitation: If ⊢ φ, then ⊢ O(φ)"""
 
+    premise_shapes = (None,)
+    introduction = True
+    premises_in_conclusion = True
+
     def __init__(self):
         super().__init__("DeonticNecessitation", "If φ is a theorem, it is obligatory")
 
@@ -174,6 +192,8 @@ class DeonticNecessitationRule(TDFOLInferenceRule):
 class ProhibitionFromObligationRule(TDFOLInferenceRule):
     """Prohibition from Obligation: O(¬φ) ⊢ F(φ)"""
 
+    premise_shapes = (DeonticOperator.OBLIGATION,)
+
     def __init__(self):
         super().__init__("ProhibitionFromObligation", "Obligatory not is equivalent to forbidden")
 
@@ -200,6 +220,8 @@ class ProhibitionFromObligationRule(TDFOLInferenceRule):
 class ObligationWeakeningRule(TDFOLInferenceRule):
     """Obligation Weakening: O(φ ∧ ψ) ⊢ O(φ)"""
 
+    premise_shapes = (DeonticOperator.OBLIGATION,)
+
     def __init__(self):
         super().__init__("ObligationWeakening", "Obligation weakening: O(φ ∧ ψ) → O(φ)")
 
@@ -230,6 +252,9 @@ class ObligationWeakeningRule(TDFOLInferenceRule):
 class PermissionStrengtheningRule(TDFOLInferenceRule):
     """Permission Strengthening: P(φ) ⊢ P(φ ∨ ψ)"""
 
+    premise_shapes = (DeonticOperator.PERMISSION, None)
+    introduction = True
+
     def __init__(self):
         super().__init__("PermissionStrengthening", "Permission strengthening: P(φ) → P(φ ∨ ψ)")
 
@@ -257,6 +282,8 @@ class PermissionStrengtheningRule(TDFOLInferenceRule):
 class ProhibitionContrapositionRule(TDFOLInferenceRule):
     """Prohibition Contraposition: F(φ) ↔ O(¬φ)"""
 
+    premise_shapes = (DeonticOperator.PROHIBITION,)
+
     def __init__(self):
         super().__init__("ProhibitionContraposition", "Forbidden is obligatory not: F(φ) ↔ O(¬φ)")
 
@@ -283,6 +310,8 @@ class ProhibitionContrapositionRule(TDFOLInferenceRule):
 class DeonticDistributionRule(TDFOLInferenceRule):
     """Deontic Distribution: O(φ → ψ), O(φ) ⊢ O(ψ)"""
 
+    premise_shapes = (DeonticOperator.OBLIGATION, DeonticOperator.OBLIGATION)
+
     def __init__(self):
         super().__init__("DeonticDistribution", "Deontic K: O(φ → ψ) → (O(φ) → O(ψ))")
 
@@ -320,6 +349,8 @@ class DeonticDistributionRule(TDFOLInferenceRule):
 class PermissionProhibitionDualityRule(TDFOLInferenceRule):
     """Permission-Prohibition Duality: P(φ) ↔ ¬F(φ)"""
 
+    premise_shapes = (DeonticOperator.PERMISSION,)
+
     def __init__(self):
         super().__init__(
             "PermissionProhibitionDuality", "Permission is not forbidden: P(φ) ↔ ¬F(φ)"
@@ -348,6 +379,8 @@ class PermissionProhibitionDualityRule(TDFOLInferenceRule):
 class ObligationPermissionImplicationRule(TDFOLInferenceRule):
     """Obligation-Permission: O(φ) ⊢ P(φ)"""
 
+    premise_shapes = (DeonticOperator.OBLIGATION,)
+
     def __init__(self):
         super().__init__(
             "ObligationPermissionImplication", "Obligation implies permission: O(φ) → P(φ)"
@@ -373,6 +406,8 @@ class ObligationPermissionImplicationRule(TDFOLInferenceRule):
 class ContraryToDutyRule(TDFOLInferenceRule):
     """Contrary-to-Duty: O(φ), ¬φ ⊢ O(ψ) for reparation ψ"""
 
+    premise_shapes = (DeonticOperator.OBLIGATION, LogicOperator.NOT, None)
+
     def __init__(self):
         super().__init__("ContraryToDuty", "Contrary-to-duty obligation: O(φ) ∧ ¬φ → O(reparation)")
 
@@ -406,6 +441,8 @@ class ContraryToDutyRule(TDFOLInferenceRule):
 class DeonticDetachmentRule(TDFOLInferenceRule):
     """Deontic Detachment: O(φ → ψ), φ ⊢ O(ψ)"""
 
+    premise_shapes = (DeonticOperator.OBLIGATION, None)
+
     def __init__(self):
         super().__init__("DeonticDetachment", "Deontic detachment: O(φ → ψ) ∧ φ → O(ψ)")
 
@@ -22,6 +22,8 @@ from ..tdfol_core import (
 class UniversalInstantiationRule(TDFOLInferenceRule):
     """Universal Instantiation: ∀x.φ(x) ⊢ φ(t) for any term t"""
 
+    premise_shapes = (Quantifier.FORALL,)
+
     def __init__(self):
         super().__init__("UniversalInstantiation", "From ∀x.φ(x), infer φ(t) for any term t")
 
@@ -51,6 +53,9 @@ class UniversalInstantiationRule(TDFOLInferenceRule):
 class ExistentialGeneralizationRule(TDFOLInferenceRule):
     """Existential Generalization: φ(t) ⊢ ∃x.φ(x)"""
 
+    premise_shapes = (None,)
+    introduction = True
+
     def __init__(self):
         super().__init__("ExistentialGeneralization", "From φ(t), infer ∃x.φ(x)")
 
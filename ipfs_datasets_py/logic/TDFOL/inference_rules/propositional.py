@@ -43,6 +43,8 @@ logger = logging.getLogger(__name__)
 class ModusPonensRule(TDFOLInferenceRule):
     """Modus Ponens: φ, φ → ψ ⊢ ψ"""
 
+    premise_shapes = (None, LogicOperator.IMPLIES)
+
     def __init__(self):
         super().__init__("ModusPonens", "From φ and φ → ψ, infer ψ")
 
@@ -64,6 +66,8 @@ class ModusPonensRule(TDFOLInferenceRule):
 class ModusTollensRule(TDFOLInferenceRule):
     """Modus Tollens: φ → ψ, ¬ψ ⊢ ¬φ"""
 
+    premise_shapes = (LogicOperator.IMPLIES, LogicOperator.NOT)
+
     def __init__(self):
         super().__init__("ModusTollens", "From φ → ψ and ¬ψ, infer ¬φ")
 
@@ -93,6 +97,8 @@ class ModusTollensRule(TDFOLInferenceRule):
 class DisjunctiveSyllogismRule(TDFOLInferenceRule):
     """Disjunctive Syllogism: φ ∨ ψ, ¬φ ⊢ ψ"""
 
+    premise_shapes = (LogicOperator.OR, LogicOperator.NOT)
+
     def __init__(self):
         super().__init__("DisjunctiveSyllogism", "From φ ∨ ψ and ¬φ, infer ψ")
 
@@ -119,6 +125,8 @@ class DisjunctiveSyllogismRule(TDFOLInferenceRule):
 class HypotheticalSyllogismRule(TDFOLInferenceRule):
     """Hypothetical Syllogism: φ → ψ, ψ → χ ⊢ φ → χ"""
 
+    premise_shapes = (LogicOperator.IMPLIES, LogicOperator.IMPLIES)
+
     def __init__(self):
         super().__init__("HypotheticalSyllogism", "From φ → ψ and ψ → χ, infer φ → χ")
 
@@ -143,6 +151,10 @@ class HypotheticalSyllogismRule(TDFOLInferenceRule):
 class ConjunctionIntroductionRule(TDFOLInferenceRule):
     """Conjunction Introduction: φ, ψ ⊢ φ ∧ ψ"""
 
+    premise_shapes = (None, None)
+    introduction = True
+    premises_in_conclusion = True
+
     def __init__(self):
         super().__init__("ConjunctionIntroduction", "From φ and ψ, infer φ ∧ ψ")
 
@@ -156,6 +168,8 @@ class ConjunctionIntroductionRule(TDFOLInferenceRule):
 class ConjunctionEliminationLeftRule(TDFOLInferenceRule):
     """Conjunction Elimination (Left): φ ∧ ψ ⊢ φ"""
 
+    premise_shapes = (LogicOperator.AND,)
+
     def __init__(self):
         super().__init__("ConjunctionEliminationLeft", "From φ ∧ ψ, infer φ")
 
@@ -172,6 +186,8 @@ class ConjunctionEliminationLeftRule(TDFOLInferenceRule):
 class ConjunctionEliminationRightRule(TDFOLInferenceRule):
     """Conjunction Elimination (Right): φ ∧ ψ ⊢ ψ"""
 
+    premise_shapes = (LogicOperator.AND,)
+
     def __init__(self):
         super().__init__("ConjunctionEliminationRight", "From φ ∧ ψ, infer ψ")
 
@@ -188,6 +204,10 @@ class ConjunctionEliminationRightRule(TDFOLInferenceRule):
 class DisjunctionIntroductionLeftRule(TDFOLInferenceRule):
     """Disjunction Introduction (Left): φ ⊢ φ ∨ ψ"""
 
+    premise_shapes = (None, None)
+    introduction = True
+    premises_in_conclusion = True
+
     def __init__(self):
         super().__init__("DisjunctionIntroductionLeft", "From φ, infer φ ∨ ψ for any ψ")
 
@@ -206,6 +226,8 @@ class DisjunctionIntroductionLeftRule(TDFOLInferenceRule):
 class DoubleNegationEliminationRule(TDFOLInferenceRule):
     """Double Negation Elimination: ¬¬φ ⊢ φ"""
 
+    premise_shapes = (LogicOperator.NOT,)
+
     def __init__(self):
         super().__init__("DoubleNegationElimination", "From ¬¬φ, infer φ")
 
@@ -232,6 +254,10 @@ class DoubleNegationEliminationRule(TDFOLInferenceRule):
 class DoubleNegationIntroductionRule(TDFOLInferenceRule):
     """Double Negation Introduction: φ ⊢ ¬¬φ"""
 
+    premise_shapes = (None,)
+    introduction = True
+    premises_in_conclusion = True
+
     def __init__(self):
         super().__init__("DoubleNegationIntroduction", "From φ, infer ¬¬φ")
 
@@ -246,6 +272,8 @@ class DoubleNegationIntroductionRule(TDFOLInferenceRule):
 class ContrapositionRule(TDFOLInferenceRule):
     """Contraposition: φ → ψ ⊢ ¬ψ → ¬φ"""
 
+    premise_shapes = (LogicOperator.IMPLIES,)
+
     def __init__(self):
         super().__init__("Contraposition", "From φ → ψ, infer ¬ψ → ¬φ")
 
@@ -270,6 +298,8 @@ class ContrapositionRule(TDFOLInferenceRule):
 class DeMorganAndRule(TDFOLInferenceRule):
     """De Morgan (AND): ¬(φ ∧ ψ) ⊢ ¬φ ∨ ¬ψ"""
 
+    premise_shapes = (LogicOperator.NOT,)
+
     def __init__(self):
         super().__init__("DeMorganAnd", "From ¬(φ ∧ ψ), infer ¬φ ∨ ¬ψ")
 
@@ -300,6 +330,8 @@ class DeMorganAndRule(TDFOLInferenceRule):
 class DeMorganOrRule(TDFOLInferenceRule):
     """De Morgan (OR): ¬(φ ∨ ψ) ⊢ ¬φ ∧ ¬ψ"""
 
+    premise_shapes = (LogicOperator.NOT,)
+
     def __init__(self):
         super().__init__("DeMorganOr", "From ¬(φ ∨ ψ), infer ¬φ ∧ ¬ψ")
 
@@ -26,6 +26,8 @@ from ..tdfol_core import (
 class TemporalKAxiomRule(TDFOLInferenceRule):
     """K Axiom for Temporal Logic: □(φ → ψ) → (□φ → □ψ)"""
 
+    premise_shapes = (TemporalOperator.ALWAYS, TemporalOperator.ALWAYS)
+
     def __init__(self):
         super().__init__("TemporalKAxiom", "Distribution axiom for □: □(φ → ψ), □φ ⊢ □ψ")
 
@@ -63,6 +65,8 @@ class TemporalKAxiomRule(TDFOLInferenceRule):
 class TemporalTAxiomRule(TDFOLInferenceRule):
     """T Axiom for Temporal Logic: □φ ⊢ φ"""
 
+    premise_shapes = (TemporalOperator.ALWAYS,)
+
     def __init__(self):
         super().__init__("TemporalTAxiom", "Truth axiom: from □φ, infer φ")
 
@@ -82,6 +86,8 @@ class TemporalTAxiomRule(TDFOLInferenceRule):
 class TemporalS4AxiomRule(TDFOLInferenceRule):
     """S4 Axiom for Temporal Logic: □φ ⊢ □□φ"""
 
+    premise_shapes = (TemporalOperator.ALWAYS,)
+
     def __init__(self):
         super().__init__("TemporalS4Axiom", "Transitivity axiom: from □φ, infer □□φ")
 
@@ -101,6 +107,8 @@ class TemporalS4AxiomRule(TDFOLInferenceRule):
 class TemporalS5AxiomRule(TDFOLInferenceRule):
     """S5 Axiom for Temporal Logic: ◊φ ⊢ □◊φ"""
 
+    premise_shapes = (TemporalOperator.EVENTUALLY,)
+
     def __init__(self):
         super().__init__("TemporalS5Axiom", "Euclidean axiom: from ◊φ, infer □◊φ")
 
@@ -120,6 +128,10 @@ class TemporalS5AxiomRule(TDFOLInferenceRule):
 class EventuallyIntroductionRule(TDFOLInferenceRule):
     """Eventually Introduction: φ ⊢ ◊φ"""
 
+    premise_shapes = (None,)
+    introduction = True
+    premises_in_conclusion = True
+
     def __init__(self):
         super().__init__("EventuallyIntroduction", "From φ, infer ◊φ")
 
@@ -133,6 +145,10 @@ class EventuallyIntroductionRule(TDFOLInferenceRule):
 class AlwaysNecessitationRule(TDFOLInferenceRule):
     """Always Necessitation: If ⊢ φ, then ⊢ □φ"""
 
+    premise_shapes = (None,)
+    introduction = True
+    premises_in_conclusion = True
+
     def __init__(self):
         super().__init__("AlwaysNecessitation", "If φ is a theorem, infer □φ")
 
@@ -147,6 +163,8 @@ class AlwaysNecessitationRule(TDFOLInferenceRule):
 class UntilUnfoldingRule(TDFOLInferenceRule):
     """Until Unfolding: φ U ψ ⊢ ψ ∨ (φ ∧ X(φ U ψ))"""
 
+    premise_shapes = (TemporalOperator.UNTIL,)
+
     def __init__(self):
         super().__init__("UntilUnfolding", "Unfold until operator")
 
@@ -176,6 +194,8 @@ class UntilUnfoldingRule(TDFOLInferenceRule):
 class UntilInductionRule(TDFOLInferenceRule):
     """Until Induction: ψ ∨ (φ ∧ X(φ U ψ)) ⊢ φ U ψ"""
 
+    premise_shapes = (LogicOperator.OR,)
+
     def __init__(self):
         super().__init__("UntilInduction", "Fold until operator")
 
@@ -212,6 +232,8 @@ class UntilInductionRule(TDFOLInferenceRule):
 class EventuallyExpansionRule(TDFOLInferenceRule):
     """Eventually Expansion: ◊φ ⊢ φ ∨ X◊φ"""
 
+    premise_shapes = (TemporalOperator.EVENTUALLY,)
+
     def __init__(self):
         super().__init__("EventuallyExpansion", "Expand eventually operator")
 
@@ -237,6 +259,8 @@ class EventuallyExpansionRule(TDFOLInferenceRule):
 class AlwaysDistributionRule(TDFOLInferenceRule):
     """Always Distribution: □(φ ∧ ψ) ⊢ □φ ∧ □ψ"""
 
+    premise_shapes = (TemporalOperator.ALWAYS,)
+
     def __init__(self):
         super().__init__("AlwaysDistribution", "Distribute □ over ∧")
 
@@ -266,6 +290,8 @@ class AlwaysDistributionRule(TDFOLInferenceRule):
 class AlwaysEventuallyExpansionRule(TDFOLInferenceRule):
     """Always-Eventually Expansion: □◊φ ⊢ ◊φ ∧ □◊φ"""
 
+    premise_shapes = (TemporalOperator.ALWAYS,)
+
     def __init__(self):
         super().__init__("AlwaysEventuallyExpansion", "From □◊φ, infer ◊φ and maintain □◊φ")
 
@@ -293,6 +319,8 @@ class AlwaysEventuallyExpansionRule(TDFOLInferenceRule):
 class EventuallyAlwaysContractionRule(TDFOLInferenceRule):
     """Eventually-Always Contraction: ◊□φ, φ ⊢ □φ"""
 
+    premise_shapes = (TemporalOperator.EVENTUALLY, None)
+
     def __init__(self):
         super().__init__("EventuallyAlwaysContraction", "From ◊□φ and φ, infer □φ")
 
@@ -323,6 +351,8 @@ class EventuallyAlwaysContractionRule(TDFOLInferenceRule):
 class UntilReleaseDualityRule(TDFOLInferenceRule):
     """Until-Release Duality: φ U ψ ⊢ ¬(¬φ R ¬ψ)"""
 
+    premise_shapes = (TemporalOperator.UNTIL,)
+
     def __init__(self):
         super().__init__("UntilReleaseDuality", "Until-Release duality: φ U ψ ↔ ¬(¬φ R ¬ψ)")
 
@@ -354,6 +384,8 @@ class UntilReleaseDualityRule(TDFOLInferenceRule):
 class WeakUntilExpansionRule(TDFOLInferenceRule):
     """Weak Until Expansion: φ W ψ ⊢ (φ U ψ) ∨ □φ"""
 
+    premise_shapes = (TemporalOperator.WEAK_UNTIL,)
+
     def __init__(self):
         super().__init__("WeakUntilExpansion", "Weak until expands to: φ W ψ ↔ (φ U ψ) ∨ □φ")
 
@@ -384,6 +416,8 @@ class WeakUntilExpansionRule(TDFOLInferenceRule):
 class NextDistributionRule(TDFOLInferenceRule):
     """Next Distribution: X(φ ∧ ψ) ⊢ Xφ ∧ Xψ"""
 
+    premise_shapes = (TemporalOperator.NEXT,)
+
     def __init__(self):
         super().__init__(
             "NextDistribution", "Next distributes over conjunction: X(φ ∧ ψ) ↔ Xφ ∧ Xψ"
@@ -421,6 +455,8 @@ class NextDistributionRule(TDFOLInferenceRule):
 class EventuallyAggregationRule(TDFOLInferenceRule):
     """Eventually Aggregation: ◊φ ∨ ◊ψ ⊢ ◊(φ ∨ ψ)"""
 
+    premise_shapes = (LogicOperator.OR,)
+
     def __init__(self):
         super().__init__(
             "EventuallyAggregation", "Eventually aggregates disjunction: ◊φ ∨ ◊ψ → ◊(φ ∨ ψ)"
@@ -463,6 +499,8 @@ class EventuallyAggregationRule(TDFOLInferenceRule):
 class TemporalInductionRule(TDFOLInferenceRule):
     """Temporal Induction: □(φ → Xφ), φ ⊢ □φ"""
 
+    premise_shapes = (TemporalOperator.ALWAYS, None)
+
     def __init__(self):
         super().__init__("TemporalInduction", "From □(φ → Xφ) and φ, infer □φ (temporal induction)")
 
@@ -504,6 +542,8 @@ class TemporalInductionRule(TDFOLInferenceRule):
 class UntilInductionStepRule(TDFOLInferenceRule):
     """Until Induction Step: φ U ψ ⊢ ψ ∨ (φ ∧ X(φ U ψ))"""
 
+    premise_shapes = (TemporalOperator.UNTIL,)
+
     def __init__(self):
         super().__init__("UntilInductionStep", "Until induction: (φ U ψ) → ψ ∨ (φ ∧ X(φ U ψ))")
 
@@ -534,6 +574,8 @@ class UntilInductionStepRule(TDFOLInferenceRule):
 class ReleaseCoinductionRule(TDFOLInferenceRule):
     """Release Coinduction: φ R ψ ⊢ ψ ∧ (φ ∨ X(φ R ψ))"""
 
+    premise_shapes = (TemporalOperator.RELEASE,)
+
     def __init__(self):
         super().__init__("ReleaseCoinduction", "Release coinduction: (φ R ψ) ↔ ψ ∧ (φ ∨ X(φ R ψ))")
 
@@ -564,6 +606,8 @@ class ReleaseCoinductionRule(TDFOLInferenceRule):
 class EventuallyDistributionRule(TDFOLInferenceRule):
     """Eventually Distribution: ◊(φ ∧ ψ) ⊢ ◊φ ∧ ◊ψ is INVALID, but reverse is"""
 
+    premise_shapes = (TemporalOperator.EVENTUALLY,)
+
     def __init__(self):
         super().__init__("EventuallyDistribution", "Eventually weakening: ◊(φ ∧ ψ) → ◊φ")
 
@@ -26,6 +26,8 @@ from ..tdfol_core import (
 class TemporalObligationPersistenceRule(TDFOLInferenceRule):
     """Temporal Obligation Persistence: O(□φ) ⊢ □O(φ)"""
 
+    premise_shapes = (DeonticOperator.OBLIGATION,)
+
     def __init__(self):
         super().__init__(
             "TemporalObligationPersistence", "Obligation of always implies always obligated"
@@ -59,6 +61,8 @@ class TemporalObligationPersistenceRule(TDFOLInferenceRule):
 class DeonticTemporalIntroductionRule(TDFOLInferenceRule):
     """Deontic Temporal Introduction: O(φ) ⊢ O(Xφ)"""
 
+    premise_shapes = (DeonticOperator.OBLIGATION,)
+
     def __init__(self):
         super().__init__("DeonticTemporalIntroduction", "Obligation persists to next time")
 
@@ -85,6 +89,8 @@ class DeonticTemporalIntroductionRule(TDFOLInferenceRule):
 class UntilObligationRule(TDFOLInferenceRule):
     """Until Obligation: O(φ U ψ) ⊢ ◊O(ψ)"""
 
+    premise_shapes = (DeonticOperator.OBLIGATION,)
+
     def __init__(self):
         super().__init__(
             "UntilObligation", "Obligation of until implies eventual obligation of goal"
@@ -115,6 +121,8 @@ class UntilObligationRule(TDFOLInferenceRule):
 class AlwaysPermissionRule(TDFOLInferenceRule):
     """Always Permission: P(□φ) ⊢ □P(φ)"""
 
+    premise_shapes = (DeonticOperator.PERMISSION,)
+
     def __init__(self):
         super().__init__("AlwaysPermission", "Permission of always implies always permitted")
 
@@ -146,6 +154,8 @@ class AlwaysPermissionRule(TDFOLInferenceRule):
 class EventuallyForbiddenRule(TDFOLInferenceRule):
     """Eventually Forbidden: F(◊φ) ⊢ □F(φ)"""
 
+    premise_shapes = (DeonticOperator.PROHIBITION,)
+
     def __init__(self):
         super().__init__("EventuallyForbidden", "Forbidden eventually implies always forbidden")
 
@@ -177,6 +187,8 @@ class EventuallyForbiddenRule(TDFOLInferenceRule):
 class ObligationEventuallyRule(TDFOLInferenceRule):
     """Obligation Eventually: O(◊φ) ⊢ ◊O(φ)"""
 
+    premise_shapes = (DeonticOperator.OBLIGATION,)
+
     def __init__(self):
         super().__init__(
             "ObligationEventually", "Obligation of eventually implies eventually obligated"
@@ -210,6 +222,8 @@ class ObligationEventuallyRule(TDFOLInferenceRule):
 class PermissionTemporalWeakeningRule(TDFOLInferenceRule):
     """Permission Temporal Weakening: P(φ) ⊢ P(◊φ)"""
 
+    premise_shapes = (DeonticOperator.PERMISSION,)
+
     def __init__(self):
         super().__init__("PermissionTemporalWeakening", "Permission implies permission eventually")
 
@@ -236,6 +250,8 @@ class PermissionTemporalWeakeningRule(TDFOLInferenceRule):
 class AlwaysObligationDistributionRule(TDFOLInferenceRule):
     """Always-Obligation Distribution: □O(φ) ⊢ O(□φ)"""
 
+    premise_shapes = (TemporalOperator.ALWAYS,)
+
     def __init__(self):
         super().__init__(
             "AlwaysObligationDistribution",
@@ -271,6 +287,8 @@ class AlwaysObligationDistributionRule(TDFOLInferenceRule):
 class FutureObligationPersistenceRule(TDFOLInferenceRule):
     """Future Obligation Persistence: O(Xφ) ⊢ X(O(φ))"""
 
+    premise_shapes = (DeonticOperator.OBLIGATION,)
+
     def __init__(self):
         super().__init__(
             "FutureObligationPersistence", "Future obligation persists: O(Xφ) → X(O(φ))"
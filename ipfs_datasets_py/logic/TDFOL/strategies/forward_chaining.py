@@ -4,18 +4,174 @@ Forward chaining strategy for TDFOL theorem proving.
 This module implements forward chaining proof strategy, which applies
 inference rules to derive new formulas from axioms and theorems until
 the goal formula is proved or no further progress can be made.
+
+Rule application is semi-naive: every round only joins the formulas
+derived in the previous round (the frontier) against the accumulated set,
+so no rule is re-applied to premises it has already seen. Rules are indexed
+by the top-level shape of their premises (``premise_shapes``), so each
+formula is only offered to rules that can match it, and derived formulas
+are deduplicated by structural hash. To keep saturation finite, derived
+formulas may be at most one level deeper than the deepest formula in the
+goal or knowledge base, and introduction rules only keep conclusions that
+occur in them. Rules with three or more premises are joined the same way,
+one premise position at a time.
 """
 
+import itertools
 import logging
 import time
-from typing import List, Set
+from collections import defaultdict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
 
 from .base import ProverStrategy, StrategyType, ProofStep
+from ..inference_rules.base import formula_shape
 from ..tdfol_core import Formula, TDFOLKnowledgeBase
 from ..tdfol_prover import ProofResult, ProofStatus
 
 logger = logging.getLogger(__name__)
 
+# Default cap on formulas derived beyond the knowledge base in one proof.
+DEFAULT_MAX_DERIVED = 10000
+
+# Derived formulas may nest this many levels deeper than the goal and KB.
+_DEPTH_SLACK = 1
+
+_RULE_ERRORS = (AttributeError, TypeError, ValueError, IndexError)
+
+
+def _formula_key(formula: Formula) -> Hashable:
+    """Structural dedup key; falls back to the string form if unhashable."""
+    try:
+        hash(formula)
+        return formula
+    except TypeError:
+        return str(formula)
+
+
+def _children(formula: Formula) -> List[Formula]:
+    children = []
+    for attr in ("formula", "left", "right"):
+        child = getattr(formula, attr, None)
+        if isinstance(child, Formula):
+            children.append(child)
+    return children
+
+
+def _formula_depth(formula: Formula) -> int:
+    """Nesting depth of connectives and operators; 1 for an atom."""
+    return 1 + max((_formula_depth(child) for child in _children(formula)), default=0)
+
+
+def _subformula_keys(formulas: Iterable[Formula]) -> Set[Hashable]:
+    """Keys of the given formulas and all their subformulas."""
+    keys: Set[Hashable] = set()
+    stack = list(formulas)
+    while stack:
+        formula = stack.pop()
+        key = _formula_key(formula)
+        if key in keys:
+            continue
+        keys.add(key)
+        stack.extend(_children(formula))
+    return keys
+
+
+class _RuleIndex:
+    """
+    Inference rules indexed by the top-level shape of their premises.
+
+    ``unary``/``first``/``second`` map a premise shape to the rules whose
+    only/first/second premise requires it; the key None holds rules that
+    accept any formula in that position. ``nary`` maps a shape to
+    ``(rule, position)`` for rules with three or more premises.
+    Introduction rules whose premises all occur in their conclusion
+    (``premises_in_conclusion``) are only applied to formulas that occur in
+    the goal or knowledge base; other introduction rules see every formula
+    and are filtered on their conclusion alone.
+    """
+
+    def __init__(self, rules: Iterable[Any]):
+        self.unary: Dict[Any, List[Any]] = defaultdict(list)
+        self.first: Dict[Any, List[Any]] = defaultdict(list)
+        self.second: Dict[Any, List[Any]] = defaultdict(list)
+        self.nary: Dict[Any, List[Tuple[Any, int]]] = defaultdict(list)
+        self.introduction: Set[int] = set()
+        self.relevant_premises: Set[int] = set()
+        for rule in rules:
+            if not hasattr(rule, "can_apply"):
+                continue
+            shapes = getattr(rule, "premise_shapes", None)
+            if shapes is None:
+                # Unannotated rule: try it everywhere, as a unary and binary rule.
+                self.unary[None].append(rule)
+                self.first[None].append(rule)
+                self.second[None].append(rule)
+                continue
+            if len(shapes) == 1:
+                self.unary[shapes[0]].append(rule)
+            elif len(shapes) == 2:
+                self.first[shapes[0]].append(rule)
+                self.second[shapes[1]].append(rule)
+            else:
+                for position, shape in enumerate(shapes):
+                    self.nary[shape].append((rule, position))
+            if getattr(rule, "introduction", False):
+                self.introduction.add(id(rule))
+                if getattr(rule, "premises_in_conclusion", False):
+                    self.relevant_premises.add(id(rule))
+
+    @staticmethod
+    def _lookup(table: Dict[Any, List[Any]], shape: Any) -> List[Any]:
+        return table.get(shape, []) + table.get(None, [])
+
+    def unary_rules(self, shape: Any) -> List[Any]:
+        return self._lookup(self.unary, shape)
+
+    def first_rules(self, shape: Any) -> List[Any]:
+        return self._lookup(self.first, shape)
+
+    def second_rules(self, shape: Any) -> List[Any]:
+        return self._lookup(self.second, shape)
+
+    def nary_rules(self, shape: Any) -> List[Tuple[Any, int]]:
+        return self._lookup(self.nary, shape)
+
+
+class _DerivedSet:
+    """Accumulated formulas, deduplicated by key and bucketed by shape."""
+
+    def __init__(self, seeds: List[Formula]):
+        self.relevant = _subformula_keys(seeds)
+        self.max_depth = max((_formula_depth(f) for f in seeds), default=0) + _DEPTH_SLACK
+        self.keys: Set[Hashable] = set()
+        self.formulas: List[Formula] = []
+        self.by_shape: Dict[Any, List[Formula]] = defaultdict(list)
+        self.relevant_formulas: List[Formula] = []
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.keys
+
+    def __len__(self) -> int:
+        return len(self.formulas)
+
+    def add(self, formula: Formula) -> bool:
+        key = _formula_key(formula)
+        if key in self.keys:
+            return False
+        self.keys.add(key)
+        self.formulas.append(formula)
+        self.by_shape[formula_shape(formula)].append(formula)
+        if key in self.relevant:
+            self.relevant_formulas.append(formula)
+        return True
+
+    def candidates(self, shape: Any, relevant_only: bool) -> List[Formula]:
+        if relevant_only:
+            return self.relevant_formulas
+        if shape is None:
+            return self.formulas
+        return self.by_shape.get(shape, [])
+
 
 class ForwardChainingStrategy(ProverStrategy):
     """
@@ -26,12 +182,17 @@ class ForwardChainingStrategy(ProverStrategy):
     all available TDFOL inference rules to generate new formulas until either:
     1. The goal formula is derived (proof succeeds)
     2. No new formulas can be generated (proof fails)
-    3. Maximum iterations or timeout is reached
+    3. Maximum iterations, derived formulas or timeout is reached
+
+    Each iteration is one semi-naive round: only pairs involving at least
+    one formula derived in the previous round are tried.
 
     Characteristics:
     - Data-driven: Works forward from known facts
     - Completeness: Complete for Horn clauses
-    - Performance: Can be slow for large knowledge bases
+    - Performance: Rules are indexed by premise shape; introduction rules
+      only build formulas that occur in the goal or knowledge base, and
+      derived formulas are depth-bounded
     - Best for: Goals that follow naturally from axioms
 
     Example:
@@ -44,16 +205,24 @@ class ForwardChainingStrategy(ProverStrategy):
         >>> assert result.is_proved()
     """
 
-    def __init__(self, max_iterations: int = 100, rules=None):
+    def __init__(
+        self,
+        max_iterations: int = 100,
+        rules=None,
+        max_derived: int = DEFAULT_MAX_DERIVED,
+    ):
         """
         Initialize forward chaining strategy.
 
         Args:
             max_iterations: Maximum number of rule application iterations
             rules: Optional list of inference rules (overrides auto-loaded rules)
+            max_derived: Maximum number of formulas derived beyond the
+                knowledge base before giving up
         """
         super().__init__("Forward Chaining", StrategyType.FORWARD_CHAINING)
         self.max_iterations = max_iterations
+        self.max_derived = max_derived
         self.tdfol_rules = rules if rules is not None else []
 
         if rules is None:
@@ -103,32 +272,16 @@ class ForwardChainingStrategy(ProverStrategy):
         # Cap timeout to avoid very long runs; use a sensible default upper bound
         timeout_ms = min(timeout_ms, 2000)
         start_time = time.time()
+        deadline = start_time + timeout_ms / 1000.0
 
-        # Initialize derived collection with axioms and theorems
-        # Use a list to avoid hash issues with TDFOL formulas that contain list attributes
         all_formulas = list(kb.axioms) + list(kb.theorems)
-        derived_list: List[Formula] = list(all_formulas)
-        derived_strs: Set[str] = {str(f) for f in derived_list}
+        goal_key = _formula_key(formula)
+        derived = _DerivedSet(all_formulas + [formula])
+        frontier = [f for f in all_formulas if derived.add(f)]
         proof_steps: List[ProofStep] = []
 
-        def _in_derived(f: Formula) -> bool:
-            """Check membership using string representation (handles unhashable formulas)."""
-            try:
-                return f in derived_list or str(f) in derived_strs
-            except Exception:
-                return any(str(f) == str(x) for x in derived_list)
-
-        def _add_to_derived(f: Formula) -> bool:
-            """Add formula to derived if not already present. Returns True if added."""
-            f_str = str(f)
-            if f_str not in derived_strs:
-                derived_list.append(f)
-                derived_strs.add(f_str)
-                return True
-            return False
-
         # Check if goal is already in derived
-        if _in_derived(formula):
+        if goal_key in derived:
             return ProofResult(
                 status=ProofStatus.PROVED,
                 formula=formula,
@@ -137,7 +290,8 @@ class ForwardChainingStrategy(ProverStrategy):
                 method=self.name,
             )
 
-        # Iteratively apply rules until goal is derived or no progress
+        index = _RuleIndex(self.tdfol_rules)
+        derived_count = 0
         for iteration in range(self.max_iterations):
             # Check timeout
             elapsed_ms = (time.time() - start_time) * 1000
@@ -151,28 +305,40 @@ class ForwardChainingStrategy(ProverStrategy):
                     message=f"Timeout after {iteration} iterations",
                 )
 
-            # Check if goal is derived
-            if _in_derived(formula):
+            budget = self.max_derived - derived_count
+            new_formulas = self._semi_naive_round(
+                index, frontier, derived, proof_steps, goal_key, budget, deadline
+            )
+
+            # No progress made - stop
+            if not new_formulas:
+                break
+
+            for f in new_formulas:
+                derived.add(f)
+            derived_count += len(new_formulas)
+
+            if goal_key in derived:
                 return ProofResult(
                     status=ProofStatus.PROVED,
                     formula=formula,
                     proof_steps=proof_steps,
                     time_ms=(time.time() - start_time) * 1000,
                     method=self.name,
-                    message=f"Proved in {iteration} iterations",
+                    message=f"Proved in {iteration + 1} iterations",
                 )
 
-            # Apply all TDFOL rules to derive new formulas (with deadline)
-            deadline = start_time + timeout_ms / 1000.0
-            new_formulas = self._apply_rules_list(derived_list, proof_steps, deadline=deadline)
-
-            # No progress made - stop
-            if not new_formulas:
-                break
+            if derived_count >= self.max_derived:
+                return ProofResult(
+                    status=ProofStatus.UNKNOWN,
+                    formula=formula,
+                    proof_steps=proof_steps,
+                    time_ms=(time.time() - start_time) * 1000,
+                    method=self.name,
+                    message=f"Forward chaining stopped after deriving {derived_count} formulas",
+                )
 
-            # Add new formulas to derived collection
-            for f in new_formulas:
-                _add_to_derived(f)
+            frontier = new_formulas
 
         # Goal not derived
         return ProofResult(
@@ -184,107 +350,153 @@ class ForwardChainingStrategy(ProverStrategy):
             message=f"Forward chaining exhausted after {self.max_iterations} iterations",
         )
 
-    def _apply_rules(self, derived: Set[Formula], proof_steps: List[ProofStep]) -> Set[Formula]:
+    def _apply_rules(
+        self,
+        frontier: Iterable[Formula],
+        derived: Iterable[Formula],
+        proof_steps: List[ProofStep],
+    ) -> List[Formula]:
         """
-        Apply all inference rules to derived formulas.
+        Run one semi-naive round of rule application.
 
         Args:
-            derived: Set of currently derived formulas
+            frontier: Formulas derived in the previous round
+            derived: All formulas known so far (including the frontier)
             proof_steps: List to append proof steps to
 
         Returns:
-            Set of newly derived formulas
+            List of newly derived formulas (without duplicates)
         """
-        return self._apply_rules_list(list(derived), proof_steps)
+        derived = list(derived)
+        derived_set = _DerivedSet(derived)
+        for f in derived:
+            derived_set.add(f)
+        return self._semi_naive_round(
+            _RuleIndex(self.tdfol_rules),
+            list(frontier),
+            derived_set,
+            proof_steps,
+            goal_key=None,
+            budget=self.max_derived,
+        )
 
-    def _apply_rules_list(
+    def _semi_naive_round(
         self,
-        derived: List["Formula"],
-        proof_steps: List["ProofStep"],
-        deadline: float = None,
-    ) -> List["Formula"]:
+        index: _RuleIndex,
+        frontier: List[Formula],
+        derived: _DerivedSet,
+        proof_steps: List[ProofStep],
+        goal_key: Optional[Hashable],
+        budget: int,
+        deadline: Optional[float] = None,
+    ) -> List[Formula]:
         """
-        Apply all inference rules to derived formulas (list-based, hash-safe).
-
-        Args:
-            derived: List of currently derived formulas
-            proof_steps: List to append proof steps to
-            deadline: Optional absolute time.time() deadline; stop early if exceeded.
-
-        Returns:
-            List of newly derived formulas (without duplicates)
+        Join the frontier against the derived set.
+
+        Unary rules see each frontier formula once. Binary rules see every
+        pair with the frontier formula first and any derived formula second,
+        and every pair with an older (non-frontier) formula first, so each
+        pair is tried exactly once over the whole proof. The round stops
+        early once the goal is derived, ``budget`` new formulas have been
+        produced or the deadline passes.
         """
-        import time as _time
-
         new_formulas: List[Formula] = []
-        derived_strs: Set[str] = {str(f) for f in derived}
-        # Hard cap: never generate more than 200 new formulas per iteration
-        _MAX_NEW = 200
-
-        def _not_in_derived(f: Formula) -> bool:
+        new_keys: Set[Hashable] = set()
+        # Derived formulas are the very objects that were in the frontier.
+        frontier_ids = {id(f) for f in frontier}
+        introduction = index.introduction
+        relevant_premises = index.relevant_premises
+
+        def emit(rule: Any, premises: tuple) -> bool:
+            """Apply ``rule``; return True when the round should stop."""
             try:
-                return str(f) not in derived_strs
-            except Exception:
-                return True
+                if not rule.can_apply(*premises):
+                    return False
+                new_formula = rule.apply(*premises)
+                key = _formula_key(new_formula)
+            except _RULE_ERRORS as e:
+                logger.debug(f"Rule {rule.name} failed: {e}")
+                return False
+            if key in derived or key in new_keys:
+                return False
+            if id(rule) in introduction and key not in derived.relevant:
+                return False
+            if _formula_depth(new_formula) > derived.max_depth:
+                return False
+            new_formulas.append(new_formula)
+            new_keys.add(key)
+            proof_steps.append(
+                ProofStep(
+                    formula=new_formula,
+                    justification=f"Applied {rule.name}",
+                    rule_name=rule.name,
+                    premises=list(premises),
+                )
+            )
+            return key == goal_key or len(new_formulas) >= budget
 
-        # Try each formula with each rule
-        for current_formula in list(derived):
-            if deadline is not None and _time.time() > deadline:
-                break
-            if len(new_formulas) >= _MAX_NEW:
+        if budget <= 0:
+            return new_formulas
+
+        for current in frontier:
+            if deadline is not None and time.time() > deadline:
                 break
-            for rule in self.tdfol_rules:
-                if deadline is not None and _time.time() > deadline:
-                    break
-                if len(new_formulas) >= _MAX_NEW:
-                    break
-                try:
-                    # Try single-formula rules
-                    if hasattr(rule, "can_apply"):
-                        if rule.can_apply(current_formula):
-                            new_formula = rule.apply(current_formula)
-                            if _not_in_derived(new_formula):
-                                new_formulas.append(new_formula)
-                                derived_strs.add(str(new_formula))
-                                proof_steps.append(
-                                    ProofStep(
-                                        formula=new_formula,
-                                        justification=f"Applied {rule.name}",
-                                        rule_name=rule.name,
-                                        premises=[current_formula],
-                                    )
-                                )
-
-                    # Try two-formula rules (only first 20 derived to cap O(n²))
-                    for other_formula in list(derived)[:20]:
-                        if current_formula == other_formula:
-                            continue
-                        if deadline is not None and _time.time() > deadline:
-                            break
-                        if len(new_formulas) >= _MAX_NEW:
-                            break
-                        try:
-                            if hasattr(rule, "can_apply"):
-                                if rule.can_apply(current_formula, other_formula):
-                                    new_formula = rule.apply(current_formula, other_formula)
-                                    if _not_in_derived(new_formula):
-                                        new_formulas.append(new_formula)
-                                        derived_strs.add(str(new_formula))
-                                        proof_steps.append(
-                                            ProofStep(
-                                                formula=new_formula,
-                                                justification=f"Applied {rule.name}",
-                                                rule_name=rule.name,
-                                                premises=[current_formula, other_formula],
-                                            )
-                                        )
-                        except (AttributeError, TypeError, ValueError):
-                            # Rule doesn't support two formulas or application failed
-                            continue
-
-                except (AttributeError, TypeError, ValueError) as e:
-                    logger.debug(f"Rule {rule.name} failed: {e}")
+            shape = formula_shape(current)
+            current_relevant = _formula_key(current) in derived.relevant
+
+            for rule in index.unary_rules(shape):
+                if id(rule) in relevant_premises and not current_relevant:
+                    continue
+                if emit(rule, (current,)):
+                    return new_formulas
+
+            # Frontier formula as the first premise, any derived formula second.
+            for rule in index.first_rules(shape):
+                relevant_only = id(rule) in relevant_premises
+                if relevant_only and not current_relevant:
+                    continue
+                shapes = getattr(rule, "premise_shapes", None)
+                other_shape = shapes[1] if shapes is not None else None
+                for other in derived.candidates(other_shape, relevant_only):
+                    if other is current:
+                        continue
+                    if emit(rule, (current, other)):
+                        return new_formulas
+
+            # Frontier formula as the second premise, an older formula first.
+            for rule in index.second_rules(shape):
+                relevant_only = id(rule) in relevant_premises
+                if relevant_only and not current_relevant:
+                    continue
+                shapes = getattr(rule, "premise_shapes", None)
+                other_shape = shapes[0] if shapes is not None else None
+                for other in derived.candidates(other_shape, relevant_only):
+                    if id(other) in frontier_ids:
+                        continue
+                    if emit(rule, (other, current)):
+                        return new_formulas
+
+            # Rules with three or more premises: the frontier formula takes
+            # the first position holding a frontier formula, so earlier
+            # positions draw from older formulas and later ones from any.
+            for rule, position in index.nary_rules(shape):
+                relevant_only = id(rule) in relevant_premises
+                if relevant_only and not current_relevant:
                     continue
+                pools = []
+                for i, other_shape in enumerate(rule.premise_shapes):
+                    if i == position:
+                        pools.append([current])
+                        continue
+                    pool = derived.candidates(other_shape, relevant_only)
+                    if i < position:
+                        pool = [f for f in pool if id(f) not in frontier_ids]
+                    pools.append(pool)
+                for premises in itertools.product(*pools):
+                    if len({id(f) for f in premises}) < len(premises):
+                        continue
+                    if emit(rule, premises):
+                        return new_formulas
 
         return new_formulas
 
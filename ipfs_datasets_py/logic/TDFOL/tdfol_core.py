@@ -20,6 +20,7 @@ Example TDFOL formulas:
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -484,25 +485,75 @@ class BinaryTemporalFormula(Formula):
 # ============================================================================
 
 
+_FINGERPRINT_MASK = (1 << 128) - 1
+
+
+def _fingerprint_term(kind: str, formula: Formula) -> int:
+    """Stable 128-bit digest of one KB entry (process-independent)."""
+    data = f"{kind}:{formula}".encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=16).digest(), "big")
+
+
 @dataclass
 class TDFOLKnowledgeBase:
-    """Knowledge base for TDFOL formulas with theorem proving support."""
+    """
+    Knowledge base for TDFOL formulas with theorem proving support.
+
+    The knowledge base keeps an order-independent ``fingerprint`` of its
+    axioms and theorems: the sum of a stable digest per entry, updated in
+    O(1) by ``add_axiom``/``add_theorem``. Appending to or reassigning the
+    ``axioms``/``theorems`` lists directly is detected and triggers a full
+    recompute; replacing an entry in place without changing the list length
+    is not detected.
+    """
 
     axioms: List[Formula] = field(default_factory=list)
     theorems: List[Formula] = field(default_factory=list)
     definitions: Dict[str, Formula] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _fingerprint_sum: int = field(default=0, init=False, repr=False, compare=False)
+    _fingerprint_shape: Optional[Tuple[int, int, int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _shape(self) -> Tuple[int, int, int, int]:
+        return (id(self.axioms), len(self.axioms), id(self.theorems), len(self.theorems))
+
+    def _extend_fingerprint(self, kind: str, formula: Formula, entries: List[Formula]) -> None:
+        """Append ``formula`` to ``entries``, folding it into the fingerprint if in sync."""
+        in_sync = self._fingerprint_shape == self._shape()
+        entries.append(formula)
+        if in_sync:
+            self._fingerprint_sum = (
+                self._fingerprint_sum + _fingerprint_term(kind, formula)
+            ) & _FINGERPRINT_MASK
+            self._fingerprint_shape = self._shape()
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Order-independent digest of the axioms and theorems.
+
+        Two knowledge bases holding the same axioms and theorems (as
+        multisets) have the same fingerprint, in any process.
+        """
+        if self._fingerprint_shape != self._shape():
+            total = sum(_fingerprint_term("axiom", f) for f in self.axioms)
+            total += sum(_fingerprint_term("theorem", f) for f in self.theorems)
+            self._fingerprint_sum = total & _FINGERPRINT_MASK
+            self._fingerprint_shape = self._shape()
+        return f"{len(self.axioms)}-{len(self.theorems)}-{self._fingerprint_sum:032x}"
 
     def add_axiom(self, formula: Formula, name: Optional[str] = None) -> None:
         """Add an axiom to the knowledge base."""
-        self.axioms.append(formula)
+        self._extend_fingerprint("axiom", formula, self.axioms)
         if name:
             self.metadata[name] = {"type": "axiom", "formula": formula}
         logger.debug(f"Added axiom: {formula}")
 
     def add_theorem(self, formula: Formula, name: Optional[str] = None) -> None:
         """Add a theorem to the knowledge base."""
-        self.theorems.append(formula)
+        self._extend_fingerprint("theorem", formula, self.theorems)
         if name:
             self.metadata[name] = {"type": "theorem", "formula": formula}
         logger.debug(f"Added theorem: {formula}")
@@ -491,10 +491,11 @@ class TDFOLProver:
             )
 
         # Check cache first (O(1) lookup)
-        # Cache key includes both axioms AND theorems to avoid cross-KB collisions
-        _kb_context = list(self.kb.axioms) + list(self.kb.theorems)
+        # The KB fingerprint covers axioms AND theorems, so different KBs never
+        # share entries, and is maintained incrementally by the KB.
+        kb_fingerprint = self.kb.fingerprint
         if self.proof_cache is not None:
-            cached_result = self.proof_cache.get(goal, _kb_context)
+            cached_result = self.proof_cache.get(goal, kb_fingerprint=kb_fingerprint)
             if cached_result is not None:
                 logger.debug(f"Cache hit for formula: {goal}")
                 return cached_result
@@ -510,7 +511,7 @@ class TDFOLProver:
             )
             # Cache the result
             if self.proof_cache is not None:
-                self.proof_cache.set(goal, result, _kb_context)
+                self.proof_cache.set(goal, result, kb_fingerprint=kb_fingerprint)
             return result
 
         if goal in self.kb.theorems:
@@ -523,7 +524,7 @@ class TDFOLProver:
             )
             # Cache the result
             if self.proof_cache is not None:
-                self.proof_cache.set(goal, result, _kb_context)
+                self.proof_cache.set(goal, result, kb_fingerprint=kb_fingerprint)
             return result
 
         # Use strategy pattern if available
@@ -549,7 +550,7 @@ class TDFOLProver:
 
             # Cache successful proof
             if result.is_proved() and self.proof_cache is not None:
-                self.proof_cache.set(goal, result, _kb_context)
+                self.proof_cache.set(goal, result, kb_fingerprint=kb_fingerprint)
 
             return result
 
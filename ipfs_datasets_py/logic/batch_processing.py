@@ -5,19 +5,57 @@ Features:
 - Async batch FOL conversion
 - Parallel proof execution
 - Memory-efficient processing
+- Backpressured streaming with a bounded in-flight window
 - Progress tracking
 """
 
 import anyio
-from ipfs_datasets_py.utils.anyio_compat import gather as _anyio_gather
+import functools
+import inspect
 import logging
-from typing import List, Dict, Any, Callable
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
 from dataclasses import dataclass, field
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
 import time
 
 logger = logging.getLogger(__name__)
 
+# Streams log progress once per this many completed items.
+_STREAM_PROGRESS_EVERY = 1000
+
+
+async def _aiter_items(items: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator[Any]:
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+def _is_async_callable(func: Callable) -> bool:
+    """True for coroutine functions, async partials and async ``__call__`` objects."""
+    while isinstance(func, functools.partial):
+        func = func.func
+    return inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(
+        getattr(func, "__call__", None)
+    )
+
+
+def _submit_and_wait(pool: Executor, func: Callable, item: Any, kwargs: Dict[str, Any]) -> Any:
+    return pool.submit(func, item, **kwargs).result()
+
 
 @dataclass
 class BatchResult:
@@ -79,47 +117,36 @@ class BatchProcessor:
         """
         Process batch of items asynchronously.
 
+        Items are fed through :meth:`stream`, so at most ``max_concurrency``
+        of them are in flight at once; results keep the input order.
+
         Args:
             items: List of items to process
-            process_func: Async function to process each item
+            process_func: Async function to process each item (a plain
+                function runs in a worker thread or process, see :meth:`stream`)
             **kwargs: Additional arguments for process_func
 
         Returns:
             BatchResult with statistics and results
         """
         start_time = time.time()
-        results = []
-        errors = []
-        successful = 0
-        failed = 0
-
-        async def process_item(item, index):
-            async with self._semaphore:
-                try:
-                    if self.show_progress and index % 10 == 0:
-                        logger.info(f"Processing item {index}/{len(items)}")
-
-                    result = await process_func(item, **kwargs)
-                    return {"success": True, "result": result, "index": index}
-                except Exception as e:
-                    logger.error(f"Error processing item {index}: {e}")
-                    return {"success": False, "error": str(e), "index": index}
-
-        # Process all items concurrently
-        tasks = [process_item(item, i) for i, item in enumerate(items)]
-        completed = await _anyio_gather(*tasks)
-
-        # Collect results
-        for item_result in completed:
-            if isinstance(item_result, Exception):
-                failed += 1
-                errors.append({"error": str(item_result)})
-            elif item_result.get("success"):
-                successful += 1
-                results.append(item_result["result"])
-            else:
-                failed += 1
-                errors.append(item_result)
+        completed = []
+
+        async with self.stream(
+            items, process_func, window=self.max_concurrency, **kwargs
+        ) as outcomes:
+            async for item_result in outcomes:
+                index = item_result["index"]
+                if self.show_progress and index % 10 == 0:
+                    logger.info(f"Processed item {index}/{len(items)}")
+                completed.append(item_result)
+
+        # Collect results in input order
+        completed.sort(key=lambda item_result: item_result["index"])
+        results = [r["result"] for r in completed if r["success"]]
+        errors = [r for r in completed if not r["success"]]
+        successful = len(results)
+        failed = len(errors)
 
         total_time = time.time() - start_time
 
@@ -141,6 +168,152 @@ class BatchProcessor:
 
         return batch_result
 
+    @asynccontextmanager
+    async def stream(
+        self,
+        items: Union[Iterable[Any], AsyncIterable[Any]],
+        process_func: Callable,
+        *,
+        window: Optional[int] = None,
+        ordered: bool = False,
+        **kwargs,
+    ) -> AsyncIterator[AsyncIterator[Dict[str, Any]]]:
+        """
+        Stream items through process_func with a bounded in-flight window.
+
+        Items are pulled from ``items`` (any iterable or async iterable) only
+        as window slots free up, and each outcome is yielded as soon as it
+        completes, or in input order when ``ordered`` is set. A slot is held
+        from the moment an item is pulled until its outcome is handed to the
+        consumer, so at most ``window`` items are in flight or buffered and
+        memory stays O(window) however long the input is; a slow consumer
+        pauses the input instead of piling up results. At most
+        ``max_concurrency`` items are processed at once.
+
+        ``process_func`` may be a coroutine function (run on the event loop)
+        or a plain function, run in a worker thread, or in a process pool of
+        ``max_concurrency`` workers when ``use_process_pool`` is set (for
+        CPU-bound work; the function, items, kwargs and results must then
+        be picklable).
+
+        Example:
+            >>> async with processor.stream(texts, convert, ordered=True) as outcomes:
+            ...     async for outcome in outcomes:
+            ...         handle(outcome)
+
+        Args:
+            items: Items to process, consumed lazily
+            process_func: Function to process each item
+            window: Maximum items in flight or awaiting the consumer
+                (default: twice max_concurrency)
+            ordered: Yield outcomes in input order instead of completion order
+            **kwargs: Additional arguments for process_func
+
+        Yields:
+            An async iterator of ``{"success": True, "result": ..., "index": i}``
+            or ``{"success": False, "error": str, "index": i}`` dicts. An
+            exception raised by ``items`` itself is re-raised from it once
+            the items already started have been yielded.
+        """
+        window = 2 * self.max_concurrency if window is None else window
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        limiter = anyio.CapacityLimiter(max(1, min(window, self.max_concurrency)))
+        is_async = _is_async_callable(process_func)
+        pool = (
+            ProcessPoolExecutor(max_workers=self.max_concurrency)
+            if self.use_process_pool and not is_async
+            else None
+        )
+        slots = anyio.Semaphore(window)
+        send, receive = anyio.create_memory_object_stream(window)
+        input_errors: List[BaseException] = []
+
+        async def call(item):
+            if is_async:
+                async with limiter:
+                    return await process_func(item, **kwargs)
+            if pool is not None:
+                run = functools.partial(_submit_and_wait, pool, process_func, item, kwargs)
+            else:
+                run = functools.partial(process_func, item, **kwargs)
+            result = await anyio.to_thread.run_sync(run, limiter=limiter)
+            if inspect.isawaitable(result):
+                # A plain callable that hands back a coroutine (e.g. a lambda)
+                async with limiter:
+                    return await result
+            return result
+
+        async def process_item(item, index):
+            try:
+                outcome = {"success": True, "result": await call(item), "index": index}
+            except Exception as e:
+                logger.error(f"Error processing item {index}: {e}")
+                outcome = {"success": False, "error": str(e), "index": index}
+            await send.send(outcome)
+
+        async def feed():
+            async with send:
+                async with anyio.create_task_group() as workers:
+                    source = _aiter_items(items)
+                    index = 0
+                    try:
+                        while True:
+                            # Take the slot before pulling, so at most
+                            # ``window`` items are ever out of the input.
+                            await slots.acquire()
+                            try:
+                                item = await source.__anext__()
+                            except StopAsyncIteration:
+                                break
+                            workers.start_soon(process_item, item, index)
+                            index += 1
+                    except Exception as e:
+                        input_errors.append(e)
+                    finally:
+                        await source.aclose()
+
+        async def outcomes():
+            pending: Dict[int, Dict[str, Any]] = {}
+            next_index = 0
+            done = 0
+            async with receive:
+                async for outcome in receive:
+                    if ordered:
+                        pending[outcome["index"]] = outcome
+                        ready = []
+                        while next_index in pending:
+                            ready.append(pending.pop(next_index))
+                            next_index += 1
+                    else:
+                        ready = [outcome]
+                    for outcome in ready:
+                        done += 1
+                        if self.show_progress and done % _STREAM_PROGRESS_EVERY == 0:
+                            logger.info(f"Streamed {done} items")
+                        slots.release()
+                        yield outcome
+            if input_errors:
+                raise input_errors[0]
+
+        try:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(feed)
+                try:
+                    yield outcomes()
+                finally:
+                    # Stop pulling input if the consumer left early.
+                    tg.cancel_scope.cancel()
+        except BaseExceptionGroup as group:
+            # Surface the consumer's own exception, not the task group's wrapper.
+            if len(group.exceptions) == 1:
+                raise group.exceptions[0] from None
+            raise
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
     def process_batch_parallel(
         self, items: List[Any], process_func: Callable, **kwargs
     ) -> BatchResult:
@@ -238,30 +411,95 @@ class FOLBatchProcessor:
         """
         from ipfs_datasets_py.logic.fol.text_to_fol import convert_text_to_fol
 
-        async def convert_single(text):
-            return await convert_text_to_fol(
-                text,
-                use_nlp=use_nlp,
-                confidence_threshold=confidence_threshold,
-            )
-
         return await self.processor.process_batch_async(
             items=texts,
-            process_func=convert_single,
+            process_func=convert_text_to_fol,
+            use_nlp=use_nlp,
+            confidence_threshold=confidence_threshold,
         )
 
+    def convert_stream(
+        self,
+        texts: Union[Iterable[str], AsyncIterable[str]],
+        use_nlp: bool = True,
+        confidence_threshold: float = 0.7,
+        *,
+        window: Optional[int] = None,
+        ordered: bool = False,
+    ):
+        """
+        Stream texts through FOL conversion with a bounded in-flight window.
+
+        Suited to conversion jobs too large to hold in memory: ``texts`` is
+        consumed lazily. See :meth:`BatchProcessor.stream`.
+
+        Example:
+            >>> async with fol_processor.convert_stream(lines, ordered=True) as outcomes:
+            ...     async for outcome in outcomes:
+            ...         write(outcome)
+
+        Args:
+            texts: Natural language texts (any iterable or async iterable)
+            use_nlp: Whether to use NLP extraction
+            confidence_threshold: Minimum confidence threshold
+            window: Maximum texts in flight or awaiting the consumer
+            ordered: Yield outcomes in input order
+
+        Returns:
+            Async context manager yielding an async iterator of outcome dicts
+        """
+        from ipfs_datasets_py.logic.fol.text_to_fol import convert_text_to_fol
+
+        return self.processor.stream(
+            texts,
+            convert_text_to_fol,
+            window=window,
+            ordered=ordered,
+            use_nlp=use_nlp,
+            confidence_threshold=confidence_threshold,
+        )
+
+
+_WORKER_PROOF_ENGINES: Dict[bool, Any] = {}
+
+
+def _prove_formula(formula: Any, prover: str = "z3", use_cache: bool = True) -> Any:
+    """Prove formula with this process's engine; the process-pool entry point."""
+    engine = _WORKER_PROOF_ENGINES.get(use_cache)
+    if engine is None:
+        from ipfs_datasets_py.logic.integration.reasoning.proof_execution_engine import (
+            ProofExecutionEngine,
+        )
+
+        engine = ProofExecutionEngine(enable_caching=use_cache)
+        _WORKER_PROOF_ENGINES[use_cache] = engine
+    return engine.prove_deontic_formula(formula, prover=prover, use_cache=use_cache)
+
 
 class ProofBatchProcessor:
     """Optimized batch processor for proof execution."""
 
-    def __init__(self, max_concurrency: int = 5):
+    def __init__(self, max_concurrency: int = 5, use_process_pool: bool = False):
         """
         Initialize proof batch processor.
 
         Args:
             max_concurrency: Maximum concurrent proofs
+            use_process_pool: Run proofs in a pool of worker processes, each
+                with its own engine, instead of threads sharing one engine
         """
-        self.processor = BatchProcessor(max_concurrency=max_concurrency)
+        self.processor = BatchProcessor(
+            max_concurrency=max_concurrency, use_process_pool=use_process_pool
+        )
+
+    def _prove_func(self, use_cache: bool) -> Callable:
+        if self.processor.use_process_pool:
+            return _prove_formula
+        from ipfs_datasets_py.logic.integration.reasoning.proof_execution_engine import (
+            ProofExecutionEngine,
+        )
+
+        return ProofExecutionEngine(enable_caching=use_cache).prove_deontic_formula
 
     async def prove_batch(
         self,
@@ -280,22 +518,45 @@ class ProofBatchProcessor:
         Returns:
             BatchResult with proof results
         """
-        from ipfs_datasets_py.logic.integration.proof_execution_engine import ProofExecutionEngine
+        return await self.processor.process_batch_async(
+            items=formulas,
+            process_func=self._prove_func(use_cache),
+            prover=prover,
+            use_cache=use_cache,
+        )
 
-        engine = ProofExecutionEngine(enable_caching=use_cache)
+    def prove_stream(
+        self,
+        formulas: Union[Iterable[Any], AsyncIterable[Any]],
+        prover: str = "z3",
+        use_cache: bool = True,
+        *,
+        window: Optional[int] = None,
+        ordered: bool = False,
+    ):
+        """
+        Stream formulas through the prover with a bounded in-flight window.
 
-        async def prove_single(formula):
-            # Wrap sync prove in async
-            return await anyio.to_thread.run_sync(
-                engine.prove_deontic_formula,
-                formula,
-                prover=prover,
-                use_cache=use_cache,
-            )
+        See :meth:`BatchProcessor.stream`; with ``use_process_pool`` the
+        formulas and proof results must be picklable.
 
-        return await self.processor.process_batch_async(
-            items=formulas,
-            process_func=prove_single,
+        Args:
+            formulas: Formulas to prove (any iterable or async iterable)
+            prover: Prover to use
+            use_cache: Whether to use proof caching
+            window: Maximum formulas in flight or awaiting the consumer
+            ordered: Yield outcomes in input order
+
+        Returns:
+            Async context manager yielding an async iterator of outcome dicts
+        """
+        return self.processor.stream(
+            formulas,
+            self._prove_func(use_cache),
+            window=window,
+            ordered=ordered,
+            prover=prover,
+            use_cache=use_cache,
         )
 
 
@@ -657,13 +657,14 @@ class ProofCache:
         formula,
         axioms: Optional[List] = None,
         prover_name: str = "unknown",
-        prover_config: Optional[Dict] = None
+        prover_config: Optional[Dict] = None,
+        kb_fingerprint: Optional[str] = None,
     ) -> str:
         """Compute CID for a proof query.
         
         The CID is computed from:
         - Formula (canonical representation)
-        - Axioms (if any)
+        - Axioms (if any), or the knowledge-base fingerprint when given
         - Prover name
         - Prover configuration (if any)
         
@@ -674,6 +675,9 @@ class ProofCache:
             axioms: Optional list of axioms
             prover_name: Name of prover
             prover_config: Optional prover configuration
+            kb_fingerprint: Optional precomputed digest of the axioms (e.g.
+                ``TDFOLKnowledgeBase.fingerprint``); replaces ``axioms`` so
+                the key costs O(1) in the knowledge-base size
             
         Returns:
             CID string (content identifier)
@@ -681,10 +685,13 @@ class ProofCache:
         # Build canonical representation
         query_obj = {
             'formula': str(formula),
-            'axioms': [str(a) for a in axioms] if axioms else [],
             'prover': prover_name,
             'config': prover_config or {}
         }
+        if kb_fingerprint is not None:
+            query_obj['kb'] = kb_fingerprint
+        else:
+            query_obj['axioms'] = [str(a) for a in axioms] if axioms else []
         
         # Compute CID
         try:
@@ -708,6 +715,7 @@ class ProofCache:
         prover_config: Optional[Dict] = None,
         *,
         axioms: Optional[List] = None,
+        kb_fingerprint: Optional[str] = None,
     ) -> Optional[Any]:
         """Get cached proof result (O(1) lookup).
 
@@ -725,6 +733,7 @@ class ProofCache:
             prover_name: prover name (keyword arg takes priority over positional)
             prover_config: Optional prover configuration
             axioms: explicit axioms keyword arg (takes priority over positional)
+            kb_fingerprint: Knowledge-base fingerprint used instead of axioms
 
         Returns:
             Cached proof result if found, None otherwise
@@ -762,7 +771,7 @@ class ProofCache:
                 self.stats['hits'] += 1
                 return entry.result
 
-        cid = self._compute_cid(formula, _axioms, _prover_name, prover_config)
+        cid = self._compute_cid(formula, _axioms, _prover_name, prover_config, kb_fingerprint)
 
         # Check CID-based local cache
         with self.lock:
@@ -814,7 +823,8 @@ class ProofCache:
         result: Any,
         axioms: Optional[List] = None,
         prover_name: str = "unknown",
-        prover_config: Optional[Dict] = None
+        prover_config: Optional[Dict] = None,
+        kb_fingerprint: Optional[str] = None,
     ) -> str:
         """Cache a proof result (O(1) insertion).
         
@@ -826,11 +836,12 @@ class ProofCache:
             axioms: Optional list of axioms
             prover_name: Name of prover
             prover_config: Optional prover configuration
+            kb_fingerprint: Knowledge-base fingerprint used instead of axioms
             
         Returns:
             CID of the cached entry
         """
-        cid = self._compute_cid(formula, axioms, prover_name, prover_config)
+        cid = self._compute_cid(formula, axioms, prover_name, prover_config, kb_fingerprint)
         
         with self.lock:
             cached_result = CachedProofResult(
@@ -881,7 +892,7 @@ class ProofCache:
             cid=cid,
             prover_name=prover_name,
             prover_config=prover_config,
-            axioms=axioms,
+            axioms=(f"kb:{kb_fingerprint}",) if kb_fingerprint is not None else axioms,
         )
         
         return cid
@@ -891,7 +902,8 @@ class ProofCache:
         formula,
         axioms: Optional[List] = None,
         prover_name: str = "unknown",
-        prover_config: Optional[Dict] = None
+        prover_config: Optional[Dict] = None,
+        kb_fingerprint: Optional[str] = None,
     ) -> bool:
         """Invalidate a cached entry.
         
@@ -900,11 +912,14 @@ class ProofCache:
             axioms: Optional list of axioms
             prover_name: Name of prover
             prover_config: Optional prover configuration
+            kb_fingerprint: Knowledge-base fingerprint used instead of axioms
             
         Returns:
             True if entry was found and removed, False otherwise
         """
-        cid = self._compute_cid(formula, axioms, prover_name, prover_config)
+        cid = self._compute_cid(formula, axioms, prover_name, prover_config, kb_fingerprint)
+        if kb_fingerprint is not None:
+            axioms = (f"kb:{kb_fingerprint}",)
 
         repo = self.shadow_repository
         if repo is not None:
@@ -53,6 +53,8 @@ Every attempt is captured as an untrusted
 :class:`~.models.SolverAttemptRecord` plus out-of-band
 :class:`~.portfolio.SolverAttemptEvidence` (exact command, input digest,
 raw stdout/stderr, solver trace) — never as a verified result.
+:class:`~.portfolio.SolverPortfolioRuntime` keeps a portfolio's workers,
+scheduler envelope and scratch directory warm across batch runs.
 
 Normalizing the raw, solver-specific evidence produced by that portfolio
 (TSTP/TPTP derivation listings, SMT-LIB unsat-core/model s-expressions) into
@@ -138,10 +140,12 @@ from .models import (
 )
 from .premise_selection import (
     DETERMINISTIC_BASELINE_METHOD,
+    DETERMINISTIC_IDF_METHOD,
     ExcludedPremise,
     GoalFeatures,
     InvalidTopKError,
     PremiseExclusionReason,
+    PremiseIndex,
     PremiseSelectionError,
     PremiseSelectionResult,
     PremiseSelectionWeights,
@@ -236,6 +240,7 @@ from .portfolio import (
     PortfolioRunResult,
     SolverAttemptEvidence,
     SolverPortfolio,
+    SolverPortfolioRuntime,
     SolverProcessOutcome,
     build_solver_input_text,
     parse_smtlib_verdict,
@@ -370,6 +375,7 @@ __all__ = [
     "DEFAULT_GRAPH_SELECTOR_MODEL_ID",
     "DEFAULT_RECONSTRUCTION_TIMEOUT_SECONDS",
     "DETERMINISTIC_BASELINE_METHOD",
+    "DETERMINISTIC_IDF_METHOD",
     "DecompositionPlan",
     "DecompositionSource",
     "DecompositionSubgoal",
@@ -439,6 +445,7 @@ __all__ = [
     "PersistentProofCache",
     "PersistentProofObligationCache",
     "PremiseExclusionReason",
+    "PremiseIndex",
     "PremiseRecord",
     "PremiseSelectionError",
     "PremiseSelectionResult",
@@ -473,6 +480,7 @@ __all__ = [
     "SolverAttemptRecord",
     "SolverBudget",
     "SolverPortfolio",
+    "SolverPortfolioRuntime",
     "SolverProcessOutcome",
     "SolverSpec",
     "SolverVerdict",
@@ -40,6 +40,10 @@ Pipeline
    group is killed (the cancellation budget) — a cancelled attempt is
    still recorded (verdict ``unknown``, never fabricated as conclusive),
    never silently dropped.
+5. For batch runs over many goals, :class:`SolverPortfolioRuntime` keeps
+   the scheduler envelope, a scratch directory and a pool of worker threads
+   alive across ``run`` calls, bounding the total number of solver
+   processes across every concurrent run instead of per call.
 
 Trust boundary
 ---------------
@@ -63,6 +67,7 @@ contents) appears in ``argv``.
 from __future__ import annotations
 
 import concurrent.futures
+import contextlib
 import hashlib
 import os
 import re
@@ -120,6 +125,7 @@ __all__ = [
     "parse_tptp_verdict",
     "run_bounded_solver_process",
     "SolverPortfolio",
+    "SolverPortfolioRuntime",
 ]
 
 #: Verdicts that count as "conclusive" for the cancellation budget: once any
@@ -538,6 +544,10 @@ class PortfolioRunResult:
 #: executable path.
 _ResolvedAttempt = Tuple[PortfolioAttemptSpec, str]
 
+#: One attempt queued for execution: ``(spec, executable_path, budget,
+#: attempt_id, scratch_directory)``.
+_WorkItem = Tuple[PortfolioAttemptSpec, str, SolverBudget, str, str]
+
 
 class SolverPortfolio:
     """Executes an allowlisted Z3/CVC5/Vampire/E solver portfolio under a
@@ -703,14 +713,7 @@ class SolverPortfolio:
             request_id=request_id,
         ) as portfolio_lease:
             with supervised_temporary_directory(prefix="itp_hammer_portfolio_") as tmp_dir:
-                work_items = []
-                for index, (spec, executable_path) in enumerate(permitted):
-                    budget = self.policy.budget_for(spec.solver_name)
-                    attempt_id = (
-                        f"{request_id}:{spec.translation.translation_id}:{spec.solver_name}:{index}"
-                    )
-                    work_items.append((spec, executable_path, budget, attempt_id, tmp_dir))
-
+                work_items = self._work_items(request_id, permitted, tmp_dir)
                 with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
                     futures = [
                         executor.submit(
@@ -723,16 +726,13 @@ class SolverPortfolio:
                         for item in work_items
                     ]
                     for future in concurrent.futures.as_completed(futures):
-                        attempt_id, record, attempt_evidence, was_cancelled = future.result()
-                        records.append(record)
-                        evidence[attempt_id] = attempt_evidence
-                        if was_cancelled:
-                            cancelled_ids.append(attempt_id)
-                        if (
-                            self.policy.cancel_on_first_conclusive
-                            and record.verdict in _CONCLUSIVE_VERDICTS
-                        ):
-                            portfolio_cancel_event.set()
+                        self._collect(
+                            future.result(),
+                            records,
+                            evidence,
+                            cancelled_ids,
+                            portfolio_cancel_event,
+                        )
 
         records.sort(key=lambda r: r.attempt_id)
         return PortfolioRunResult(
@@ -750,36 +750,51 @@ class SolverPortfolio:
             },
         )
 
-    def _run_one(
+    def _work_items(
+        self, request_id: str, permitted: List[_ResolvedAttempt], tmp_dir: str
+    ) -> List[_WorkItem]:
+        work_items: List[_WorkItem] = []
+        for index, (spec, executable_path) in enumerate(permitted):
+            budget = self.policy.budget_for(spec.solver_name)
+            attempt_id = (
+                f"{request_id}:{spec.translation.translation_id}:{spec.solver_name}:{index}"
+            )
+            work_items.append((spec, executable_path, budget, attempt_id, tmp_dir))
+        return work_items
+
+    def _collect(
         self,
-        request_id: str,
-        item: Tuple[PortfolioAttemptSpec, str, SolverBudget, str, str],
+        outcome: Tuple[str, SolverAttemptRecord, SolverAttemptEvidence, bool],
+        records: List[SolverAttemptRecord],
+        evidence: Dict[str, SolverAttemptEvidence],
+        cancelled_ids: List[str],
+        cancel_event: _PortfolioCancellationSignal,
+    ) -> None:
+        attempt_id, record, attempt_evidence, was_cancelled = outcome
+        records.append(record)
+        evidence[attempt_id] = attempt_evidence
+        if was_cancelled:
+            cancelled_ids.append(attempt_id)
+        if self.policy.cancel_on_first_conclusive and record.verdict in _CONCLUSIVE_VERDICTS:
+            cancel_event.set()
+
+    def _input_path(self, attempt_id: str, tmp_dir: str, suffix: str) -> str:
+        return os.path.join(tmp_dir, _input_filename(attempt_id, suffix))
+
+    def _launch(
+        self,
+        spec: PortfolioAttemptSpec,
+        executable_path: str,
+        command: List[str],
+        budget: SolverBudget,
+        attempt_id: str,
         cancel_event: _PortfolioCancellationSignal,
         portfolio_lease: ResourceLeaseToken,
-    ) -> Tuple[str, SolverAttemptRecord, SolverAttemptEvidence, bool]:
-        spec, executable_path, budget, attempt_id, tmp_dir = item
-        translation = spec.translation
+    ) -> Tuple[SolverProcessOutcome, Optional[str], Optional[ResourceLease]]:
+        """Run one solver under a child lease of ``portfolio_lease``; return
+        the outcome, the probed solver version and the (released) lease."""
 
-        input_text = build_solver_input_text(translation)
-        input_digest = compute_content_digest(
-            {
-                "solver_name": spec.solver_name,
-                "target": translation.target.value,
-                "text": input_text,
-            }
-        )
-        suffix = _SOLVER_INPUT_SUFFIX[translation.target]
-        input_path = os.path.join(tmp_dir, _input_filename(attempt_id, suffix))
-        with open(input_path, "w", encoding="utf-8") as fh:
-            fh.write(input_text)
-
-        # `command` is a literal argv list built only from a resolved
-        # executable path, fixed CLI flags, and this file *path* — never
-        # from `input_text` itself.
-        command = self.policy.build_command(spec.solver_name, executable_path, input_path, budget)
         solver_version: Optional[str] = None
-
-        started_at = _utcnow()
         solver_lease: Optional[ResourceLease] = None
         try:
             solver_lease = self.resource_scheduler.acquire(
@@ -809,6 +824,40 @@ class SolverPortfolio:
                         budget=budget,
                         cancel_event=lease_cancellation,
                     )
+        return outcome, solver_version, solver_lease
+
+    def _run_one(
+        self,
+        request_id: str,
+        item: _WorkItem,
+        cancel_event: _PortfolioCancellationSignal,
+        portfolio_lease: ResourceLeaseToken,
+    ) -> Tuple[str, SolverAttemptRecord, SolverAttemptEvidence, bool]:
+        spec, executable_path, budget, attempt_id, tmp_dir = item
+        translation = spec.translation
+
+        input_text = build_solver_input_text(translation)
+        input_digest = compute_content_digest(
+            {
+                "solver_name": spec.solver_name,
+                "target": translation.target.value,
+                "text": input_text,
+            }
+        )
+        suffix = _SOLVER_INPUT_SUFFIX[translation.target]
+        input_path = self._input_path(attempt_id, tmp_dir, suffix)
+        with open(input_path, "w", encoding="utf-8") as fh:
+            fh.write(input_text)
+
+        # `command` is a literal argv list built only from a resolved
+        # executable path, fixed CLI flags, and this file *path* — never
+        # from `input_text` itself.
+        command = self.policy.build_command(spec.solver_name, executable_path, input_path, budget)
+
+        started_at = _utcnow()
+        outcome, solver_version, solver_lease = self._launch(
+            spec, executable_path, command, budget, attempt_id, cancel_event, portfolio_lease
+        )
         finished_at = _utcnow()
 
         raw_output_digest = compute_content_digest(
@@ -876,3 +925,253 @@ class SolverPortfolio:
         )
 
         return attempt_id, record, attempt_evidence, outcome.cancelled
+
+
+class SolverPortfolioRuntime(SolverPortfolio):
+    """A long-lived :class:`SolverPortfolio` for batch hammer runs.
+
+    Every :meth:`SolverPortfolio.run` call pays its own setup — a root
+    scheduler lease plus two telemetry snapshots, a fresh supervised
+    temporary directory, a new thread pool and one child lease per solver —
+    and over thousands of goals that setup, not the solvers, dominates. The
+    runtime pays it once: on first use it acquires one scheduler envelope of
+    ``max_concurrent_processes`` CPU slots (under ``parent_lease`` if
+    given), one supervised scratch directory and a pool of that many warm
+    worker threads, and keeps them until :meth:`close`.
+
+    - All ``run`` calls, from any number of threads, share the pool, so at
+      most ``max_concurrent_processes`` solver processes run at once across
+      all of them; each run still keeps at most
+      ``policy.max_parallel_processes`` attempts in flight.
+    - Each worker rewrites its own input file in the scratch directory for
+      every attempt instead of creating a file in a new directory.
+    - Solvers run directly under the envelope rather than under a child
+      lease each: the pool already bounds them to the envelope's slots.
+      Cancelling the envelope cancels every running solver, and the next
+      run acquires a fresh one.
+    - A conclusive verdict cancels the run's other attempts exactly as in
+      :class:`SolverPortfolio`; attempts still queued never start a process.
+
+    Every attempt still runs in its own bounded solver process, so budgets,
+    process-group cleanup and the argv-only security invariant are unchanged
+    and no solver state carries over between goals.
+    """
+
+    def __init__(
+        self,
+        policy: PortfolioPolicy,
+        *,
+        max_concurrent_processes: Optional[int] = None,
+        parent_lease: Optional[ResourceLease | ResourceLeaseToken] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(policy, **kwargs)
+        if max_concurrent_processes is None:
+            max_concurrent_processes = max(1, int(policy.max_parallel_processes))
+        if (
+            isinstance(max_concurrent_processes, bool)
+            or not isinstance(max_concurrent_processes, int)
+            or max_concurrent_processes <= 0
+        ):
+            raise ValueError("max_concurrent_processes must be a positive integer")
+        self.max_concurrent_processes = max_concurrent_processes
+        self._parent_lease = parent_lease
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._active_runs: List[_PortfolioCancellationSignal] = []
+        self._closed = False
+        self._envelope: Optional[ResourceLease] = None
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._scratch: Optional[contextlib.ExitStack] = None
+        self._scratch_dir: Optional[str] = None
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _envelope_memory_mb(self) -> int:
+        allowed = [
+            name
+            for name in self.policy.hammer_policy.allowed_solvers
+            if name in known_solver_names()
+        ]
+        per_process = max(
+            (int(self.policy.budget_for(name).memory_mb or 0) for name in allowed), default=0
+        )
+        return per_process * self.max_concurrent_processes
+
+    def _start(
+        self, run_cancel_event: _PortfolioCancellationSignal
+    ) -> Tuple[ResourceLease, concurrent.futures.ThreadPoolExecutor, str]:
+        """Register a run, (re)acquiring whatever the runtime does not hold."""
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("SolverPortfolioRuntime is closed")
+            if self._envelope is not None and self._envelope.cancelled:
+                self._envelope.release()
+                self._envelope = None
+            if self._envelope is None:
+                self._envelope = self.resource_scheduler.acquire(
+                    self.resource_lane,
+                    cpu_slots=self.max_concurrent_processes,
+                    memory_mb=self._envelope_memory_mb(),
+                    parent_lease=self._parent_lease,
+                    timeout=self.resource_wait_timeout_seconds,
+                    cancel_event=run_cancel_event,
+                    request_id="solver-portfolio-runtime",
+                )
+            if self._scratch_dir is None:
+                self._scratch = contextlib.ExitStack()
+                self._scratch_dir = self._scratch.enter_context(
+                    supervised_temporary_directory(prefix="itp_hammer_portfolio_runtime_")
+                )
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_concurrent_processes,
+                    thread_name_prefix="solver-portfolio",
+                )
+            self._active_runs.append(run_cancel_event)
+            return self._envelope, self._executor, self._scratch_dir
+
+    def _finish(self, run_cancel_event: _PortfolioCancellationSignal) -> None:
+        with self._lock:
+            self._active_runs.remove(run_cancel_event)
+            self._idle.notify_all()
+
+    def run(
+        self,
+        request_id: str,
+        attempts: Sequence[PortfolioAttemptSpec],
+        *,
+        parent_lease: Optional[ResourceLease | ResourceLeaseToken] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> PortfolioRunResult:
+        """Execute ``attempts`` on the runtime's warm workers; same contract
+        as :meth:`SolverPortfolio.run`. Safe to call from several threads at
+        once. ``parent_lease`` must be given to the constructor instead,
+        since the runtime holds one envelope across runs.
+
+        Raises:
+            ValueError: If ``parent_lease`` is passed.
+            RuntimeError: If the runtime has been closed.
+        """
+
+        _require_nonempty_str(
+            request_id, field_name="request_id", owner="SolverPortfolioRuntime.run"
+        )
+        if parent_lease is not None:
+            raise ValueError(
+                "SolverPortfolioRuntime holds one lease across runs; pass parent_lease "
+                "to the constructor instead"
+            )
+
+        permitted, denied = self.resolve_attempts(attempts)
+        if not permitted:
+            return PortfolioRunResult(request_id=request_id, denied=denied)
+
+        portfolio_cancel_event = _PortfolioCancellationSignal(cancel_event)
+        envelope, executor, scratch_dir = self._start(portfolio_cancel_event)
+        attempt_cancel_event = envelope.combined_cancellation_signal(portfolio_cancel_event)
+        records: List[SolverAttemptRecord] = []
+        evidence: Dict[str, SolverAttemptEvidence] = {}
+        cancelled_ids: List[str] = []
+
+        queued = list(reversed(self._work_items(request_id, permitted, scratch_dir)))
+        in_flight: set = set()
+
+        def submit_next() -> None:
+            if queued:
+                in_flight.add(
+                    executor.submit(
+                        self._run_one,
+                        request_id,
+                        queued.pop(),
+                        attempt_cancel_event,
+                        envelope.token,
+                    )
+                )
+
+        try:
+            for _ in range(max(1, int(self.policy.max_parallel_processes))):
+                submit_next()
+            while in_flight:
+                done, _ = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    in_flight.discard(future)
+                    self._collect(
+                        future.result(), records, evidence, cancelled_ids, portfolio_cancel_event
+                    )
+                    submit_next()
+        except BaseException:
+            portfolio_cancel_event.set()
+            concurrent.futures.wait(in_flight)
+            raise
+        finally:
+            self._finish(portfolio_cancel_event)
+
+        records.sort(key=lambda r: r.attempt_id)
+        return PortfolioRunResult(
+            request_id=request_id,
+            attempts=records,
+            evidence=evidence,
+            denied=denied,
+            cancelled_attempt_ids=sorted(cancelled_ids),
+            resource_telemetry={
+                "lane": self.resource_lane,
+                "portfolio_cpu_slots": envelope.cpu_slots,
+                "portfolio_memory_mb": envelope.memory_mb,
+                "runtime_lease_wait_seconds": envelope.wait_seconds,
+            },
+        )
+
+    def _input_path(self, attempt_id: str, tmp_dir: str, suffix: str) -> str:
+        # A worker runs one attempt at a time and waits for its process to
+        # exit, so it can safely rewrite the same file for every attempt.
+        return os.path.join(tmp_dir, f"worker-{threading.get_ident()}{suffix}")
+
+    def _launch(
+        self,
+        spec: PortfolioAttemptSpec,
+        executable_path: str,
+        command: List[str],
+        budget: SolverBudget,
+        attempt_id: str,
+        cancel_event: _PortfolioCancellationSignal,
+        portfolio_lease: ResourceLeaseToken,
+    ) -> Tuple[SolverProcessOutcome, Optional[str], Optional[ResourceLease]]:
+        if cancel_event.is_set():
+            return SolverProcessOutcome(command=command, cancelled=True), None, None
+        solver_version = self._solver_version(executable_path, spec.solver_name)
+        outcome = self._process_runner(command, budget=budget, cancel_event=cancel_event)
+        return outcome, solver_version, None
+
+    def close(self) -> None:
+        """Cancel in-flight runs, wait for them to return, then release the
+        envelope, the worker pool and the scratch directory. Idempotent."""
+
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for run_cancel_event in self._active_runs:
+                run_cancel_event.set()
+            while self._active_runs:
+                self._idle.wait()
+            executor, self._executor = self._executor, None
+            envelope, self._envelope = self._envelope, None
+            scratch, self._scratch, self._scratch_dir = self._scratch, None, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if envelope is not None:
+            envelope.release()
+        if scratch is not None:
+            scratch.close()
+
+    def __enter__(self) -> "SolverPortfolioRuntime":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        self.close()
@@ -43,6 +43,9 @@ Building blocks
   weights combining the four feature scores into one deterministic total.
 - :class:`ScoredCandidate` — one candidate premise's full score breakdown,
   produced by :func:`score_candidates`.
+- :class:`PremiseIndex` — a persistent, incrementally maintained inverted
+  index (symbol/type/import postings) that scores only the premises sharing
+  at least one feature with the goal, optionally with IDF weighting.
 - :class:`PremiseExclusionReason` / :class:`ExcludedPremise` — the record of
   a candidate that was considered but not selected, and why.
 - :class:`PremiseSelectionResult` — the final, versioned selection outcome
@@ -55,11 +58,13 @@ Building blocks
 
 from __future__ import annotations
 
+import heapq
+import math
 import re
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
 
 from .corpus import CorpusManifest, TheoremEntry
 from .models import (
@@ -77,12 +82,14 @@ from .models import (
 __all__ = [
     "SCHEMA_VERSION",
     "DETERMINISTIC_BASELINE_METHOD",
+    "DETERMINISTIC_IDF_METHOD",
     "PremiseSelectionError",
     "InvalidTopKError",
     "PremiseExclusionReason",
     "GoalFeatures",
     "PremiseSelectionWeights",
     "ScoredCandidate",
+    "PremiseIndex",
     "ExcludedPremise",
     "PremiseSelectionResult",
     "extract_symbols",
@@ -122,6 +129,11 @@ class InvalidTopKError(PremiseSelectionError):
 #: :attr:`~ipfs_datasets_py.logic.hammers.models.PremiseRecord.selection_method`).
 DETERMINISTIC_BASELINE_METHOD = "deterministic-baseline"
 
+#: Identifier stamped onto premises selected through a :class:`PremiseIndex`
+#: built with ``weighting="idf"``, whose symbol/type scores are IDF-weighted
+#: rather than plain Jaccard and therefore not comparable with the baseline's.
+DETERMINISTIC_IDF_METHOD = "deterministic-idf"
+
 
 # ---------------------------------------------------------------------------
 # Lexical feature extraction (symbols / types)
@@ -312,6 +324,28 @@ def extract_types(statement: str) -> FrozenSet[str]:
     return frozenset(types)
 
 
+def _extract_features(statement: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """``(extract_symbols(statement), extract_types(statement))`` in a
+    single tokenizer pass."""
+
+    if not statement:
+        return frozenset(), frozenset()
+
+    symbols = set()
+    types = set()
+    for match in _IDENTIFIER_RE.finditer(statement):
+        token = match.group(0)
+        if len(token) <= 1:
+            continue
+        lowered = token.lower()
+        if lowered in _STOPWORDS:
+            continue
+        symbols.add(lowered)
+        if token[0].isupper():
+            types.add(token)
+    return frozenset(symbols), frozenset(types)
+
+
 def _normalize_imports(imports: Optional[Iterable[str]]) -> FrozenSet[str]:
     if not imports:
         return frozenset()
@@ -560,6 +594,7 @@ def score_candidates(
     *,
     weights: Optional[PremiseSelectionWeights] = None,
     candidates: Optional[Sequence[TheoremEntry]] = None,
+    index: Optional["PremiseIndex"] = None,
 ) -> List[ScoredCandidate]:
     """Score every candidate premise against ``goal`` and return them in
     stable, deterministic rank order.
@@ -578,6 +613,11 @@ def score_candidates(
         candidates: Optional explicit candidate pool (e.g. a pre-filtered
             subset of the manifest); defaults to every theorem in the
             manifest (:meth:`~ipfs_datasets_py.logic.hammers.corpus.CorpusManifest.iter_theorems`).
+        index: Optional :class:`PremiseIndex` to draw candidates from
+            instead. Only premises sharing at least one symbol, type, or
+            (one-hop) import with the goal are scored; every other premise
+            would score 0.0 under any weighting. Mutually exclusive with
+            ``candidates``.
 
     Returns:
         Every candidate's :class:`ScoredCandidate`, sorted deterministically.
@@ -587,6 +627,12 @@ def score_candidates(
         raise PremiseSelectionError("manifest must be a CorpusManifest")
     if not isinstance(goal, GoalFeatures):
         raise PremiseSelectionError("goal must be a GoalFeatures instance")
+    if index is not None:
+        if candidates is not None:
+            raise PremiseSelectionError("candidates and index are mutually exclusive")
+        if not isinstance(index, PremiseIndex):
+            raise PremiseSelectionError("index must be a PremiseIndex")
+        return index.score(goal, weights=weights)
     goal.validate()
 
     resolved_weights = weights if weights is not None else PremiseSelectionWeights()
@@ -600,8 +646,7 @@ def score_candidates(
     for entry in pool:
         if not isinstance(entry, TheoremEntry):
             raise PremiseSelectionError("candidates must be TheoremEntry instances")
-        entry_symbols = extract_symbols(entry.statement)
-        entry_types = extract_types(entry.statement)
+        entry_symbols, entry_types = _extract_features(entry.statement)
         entry_imports = frozenset(entry.imports)
 
         symbol_score = _jaccard(goal.symbols, entry_symbols)
@@ -630,6 +675,405 @@ def score_candidates(
     return scored
 
 
+# ---------------------------------------------------------------------------
+# Inverted premise index
+# ---------------------------------------------------------------------------
+
+_INDEX_WEIGHTINGS = ("jaccard", "idf")
+
+#: Slack on the MaxScore stopping test in :meth:`PremiseIndex.top_candidates`,
+#: so float rounding in the summed upper bounds can never prune a premise
+#: whose exact score ties the current k-th best.
+_BOUND_SLACK = 1e-9
+
+
+def _overlap_ratio(left: FrozenSet[str], right: FrozenSet[str]) -> float:
+    """:func:`_jaccard` without materializing the union; the result is
+    bit-identical since both divide the same two integers."""
+
+    shared = len(left & right)
+    if not shared:
+        return 0.0
+    return shared / (len(left) + len(right) - shared)
+
+
+@dataclass(frozen=True)
+class _IndexedPremise:
+    """A premise's features, extracted once when it enters the index. The
+    sorted tuples keep floating-point sums over them order-stable."""
+
+    entry: TheoremEntry
+    symbols: FrozenSet[str]
+    types: FrozenSet[str]
+    imports: FrozenSet[str]
+    sorted_symbols: Tuple[str, ...]
+    sorted_types: Tuple[str, ...]
+
+
+#: ``(negated total, theorem_id, symbol, type, import, graph)``: sorting rows
+#: ascending yields the ``(-score, theorem_id)`` order of :func:`score_candidates`.
+_Row = Tuple[float, str, float, float, float, float]
+
+
+class PremiseIndex:
+    """Persistent inverted index over candidate premises.
+
+    :func:`score_candidates` re-tokenizes every premise statement for every
+    goal and compares each one against the goal, so selection costs
+    ``O(#premises x statement length)`` per goal. A :class:`PremiseIndex`
+    extracts each premise's symbols, types, and imports once, when it is
+    :meth:`add`\\ ed, and keeps feature -> premise postings plus, per import,
+    the imports it co-occurs with (which answers the one-hop dependency
+    expansion without scanning the corpus). A goal is then scored against
+    the union of its own features' postings only, so premises sharing
+    nothing with the goal are never touched, and :meth:`top_candidates`
+    stops walking postings as soon as no unvisited feature could lift a
+    premise into the top ``k`` (MaxScore-style pruning; the result is still
+    exact).
+
+    Two weightings are supported:
+
+    - ``"jaccard"`` (default): every score is identical to the one
+      :func:`score_candidates` computes for the same premise, so the ranking
+      of the touched premises is unchanged.
+    - ``"idf"``: symbol and type overlap become weighted Jaccard over
+      IDF-weighted sparse vectors (``idf = log(1 + N / df)``), so a shared
+      rare symbol counts for more than a shared ubiquitous one, in the
+      spirit of MePo's relevance weighting. Import and graph scores stay
+      plain Jaccard. Results are stamped with
+      :data:`DETERMINISTIC_IDF_METHOD`.
+
+    The index is independent of any one :class:`~ipfs_datasets_py.logic.hammers.corpus.CorpusManifest`
+    snapshot: :meth:`add` / :meth:`remove` keep it in step as the corpus
+    changes, and :func:`select_premises` still stamps the manifest's own
+    ``revision`` on every record.
+    """
+
+    def __init__(
+        self,
+        entries: Optional[Iterable[TheoremEntry]] = None,
+        *,
+        weighting: str = "jaccard",
+    ) -> None:
+        if weighting not in _INDEX_WEIGHTINGS:
+            raise PremiseSelectionError(
+                f"weighting must be one of {_INDEX_WEIGHTINGS}, got {weighting!r}"
+            )
+        self.weighting = weighting
+        self._premises: Dict[str, _IndexedPremise] = {}
+        self._symbol_postings: Dict[str, set] = {}
+        self._type_postings: Dict[str, set] = {}
+        self._import_postings: Dict[str, set] = {}
+        self._co_imports: Dict[str, Dict[str, int]] = {}
+        for entry in entries or ():
+            self.add(entry)
+
+    @classmethod
+    def from_manifest(
+        cls, manifest: CorpusManifest, *, weighting: str = "jaccard"
+    ) -> "PremiseIndex":
+        """Index every theorem currently in ``manifest``."""
+
+        if not isinstance(manifest, CorpusManifest):
+            raise PremiseSelectionError("manifest must be a CorpusManifest")
+        return cls(manifest.iter_theorems(), weighting=weighting)
+
+    @property
+    def selection_method(self) -> str:
+        """The ``selection_method`` stamped on premises selected via this index."""
+
+        if self.weighting == "idf":
+            return DETERMINISTIC_IDF_METHOD
+        return DETERMINISTIC_BASELINE_METHOD
+
+    def __len__(self) -> int:
+        return len(self._premises)
+
+    def __contains__(self, theorem_id: object) -> bool:
+        return theorem_id in self._premises
+
+    # -- maintenance --------------------------------------------------------
+
+    def add(self, entry: TheoremEntry) -> None:
+        """Index ``entry``, replacing any premise with the same ``theorem_id``."""
+
+        if not isinstance(entry, TheoremEntry):
+            raise PremiseSelectionError("PremiseIndex entries must be TheoremEntry instances")
+        theorem_id = entry.theorem_id
+        if theorem_id in self._premises:
+            self.remove(theorem_id)
+
+        symbols, types = _extract_features(entry.statement)
+        premise = _IndexedPremise(
+            entry=entry,
+            symbols=symbols,
+            types=types,
+            imports=frozenset(entry.imports),
+            sorted_symbols=tuple(sorted(symbols)),
+            sorted_types=tuple(sorted(types)),
+        )
+        self._premises[theorem_id] = premise
+        for symbol in premise.symbols:
+            self._symbol_postings.setdefault(symbol, set()).add(theorem_id)
+        for type_name in premise.types:
+            self._type_postings.setdefault(type_name, set()).add(theorem_id)
+        for module in premise.imports:
+            self._import_postings.setdefault(module, set()).add(theorem_id)
+            co_imports = self._co_imports.setdefault(module, {})
+            for other in premise.imports:
+                co_imports[other] = co_imports.get(other, 0) + 1
+
+    def remove(self, theorem_id: str) -> bool:
+        """Drop ``theorem_id`` from the index; ``False`` if it was not indexed."""
+
+        premise = self._premises.pop(theorem_id, None)
+        if premise is None:
+            return False
+        for postings, keys in (
+            (self._symbol_postings, premise.symbols),
+            (self._type_postings, premise.types),
+            (self._import_postings, premise.imports),
+        ):
+            for key in keys:
+                ids = postings[key]
+                ids.discard(theorem_id)
+                if not ids:
+                    del postings[key]
+        for module in premise.imports:
+            co_imports = self._co_imports[module]
+            for other in premise.imports:
+                remaining = co_imports[other] - 1
+                if remaining:
+                    co_imports[other] = remaining
+                else:
+                    del co_imports[other]
+            if not co_imports:
+                del self._co_imports[module]
+        return True
+
+    # -- scoring ------------------------------------------------------------
+
+    def expand_imports(self, goal_imports: FrozenSet[str]) -> FrozenSet[str]:
+        """The indexed equivalent of :func:`_expand_imports_one_hop`."""
+
+        expanded = set(goal_imports)
+        for module in goal_imports:
+            expanded.update(self._co_imports.get(module, ()))
+        return frozenset(expanded)
+
+    def score(
+        self, goal: GoalFeatures, *, weights: Optional[PremiseSelectionWeights] = None
+    ) -> List[ScoredCandidate]:
+        """Score every premise sharing a feature with ``goal``, in the same
+        ``(-score, theorem_id)`` order :func:`score_candidates` uses."""
+
+        scorer = _GoalScorer(self, goal, weights)
+        touched: set = set()
+        for _, _, _, ids, _ in scorer.features:
+            touched.update(ids)
+        rows = [scorer.row(theorem_id) for theorem_id in touched]
+        rows.sort()
+        return [_scored_candidate(row) for row in rows]
+
+    def top_candidates(
+        self,
+        goal: GoalFeatures,
+        k: int,
+        *,
+        weights: Optional[PremiseSelectionWeights] = None,
+        exclude_theorem_ids: Optional[Iterable[str]] = None,
+    ) -> List[ScoredCandidate]:
+        """The first ``k`` entries of :meth:`score`, skipping
+        ``exclude_theorem_ids`` and the goal itself.
+
+        The goal's features are visited shortest posting (relative to what
+        the feature can add to a score) first. Every premise not yet
+        reached shares only unvisited features with the goal, so its score
+        is at most the sum of those features' upper bounds; once that sum
+        drops below the current ``k``-th best score, no unvisited posting
+        can change the answer and the walk stops.
+        """
+
+        k = _resolve_top_k(k, policy=None)
+        seen = {str(item) for item in (exclude_theorem_ids or [])}
+        if goal.theorem_id is not None:
+            seen.add(goal.theorem_id)
+
+        scorer = _GoalScorer(self, goal, weights)
+        remaining_bound = [0.0] * (len(scorer.features) + 1)
+        for position in range(len(scorer.features) - 1, -1, -1):
+            remaining_bound[position] = (
+                remaining_bound[position + 1] + scorer.features[position][4]
+            )
+
+        rows: List[_Row] = []
+        best_totals: List[float] = []  # min-heap of the k best totals so far
+        for position, (_, _, _, ids, _) in enumerate(scorer.features):
+            if (
+                len(best_totals) == k
+                and remaining_bound[position] < best_totals[0] - _BOUND_SLACK
+            ):
+                break
+            for theorem_id in ids:
+                if theorem_id in seen:
+                    continue
+                seen.add(theorem_id)
+                row = scorer.row(theorem_id)
+                rows.append(row)
+                if len(best_totals) < k:
+                    heapq.heappush(best_totals, -row[0])
+                elif -row[0] > best_totals[0]:
+                    heapq.heapreplace(best_totals, -row[0])
+        return [_scored_candidate(row) for row in heapq.nsmallest(k, rows)]
+
+
+def _scored_candidate(row: _Row) -> ScoredCandidate:
+    negated_total, theorem_id, symbol_score, type_score, import_score, graph_score = row
+    return ScoredCandidate(
+        theorem_id=theorem_id,
+        score=-negated_total,
+        symbol_score=symbol_score,
+        type_score=type_score,
+        import_score=import_score,
+        graph_score=graph_score,
+    )
+
+
+class _GoalScorer:
+    """Scores indexed premises against one goal.
+
+    ``features`` lists every goal feature with a non-empty posting as
+    ``(df, kind, term, postings, bound)``, where ``bound`` is
+    the most that sharing this one feature can add to a premise's total:
+    each Jaccard-style score is at most ``shared / |goal side|``, so a
+    feature is worth at most its weight over the goal's feature count (its
+    IDF share of the goal's weight, for ``"idf"``), and a direct import
+    counts toward both the import and the graph score.
+    """
+
+    def __init__(
+        self,
+        index: PremiseIndex,
+        goal: GoalFeatures,
+        weights: Optional[PremiseSelectionWeights],
+    ) -> None:
+        if not isinstance(goal, GoalFeatures):
+            raise PremiseSelectionError("goal must be a GoalFeatures instance")
+        goal.validate()
+        resolved_weights = weights if weights is not None else PremiseSelectionWeights()
+        resolved_weights.validate()
+
+        self.premises = index._premises
+        self.goal = goal
+        self.weights = resolved_weights
+        self.expanded_imports = index.expand_imports(goal.imports)
+        self.weighted = index.weighting == "idf"
+        self.symbol_idf = _idf_table(index._symbol_postings, len(index))
+        self.type_idf = _idf_table(index._type_postings, len(index))
+        if self.weighted:
+            self.symbol_goal_weight = sum(self.symbol_idf(t) for t in sorted(goal.symbols))
+            self.type_goal_weight = sum(self.type_idf(t) for t in sorted(goal.types))
+
+        features = []
+        for kind, postings, terms in (
+            (0, index._symbol_postings, goal.symbols),
+            (1, index._type_postings, goal.types),
+            (2, index._import_postings, self.expanded_imports),
+        ):
+            for term in terms:
+                ids = postings.get(term)
+                if ids:
+                    features.append((len(ids), kind, term, ids, self._bound(kind, term)))
+        # Cheapest postings per unit of score first: short, high-bound
+        # postings raise the k-th best score fastest for the least work.
+        # A feature whose kind has zero weight adds nothing and goes last.
+        features.sort(
+            key=lambda feature: (
+                feature[0] / feature[4] if feature[4] > 0 else math.inf,
+                feature[1],
+                feature[2],
+            )
+        )
+        self.features = features
+
+    def _bound(self, kind: int, term: str) -> float:
+        goal, weights = self.goal, self.weights
+        if kind == 0:
+            if self.weighted:
+                return weights.symbol_weight * self.symbol_idf(term) / self.symbol_goal_weight
+            return weights.symbol_weight / len(goal.symbols)
+        if kind == 1:
+            if self.weighted:
+                return weights.type_weight * self.type_idf(term) / self.type_goal_weight
+            return weights.type_weight / len(goal.types)
+        bound = weights.graph_weight / len(self.expanded_imports)
+        if term in goal.imports:
+            bound += weights.import_weight / len(goal.imports)
+        return bound
+
+    def row(self, theorem_id: str) -> _Row:
+        premise = self.premises[theorem_id]
+        goal = self.goal
+        if self.weighted:
+            symbol_score = _weighted_jaccard(
+                goal.symbols,
+                self.symbol_goal_weight,
+                premise.symbols,
+                premise.sorted_symbols,
+                self.symbol_idf,
+            )
+            type_score = _weighted_jaccard(
+                goal.types,
+                self.type_goal_weight,
+                premise.types,
+                premise.sorted_types,
+                self.type_idf,
+            )
+        else:
+            symbol_score = _overlap_ratio(goal.symbols, premise.symbols)
+            type_score = _overlap_ratio(goal.types, premise.types)
+        import_score = _overlap_ratio(goal.imports, premise.imports)
+        graph_score = _overlap_ratio(premise.imports, self.expanded_imports)
+        weights = self.weights
+        total = (
+            weights.symbol_weight * symbol_score
+            + weights.type_weight * type_score
+            + weights.import_weight * import_score
+            + weights.graph_weight * graph_score
+        )
+        return (-total, theorem_id, symbol_score, type_score, import_score, graph_score)
+
+
+def _idf_table(postings: Dict[str, set], total: int) -> Callable[[str], float]:
+    """``term -> log(1 + N / df)`` over ``postings``, memoized for the
+    duration of one query (df and N change with every add/remove)."""
+
+    memo: Dict[str, float] = {}
+
+    def idf(term: str) -> float:
+        value = memo.get(term)
+        if value is None:
+            value = memo[term] = math.log(1.0 + total / max(len(postings.get(term, ())), 1))
+        return value
+
+    return idf
+
+
+def _weighted_jaccard(
+    goal_terms: FrozenSet[str],
+    goal_weight: float,
+    premise_terms: FrozenSet[str],
+    sorted_premise_terms: Tuple[str, ...],
+    idf: Callable[[str], float],
+) -> float:
+    shared = goal_terms & premise_terms
+    if not shared:
+        return 0.0
+    overlap = sum(idf(term) for term in sorted(shared))
+    premise_weight = sum(idf(term) for term in sorted_premise_terms)
+    return overlap / (goal_weight + premise_weight - overlap)
+
+
 # ---------------------------------------------------------------------------
 # Exclusion / selection result records
 # ---------------------------------------------------------------------------
@@ -709,8 +1153,9 @@ class PremiseSelectionResult:
         goal_theorem_id: The goal's own corpus identity, if it has one
             (``None`` for a genuinely new goal).
         selection_method: Identifier of the selector that produced this
-            result; always :data:`DETERMINISTIC_BASELINE_METHOD` for this
-            module.
+            result: :data:`DETERMINISTIC_BASELINE_METHOD`, or
+            :data:`DETERMINISTIC_IDF_METHOD` when selected through an
+            IDF-weighted :class:`PremiseIndex`.
         top_k: The enforced selection cutoff (bound on ``len(selected)``).
         weights: The feature weights used to compute every score.
         selected: The selected premises, in stable rank order (``rank`` 0 =
@@ -856,6 +1301,7 @@ def select_premises(
     exclude_theorem_ids: Optional[Iterable[str]] = None,
     min_score: Optional[float] = None,
     candidates: Optional[Sequence[TheoremEntry]] = None,
+    index: Optional[PremiseIndex] = None,
 ) -> PremiseSelectionResult:
     """Deterministically rank and select premises for ``goal`` from
     ``manifest``.
@@ -883,6 +1329,12 @@ def select_premises(
             slot.
         candidates: Optional explicit candidate pool; defaults to every
             theorem in ``manifest``.
+        index: Optional :class:`PremiseIndex` over ``manifest``'s theorems
+            to score through instead (see :func:`score_candidates`). Only
+            premises sharing a feature with the goal are considered, so
+            zero-overlap premises appear in neither ``selected`` nor
+            ``excluded``; selected records carry the index's
+            :attr:`PremiseIndex.selection_method`.
 
     Returns:
         A validated :class:`PremiseSelectionResult`.
@@ -904,8 +1356,13 @@ def select_premises(
     excluded_ids = frozenset(str(item) for item in (exclude_theorem_ids or []))
     corpus_revision = manifest.revision
 
-    ranked = score_candidates(goal, manifest, weights=weights, candidates=candidates)
+    ranked = score_candidates(
+        goal, manifest, weights=weights, candidates=candidates, index=index
+    )
     resolved_weights = weights if weights is not None else PremiseSelectionWeights()
+    selection_method = (
+        index.selection_method if index is not None else DETERMINISTIC_BASELINE_METHOD
+    )
 
     excluded_records: List[ExcludedPremise] = []
     ranking_pool: List[ScoredCandidate] = []
@@ -973,7 +1430,7 @@ def select_premises(
                 corpus_revision=corpus_revision,
                 rank=rank,
                 score=candidate.score,
-                selection_method=DETERMINISTIC_BASELINE_METHOD,
+                selection_method=selection_method,
                 content_digest=entry.content_digest,
             )
         )
@@ -981,7 +1438,7 @@ def select_premises(
     result = PremiseSelectionResult(
         corpus_revision=corpus_revision,
         goal_theorem_id=goal.theorem_id,
-        selection_method=DETERMINISTIC_BASELINE_METHOD,
+        selection_method=selection_method,
         top_k=resolved_top_k,
         weights=resolved_weights,
         selected=selected_premises,
@@ -1001,6 +1458,7 @@ def select_premises_for_theorem(
     exclude_theorem_ids: Optional[Iterable[str]] = None,
     min_score: Optional[float] = None,
     candidates: Optional[Sequence[TheoremEntry]] = None,
+    index: Optional[PremiseIndex] = None,
 ) -> PremiseSelectionResult:
     """Convenience wrapper: select premises for an existing corpus theorem,
     using its own statement/imports as the goal (see
@@ -1021,6 +1479,7 @@ def select_premises_for_theorem(
         exclude_theorem_ids: See :func:`select_premises`.
         min_score: See :func:`select_premises`.
         candidates: See :func:`select_premises`.
+        index: See :func:`select_premises`.
 
     Returns:
         A validated :class:`PremiseSelectionResult`.
@@ -1040,4 +1499,5 @@ def select_premises_for_theorem(
         exclude_theorem_ids=exclude_theorem_ids,
         min_score=min_score,
         candidates=candidates,
+        index=index,
     )
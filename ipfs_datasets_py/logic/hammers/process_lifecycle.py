@@ -351,10 +351,15 @@ class ProcessSupervisor:
         state_directory: Optional[str | Path] = None,
         heartbeat_interval_seconds: float = 0.25,
         stale_after_seconds: float = 30.0,
+        cancel_poll_interval_seconds: float = 0.01,
         recover: bool = True,
     ) -> None:
-        if heartbeat_interval_seconds <= 0 or stale_after_seconds <= 0:
-            raise ValueError("heartbeat and stale intervals must be positive")
+        if (
+            heartbeat_interval_seconds <= 0
+            or stale_after_seconds <= 0
+            or cancel_poll_interval_seconds <= 0
+        ):
+            raise ValueError("heartbeat, stale, and cancel-poll intervals must be positive")
         self.state_directory = (
             Path(state_directory or _default_state_directory()).expanduser().resolve()
         )
@@ -367,6 +372,12 @@ class ProcessSupervisor:
         self.owner_birth_marker = _process_birth_marker(self.owner_pid)
         self.heartbeat_interval_seconds = float(heartbeat_interval_seconds)
         self.stale_after_seconds = float(stale_after_seconds)
+        # Cancellation is checked more often than the durable heartbeat is
+        # written, so a cancelled process (e.g. a portfolio solver that lost
+        # the race) is terminated promptly without extra manifest writes.
+        self.cancel_poll_interval_seconds = min(
+            float(cancel_poll_interval_seconds), self.heartbeat_interval_seconds
+        )
         self._active: Dict[str, ManagedProcess] = {}
         self._lock = threading.RLock()
         self._closed = False
@@ -549,6 +560,7 @@ class ProcessSupervisor:
                 manifest = json.loads(handle.manifest_path.read_text(encoding="utf-8"))
             except (OSError, ValueError):
                 manifest = {}
+            last_heartbeat = time.monotonic()
             while True:
                 external_cancelled = bool(
                     handle.external_cancel_event is not None
@@ -583,12 +595,15 @@ class ProcessSupervisor:
                 try:
                     stdout, stderr = process.communicate(
                         input=input_value,
-                        timeout=min(self.heartbeat_interval_seconds, max(0.001, deadline - now)),
+                        timeout=min(self.cancel_poll_interval_seconds, max(0.001, deadline - now)),
                     )
                     input_value = None
                     break
                 except subprocess.TimeoutExpired:
                     input_value = None
+                    if time.monotonic() - last_heartbeat < self.heartbeat_interval_seconds:
+                        continue
+                    last_heartbeat = time.monotonic()
                     manifest["heartbeat_at"] = time.time()
                     try:
                         _atomic_json(handle.manifest_path, manifest)
@@ -43,8 +43,11 @@ References:
 
 from __future__ import annotations
 
+import bisect
 import functools
 import logging
+import os
+import pickle
 import re
 import time
 import weakref
@@ -52,7 +55,8 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Union
 from enum import Enum
 import threading
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 # Import unified extraction config from common module
 from ipfs_datasets_py.optimizers.common.backend_resilience import (
@@ -91,6 +95,14 @@ _BIDIRECTIONAL_RELATIONSHIP_PATTERNS: tuple[tuple[re.Pattern[str], str, float],
     (re.compile(r"\b(member\s+of|belongs\s+to)\b"), "member_of", 0.75),
 )
 
+# Co-occurrence relationships are only inferred between entities whose first
+# mentions are at most this many characters apart.
+_COOCCURRENCE_MAX_DISTANCE = 200
+
+# Subject prefix shared by the verb-frame patterns; _get_verb_frame_scanner()
+# can only fold them into one scan when every pattern starts with it.
+_VERB_FRAME_SUBJECT_PREFIX = r"\b(\w+)\s+"
+
 
 class ExtractionStrategy(Enum):
     """Ontology extraction strategies."""
@@ -3116,6 +3128,7 @@ class OntologyGenerator:
 
     # Lazy-loaded domain-specific rule patterns (class-level caching)
     _verb_patterns_cache = None
+    _verb_frame_scanner_cache = None
     _type_inference_rules_cache = None
 
     @classmethod
@@ -3144,6 +3157,75 @@ class OntologyGenerator:
             ]
         return cls._verb_patterns_cache
 
+    @classmethod
+    def _get_verb_frame_scanner(cls):
+        """
+        Get the one-pass scanner over all verb-frame patterns (lazy-loaded).
+
+        The scanner is one alternation of every pattern's body behind the
+        shared subject prefix, inside a lookahead, so a single pass over the
+        text finds each word that starts a match of at least one pattern.
+        Each alternative is a named group ``v<k>``; the group that matched
+        is the first pattern that matches at that word. The cache is rebuilt
+        whenever :meth:`_get_verb_patterns` returns a different list.
+
+        Returns:
+            Tuple of (patterns, scanner, compiled) where *compiled* is a list
+            of (compiled_pattern, rel_type). *scanner* is None when a pattern
+            does not start with the subject prefix.
+        """
+        patterns = cls._get_verb_patterns()
+        cache = cls._verb_frame_scanner_cache
+        if cache is None or cache[0] is not patterns:
+            compiled = [(re.compile(pattern, re.IGNORECASE), rel) for pattern, rel in patterns]
+            scanner = None
+            if all(pattern.startswith(_VERB_FRAME_SUBJECT_PREFIX) for pattern, _ in patterns):
+                prefix_len = len(_VERB_FRAME_SUBJECT_PREFIX)
+                alternatives = "|".join(
+                    f"(?P<v{k}>{pattern[prefix_len:]})" for k, (pattern, _) in enumerate(patterns)
+                )
+                scanner = re.compile(rf"\b\w+\s+(?={alternatives})", re.IGNORECASE)
+            cache = cls._verb_frame_scanner_cache = (patterns, scanner, compiled)
+        return cache
+
+    @classmethod
+    def _iter_verb_frame_matches(cls, text: str):
+        """
+        Yield (rel_type, match) for every verb-frame pattern match in *text*.
+
+        Matches come out exactly as running ``re.finditer`` per pattern would
+        produce them (pattern order, then position, non-overlapping within a
+        pattern), but the text is scanned once rather than once per pattern.
+
+        Args:
+            text: Source text.
+
+        Yields:
+            Tuples of (rel_type, re.Match).
+        """
+        _, scanner, compiled = cls._get_verb_frame_scanner()
+        if scanner is None:
+            for regex, rel_type in compiled:
+                for match in regex.finditer(text):
+                    yield rel_type, match
+            return
+
+        found: List[List[Any]] = [[] for _ in compiled]
+        ends = [0] * len(compiled)
+        for hit in scanner.finditer(text):
+            start = hit.start()
+            # Patterns before the matched alternative cannot match here.
+            for k in range(int(hit.lastgroup[1:]), len(compiled)):
+                if start < ends[k]:
+                    continue
+                match = compiled[k][0].match(text, start)
+                if match:
+                    ends[k] = match.end()
+                    found[k].append(match)
+        for (_, rel_type), matches in zip(compiled, found):
+            for match in matches:
+                yield rel_type, match
+
     @classmethod
     def _get_type_inference_rules(cls):
         """
@@ -3641,13 +3723,53 @@ class OntologyGenerator:
     def _sentence_index(self, pos: int, spans: List[tuple[int, int]]) -> int:
         """Return the index of the sentence span containing *pos*.
 
-        Returns -1 when no span matches.
+        Returns -1 when no span matches. *spans* must be sorted and
+        non-overlapping, as returned by :meth:`_get_sentence_spans`.
         """
-        for idx, (start, end) in enumerate(spans):
-            if start <= pos < end:
-                return idx
+        idx = bisect.bisect_right(spans, (pos, float("inf"))) - 1
+        if idx >= 0 and spans[idx][0] <= pos < spans[idx][1]:
+            return idx
         return -1
 
+    def _cooccurrence_candidates(
+        self, entities: List[Entity], text_lower: str
+    ) -> tuple[List[int], List[tuple[int, int]]]:
+        """Return entity positions and the index pairs close enough to co-occur.
+
+        Each entity is placed at the first occurrence of its text. Entities
+        are then bucketed by position with a sliding window, so only pairs
+        whose mentions are at most ``_COOCCURRENCE_MAX_DISTANCE`` characters
+        apart are generated, instead of every one of the O(n²) pairs.
+
+        Args:
+            entities: Entities in inference order.
+            text_lower: Lowercased source text.
+
+        Returns:
+            Tuple of (positions, pairs): *positions[i]* is the first offset of
+            entity *i* in the text (-1 if absent), and *pairs* holds the
+            ``(i, j)`` index pairs with ``i < j``, sorted.
+        """
+        first_offsets: Dict[str, int] = {}
+        positions: List[int] = []
+        for entity in entities:
+            key = entity.text.lower()
+            pos = first_offsets.get(key)
+            if pos is None:
+                pos = first_offsets[key] = text_lower.find(key)
+            positions.append(pos)
+
+        by_position = sorted((pos, i) for i, pos in enumerate(positions) if pos >= 0)
+        pairs: List[tuple[int, int]] = []
+        for a, (pos_a, i) in enumerate(by_position):
+            for b in range(a + 1, len(by_position)):
+                pos_b, j = by_position[b]
+                if pos_b - pos_a > _COOCCURRENCE_MAX_DISTANCE:
+                    break
+                pairs.append((i, j) if i < j else (j, i))
+        pairs.sort()
+        return positions, pairs
+
     def _is_impossible_type_pair(self, e1_type: str, e2_type: str) -> bool:
         """Check if a type pair is semantically impossible (optimization P1).
 
@@ -3770,11 +3892,6 @@ class OntologyGenerator:
         sentence_spans = self._get_sentence_spans(text) if sentence_window > 0 else []
         entity_sentence_index: Dict[str, int] = {}
 
-        # Use lazy-loaded verb-frame patterns (cached at class level)
-        _VERB_PATTERNS = self._get_verb_patterns()
-
-        import re as _re
-
         entity_texts = {e.text.lower(): e for e in entities}
         entity_ids_by_text = {e.text.lower(): e.id for e in entities}
 
@@ -3784,45 +3901,45 @@ class OntologyGenerator:
             rel_id_counter[0] += 1
             return f"rel_{rel_id_counter[0]:04d}"
 
-        # 1) Verb-frame matching in text with type confidence scoring
-        for pattern, rel_type in _VERB_PATTERNS:
-            for m in _re.finditer(pattern, text, _re.IGNORECASE):
-                subj_text = m.group(1).lower()
-                obj_text = m.group(2).lower()
-                src_id = entity_ids_by_text.get(subj_text)
-                tgt_id = entity_ids_by_text.get(obj_text)
-                if src_id and tgt_id and src_id != tgt_id:
-                    # Calculate type confidence based on pattern specificity and verb matching
-                    # More specific patterns (e.g., "obligates") and exact matches get higher scores
-                    verb_text = m.group(0)
-
-                    # Type confidence: how certain we are this is the correct relationship type
-                    # Based on: pattern match exactness, specificity, and verb phrase clustering
-                    if rel_type == "obligates":
-                        type_confidence = 0.85  # Very specific, legal domain
-                    elif rel_type in ("owns", "employs", "manages"):
-                        type_confidence = 0.80  # Clear semantic verbs
-                    elif rel_type in ("causes", "is_a"):
-                        type_confidence = 0.75  # More general but clear intent
-                    elif rel_type == "part_of":
-                        type_confidence = 0.72  # Compositional, sometimes ambiguous
-                    else:
-                        type_confidence = 0.65  # Default fallback
-
-                    relationships.append(
-                        Relationship(
-                            id=_make_rel_id(),
-                            source_id=src_id,
-                            target_id=tgt_id,
-                            type=rel_type,
-                            confidence=0.65,
-                            direction="subject_to_object",
-                            properties={
-                                "type_confidence": type_confidence,
-                                "type_method": "verb_frame",
-                            },
-                        )
+        # 1) Verb-frame matching in text with type confidence scoring; all
+        # lazy-loaded patterns share one scan of the text
+        for rel_type, m in self._iter_verb_frame_matches(text):
+            subj_text = m.group(1).lower()
+            obj_text = m.group(2).lower()
+            src_id = entity_ids_by_text.get(subj_text)
+            tgt_id = entity_ids_by_text.get(obj_text)
+            if src_id and tgt_id and src_id != tgt_id:
+                # Calculate type confidence based on pattern specificity and verb matching
+                # More specific patterns (e.g., "obligates") and exact matches get higher scores
+                verb_text = m.group(0)
+
+                # Type confidence: how certain we are this is the correct relationship type
+                # Based on: pattern match exactness, specificity, and verb phrase clustering
+                if rel_type == "obligates":
+                    type_confidence = 0.85  # Very specific, legal domain
+                elif rel_type in ("owns", "employs", "manages"):
+                    type_confidence = 0.80  # Clear semantic verbs
+                elif rel_type in ("causes", "is_a"):
+                    type_confidence = 0.75  # More general but clear intent
+                elif rel_type == "part_of":
+                    type_confidence = 0.72  # Compositional, sometimes ambiguous
+                else:
+                    type_confidence = 0.65  # Default fallback
+
+                relationships.append(
+                    Relationship(
+                        id=_make_rel_id(),
+                        source_id=src_id,
+                        target_id=tgt_id,
+                        type=rel_type,
+                        confidence=0.65,
+                        direction="subject_to_object",
+                        properties={
+                            "type_confidence": type_confidence,
+                            "type_method": "verb_frame",
+                        },
                     )
+                )
 
         # 2) Sliding-window co-occurrence (window=200 chars) with improved type inference
         # Confidence decay: base 0.6 at distance 0, decays linearly.
@@ -3838,99 +3955,93 @@ class OntologyGenerator:
             )
             relationships.extend(co_occurrence_rels)
         else:
-            # Serial co-occurrence inference (original implementation)
+            # Serial co-occurrence inference over the windowed candidate pairs,
+            # visited in the same (i, j) order as a full pairwise scan
             linked = {(r.source_id, r.target_id) for r in relationships}
             entity_list = list(entities)
-            for i, e1 in enumerate(entity_list):
-                pos1 = text_lower.find(e1.text.lower())
-                if pos1 < 0:
+            positions, candidate_pairs = self._cooccurrence_candidates(entity_list, text_lower)
+            llm_threshold = float(getattr(context.extraction_config, "llm_fallback_threshold", 0.0))
+            for i, j in candidate_pairs:
+                e1 = entity_list[i]
+                e2 = entity_list[j]
+                if (e1.id, e2.id) in linked or (e2.id, e1.id) in linked:
                     continue
-                for e2 in entity_list[i + 1 :]:
-                    if (e1.id, e2.id) in linked or (e2.id, e1.id) in linked:
-                        continue
-                    pos2 = text_lower.find(e2.text.lower())
-                    if pos2 < 0:
+                pos1 = positions[i]
+                pos2 = positions[j]
+                if sentence_window > 0 and sentence_spans:
+                    if e1.id in entity_sentence_index:
+                        idx1 = entity_sentence_index[e1.id]
+                    else:
+                        idx1 = self._sentence_index(pos1, sentence_spans)
+                        entity_sentence_index[e1.id] = idx1
+
+                    if e2.id in entity_sentence_index:
+                        idx2 = entity_sentence_index[e2.id]
+                    else:
+                        idx2 = self._sentence_index(pos2, sentence_spans)
+                        entity_sentence_index[e2.id] = idx2
+
+                    if idx1 >= 0 and idx2 >= 0 and abs(idx1 - idx2) > sentence_window:
                         continue
-                    if sentence_window > 0 and sentence_spans:
-                        if e1.id in entity_sentence_index:
-                            idx1 = entity_sentence_index[e1.id]
-                        else:
-                            idx1 = self._sentence_index(pos1, sentence_spans)
-                            entity_sentence_index[e1.id] = idx1
-
-                        if e2.id in entity_sentence_index:
-                            idx2 = entity_sentence_index[e2.id]
-                        else:
-                            idx2 = self._sentence_index(pos2, sentence_spans)
-                            entity_sentence_index[e2.id] = idx2
-
-                        if idx1 >= 0 and idx2 >= 0 and abs(idx1 - idx2) > sentence_window:
-                            continue
-                    distance = abs(pos1 - pos2)
-                    if distance <= 200:
-                        # Steeper decay beyond 100 chars to reflect weaker association
-                        if distance <= 100:
-                            confidence = max(0.4, 0.6 - distance / 500.0)
-                        else:
-                            # Extra penalty for distant entities (>100 chars apart)
-                            confidence = max(0.2, 0.4 - (distance - 100) / 500.0)
-
-                        # Extract context window for improved type inference
-                        e1_type = getattr(e1, "type", "unknown").lower()
-                        e2_type = getattr(e2, "type", "unknown").lower()
-
-                        # Skip semantically impossible type pairs to reduce O(n^2) cost
-                        if self._is_impossible_type_pair(e1_type, e2_type):
-                            continue
-
-                        # Use context window to infer relationship type with higher accuracy
-                        context_window = self._extract_context_window(
-                            text, pos1, pos2, window_size=100
-                        )
-                        inferred_type, type_confidence = self._infer_type_from_context(
-                            context_window,
-                            e1.text,
-                            e2.text,
-                            e1_type,
-                            e2_type,
-                        )
+                distance = abs(pos1 - pos2)
+                # Steeper decay beyond 100 chars to reflect weaker association
+                if distance <= 100:
+                    confidence = max(0.4, 0.6 - distance / 500.0)
+                else:
+                    # Extra penalty for distant entities (>100 chars apart)
+                    confidence = max(0.2, 0.4 - (distance - 100) / 500.0)
+
+                # Extract context window for improved type inference
+                e1_type = getattr(e1, "type", "unknown").lower()
+                e2_type = getattr(e2, "type", "unknown").lower()
 
-                        # Discount confidence for very distant co-occurrences
-                        if distance > 150:
-                            type_confidence *= 0.8
+                # Skip semantically impossible type pairs
+                if self._is_impossible_type_pair(e1_type, e2_type):
+                    continue
 
-                        llm_threshold = float(
-                            getattr(context.extraction_config, "llm_fallback_threshold", 0.0)
-                        )
-                        type_method = "cooccurrence"
-                        if llm_threshold > 0.0 and type_confidence < llm_threshold:
-                            inferred_type, type_confidence, type_method = (
-                                self._refine_relationship_type_with_llm(
-                                    context_window=context_window,
-                                    source_text=e1.text,
-                                    target_text=e2.text,
-                                    heuristic_type=inferred_type,
-                                    heuristic_confidence=type_confidence,
-                                )
-                            )
-
-                        relationships.append(
-                            Relationship(
-                                id=_make_rel_id(),
-                                source_id=e1.id,
-                                target_id=e2.id,
-                                type=inferred_type,
-                                confidence=confidence,
-                                direction="undirected",
-                                properties={
-                                    "type_confidence": type_confidence,
-                                    "type_method": type_method,
-                                    "source_entity_type": e1_type,
-                                    "target_entity_type": e2_type,
-                                },
-                            )
+                # Use context window to infer relationship type with higher accuracy
+                context_window = self._extract_context_window(text, pos1, pos2, window_size=100)
+                inferred_type, type_confidence = self._infer_type_from_context(
+                    context_window,
+                    e1.text,
+                    e2.text,
+                    e1_type,
+                    e2_type,
+                )
+
+                # Discount confidence for very distant co-occurrences
+                if distance > 150:
+                    type_confidence *= 0.8
+
+                type_method = "cooccurrence"
+                if llm_threshold > 0.0 and type_confidence < llm_threshold:
+                    inferred_type, type_confidence, type_method = (
+                        self._refine_relationship_type_with_llm(
+                            context_window=context_window,
+                            source_text=e1.text,
+                            target_text=e2.text,
+                            heuristic_type=inferred_type,
+                            heuristic_confidence=type_confidence,
                         )
-                        linked.add((e1.id, e2.id))
+                    )
+
+                relationships.append(
+                    Relationship(
+                        id=_make_rel_id(),
+                        source_id=e1.id,
+                        target_id=e2.id,
+                        type=inferred_type,
+                        confidence=confidence,
+                        direction="undirected",
+                        properties={
+                            "type_confidence": type_confidence,
+                            "type_method": type_method,
+                            "source_entity_type": e1_type,
+                            "target_entity_type": e2_type,
+                        },
+                    )
+                )
+                linked.add((e1.id, e2.id))
 
         self._log.info(f"Inferred {len(relationships)} relationships")
         return relationships
@@ -3939,7 +4050,6 @@ class OntologyGenerator:
         self,
         batch: List[tuple],
         entities: List[Any],
-        context: Any,
         text: str,
         text_lower: str,
         linked: set,
@@ -3948,6 +4058,8 @@ class OntologyGenerator:
         sentence_window: int,
         sentence_spans: List[tuple],
         entity_sentence_index: Dict[str, int],
+        llm_threshold: float = 0.0,
+        positions: Optional[List[int]] = None,
     ) -> List[Any]:
         """Process a batch of entity pairs and return inferred relationships.
 
@@ -3962,6 +4074,11 @@ class OntologyGenerator:
             sentence_window: Sentence window size for filtering
             sentence_spans: List of (start, end) tuples for sentences
             entity_sentence_index: Dict mapping entity IDs to sentence indices
+            llm_threshold: Type confidence below which the LLM refines the
+                relationship type (0.0 disables refinement)
+            positions: Optional first-mention offsets per entity index, as
+                returned by :meth:`_cooccurrence_candidates`; looked up in
+                *text_lower* when omitted
 
         Returns:
             List of Relationship objects inferred from this batch
@@ -3980,11 +4097,13 @@ class OntologyGenerator:
             if (e1.id, e2.id) in linked or (e2.id, e1.id) in linked:
                 continue
 
-            pos1 = text_lower.find(e1.text.lower())
-            if pos1 < 0:
-                continue
-            pos2 = text_lower.find(e2.text.lower())
-            if pos2 < 0:
+            if positions is not None:
+                pos1 = positions[i]
+                pos2 = positions[j]
+            else:
+                pos1 = text_lower.find(e1.text.lower())
+                pos2 = text_lower.find(e2.text.lower())
+            if pos1 < 0 or pos2 < 0:
                 continue
 
             if sentence_window > 0 and sentence_spans:
@@ -3996,7 +4115,7 @@ class OntologyGenerator:
                     continue
 
             distance = abs(pos1 - pos2)
-            if distance <= 200:
+            if distance <= _COOCCURRENCE_MAX_DISTANCE:
                 if distance <= 100:
                     confidence = max(0.4, 0.6 - distance / 500.0)
                 else:
@@ -4020,9 +4139,6 @@ class OntologyGenerator:
                 if distance > 150:
                     type_confidence *= 0.8
 
-                llm_threshold = float(
-                    getattr(context.extraction_config, "llm_fallback_threshold", 0.0)
-                )
                 type_method = "context_window"
                 if llm_threshold > 0.0 and type_confidence < llm_threshold:
                     inferred_type, type_confidence, type_method = (
@@ -4066,8 +4182,10 @@ class OntologyGenerator:
     ) -> List[Any]:
         """Infer co-occurrence relationships using parallel processing.
 
-        Partitions entity pairs across worker threads and processes them
-        concurrently to leverage multi-core systems.
+        Only the entity pairs bucketed together by
+        :meth:`_cooccurrence_candidates` are considered; they are split into
+        contiguous batches processed on worker threads, which overlap the
+        I/O of LLM type refinement when it is enabled.
 
         Args:
             entities: List of extracted entities
@@ -4082,15 +4200,21 @@ class OntologyGenerator:
         """
         sentence_window = getattr(context.extraction_config, "sentence_window", 0)
         sentence_spans = self._get_sentence_spans(text) if sentence_window > 0 else []
+        llm_threshold = float(getattr(context.extraction_config, "llm_fallback_threshold", 0.0))
+
+        entity_list = list(entities)
+        positions, candidate_pairs = self._cooccurrence_candidates(entity_list, text_lower)
 
         # Pre-compute sentence indices for all entities (thread-safe, done once)
         entity_sentence_index: Dict[str, int] = {}
         if sentence_window > 0 and sentence_spans:
-            for entity in entities:
-                pos = text_lower.find(entity.text.lower())
+            for entity, pos in zip(entity_list, positions):
                 if pos >= 0:
                     entity_sentence_index[entity.id] = self._sentence_index(pos, sentence_spans)
 
+        if not candidate_pairs:
+            return []
+
         # Build initial linked set from verb relationships
         linked = {(r.source_id, r.target_id) for r in verb_relationships}
 
@@ -4098,39 +4222,22 @@ class OntologyGenerator:
         rel_id_counter = [len(verb_relationships)]
         rel_id_lock = threading.Lock()
 
-        # Create entity pair batches
-        entity_list = list(entities)
-        num_entities = len(entity_list)
-
-        # Estimate pairs per worker (divide pairs evenly across workers)
-        total_pairs = (num_entities * (num_entities - 1)) // 2
-        pairs_per_worker = max(1, (total_pairs + max_workers - 1) // max_workers)
-
-        batches = []
-        batch_results = []
-        batch_idx = 0
-
-        for i in range(num_entities):
-            for j in range(i + 1, num_entities):
-                if batch_idx >= len(batch_results):
-                    batch_results.append([])
-                    batches.append([])
-
-                batches[-1].append((i, j))
-
-                if len(batches[-1]) >= pairs_per_worker and batch_idx < max_workers - 1:
-                    batch_idx += 1
+        # Divide the candidate pairs evenly across workers
+        pairs_per_worker = max(1, -(-len(candidate_pairs) // max(1, max_workers)))
+        batches = [
+            candidate_pairs[start : start + pairs_per_worker]
+            for start in range(0, len(candidate_pairs), pairs_per_worker)
+        ]
 
         # Process batches in parallel
         all_relationships = []
-        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+        with ThreadPoolExecutor(max_workers=len(batches)) as executor:
             futures = []
             for batch in batches:
                 future = executor.submit(
                     self._process_entity_pairs_batch,
                     batch,
                     entity_list,
-                    context,
                     text,
                     text_lower,
                     linked,
@@ -4139,6 +4246,8 @@ class OntologyGenerator:
                     sentence_window,
                     sentence_spans,
                     entity_sentence_index,
+                    llm_threshold,
+                    positions,
                 )
                 futures.append(future)
 
@@ -4172,30 +4281,87 @@ class OntologyGenerator:
             text = fh.read()
         return self.extract_entities(text, context)
 
+    def _batch_extract_worker_kwargs(self, context: Any) -> Optional[Dict[str, Any]]:
+        """Return constructor kwargs that rebuild this generator in a worker process.
+
+        Returns None when a fresh generator would not behave the same: an
+        LLM backend or accelerate client is attached, methods are overridden
+        on the instance (e.g. mocks), the class is a subclass, or the kwargs
+        and *context* cannot be pickled. Loggers pickle by name, so a custom
+        logger that is not registered with :mod:`logging` keeps the batch on
+        threads.
+        """
+        if type(self) is not OntologyGenerator:
+            return None
+        if self.llm_backend is not None or self.use_ipfs_accelerate:
+            return None
+        if any(hasattr(type(self), name) for name in vars(self)):
+            return None
+        init_kwargs = {
+            "ipfs_accelerate_config": {
+                key: value for key, value in self.ipfs_accelerate_config.items() if key != "client"
+            },
+            "use_ipfs_accelerate": False,
+            "enable_semantic_dedup": self.enable_semantic_dedup,
+            "logger": self._log,
+        }
+        try:
+            pickle.dumps((init_kwargs, context))
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return None
+        return init_kwargs
+
     def batch_extract(
         self,
         docs: List[Any],
         context: "OntologyGenerationContext",
         max_workers: int = 4,
+        use_processes: bool = True,
     ) -> List["EntityExtractionResult"]:
         """Extract entities from multiple documents in parallel.
 
-        Uses :class:`concurrent.futures.ThreadPoolExecutor` to call
-        :meth:`extract_entities` for each document concurrently.
+        Rule-based extraction is pure-Python and CPU-bound, so by default the
+        documents are spread over a :class:`concurrent.futures.ProcessPoolExecutor`.
+        Each worker process builds its own generator and receives the context
+        once, and results travel back as plain tuples. Generators that cannot
+        be rebuilt in a worker (see :meth:`_batch_extract_worker_kwargs`) and
+        calls with ``use_processes=False`` fall back to a
+        :class:`concurrent.futures.ThreadPoolExecutor` calling
+        :meth:`extract_entities` on this instance, as does the whole batch
+        when the process pool cannot start or a worker dies.
 
         Args:
             docs: List of document texts (or data objects) to extract from.
             context: Shared extraction context used for all documents.
-            max_workers: Thread pool size (default: 4).
+            max_workers: Pool size (default: 4); process pools are also
+                capped at the CPU count.
+            use_processes: Use worker processes when possible (default: True).
 
         Returns:
             List of :class:`EntityExtractionResult` in the same order as
             *docs*.  Failed extractions produce an
             :class:`EntityExtractionResult` with ``errors`` populated.
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from concurrent.futures import as_completed
 
-        results: List[Any] = [None] * len(docs)
+        init_kwargs = None
+        if use_processes and len(docs) > 1 and max_workers > 1:
+            init_kwargs = self._batch_extract_worker_kwargs(context)
+        if init_kwargs is not None:
+            workers = min(max_workers, os.cpu_count() or 1, len(docs))
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_batch_extract_worker,
+                    initargs=(init_kwargs, context),
+                ) as pool:
+                    chunksize = max(1, len(docs) // (workers * 4))
+                    packed_results = pool.map(_batch_extract_in_worker, docs, chunksize=chunksize)
+                    return [_unpack_extraction_result(packed) for packed in packed_results]
+            except (BrokenProcessPool, OSError, NotImplementedError, pickle.PicklingError) as exc:
+                self._log.warning(
+                    "batch_extract worker processes failed, extracting on threads: %s", exc
+                )
 
         def _extract(idx: int, doc: Any) -> tuple:
             try:
@@ -4214,6 +4380,7 @@ class OntologyGenerator:
                 )
                 return idx, empty
 
+        results: List[Any] = [None] * len(docs)
         with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
             futures = {pool.submit(_extract, i, doc): i for i, doc in enumerate(docs)}
             for future in as_completed(futures):
@@ -9936,6 +10103,65 @@ class OntologyGenerator:
         return count
 
 
+
+# Per-process state for OntologyGenerator.batch_extract() worker processes:
+# one generator and the shared context, set up once by the pool initializer.
+_BATCH_EXTRACT_WORKER: Optional[tuple[OntologyGenerator, Any]] = None
+
+
+def _init_batch_extract_worker(init_kwargs: Dict[str, Any], context: Any) -> None:
+    global _BATCH_EXTRACT_WORKER
+    _BATCH_EXTRACT_WORKER = (OntologyGenerator(**init_kwargs), context)
+
+
+def _pack_extraction_result(result: EntityExtractionResult) -> tuple:
+    """Flatten *result* into plain tuples, which pickle smaller and faster."""
+    return (
+        [
+            (e.id, e.type, e.text, e.properties, e.confidence, e.source_span, e.last_seen)
+            for e in result.entities
+        ],
+        [
+            (r.id, r.source_id, r.target_id, r.type, r.properties, r.confidence, r.direction)
+            for r in result.relationships
+        ],
+        result.confidence,
+        result.metadata,
+        result.errors,
+    )
+
+
+def _unpack_extraction_result(packed: tuple) -> EntityExtractionResult:
+    """Inverse of :func:`_pack_extraction_result`."""
+    entities, relationships, confidence, metadata, errors = packed
+    return EntityExtractionResult(
+        entities=[Entity(*fields) for fields in entities],
+        relationships=[Relationship(*fields) for fields in relationships],
+        confidence=confidence,
+        metadata=metadata,
+        errors=errors,
+    )
+
+
+def _batch_extract_in_worker(doc: Any) -> tuple:
+    generator, context = _BATCH_EXTRACT_WORKER
+    try:
+        result = generator.extract_entities(doc, context)
+    except (
+        AttributeError,
+        RuntimeError,
+        TypeError,
+        ValueError,
+    ) as exc:  # extraction must never crash the whole batch
+        result = EntityExtractionResult(
+            entities=[],
+            relationships=[],
+            confidence=0.0,
+            errors=[str(exc)],
+        )
+    return _pack_extraction_result(result)
+
+
 __all__ = [
     "OntologyGenerator",
     "OntologyGenerationContext",
@@ -8,7 +8,7 @@ the InterPlanetary File System (IPFS) network. The module supports various chunk
 strategies for optimal performance and provides seamless integration with IPFS nodes.
 
 The module includes:
-- Multiple chunking strategies for optimal file segmentation (fixed-size, Rabin)
+- Multiple chunking strategies for optimal file segmentation (fixed-size, Rabin, FastCDC)
 - UnixFS file and directory operations with IPFS integration
 - CAR (Content Addressable aRchive) file export capabilities
 - Flexible IPFS client connection management
@@ -19,6 +19,7 @@ Key Components:
 - ChunkerBase: Abstract base class for chunking strategy implementations
 - FixedSizeChunker: Fixed-size chunking for predictable segmentation
 - RabinChunker: Content-defined chunking using Rabin fingerprinting
+- FastCDCChunker: Built-in content-defined chunking using a vectorized gear hash
 - UnixFSHandler: Main class for IPFS file system operations
 
 This module is designed to provide high-level abstractions over IPFS operations
@@ -27,12 +28,16 @@ management gracefully and provides fallback mechanisms for optional components.
 
 Dependencies:
 - ipfshttpclient: Required for IPFS node communication
-- ipld_car: Optional, required for CAR file operations
+- ipld_car: Optional, required for CAR export of daemon-chunked content
 - pyrabin: Optional, required for Rabin chunking (falls back to fixed-size)
 """
 
+import hashlib
+import math
 import os
-from typing import List
+from typing import List, Optional
+
+import numpy as np
 
 try:
     from ipfs_datasets_py import ipfs_backend_router as ipfs_router
@@ -412,6 +417,336 @@ class RabinChunker(ChunkerBase):
         return sizes
 
 
+def _gear_table() -> "np.ndarray":
+    """Deterministic 256-entry table of 32-bit gear values."""
+    values = [
+        int.from_bytes(hashlib.sha256(b"fastcdc-gear-%d" % i).digest()[:4], "big")
+        for i in range(256)
+    ]
+    return np.array(values, dtype=np.uint32)
+
+
+_GEAR = _gear_table()
+
+# Bytes hashed per tile; small enough that the working arrays stay in cache.
+_GEAR_TILE = 64 * 1024
+_GEAR_WINDOW = 32
+
+
+def _high_mask(bits: int) -> int:
+    """32-bit mask with the ``bits`` highest bits set."""
+    return ((1 << bits) - 1) << (32 - bits)
+
+
+def _gear_candidates(data, strict_mask: int, loose_mask: int):
+    """
+    Positions of ``data`` whose gear hash matches the cut masks.
+
+    The gear hash at byte ``i`` is ``sum(G[data[i - j]] << j for j < 32)``
+    (mod 2**32), i.e. the rolling ``h = (h << 1) + G[b]`` of FastCDC. It is
+    computed for a whole tile at once by log-doubling: after the pass with
+    shift ``k`` every position holds the hash of its last ``2k`` bytes.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Sorted positions matching the strict
+        and the loose mask; strict positions are a subset of loose ones.
+    """
+    src = np.frombuffer(data, dtype=np.uint8)
+    loose_mask = np.uint32(loose_mask)
+    strict_mask = np.uint32(strict_mask)
+    shifted = np.empty(_GEAR_TILE + _GEAR_WINDOW, dtype=np.uint32)
+    loose, strict = [], []
+    for start in range(0, len(src), _GEAR_TILE):
+        lo = max(0, start - (_GEAR_WINDOW - 1))
+        h = np.take(_GEAR, src[lo : start + _GEAR_TILE])
+        k = 1
+        while k < min(_GEAR_WINDOW, len(h)):
+            np.left_shift(h[:-k], k, out=shifted[: len(h) - k])
+            h[k:] += shifted[: len(h) - k]
+            k *= 2
+        h = h[start - lo :]
+        hits = np.flatnonzero((h & loose_mask) == 0)
+        loose.append(hits + start)
+        strict.append(hits[(h[hits] & strict_mask) == 0] + start)
+    if not loose:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    return np.concatenate(strict), np.concatenate(loose)
+
+
+class FastCDCChunker(ChunkerBase):
+    """
+    Content-Defined Chunking Using the FastCDC Gear Hash
+
+    The FastCDCChunker is a built-in content-defined chunker that needs no
+    optional dependency. It uses the gear rolling hash of FastCDC with
+    normalized chunking: below ``avg_size`` a boundary requires a stricter
+    mask (harder to match) and above it a looser one, which pulls chunk sizes
+    towards the average. The hash is computed with vectorized NumPy passes
+    over the whole buffer instead of a per-byte Python loop.
+
+    Boundaries depend only on the bytes of the current chunk, so an edit in
+    one region of a file changes the chunks around it and leaves the rest of
+    the chunk sequence (and hence their CIDs) intact.
+
+    Args:
+        min_size (int, optional): Minimum chunk size in bytes. Defaults to 64KB.
+        avg_size (int, optional): Target average chunk size in bytes; rounded
+                                 to a power of two for the masks. Defaults to 256KB.
+        max_size (int, optional): Maximum chunk size in bytes. Defaults to 1MB.
+        normalization (int, optional): Mask bits added below and removed above
+                                      the average size. Defaults to 2.
+
+    Attributes:
+        min_size (int): Minimum allowed chunk size in bytes
+        avg_size (int): Target average chunk size in bytes
+        max_size (int): Maximum allowed chunk size in bytes
+        normalization (int): Normalization level
+
+    Public Methods:
+        cut(context, buffer, end) -> List[int]:
+            Returns the lengths of the complete chunks found in the buffer.
+
+    Usage Example:
+        chunker = FastCDCChunker(min_size=16*1024, avg_size=64*1024, max_size=256*1024)
+        chunks = chunker.cut(None, file_content, end=True)
+    """
+
+    def __init__(
+        self,
+        min_size: int = 64 * 1024,
+        avg_size: int = 256 * 1024,
+        max_size: int = 1024 * 1024,
+        normalization: int = 2,
+    ):
+        """
+        Initialize a FastCDC chunker with size constraints.
+
+        Args:
+            min_size (int, optional): Minimum chunk size in bytes
+            avg_size (int, optional): Target average chunk size in bytes
+            max_size (int, optional): Maximum chunk size in bytes
+            normalization (int, optional): Normalization level (0-3)
+
+        Raises:
+            ValueError: If the sizes are not ordered min <= avg <= max, or
+                        min_size is smaller than the 32-byte hash window
+        """
+        if not _GEAR_WINDOW <= min_size <= avg_size <= max_size:
+            raise ValueError(
+                f"FastCDC sizes must satisfy {_GEAR_WINDOW} <= min_size <= avg_size <= max_size"
+            )
+        if not 0 <= normalization <= 3:
+            raise ValueError("normalization must be between 0 and 3")
+        self.min_size = min_size
+        self.avg_size = avg_size
+        self.max_size = max_size
+        self.normalization = normalization
+
+        bits = max(1, round(math.log2(avg_size)))
+        self._strict_mask = _high_mask(min(31, bits + normalization))
+        self._loose_mask = _high_mask(max(1, bits - normalization))
+
+    def cut(self, context, buffer, end=False) -> List[int]:
+        """
+        Cut a data buffer at content-defined boundaries.
+
+        A chunk starting at ``s`` ends after the first byte in
+        ``[s + min_size, s + avg_size)`` whose hash matches the strict mask,
+        otherwise after the first byte in ``[s + avg_size, s + max_size)``
+        matching the loose mask, otherwise at ``s + max_size``.
+
+        Args:
+            context: Ignored; boundaries depend only on the data.
+            buffer (bytes): Data to chunk. When streaming, it must start at a
+                        chunk boundary, i.e. with the bytes left over by the
+                        previous call.
+            end (bool, optional): Whether this is the final buffer. When False,
+                                trailing bytes whose boundary cannot be decided
+                                yet are left out of the result for the caller
+                                to carry into the next call. Defaults to False.
+
+        Returns:
+            List[int]: Chunk lengths in bytes. They cover the whole buffer when
+                    ``end`` is True and a prefix of it otherwise.
+
+        Examples:
+            >>> chunker = FastCDCChunker(min_size=2048, avg_size=8192, max_size=65536)
+            >>> lengths = chunker.cut(None, data, end=True)
+            >>> sum(lengths) == len(data)
+            True
+        """
+        size = len(buffer)
+        if not size:
+            return []
+        strict, loose = _gear_candidates(buffer, self._strict_mask, self._loose_mask)
+
+        lengths = []
+        start = 0
+        while start < size:
+            remaining = size - start
+            # Positions are the last byte of a chunk, so a chunk of length n
+            # ending at a match at position p has p = start + n - 1.
+            normal_end = start + self.avg_size - 1
+            i = int(np.searchsorted(strict, start + self.min_size - 1))
+            if i < len(strict) and strict[i] < normal_end:
+                cut = int(strict[i]) + 1 - start
+            elif normal_end > size:
+                if not end:
+                    break
+                cut = remaining
+            else:
+                i = int(np.searchsorted(loose, normal_end))
+                if i < len(loose) and loose[i] < start + self.max_size - 1:
+                    cut = int(loose[i]) + 1 - start
+                elif remaining >= self.max_size:
+                    cut = self.max_size
+                elif end:
+                    cut = remaining
+                else:
+                    break
+            lengths.append(cut)
+            start += cut
+        return lengths
+
+
+# UnixFS node types and the file fan-out used by the Kubo balanced layout.
+_UNIXFS_DIRECTORY = 1
+_UNIXFS_FILE = 2
+_UNIXFS_LINKS_PER_NODE = 174
+
+# Bytes read from disk per chunker call.
+_READ_SIZE = 8 * 1024 * 1024
+
+
+def _pb_varint(value: int) -> bytes:
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _pb_bytes(field: int, value: bytes) -> bytes:
+    return _pb_varint(field << 3 | 2) + _pb_varint(len(value)) + value
+
+
+def _pb_uint(field: int, value: int) -> bytes:
+    return _pb_varint(field << 3) + _pb_varint(value)
+
+
+def _unixfs_data(
+    node_type: int, filesize: Optional[int] = None, blocksizes: List[int] = ()
+) -> bytes:
+    """Protobuf-encoded UnixFS ``Data`` message."""
+    out = _pb_uint(1, node_type)
+    if filesize is not None:
+        out += _pb_uint(3, filesize)
+    for blocksize in blocksizes:
+        out += _pb_uint(4, blocksize)
+    return out
+
+
+def _dag_pb_node(links, data: bytes) -> bytes:
+    """
+    Canonical DAG-PB ``PBNode`` bytes.
+
+    Args:
+        links: ``(name, cid_bytes, tsize)`` tuples in link order
+        data (bytes): UnixFS ``Data`` message
+    """
+    out = bytearray()
+    for name, cid, tsize in links:
+        link = _pb_bytes(1, cid) + _pb_bytes(2, name.encode("utf-8")) + _pb_uint(3, tsize)
+        out += _pb_bytes(2, link)
+    out += _pb_bytes(1, data)
+    return bytes(out)
+
+
+class _UnixFSBuilder:
+    """
+    Builds UnixFS DAGs locally, block by block.
+
+    Used for chunkers the IPFS daemon does not implement. Leaves are raw
+    blocks (CIDv1) and files larger than one chunk get a balanced tree of
+    DAG-PB nodes, as ``ipfs add --raw-leaves --cid-version=1`` produces.
+    Every block is handed to ``put_block(data, codec) -> cid`` as soon as it
+    is complete, so memory use is bounded by the read size, not the file.
+    """
+
+    def __init__(self, put_block):
+        from ipfs_datasets_py.processors.storage.ipld.car_stream import cid_to_bytes
+
+        self._put_block = put_block
+        self._cid_to_bytes = cid_to_bytes
+
+    def add_file(self, file_path: str, chunker: ChunkerBase):
+        """
+        Chunk and store a file.
+
+        Returns:
+            Tuple[str, int, int]: Root CID, cumulative DAG size and file size
+        """
+        read_size = max(_READ_SIZE, 4 * getattr(chunker, "max_size", 0))
+        leaves = []
+        pending = b""
+        with open(file_path, "rb") as f:
+            while True:
+                piece = f.read(read_size)
+                end = not piece
+                buffer = pending + piece if pending else piece
+                offset = 0
+                view = memoryview(buffer)
+                for length in chunker.cut(None, buffer, end=end):
+                    chunk = bytes(view[offset : offset + length])
+                    leaves.append((self._put_block(chunk, "raw"), length, length))
+                    offset += length
+                pending = buffer[offset:]
+                if end:
+                    break
+        if not leaves:
+            leaves.append((self._put_block(b"", "raw"), 0, 0))
+        return self._build_tree(leaves)
+
+    def _build_tree(self, nodes):
+        """Group ``(cid, tsize, filesize)`` nodes level by level into one root."""
+        while len(nodes) > 1:
+            parents = []
+            for i in range(0, len(nodes), _UNIXFS_LINKS_PER_NODE):
+                group = nodes[i : i + _UNIXFS_LINKS_PER_NODE]
+                filesize = sum(child[2] for child in group)
+                data = _unixfs_data(_UNIXFS_FILE, filesize, [child[2] for child in group])
+                block = _dag_pb_node(
+                    [("", self._cid_to_bytes(cid), tsize) for cid, tsize, _ in group], data
+                )
+                tsize = len(block) + sum(child[1] for child in group)
+                parents.append((self._put_block(block, "dag-pb"), tsize, filesize))
+            nodes = parents
+        return nodes[0]
+
+    def add_directory(self, dir_path: str, chunker: ChunkerBase, recursive: bool = True):
+        """
+        Store a directory and the regular files (and subdirectories) in it.
+
+        Returns:
+            Tuple[str, int]: Directory CID and cumulative DAG size
+        """
+        links = []
+        for name in sorted(os.listdir(dir_path), key=lambda entry: entry.encode("utf-8")):
+            path = os.path.join(dir_path, name)
+            if os.path.isfile(path):
+                cid, tsize, _ = self.add_file(path, chunker)
+            elif recursive and os.path.isdir(path):
+                cid, tsize = self.add_directory(path, chunker, recursive)
+            else:
+                continue
+            links.append((name, self._cid_to_bytes(cid), tsize))
+        block = _dag_pb_node(links, _unixfs_data(_UNIXFS_DIRECTORY))
+        tsize = len(block) + sum(link[2] for link in links)
+        return self._put_block(block, "dag-pb"), tsize
+
+
 class UnixFSHandler:
     """
     Comprehensive UnixFS File System Handler for IPFS Operations
@@ -432,7 +767,7 @@ class UnixFSHandler:
 
     Key Features:
     - File and directory storage with automatic chunking
-    - Configurable chunking strategies (fixed-size, Rabin)
+    - Configurable chunking strategies (fixed-size, Rabin, FastCDC)
     - CAR (Content Addressable aRchive) file export
     - Automatic content pinning for persistence
     - Graceful connection management with retry capabilities
@@ -569,6 +904,9 @@ class UnixFSHandler:
                                             - None: Use IPFS default chunking
                                             - FixedSizeChunker(): Uniform chunk sizes
                                             - RabinChunker(): Content-defined chunking
+                                            - FastCDCChunker(): Built-in content-defined
+                                              chunking; the DAG is built locally and
+                                              its blocks are put to the node
                                             Defaults to None.
 
         Returns:
@@ -598,6 +936,13 @@ class UnixFSHandler:
         if not os.path.isfile(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
+        if isinstance(chunker, FastCDCChunker):
+            # Kubo has no FastCDC chunker; build the DAG here and put its blocks.
+            builder = _UnixFSBuilder(lambda data, codec: ipfs_router.block_put(data, codec=codec))
+            cid, _, _ = builder.add_file(file_path, chunker)
+            ipfs_router.pin(cid)
+            return cid
+
         # Determine chunking strategy
         chunker_str = None
         match chunker:
@@ -677,6 +1022,9 @@ class UnixFSHandler:
                                         - None: Use IPFS default chunking
                                         - FixedSizeChunker(): Uniform chunk sizes
                                         - RabinChunker(): Content-defined chunking
+                                        - FastCDCChunker(): Built-in content-defined
+                                          chunking; the CAR is written directly
+                                          without an IPFS daemon or ipld_car
                                         Defaults to None.
 
         Returns:
@@ -699,6 +1047,9 @@ class UnixFSHandler:
             >>> dir_cid = handler.write_to_car("/path/to/project", "/backup/project.car", chunker=rabin_chunker)
             >>> dataset_cid = handler.write_to_car("/data/research_dataset", "/transfer/dataset.car")
         """
+        if isinstance(chunker, FastCDCChunker):
+            return self._write_to_car_local(path, car_path, chunker)
+
         if not HAVE_IPLD_CAR:
             raise ImportError("ipld_car is required for CAR export")
 
@@ -721,6 +1072,28 @@ class UnixFSHandler:
 
         return cid
 
+    def _write_to_car_local(self, path, car_path, chunker):
+        """Chunk ``path`` locally and stream its UnixFS blocks into a CAR file."""
+        from ipfs_datasets_py.processors.storage.ipld.car_stream import (
+            CarWriter,
+            cid_to_str,
+            compute_cid,
+        )
+
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Path not found: {path}")
+
+        with CarWriter(car_path, root_codec="dag-pb") as writer:
+            builder = _UnixFSBuilder(
+                lambda data, codec: writer.put(cid_to_str(compute_cid(data, codec)), data)
+            )
+            if os.path.isfile(path):
+                cid, _, _ = builder.add_file(path, chunker)
+            else:
+                cid, _ = builder.add_directory(path, chunker)
+            writer.close(roots=[cid])
+        return cid
+
     def get_file(self, cid, output_path=None):
         """
         Retrieve a file from IPFS using its Content Identifier with flexible output options.
@@ -12,6 +12,7 @@ import tempfile
 from typing import Dict, List, Optional, Tuple, Union, Any, Iterator, BinaryIO
 
 from ipfs_datasets_py.processors.storage.ipld.storage import IPLDStorage
+from ipfs_datasets_py.processors.storage.ipld.car_stream import CarReader, CarWriter
 from ipfs_datasets_py.processors.serialization.dataset_serialization import DatasetSerializer
 
 # Check for dependencies
@@ -260,7 +261,8 @@ class DataInterchangeUtils:
         """
         Stream a Parquet file to a CAR file in batches.
 
-        This is memory-efficient for large files.
+        Each record batch is serialized straight into the output archive, so
+        memory use is bounded by ``batch_size`` rather than the dataset size.
 
         Args:
             parquet_path (str): Path to the input Parquet file
@@ -282,13 +284,13 @@ class DataInterchangeUtils:
         # Create a function to generate batches
         def batch_generator():
             for batch in parquet_file.iter_batches(batch_size=batch_size):
-                yield batch
+                yield pa.Table.from_batches([batch])
 
-        # Serialize the streaming dataset
-        root_cid = self.serializer.serialize_dataset_streaming(batch_generator())
-
-        # Export to CAR
-        self.storage.export_to_car([root_cid], car_path)
+        # Serialize the streaming dataset directly into the CAR file
+        with CarWriter(car_path) as writer:
+            serializer = DatasetSerializer(storage=writer)
+            root_cid = serializer.serialize_dataset_streaming(batch_generator())
+            writer.close(roots=[root_cid])
 
         return root_cid
 
@@ -296,12 +298,15 @@ class DataInterchangeUtils:
         """
         Stream a CAR file to a Parquet file in batches.
 
-        This is memory-efficient for large files.
+        The CAR file is indexed once and chunk blocks are read from disk as
+        each chunk is written, so memory use is bounded by the chunk size
+        rather than the archive size.
 
         Args:
             car_path (str): Path to the input CAR file
             parquet_path (str): Path for the output Parquet file
-            batch_size (int, optional): Number of rows per batch
+            batch_size (int, optional): Maximum number of rows per written
+                row group
 
         Returns:
             str: Path to the created Parquet file
@@ -313,44 +318,41 @@ class DataInterchangeUtils:
         if not HAVE_ARROW:
             raise ImportError("PyArrow is required for Parquet streaming")
 
-        # Import from CAR
-        root_cids = self.storage.import_from_car(car_path)
-
-        if not root_cids:
-            raise ValueError(f"No root CIDs found in CAR file {car_path}")
-
-        # Try to find a streaming dataset
-        streaming_cid = None
-        for cid in root_cids:
-            try:
-                # Check if this is a streaming dataset
-                obj = self.storage.get_json(cid)
-                if obj.get("type") == "streaming_dataset":
-                    streaming_cid = cid
+        with CarReader(car_path) as reader:
+            if not reader.roots:
+                raise ValueError(f"No root CIDs found in CAR file {car_path}")
+
+            # Try to find a streaming dataset
+            streaming_root = None
+            for cid in reader.roots:
+                try:
+                    obj = reader.get_json(cid)
+                except ValueError:
+                    continue
+                if isinstance(obj, dict) and obj.get("type") == "streaming_dataset":
+                    streaming_root = obj
                     break
-            except:
-                continue
-
-        if not streaming_cid:
-            raise ValueError(f"No streaming dataset found in CAR file {car_path}")
 
-        # Get the chunks
-        chunks = self.serializer.deserialize_dataset_streaming(streaming_cid)
+            if streaming_root is None:
+                raise ValueError(f"No streaming dataset found in CAR file {car_path}")
 
-        # Create a ParquetWriter
-        first_chunk = next(chunks)
-        schema = first_chunk.schema
-
-        writer = pq.ParquetWriter(parquet_path, schema)
-
-        # Write the first chunk
-        writer.write_table(first_chunk)
-
-        # Write the rest of the chunks
-        for chunk in chunks:
-            writer.write_table(chunk)
-
-        writer.close()
+            serializer = DatasetSerializer(storage=reader)
+            writer = None
+            try:
+                for chunk_cid in streaming_root["chunks"]:
+                    chunk = serializer.deserialize_arrow_table(chunk_cid)
+                    if writer is None:
+                        writer = pq.ParquetWriter(parquet_path, chunk.schema)
+                    writer.write_table(chunk, row_group_size=batch_size)
+
+                if writer is None:
+                    # Empty dataset: still write a valid file with the stored schema
+                    schema_dict = streaming_root.get("schema")
+                    schema = serializer._dict_to_schema(schema_dict) if schema_dict else None
+                    writer = pq.ParquetWriter(parquet_path, schema or pa.schema([]))
+            finally:
+                if writer is not None:
+                    writer.close()
 
         return parquet_path
 
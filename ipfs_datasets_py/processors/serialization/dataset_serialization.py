@@ -68,6 +68,11 @@ except ImportError:
 
 T = TypeVar("T")
 
+# Upper bound on the encoded size of one column or tensor chunk block. Keeps
+# blocks well under the 2 MiB bitswap limit and small enough to fetch, cache
+# and deduplicate individually.
+DEFAULT_CHUNK_BYTES = 1 << 20
+
 
 class GraphNode(Generic[T]):
     """A node in a graph dataset."""
@@ -6104,14 +6109,25 @@ class DatasetSerializer:
         self.storage = storage or IPLDStorage()
 
     def serialize_arrow_table(
-        self, table: "pa.Table", hash_columns: Optional[List[str]] = None
+        self,
+        table: "pa.Table",
+        hash_columns: Optional[List[str]] = None,
+        max_chunk_bytes: int = DEFAULT_CHUNK_BYTES,
     ) -> str:
         """
-        Serialize an Arrow table to IPLD.
+        Serialize an Arrow table to IPLD as chunked columns.
+
+        Each column is split into record-batch chunks of at most about
+        ``max_chunk_bytes`` and every chunk is stored as its own block, so
+        readers can fetch only the columns and row ranges they need and
+        identical chunks deduplicate. The root block indexes each chunk with
+        its row offset, row count, null count and (for numeric, boolean and
+        string columns) min/max statistics.
 
         Args:
             table: pyarrow.Table to serialize
             hash_columns (List[str], optional): Columns to use for content addressing
+            max_chunk_bytes (int, optional): Target upper bound per chunk block
 
         Returns:
             str: CID of the root IPLD block
@@ -6128,21 +6144,30 @@ class DatasetSerializer:
         # Create schema block
         schema_cid = self.storage.store_json(schema_dict)
 
-        # Process each column separately
-        column_cids = {}
+        # Process each column separately, in bounded chunks
+        columns = {}
         for col_name in table.column_names:
             column = table.column(col_name)
-            # Serialize column data
-            column_data = self._serialize_column(column)
-            column_cid = self.storage.store(column_data)
-            column_cids[col_name] = column_cid
+            chunks = []
+            for offset, length in self._column_chunk_ranges(column, max_chunk_bytes):
+                chunk = column.slice(offset, length)
+                chunk_info = {
+                    "cid": self.storage.store(self._serialize_column(chunk)),
+                    "offset": offset,
+                    "rows": length,
+                    "null_count": chunk.null_count,
+                }
+                chunk_info.update(self._chunk_stats(chunk))
+                chunks.append(chunk_info)
+            columns[col_name] = {"chunks": chunks}
 
-        # Create root object linking to schema and columns
+        # Create root object linking to schema and column chunks
         root_obj = {
             "type": "arrow_table",
+            "layout": "chunked_columns",
             "num_rows": table.num_rows,
             "schema": schema_cid,
-            "columns": column_cids,
+            "columns": columns,
         }
 
         # If hash columns are specified, add a content hash
@@ -6162,12 +6187,25 @@ class DatasetSerializer:
         root_cid = self.storage.store_json(root_obj)
         return root_cid
 
-    def deserialize_arrow_table(self, cid: str) -> "pa.Table":
+    def deserialize_arrow_table(
+        self,
+        cid: str,
+        columns: Optional[List[str]] = None,
+        row_range: Optional[Tuple[int, int]] = None,
+    ) -> "pa.Table":
         """
         Deserialize an Arrow table from IPLD.
 
+        For chunked tables only the chunk blocks of the requested columns that
+        overlap ``row_range`` are fetched. Tables written with the older
+        one-block-per-column layout are still readable.
+
         Args:
             cid (str): CID of the root IPLD block
+            columns (List[str], optional): Columns to read, in schema order
+                when omitted
+            row_range (Tuple[int, int], optional): Half-open ``[start, stop)``
+                row range to read; defaults to all rows
 
         Returns:
             pyarrow.Table: The deserialized table
@@ -6175,6 +6213,7 @@ class DatasetSerializer:
         Raises:
             ImportError: If PyArrow is not available
             ValueError: If the IPLD block is not a valid Arrow table
+            KeyError: If a requested column is not in the schema
         """
         if not HAVE_ARROW:
             raise ImportError("PyArrow is required for Arrow table deserialization")
@@ -6190,23 +6229,80 @@ class DatasetSerializer:
         schema_cid = root_obj["schema"]
         schema_dict = self.storage.get_json(schema_cid)
         schema = self._dict_to_schema(schema_dict)
-
-        # Get the columns
-        columns = []
-        for field in schema.names:
-            if field in root_obj["columns"]:
-                col_cid = root_obj["columns"][field]
-                col_data = self.storage.get(col_cid)
-                col_array = self._deserialize_column(col_data, schema.field(field).type)
-                columns.append(col_array)
-            else:
+        if columns is not None:
+            schema = pa.schema([schema.field(name) for name in columns], metadata=schema.metadata)
+
+        num_rows = root_obj["num_rows"]
+        start, stop = row_range if row_range is not None else (0, num_rows)
+        start, stop = max(0, start), min(num_rows, stop)
+        stop = max(start, stop)
+
+        # Get the columns. Column blocks carry their exact Arrow type, which
+        # the schema dict does not always preserve (e.g. int32), so the
+        # decoded type wins.
+        arrays = []
+        fields = []
+        for field in schema:
+            entry = root_obj["columns"].get(field.name)
+            if entry is None:
                 # If a column is missing, create a null array
-                columns.append(pa.nulls(root_obj["num_rows"], type=schema.field(field).type))
+                column = pa.nulls(stop - start, type=field.type)
+            elif isinstance(entry, str):
+                # Legacy layout: the whole column in one block
+                column = self._deserialize_column(self.storage.get(entry), field.type)
+                column = column.slice(start, stop - start)
+            else:
+                pieces = []
+                for chunk in entry["chunks"]:
+                    lo, hi = chunk["offset"], chunk["offset"] + chunk["rows"]
+                    if hi <= start or lo >= stop:
+                        continue
+                    data = self._deserialize_column(self.storage.get(chunk["cid"]), field.type)
+                    pieces.append(data.slice(max(start, lo) - lo, min(stop, hi) - max(start, lo)))
+                if pieces:
+                    column = pa.chunked_array(pieces, type=pieces[0].type)
+                else:
+                    column = pa.chunked_array([], type=field.type)
+            arrays.append(column)
+            fields.append(field.with_type(column.type))
 
         # Create the table
-        table = pa.Table.from_arrays(columns, schema=schema)
+        table = pa.Table.from_arrays(arrays, schema=pa.schema(fields, metadata=schema.metadata))
         return table
 
+    def _column_chunk_ranges(self, column, max_chunk_bytes):
+        """Split a column into ``(offset, length)`` ranges of bounded byte size."""
+        num_rows = len(column)
+        if num_rows == 0:
+            return [(0, 0)]
+        bytes_per_row = max(1, column.nbytes // num_rows)
+        rows_per_chunk = max(1, max_chunk_bytes // bytes_per_row)
+        return [
+            (offset, min(rows_per_chunk, num_rows - offset))
+            for offset in range(0, num_rows, rows_per_chunk)
+        ]
+
+    def _chunk_stats(self, chunk):
+        """Min/max of a column chunk for orderable scalar types, else nothing."""
+        type_obj = chunk.type
+        if not (
+            pa.types.is_integer(type_obj)
+            or pa.types.is_floating(type_obj)
+            or pa.types.is_boolean(type_obj)
+            or pa.types.is_string(type_obj)
+            or pa.types.is_large_string(type_obj)
+        ):
+            return {}
+        if chunk.null_count == len(chunk):
+            return {}
+        import pyarrow.compute as pc
+
+        bounds = pc.min_max(chunk)
+        low, high = bounds["min"].as_py(), bounds["max"].as_py()
+        if isinstance(low, float) and not (np.isfinite(low) and np.isfinite(high)):
+            return {}
+        return {"min": low, "max": high}
+
     def export_to_jsonl(
         self,
         data: Union["pa.Table", "datasets.Dataset", "pd.DataFrame", Dict[str, Any]],
@@ -7278,10 +7374,13 @@ class DatasetSerializer:
 
     def _deserialize_column(self, data, type_obj):
         """Deserialize bytes to an Arrow array."""
-        # Use Arrow's built-in deserialization
+        # Use Arrow's built-in deserialization; a chunked column is written
+        # as several batches, so read them all
         reader = pa.RecordBatchStreamReader(pa.BufferReader(data))
-        batch = reader.read_next_batch()
-        return batch.column(0)
+        batches = list(reader)
+        if len(batches) == 1:
+            return batches[0].column(0)
+        return pa.chunked_array([batch.column(0) for batch in batches], type=reader.schema.field(0).type)
 
     def _hash_column(self, column):
         """Create a hash of a column for content addressing."""
@@ -7429,20 +7528,57 @@ class DatasetSerializer:
         return graph
 
     def serialize_vectors(
-        self, vectors: List[np.ndarray], metadata: Optional[List[Dict[str, Any]]] = None
+        self,
+        vectors: List[np.ndarray],
+        metadata: Optional[List[Dict[str, Any]]] = None,
+        max_chunk_bytes: int = DEFAULT_CHUNK_BYTES,
     ) -> str:
         """
         Serialize vector embeddings to IPLD.
 
+        Equal-length numeric vectors are stored as raw little-endian tensor
+        blocks of at most ``max_chunk_bytes`` in their own dtype, indexed by a
+        small JSON root. Ragged or non-numeric input falls back to the JSON
+        encoding.
+
         Args:
-            vectors (List[np.ndarray]): List of vectors
+            vectors (List[np.ndarray]): List of vectors (or a 2-D array)
             metadata (List[Dict], optional): Metadata for each vector
+            max_chunk_bytes (int, optional): Target upper bound per tensor block
 
         Returns:
             str: CID of the root IPLD block
         """
+        try:
+            matrix = np.asarray(vectors)
+        except ValueError:
+            matrix = None
+        if matrix is None or matrix.ndim != 2 or matrix.dtype.kind not in "fiub":
+            return self._serialize_vectors_json(vectors, metadata)
+
+        dtype = matrix.dtype.newbyteorder("<")
+        rows_per_chunk = max(1, max_chunk_bytes // max(1, matrix.shape[1] * dtype.itemsize))
+        chunks = []
+        for offset in range(0, len(matrix), rows_per_chunk):
+            block = np.ascontiguousarray(matrix[offset : offset + rows_per_chunk], dtype=dtype)
+            chunks.append(
+                {"cid": self.storage.store(block.tobytes()), "offset": offset, "rows": len(block)}
+            )
+
+        root_obj = {
+            "type": "vector_tensor",
+            "dtype": dtype.str,
+            "shape": list(matrix.shape),
+            "chunks": chunks,
+        }
+        if metadata:
+            root_obj["metadata"] = self.storage.store_json(metadata)
+        return self.storage.store_json(root_obj)
+
+    def _serialize_vectors_json(self, vectors, metadata):
+        """Encode vectors as a single JSON block of nested lists."""
         # Convert vectors to list of lists
-        vector_lists = [v.tolist() for v in vectors]
+        vector_lists = [np.asarray(v).tolist() for v in vectors]
 
         # Create vector data
         vector_data = {"vectors": vector_lists}
@@ -7470,6 +7606,12 @@ class DatasetSerializer:
         vector_json = self.storage.get(cid)
         vector_data = json.loads(vector_json.decode("utf-8"))
 
+        if vector_data.get("type") == "vector_tensor":
+            matrix = self._read_vector_tensor(vector_data, 0, vector_data["shape"][0])
+            metadata_cid = vector_data.get("metadata")
+            metadata = self.storage.get_json(metadata_cid) if metadata_cid else None
+            return list(matrix), metadata
+
         # Convert lists to numpy arrays
         vectors = [np.array(v) for v in vector_data["vectors"]]
 
@@ -7478,6 +7620,45 @@ class DatasetSerializer:
 
         return vectors, metadata
 
+    def deserialize_vector_matrix(
+        self, cid: str, row_range: Optional[Tuple[int, int]] = None
+    ) -> np.ndarray:
+        """
+        Read serialized vectors as one 2-D array, optionally only a row range.
+
+        Only the tensor blocks overlapping ``row_range`` are fetched.
+
+        Args:
+            cid (str): CID of the root IPLD block
+            row_range (Tuple[int, int], optional): Half-open ``[start, stop)``
+                range of rows; defaults to all rows
+
+        Returns:
+            np.ndarray: Array of shape (rows, dimension)
+        """
+        vector_data = json.loads(self.storage.get(cid).decode("utf-8"))
+        if vector_data.get("type") != "vector_tensor":
+            vectors = np.array(vector_data["vectors"])
+            return vectors if row_range is None else vectors[row_range[0] : row_range[1]]
+        num_rows = vector_data["shape"][0]
+        start, stop = row_range if row_range is not None else (0, num_rows)
+        return self._read_vector_tensor(vector_data, max(0, start), min(num_rows, stop))
+
+    def _read_vector_tensor(self, root_obj, start, stop):
+        """Assemble rows ``[start, stop)`` of a vector_tensor from its blocks."""
+        dtype = np.dtype(root_obj["dtype"])
+        dimension = root_obj["shape"][1]
+        out = np.empty((max(0, stop - start), dimension), dtype=dtype.newbyteorder("="))
+        for chunk in root_obj["chunks"]:
+            lo, hi = chunk["offset"], chunk["offset"] + chunk["rows"]
+            if hi <= start or lo >= stop:
+                continue
+            block = np.frombuffer(self.storage.get(chunk["cid"]), dtype=dtype).reshape(-1, dimension)
+            out[max(start, lo) - start : min(stop, hi) - start] = block[
+                max(start, lo) - lo : min(stop, hi) - lo
+            ]
+        return out
+
     def _create_query_vector_from_text(self, query_text: str) -> np.ndarray:
         """
         Create a query vector from natural language text.
@@ -8,6 +8,8 @@ Main components:
 - storage: Core storage functionality for IPLD blocks
 - dag_pb: Implementation of the DAG-PB format
 - optimized_codec: High-performance encoding/decoding for IPLD with batch processing
+- car_stream: Incremental CARv1/CARv2 reader and writer with bounded memory
+- block_cache: Byte-bounded LRU block cache with optional spill to disk
 - vector_store: IPLD-based vector storage for embeddings with similarity search
 - knowledge_graph: IPLD-based knowledge graph with entity and relationship modeling
 
@@ -25,6 +27,8 @@ from .optimized_codec import (
     create_batch_processor,
     optimize_node_structure,
 )
+from .car_stream import CarReader, CarWriter
+from .block_cache import BlockCache, PackedBlockStore
 
 # Optional components: these can pull in heavy deps (e.g., numpy). Keep the
 # package import-safe so modules that only need core storage can still import.
@@ -70,6 +74,10 @@ __all__ = [
     "BatchProcessor",
     "create_batch_processor",
     "optimize_node_structure",
+    "CarReader",
+    "CarWriter",
+    "BlockCache",
+    "PackedBlockStore",
     "IPLDVectorStore",
     "SearchResult",
     "IPLDKnowledgeGraph",
@@ -0,0 +1,347 @@
+"""
+IPLD Block Cache Module
+
+Provides a byte-bounded block cache for IPLDStorage.
+
+- BlockCache keeps recently used blocks in memory under a byte budget and
+  evicts the least recently used ones when the budget is exceeded.
+- PackedBlockStore is an optional spill target: evicted blocks are appended
+  to a single packed file and found again through an in-memory offset index,
+  so a block that was stored locally is never lost by eviction. Space left by
+  dropped blocks is reclaimed by compacting the file in place.
+
+BlockCache implements the MutableMapping protocol over ``cid -> bytes``, so
+code that treats the cache as a dict keeps working unchanged.
+"""
+
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# Default in-memory budget for cached block bytes.
+DEFAULT_BLOCK_CACHE_BYTES = 256 * 1024 * 1024
+
+# A packed file is compacted once this fraction of it belongs to dropped
+# blocks, but never while it is smaller than the minimum size.
+DEFAULT_SPILL_COMPACT_RATIO = 0.5
+DEFAULT_SPILL_COMPACT_MIN_BYTES = 4 * 1024 * 1024
+
+
+def _remove_packed_file(file, path: str) -> None:
+    file.close()
+    if os.path.exists(path):
+        os.unlink(path)
+
+
+class PackedBlockStore:
+    """
+    Packed, content-addressed block file.
+
+    Blocks are appended to one file; an in-memory dict maps each CID to the
+    ``(offset, length)`` of its bytes. Dropping a block only forgets its
+    index entry and counts its bytes as dead. Once dead bytes make up
+    ``compact_ratio`` of a file of at least ``compact_min_bytes``, live
+    blocks are slid down over the gaps and the file is truncated, so it
+    stays within about ``live / (1 - compact_ratio)`` bytes. The index
+    lives only in memory, so a store that is garbage collected (or still
+    open at interpreter exit) without ``close()`` deletes its file.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        compact_ratio: Optional[float] = DEFAULT_SPILL_COMPACT_RATIO,
+        compact_min_bytes: int = DEFAULT_SPILL_COMPACT_MIN_BYTES,
+    ):
+        """
+        Create (or truncate) the packed block file.
+
+        Args:
+            path (str): Path of the packed file
+            compact_ratio (float, optional): Dead-byte fraction that triggers
+                compaction. None disables automatic compaction.
+            compact_min_bytes (int): Smallest file size worth compacting
+        """
+        if compact_ratio is not None and not 0 < compact_ratio <= 1:
+            raise ValueError("compact_ratio must be in (0, 1]")
+        self.path = path
+        self.compact_ratio = compact_ratio
+        self.compact_min_bytes = compact_min_bytes
+        self.compactions = 0
+        self._file = open(path, "w+b")
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._size = 0
+        self._dead = 0
+        self._lock = threading.Lock()
+        self._finalizer = weakref.finalize(self, _remove_packed_file, self._file, path)
+
+    def __contains__(self, cid: str) -> bool:
+        return cid in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._index))
+
+    @property
+    def file_bytes(self) -> int:
+        """Bytes in the packed file, including dropped blocks not yet compacted."""
+        return self._size
+
+    @property
+    def dead_bytes(self) -> int:
+        """Bytes in the packed file that belong to dropped blocks."""
+        return self._dead
+
+    def put(self, cid: str, data: bytes) -> None:
+        """Append a block unless it is already stored."""
+        with self._lock:
+            if cid in self._index:
+                return
+            self._file.seek(self._size)
+            self._file.write(data)
+            self._index[cid] = (self._size, len(data))
+            self._size += len(data)
+
+    def get(self, cid: str) -> Optional[bytes]:
+        """Read a block back, or return None if it is not stored."""
+        with self._lock:
+            location = self._index.get(cid)
+            if location is None:
+                return None
+            offset, length = location
+            self._file.seek(offset)
+            return self._file.read(length)
+
+    def discard(self, cid: str) -> None:
+        """Forget a block, compacting the file if enough of it is now dead."""
+        with self._lock:
+            location = self._index.pop(cid, None)
+            if location is None:
+                return
+            self._dead += location[1]
+            if (
+                self.compact_ratio is not None
+                and self._size >= self.compact_min_bytes
+                and self._dead >= self.compact_ratio * self._size
+            ):
+                self._compact()
+
+    def compact(self) -> None:
+        """Reclaim the space of dropped blocks now."""
+        with self._lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        # Live blocks only ever move towards the start of the file, so they
+        # can be copied in offset order without overwriting unread data.
+        position = 0
+        for cid, (offset, length) in sorted(self._index.items(), key=lambda item: item[1][0]):
+            if offset != position:
+                self._file.seek(offset)
+                data = self._file.read(length)
+                self._file.seek(position)
+                self._file.write(data)
+                self._index[cid] = (position, length)
+            position += length
+        self._file.truncate(position)
+        self._file.flush()
+        self._size = position
+        self._dead = 0
+        self.compactions += 1
+
+    def clear(self) -> None:
+        """Forget all blocks and truncate the file."""
+        with self._lock:
+            self._index.clear()
+            self._file.truncate(0)
+            self._size = 0
+            self._dead = 0
+
+    def close(self, remove: bool = False) -> None:
+        """Close the file, optionally deleting it."""
+        if remove:
+            self._finalizer()
+        elif self._finalizer.detach() is not None:
+            self._file.close()
+
+
+class BlockCache(MutableMapping):
+    """
+    Byte-bounded LRU cache of IPLD blocks with optional disk spill.
+
+    Reads through ``get`` or ``[]`` refresh recency and are counted as hits
+    or misses. When the cached bytes exceed ``max_bytes`` the least recently
+    used blocks are evicted; with a spill store they are moved to disk and
+    promoted back into memory on their next access.
+    """
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = DEFAULT_BLOCK_CACHE_BYTES,
+        spill_store: Optional[PackedBlockStore] = None,
+    ):
+        """
+        Initialize a block cache.
+
+        Args:
+            max_bytes (int, optional): In-memory budget in bytes. None means
+                unbounded, which matches the old plain-dict behaviour.
+            spill_store (PackedBlockStore, optional): Where evicted blocks are
+                written. Without one, evicted blocks are dropped.
+        """
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative")
+        self.max_bytes = max_bytes
+        self.spill_store = spill_store
+        self._blocks: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        # Blocks held only by the spill store, so len() needs no walk over it
+        self._spilled_only = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.spill_hits = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._blocks) + self._spilled_only
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            keys = list(self._blocks)
+            if self.spill_store is not None:
+                keys.extend(cid for cid in self.spill_store if cid not in self._blocks)
+        return iter(keys)
+
+    def __contains__(self, cid: object) -> bool:
+        with self._lock:
+            if cid in self._blocks:
+                return True
+            return self.spill_store is not None and cid in self.spill_store
+
+    def __getitem__(self, cid: str) -> bytes:
+        data = self.get(cid)
+        if data is None:
+            raise KeyError(cid)
+        return data
+
+    def __setitem__(self, cid: str, data: bytes) -> None:
+        with self._lock:
+            previous = self._blocks.pop(cid, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            if self.spill_store is not None and cid in self.spill_store:
+                if previous is None:
+                    self._spilled_only -= 1
+                self.spill_store.discard(cid)
+            self._insert(cid, data)
+
+    def __delitem__(self, cid: str) -> None:
+        with self._lock:
+            found = False
+            data = self._blocks.pop(cid, None)
+            if data is not None:
+                self._bytes -= len(data)
+                found = True
+            if self.spill_store is not None and cid in self.spill_store:
+                if not found:
+                    self._spilled_only -= 1
+                self.spill_store.discard(cid)
+                found = True
+            if not found:
+                raise KeyError(cid)
+
+    def get(self, cid: str, default: Optional[bytes] = None) -> Optional[bytes]:
+        """
+        Look up a block, refreshing its recency.
+
+        Args:
+            cid (str): CID of the block
+            default: Value returned on a miss
+
+        Returns:
+            bytes: The block data, or ``default`` if it is not cached
+        """
+        with self._lock:
+            data = self._blocks.get(cid)
+            if data is not None:
+                self._blocks.move_to_end(cid)
+                self.hits += 1
+                return data
+            if self.spill_store is not None:
+                data = self.spill_store.get(cid)
+                if data is not None:
+                    # Promote; the spilled copy stays so re-eviction is free.
+                    self.hits += 1
+                    self.spill_hits += 1
+                    self._spilled_only -= 1
+                    self._insert(cid, data)
+                    return data
+            self.misses += 1
+            return default
+
+    def _insert(self, cid: str, data: bytes) -> None:
+        self._blocks[cid] = data
+        self._bytes += len(data)
+        if self.max_bytes is None:
+            return
+        while self._bytes > self.max_bytes and self._blocks:
+            # Keep a single oversized block in memory when it cannot spill.
+            if len(self._blocks) == 1 and self.spill_store is None:
+                break
+            evicted_cid, evicted = self._blocks.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+            if self.spill_store is not None:
+                self.spill_store.put(evicted_cid, evicted)
+                self._spilled_only += 1
+
+    def clear(self) -> None:
+        """Drop all cached and spilled blocks; statistics are kept."""
+        with self._lock:
+            self._blocks.clear()
+            self._bytes = 0
+            self._spilled_only = 0
+            if self.spill_store is not None:
+                self.spill_store.clear()
+
+    def close(self) -> None:
+        """Drop all blocks and delete the spill file; later evictions are dropped."""
+        with self._lock:
+            self.clear()
+            if self.spill_store is not None:
+                self.spill_store.close(remove=True)
+                self.spill_store = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache statistics.
+
+        Returns:
+            Dict[str, Any]: Hit/miss/eviction counters and memory/spill usage
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "spill_hits": self.spill_hits,
+                "memory_blocks": len(self._blocks),
+                "memory_bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "spilled_blocks": len(self.spill_store) if self.spill_store is not None else 0,
+                "spill_file_bytes": (
+                    self.spill_store.file_bytes if self.spill_store is not None else 0
+                ),
+                "spill_dead_bytes": (
+                    self.spill_store.dead_bytes if self.spill_store is not None else 0
+                ),
+            }
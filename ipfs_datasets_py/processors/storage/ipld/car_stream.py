@@ -0,0 +1,592 @@
+"""
+IPLD CAR Streaming Module
+
+Provides an incremental reader and writer for CAR (Content Addressable aRchive)
+files that never hold more than one block in memory.
+
+- CarReader indexes block offsets of a CARv1 or CARv2 file in a single pass
+  and reads block bytes from disk on demand.
+- CarWriter appends blocks to the output file as they are produced and
+  patches the root CIDs into the header when the archive is closed.
+
+Both classes expose the ``get``/``get_json`` (and, for the writer,
+``store``/``store_json``) surface of IPLDStorage, so a DatasetSerializer can
+use them directly as its storage backend. CIDs are handled in pure Python
+(CIDv0 and CIDv1 with sha2-256), so neither ipld_car nor multiformats is
+required.
+"""
+
+import base64
+import hashlib
+import io
+import json
+import os
+import shutil
+import struct
+import tempfile
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .dag_pb import create_dag_node
+
+# Pragma that opens every CARv2 file: varint(10) + dag-cbor {"version": 2}.
+CARV2_PRAGMA = bytes.fromhex("0aa16776657273696f6e02")
+# characteristics (16 bytes) + data offset, data size, index offset (u64 LE).
+CARV2_HEADER_SIZE = 40
+
+# Copy buffer used when a header has to be rewritten in front of the payload.
+COPY_BUFFER_SIZE = 1024 * 1024
+
+_CODEC_CODES = {"raw": 0x55, "dag-pb": 0x70, "dag-cbor": 0x71, "dag-json": 0x0129}
+_SHA2_256 = 0x12
+_BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def _encode_varint(value: int) -> bytes:
+    """Encode a non-negative integer as an unsigned LEB128 varint."""
+    if value < 0:
+        raise ValueError("varint cannot be negative")
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _decode_varint(buf: bytes, pos: int = 0) -> Tuple[int, int]:
+    """Decode an unsigned varint from ``buf`` at ``pos``; return (value, new_pos)."""
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(buf):
+            raise ValueError("Truncated varint")
+        byte = buf[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+        if shift > 63:
+            raise ValueError("Varint too long")
+
+
+def _read_varint(stream) -> Optional[int]:
+    """Read an unsigned varint from a file object; return None at clean EOF."""
+    value = 0
+    shift = 0
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            if shift == 0:
+                return None
+            raise ValueError("Truncated varint in CAR section header")
+        value |= (byte[0] & 0x7F) << shift
+        if not byte[0] & 0x80:
+            return value
+        shift += 7
+        if shift > 63:
+            raise ValueError("Varint too long")
+
+
+def _base58_encode(data: bytes) -> str:
+    number = int.from_bytes(data, "big")
+    chars = []
+    while number:
+        number, rem = divmod(number, 58)
+        chars.append(_BASE58_ALPHABET[rem])
+    leading = len(data) - len(data.lstrip(b"\x00"))
+    return "1" * leading + "".join(reversed(chars))
+
+
+def _base58_decode(text: str) -> bytes:
+    number = 0
+    for char in text:
+        index = _BASE58_ALPHABET.find(char)
+        if index < 0:
+            raise ValueError(f"Invalid base58 character {char!r}")
+        number = number * 58 + index
+    body = number.to_bytes((number.bit_length() + 7) // 8, "big")
+    leading = len(text) - len(text.lstrip("1"))
+    return b"\x00" * leading + body
+
+
+def cid_to_bytes(cid: str) -> bytes:
+    """
+    Convert a CID string to its binary form.
+
+    Accepts CIDv0 (base58btc ``Qm...``) and CIDv1 in base32 (``b...``) or
+    base58btc (``z...``) multibase.
+
+    Raises:
+        ValueError: If the string is not a decodable CID
+    """
+    if not isinstance(cid, str) or not cid:
+        raise ValueError(f"Invalid CID: {cid!r}")
+    try:
+        if len(cid) == 46 and cid.startswith("Qm"):
+            return _base58_decode(cid)
+        if cid[0] == "b":
+            body = cid[1:].upper()
+            return base64.b32decode(body + "=" * (-len(body) % 8))
+        if cid[0] == "z":
+            return _base58_decode(cid[1:])
+    except ValueError as e:
+        raise ValueError(f"Invalid CID {cid!r}: {e}") from e
+    raise ValueError(f"Unsupported CID encoding: {cid!r}")
+
+
+def cid_to_str(cid_bytes: bytes) -> str:
+    """Canonical string form of a binary CID: base58btc for v0, base32 for v1."""
+    if len(cid_bytes) == 34 and cid_bytes[0] == _SHA2_256 and cid_bytes[1] == 0x20:
+        return _base58_encode(cid_bytes)
+    return "b" + base64.b32encode(cid_bytes).decode("ascii").lower().rstrip("=")
+
+
+def compute_cid(data: bytes, codec: str = "raw") -> bytes:
+    """Binary CIDv1 of ``data`` under ``codec`` with a sha2-256 multihash."""
+    if codec not in _CODEC_CODES:
+        raise ValueError(f"Unsupported codec: {codec}")
+    digest = hashlib.sha256(data).digest()
+    return b"\x01" + _encode_varint(_CODEC_CODES[codec]) + bytes([_SHA2_256, 32]) + digest
+
+
+def _cid_length(buf: bytes) -> int:
+    """Length in bytes of the binary CID at the start of ``buf``."""
+    if len(buf) >= 2 and buf[0] == _SHA2_256 and buf[1] == 0x20:
+        return 34
+    version, pos = _decode_varint(buf, 0)
+    if version != 1:
+        raise ValueError(f"Unsupported CID version {version}")
+    _, pos = _decode_varint(buf, pos)  # codec
+    _, pos = _decode_varint(buf, pos)  # multihash code
+    digest_len, pos = _decode_varint(buf, pos)
+    return pos + digest_len
+
+
+def _cbor_head(major: int, value: int) -> bytes:
+    if value < 24:
+        return bytes([(major << 5) | value])
+    for info, fmt in ((24, ">B"), (25, ">H"), (26, ">I"), (27, ">Q")):
+        if value < 1 << (8 * struct.calcsize(fmt)):
+            return bytes([(major << 5) | info]) + struct.pack(fmt, value)
+    raise ValueError("CBOR integer too large")
+
+
+def encode_car_header(roots: Sequence[bytes], version: int = 1) -> bytes:
+    """DAG-CBOR encoding of ``{"roots": [...], "version": version}``."""
+    out = bytearray(_cbor_head(5, 2))
+    out += _cbor_head(3, 5) + b"roots" + _cbor_head(4, len(roots))
+    for root in roots:
+        # Tag 42 wraps the CID bytes behind the identity multibase prefix.
+        out += b"\xd8\x2a" + _cbor_head(2, len(root) + 1) + b"\x00" + bytes(root)
+    out += _cbor_head(3, 7) + b"version" + _cbor_head(0, version)
+    return bytes(out)
+
+
+def _decode_cbor(buf: bytes, pos: int) -> Tuple[Any, int]:
+    """Decode the small DAG-CBOR subset used by CAR headers."""
+    initial = buf[pos]
+    major, info = initial >> 5, initial & 0x1F
+    pos += 1
+    if major == 7:
+        simple = {20: False, 21: True, 22: None}
+        if info not in simple:
+            raise ValueError(f"Unsupported CBOR simple value {info}")
+        return simple[info], pos
+    if info < 24:
+        value = info
+    elif info <= 27:
+        size = 1 << (info - 24)
+        value = int.from_bytes(buf[pos : pos + size], "big")
+        pos += size
+    else:
+        raise ValueError(f"Unsupported CBOR additional info {info}")
+
+    if major == 0:
+        return value, pos
+    if major == 1:
+        return -1 - value, pos
+    if major in (2, 3):
+        raw = bytes(buf[pos : pos + value])
+        return (raw if major == 2 else raw.decode("utf-8")), pos + value
+    if major == 4:
+        items = []
+        for _ in range(value):
+            item, pos = _decode_cbor(buf, pos)
+            items.append(item)
+        return items, pos
+    if major == 5:
+        mapping = {}
+        for _ in range(value):
+            key, pos = _decode_cbor(buf, pos)
+            mapping[key], pos = _decode_cbor(buf, pos)
+        return mapping, pos
+    if major == 6:
+        item, pos = _decode_cbor(buf, pos)
+        if value == 42 and isinstance(item, bytes) and item[:1] == b"\x00":
+            return cid_to_str(item[1:]), pos
+        return item, pos
+    raise ValueError(f"Unsupported CBOR major type {major}")
+
+
+def decode_car_header(data: bytes) -> Dict[str, Any]:
+    """Decode a CARv1 header block into a dict with ``version`` and ``roots``."""
+    header, _ = _decode_cbor(data, 0)
+    if not isinstance(header, dict) or "version" not in header:
+        raise ValueError("Invalid CAR header")
+    return header
+
+
+class CarReader:
+    """
+    Random-access reader over a CARv1 or CARv2 file.
+
+    Opening the reader walks the section headers once, recording the offset
+    and length of each block, and seeks past the block bytes. Memory use is
+    proportional to the number of blocks, not their size; block data is read
+    from disk on every ``get`` and is never cached.
+    """
+
+    def __init__(self, car_path: str):
+        """
+        Open and index a CAR file.
+
+        Args:
+            car_path (str): Path to a CARv1 or CARv2 file
+
+        Raises:
+            FileNotFoundError: If the CAR file does not exist
+            ValueError: If the file is not a valid CAR archive
+        """
+        self.car_path = car_path
+        self._file = open(car_path, "rb")
+        self._lock = threading.Lock()
+        self._index: Dict[bytes, Tuple[int, int]] = {}
+        try:
+            self._read_header_and_index()
+        except Exception:
+            self._file.close()
+            raise
+
+    def _read_header_and_index(self) -> None:
+        stream = self._file
+        data_start = 0
+        data_end = os.fstat(stream.fileno()).st_size
+
+        if stream.read(len(CARV2_PRAGMA)) == CARV2_PRAGMA:
+            fixed = stream.read(CARV2_HEADER_SIZE)
+            if len(fixed) != CARV2_HEADER_SIZE:
+                raise ValueError(f"Truncated CARv2 header in {self.car_path}")
+            data_start, data_size, _ = struct.unpack("<QQQ", fixed[16:])
+            data_end = data_start + data_size
+            self.version = 2
+        else:
+            self.version = 1
+        stream.seek(data_start)
+
+        header_len = _read_varint(stream)
+        if header_len is None:
+            raise ValueError(f"Empty CAR file {self.car_path}")
+        header = decode_car_header(stream.read(header_len))
+        if header["version"] != 1:
+            raise ValueError(f"Unsupported CAR payload version {header['version']}")
+        self.roots: List[str] = list(header.get("roots") or [])
+
+        position = stream.tell()
+        while position < data_end:
+            section_len = _read_varint(stream)
+            if section_len is None:
+                break
+            if section_len == 0:
+                # CARv2 data payloads may be zero-padded.
+                position = stream.tell()
+                continue
+            section_start = stream.tell()
+            prefix = stream.read(min(section_len, 64))
+            cid_len = _cid_length(prefix)
+            if cid_len > section_len:
+                raise ValueError(f"Corrupt CAR section at offset {section_start}")
+            self._index.setdefault(
+                prefix[:cid_len], (section_start + cid_len, section_len - cid_len)
+            )
+            position = section_start + section_len
+            if position > data_end:
+                raise ValueError(f"Truncated CAR block at offset {section_start}")
+            stream.seek(position)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def num_blocks(self) -> int:
+        """Number of distinct blocks in the archive."""
+        return len(self._index)
+
+    def __contains__(self, cid: str) -> bool:
+        try:
+            return cid_to_bytes(cid) in self._index
+        except ValueError:
+            return False
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._file.close()
+
+    def cids(self) -> List[str]:
+        """CIDs of all blocks in file order."""
+        return [cid_to_str(cid) for cid in self._index]
+
+    def get(self, cid: str) -> bytes:
+        """
+        Read a block from disk.
+
+        Args:
+            cid (str): CID of the block
+
+        Returns:
+            bytes: Block data
+
+        Raises:
+            ValueError: If the block is not in the archive
+        """
+        location = self._index.get(cid_to_bytes(cid))
+        if location is None:
+            raise ValueError(f"Block {cid} not found in CAR file {self.car_path}")
+        return self._read(*location)
+
+    def _read(self, offset: int, length: int) -> bytes:
+        with self._lock:
+            self._file.seek(offset)
+            return self._file.read(length)
+
+    def get_json(self, cid: str) -> Any:
+        """Read a block and parse it as JSON."""
+        data = self.get(cid)
+        try:
+            return json.loads(data.decode("utf-8"))
+        except Exception as e:
+            raise ValueError(f"Error parsing JSON from block {cid}: {e}")
+
+    def iter_blocks(self) -> Iterator[Tuple[str, bytes]]:
+        """Yield ``(cid, data)`` pairs in file order, one block at a time."""
+        for cid, location in list(self._index.items()):
+            yield cid_to_str(cid), self._read(*location)
+
+
+class CarWriter:
+    """
+    Append-only CAR writer.
+
+    Blocks are written to the output file as soon as they are stored, so a
+    producer such as DatasetSerializer can emit an archive of any size while
+    holding only the current block. When the roots are not known up front, a
+    placeholder root is written into the header and replaced on ``close``;
+    the file is rewritten only if the final header differs in length.
+    Blocks already written can be read back with ``get``, and duplicate
+    blocks are written once.
+    """
+
+    def __init__(
+        self,
+        output_path: str,
+        roots: Optional[Sequence[str]] = None,
+        version: int = 1,
+        root_codec: str = "raw",
+    ):
+        """
+        Create a CAR file and write its header.
+
+        Args:
+            output_path (str): Path of the CAR file to create
+            roots (Sequence[str], optional): Root CIDs, if already known
+            version (int, optional): CAR version to write, 1 or 2
+            root_codec (str, optional): Codec of the placeholder root used
+                when ``roots`` is None. Matching the final root's codec lets
+                ``close`` patch the header in place.
+
+        Raises:
+            ValueError: If the version or codec is unsupported
+        """
+        if version not in (1, 2):
+            raise ValueError(f"Unsupported CAR version: {version}")
+        self.output_path = output_path
+        self.version = version
+        self.roots = list(roots or [])
+        self._index: Dict[bytes, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+        if self.roots:
+            header_roots = [cid_to_bytes(root) for root in self.roots]
+        else:
+            header_roots = [compute_cid(b"", root_codec)[:-32] + bytes(32)]
+
+        self._file = open(output_path, "w+b")
+        if version == 2:
+            self._file.write(CARV2_PRAGMA + bytes(CARV2_HEADER_SIZE))
+        self._data_start = self._file.tell()
+        header = encode_car_header(header_roots)
+        self._file.write(_encode_varint(len(header)) + header)
+        self._payload_start = self._file.tell()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+            self._closed = True
+
+    @property
+    def num_blocks(self) -> int:
+        """Number of distinct blocks in the archive."""
+        return len(self._index)
+
+    def __contains__(self, cid: str) -> bool:
+        try:
+            return cid_to_bytes(cid) in self._index
+        except ValueError:
+            return False
+
+    def put(self, cid: str, data: bytes) -> str:
+        """
+        Append a block whose CID is already known.
+
+        Args:
+            cid (str): CID of the block
+            data (bytes): Block data
+
+        Returns:
+            str: The CID
+        """
+        self._append(cid_to_bytes(cid), bytes(data))
+        return cid
+
+    def store(self, data: bytes, links: Optional[List[Dict]] = None) -> str:
+        """
+        Append a block and return its CID.
+
+        Args:
+            data (bytes): The data to store
+            links (List[Dict], optional): Links to other blocks. When given,
+                the block is wrapped in a DAG-PB node as IPLDStorage does.
+
+        Returns:
+            str: CID of the stored block
+        """
+        if links:
+            block, codec = create_dag_node(data, links), "dag-pb"
+        else:
+            block, codec = bytes(data), "raw"
+        cid = compute_cid(block, codec)
+        self._append(cid, block)
+        return cid_to_str(cid)
+
+    def store_json(self, obj: Any) -> str:
+        """Serialize ``obj`` as JSON and append it as a block."""
+        return self.store(json.dumps(obj).encode("utf-8"))
+
+    def _append(self, cid: bytes, block: bytes) -> None:
+        with self._lock:
+            if self._closed:
+                raise ValueError("CAR writer is closed")
+            if cid in self._index:
+                return
+            self._file.seek(0, io.SEEK_END)
+            self._file.write(_encode_varint(len(cid) + len(block)) + cid)
+            self._index[cid] = (self._file.tell(), len(block))
+            self._file.write(block)
+
+    def get(self, cid: str) -> bytes:
+        """
+        Read back a block that has already been written.
+
+        Raises:
+            ValueError: If the block has not been written
+        """
+        location = self._index.get(cid_to_bytes(cid))
+        if location is None:
+            raise ValueError(f"Block {cid} not found in CAR file {self.output_path}")
+        offset, length = location
+        with self._lock:
+            self._file.seek(offset)
+            return self._file.read(length)
+
+    def get_json(self, cid: str) -> Any:
+        """Read back a block and parse it as JSON."""
+        data = self.get(cid)
+        try:
+            return json.loads(data.decode("utf-8"))
+        except Exception as e:
+            raise ValueError(f"Error parsing JSON from block {cid}: {e}")
+
+    def close(self, roots: Optional[Sequence[str]] = None) -> str:
+        """
+        Finalize the header and close the file.
+
+        Args:
+            roots (Sequence[str], optional): Root CIDs, replacing any given to
+                the constructor
+
+        Returns:
+            str: Path of the written CAR file
+
+        Raises:
+            ValueError: If no roots were provided
+        """
+        if self._closed:
+            return self.output_path
+        if roots is not None:
+            self.roots = list(roots)
+        if not self.roots:
+            self._file.close()
+            self._closed = True
+            raise ValueError("CAR export requires at least one root CID")
+
+        header = encode_car_header([cid_to_bytes(root) for root in self.roots])
+        header_section = _encode_varint(len(header)) + header
+        with self._lock:
+            self._closed = True
+            end = self._file.seek(0, io.SEEK_END)
+            if len(header_section) == self._payload_start - self._data_start:
+                self._file.seek(self._data_start)
+                self._file.write(header_section)
+                data_size = end - self._data_start
+                if self.version == 2:
+                    self._write_v2_header(self._file, data_size)
+                self._file.close()
+            else:
+                self._rewrite_with_header(header_section, end)
+        return self.output_path
+
+    def _write_v2_header(self, stream, data_size: int) -> None:
+        stream.seek(len(CARV2_PRAGMA))
+        stream.write(bytes(16) + struct.pack("<QQQ", self._data_start, data_size, 0))
+
+    def _rewrite_with_header(self, header_section: bytes, end: int) -> None:
+        """Stream the payload into a new file behind a header of a different length."""
+        directory = os.path.dirname(os.path.abspath(self.output_path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".car.tmp")
+        try:
+            with os.fdopen(fd, "w+b") as out:
+                if self.version == 2:
+                    out.write(CARV2_PRAGMA + bytes(CARV2_HEADER_SIZE))
+                out.write(header_section)
+                self._file.seek(self._payload_start)
+                shutil.copyfileobj(self._file, out, COPY_BUFFER_SIZE)
+                if self.version == 2:
+                    payload = end - self._payload_start
+                    self._write_v2_header(out, len(header_section) + payload)
+            self._file.close()
+            os.replace(tmp_path, self.output_path)
+        except Exception:
+            self._file.close()
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
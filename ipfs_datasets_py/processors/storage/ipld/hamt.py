@@ -0,0 +1,252 @@
+"""
+IPLD HAMT Module
+
+Provides a content-addressed Hash Array Mapped Trie (HAMT) for storing large
+string-keyed maps as a tree of small IPLD blocks.
+
+Keys are hashed with sha2-256; each level of the trie consumes ``bit_width``
+bits of the hash to pick a slot. A slot holds either a bucket of up to
+``bucket_size`` entries or a link to a child node. Mutations happen in
+memory and only mark the nodes on the path from the root as dirty;
+``flush`` stores just those nodes, so one mutation rewrites O(log N) blocks
+and a batch of k mutations rewrites at most O(k log N).
+
+Buckets are split when they overflow and child nodes are collapsed back into
+buckets when they shrink, so the tree shape (and hence the root CID) depends
+only on the map contents, not on the order of mutations.
+
+Node format (JSON)::
+
+    {"slots": {"<index>": [[key, value], ...] | {"/": "<child cid>"}}}
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+DEFAULT_BIT_WIDTH = 5
+DEFAULT_BUCKET_SIZE = 3
+
+_HASH_BITS = 256
+
+
+class _Node:
+    """In-memory HAMT node; ``slots`` is None until the node is loaded."""
+
+    __slots__ = ("cid", "slots", "dirty")
+
+    def __init__(self, cid: Optional[str] = None, slots: Optional[Dict] = None):
+        self.cid = cid
+        self.slots: Optional[Dict[int, Union[List[List[Any]], "_Node"]]] = slots
+        self.dirty = cid is None
+
+
+class HAMT:
+    """
+    Persistent content-addressed map from string keys to JSON values.
+
+    The map is backed by any storage exposing ``store(bytes) -> cid`` and
+    ``get(cid) -> bytes`` (IPLDStorage, CarWriter, ...). Nodes are loaded
+    lazily on first access and kept in memory afterwards.
+    """
+
+    def __init__(
+        self,
+        storage,
+        root_cid: Optional[str] = None,
+        bit_width: int = DEFAULT_BIT_WIDTH,
+        bucket_size: int = DEFAULT_BUCKET_SIZE,
+    ):
+        """
+        Open an existing HAMT or create an empty one.
+
+        Args:
+            storage: Block storage used to load and store nodes
+            root_cid (str, optional): Root of an existing HAMT
+            bit_width (int, optional): Hash bits consumed per level
+            bucket_size (int, optional): Entries per slot before it splits
+        """
+        if not 1 <= bit_width <= 8:
+            raise ValueError("bit_width must be between 1 and 8")
+        if bucket_size < 1:
+            raise ValueError("bucket_size must be positive")
+        self.storage = storage
+        self.bit_width = bit_width
+        self.bucket_size = bucket_size
+        self._root = _Node(cid=root_cid) if root_cid else _Node(slots={})
+        self.blocks_written = 0
+
+    @property
+    def root_cid(self) -> Optional[str]:
+        """CID of the last flushed root, or None if there are pending changes."""
+        return None if self._root.dirty else self._root.cid
+
+    @property
+    def dirty(self) -> bool:
+        """Whether there are mutations that have not been flushed."""
+        return self._root.dirty
+
+    def _index(self, key_hash: int, depth: int) -> int:
+        shift = _HASH_BITS - (depth + 1) * self.bit_width
+        if shift < 0:
+            raise ValueError("HAMT depth exhausted; too many hash collisions")
+        return (key_hash >> shift) & ((1 << self.bit_width) - 1)
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.sha256(key.encode("utf-8")).digest(), "big")
+
+    def _load(self, node: _Node) -> Dict[int, Any]:
+        if node.slots is None:
+            data = json.loads(self.storage.get(node.cid).decode("utf-8"))
+            slots = {}
+            for index, slot in data["slots"].items():
+                slots[int(index)] = _Node(cid=slot["/"]) if isinstance(slot, dict) else slot
+            node.slots = slots
+        return node.slots
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Look up ``key``; return ``default`` if it is absent."""
+        key_hash = self._hash(key)
+        node, depth = self._root, 0
+        while True:
+            slot = self._load(node).get(self._index(key_hash, depth))
+            if slot is None:
+                return default
+            if isinstance(slot, _Node):
+                node, depth = slot, depth + 1
+                continue
+            for entry_key, value in slot:
+                if entry_key == key:
+                    return value
+            return default
+
+    def __contains__(self, key: str) -> bool:
+        sentinel = object()
+        return self.get(key, sentinel) is not sentinel
+
+    def set(self, key: str, value: Any) -> None:
+        """Insert or replace ``key``."""
+        self._set(self._root, self._hash(key), 0, key, value)
+
+    def _set(self, node: _Node, key_hash: int, depth: int, key: str, value: Any) -> None:
+        slots = self._load(node)
+        index = self._index(key_hash, depth)
+        slot = slots.get(index)
+        node.dirty = True
+        if slot is None:
+            slots[index] = [[key, value]]
+        elif isinstance(slot, _Node):
+            self._set(slot, key_hash, depth + 1, key, value)
+        else:
+            for entry in slot:
+                if entry[0] == key:
+                    entry[1] = value
+                    return
+            if len(slot) < self.bucket_size:
+                slot.append([key, value])
+                slot.sort(key=lambda entry: entry[0])
+                return
+            child = _Node(slots={})
+            for entry_key, entry_value in slot + [[key, value]]:
+                self._set(child, self._hash(entry_key), depth + 1, entry_key, entry_value)
+            slots[index] = child
+
+    def delete(self, key: str) -> bool:
+        """Remove ``key``; return whether it was present."""
+        return self._delete(self._root, self._hash(key), 0, key)
+
+    def _delete(self, node: _Node, key_hash: int, depth: int, key: str) -> bool:
+        slots = self._load(node)
+        index = self._index(key_hash, depth)
+        slot = slots.get(index)
+        if slot is None:
+            return False
+        if isinstance(slot, _Node):
+            if not self._delete(slot, key_hash, depth + 1, key):
+                return False
+            collapsed = self._collapse(slot)
+            if collapsed:
+                slots[index] = collapsed
+            elif collapsed is not None:
+                del slots[index]
+            node.dirty = True
+            return True
+        for position, entry in enumerate(slot):
+            if entry[0] == key:
+                del slot[position]
+                if not slot:
+                    del slots[index]
+                node.dirty = True
+                return True
+        return False
+
+    def _collapse(self, node: _Node) -> Optional[List[List[Any]]]:
+        """Bucket replacing ``node`` if it holds few enough entries, else None."""
+        entries = []
+        for slot in node.slots.values():
+            if isinstance(slot, _Node):
+                return None
+            entries.extend(slot)
+            if len(entries) > self.bucket_size:
+                return None
+        entries.sort(key=lambda entry: entry[0])
+        return entries
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over all ``(key, value)`` pairs, loading nodes as needed."""
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            for index in sorted(self._load(node), reverse=True):
+                slot = node.slots[index]
+                if isinstance(slot, _Node):
+                    stack.append(slot)
+                else:
+                    for key, value in slot:
+                        yield key, value
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key, _ in self.items())
+
+    def node_cids(self) -> Iterator[str]:
+        """Iterate over the CIDs of all nodes; call after ``flush``."""
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.dirty:
+                raise ValueError("HAMT has unflushed changes")
+            yield node.cid
+            stack.extend(slot for slot in self._load(node).values() if isinstance(slot, _Node))
+
+    def flush(self) -> str:
+        """
+        Store every dirty node, children first.
+
+        Returns:
+            str: CID of the root node
+        """
+        return self._flush(self._root)
+
+    def _flush(self, node: _Node) -> str:
+        if not node.dirty:
+            return node.cid
+        encoded = {}
+        for index, slot in node.slots.items():
+            if isinstance(slot, _Node):
+                encoded[str(index)] = {"/": self._flush(slot)}
+            else:
+                encoded[str(index)] = slot
+        data = json.dumps({"slots": encoded}, sort_keys=True, separators=(",", ":"))
+        node.cid = self.storage.store(data.encode("utf-8"))
+        node.dirty = False
+        self.blocks_written += 1
+        return node.cid
+
+    @classmethod
+    def from_items(cls, storage, items, **kwargs) -> "HAMT":
+        """Build a new (unflushed) HAMT from ``(key, value)`` pairs."""
+        hamt = cls(storage, **kwargs)
+        for key, value in items:
+            hamt.set(key, value)
+        return hamt
@@ -11,16 +11,16 @@ Features:
 - Vector-augmented graph queries
 - Cross-document reasoning capabilities
 - Export to/import from CAR files
-- Automatic chunking for large graphs (prevents IPFS 1MiB block limit errors)
+- Incremental root updates for large graphs (HAMT-sharded CID maps)
 
 Large Graph Handling:
-When a knowledge graph grows large (e.g., 10,000+ entities), the root node
-metadata can exceed IPFS's 1MiB block size limit. This module automatically
-detects when data arrays (entity_ids, entity_cids, relationship_ids,
-relationship_cids) exceed the threshold (800KB by default) and stores them
-in separate IPLD blocks, referencing them by CID in the root node. This
-ensures the root block stays well under the 1MB limit while maintaining
-full functionality and backward compatibility.
+The entity and relationship CID maps are stored as HAMTs (see hamt.py), and
+the root node only links to their roots. Adding an entity or relationship
+rewrites the O(log N) HAMT nodes on its path plus the small root node, so
+root blocks stay far below IPFS's 1MiB limit however large the graph grows.
+Use ``batch()`` to defer the root update until a whole batch of mutations has
+been applied. Graphs written with the older inline or ``_chunked`` maps are
+still loaded by ``from_cid``.
 """
 
 import os
@@ -28,6 +28,7 @@ import json
 import uuid
 import logging
 import warnings
+from contextlib import contextmanager
 from typing import Dict, List, Any, Optional, Set, Tuple, Union
 from collections import defaultdict
 import numpy as np
@@ -35,6 +36,7 @@ import numpy as np
 from .storage import IPLDStorage
 from .dag_pb import create_dag_node, parse_dag_node
 from .optimized_codec import OptimizedEncoder, OptimizedDecoder
+from .hamt import HAMT
 
 try:
     from ipfs_datasets_py.vector_stores.ipld_vector_store import IPLDVectorStore
@@ -227,6 +229,13 @@ class Relationship:
         return f"Relationship(id={self.id}, type={self.type}, source={self.source_id}, target={self.target_id})"
 
 
+def _open_cid_map(storage, field_value, cids: Dict[str, str]) -> HAMT:
+    """Reopen a stored HAMT, or build one from a legacy inline/chunked map."""
+    if isinstance(field_value, dict) and field_value.get("_hamt"):
+        return HAMT(storage, root_cid=field_value["_hamt"])
+    return HAMT.from_items(storage, cids.items())
+
+
 class IPLDKnowledgeGraph:
     """
     Knowledge graph using IPLD for storage.
@@ -280,6 +289,14 @@ class IPLDKnowledgeGraph:
         self._entity_cids: Dict[EntityID, str] = {}
         self._relationship_cids: Dict[RelationshipID, str] = {}
 
+        # Content-addressed mirrors of the CID maps, committed incrementally
+        self._entity_map = HAMT(self.storage)
+        self._relationship_map = HAMT(self.storage)
+
+        # Deferred commit state (see batch())
+        self._batch_depth = 0
+        self._root_dirty = False
+
     @property
     def entity_count(self) -> int:
         """Get the number of entities in the graph."""
@@ -1129,6 +1146,7 @@ class IPLDKnowledgeGraph:
 
         # Store in CID index
         self._entity_cids[entity.id] = entity_cid
+        self._entity_map.set(entity.id, entity_cid)
 
         return entity_cid
 
@@ -1154,12 +1172,44 @@ class IPLDKnowledgeGraph:
 
         # Store in CID index
         self._relationship_cids[relationship.id] = relationship_cid
+        self._relationship_map.set(relationship.id, relationship_cid)
 
         return relationship_cid
 
     def _update_root_cid(self):
-        """Update the root CID of the knowledge graph."""
-        # Create root node with graph metadata
+        """Update the root CID of the knowledge graph, unless inside batch()."""
+        if self._batch_depth:
+            self._root_dirty = True
+            return
+        self.commit()
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer root updates until the end of a block of mutations.
+
+        Inside the block ``root_cid`` is stale; one commit runs on exit
+        (also on error, so the root always matches the in-memory graph).
+        Batches may be nested; only the outermost one commits.
+
+        Yields:
+            The knowledge graph itself
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._root_dirty:
+                self.commit()
+
+    def commit(self) -> str:
+        """
+        Write the dirty HAMT nodes and a new root node.
+
+        Returns:
+            Root CID of the knowledge graph
+        """
         root_node = {
             "type": "knowledge_graph",
             "name": self.name,
@@ -1167,30 +1217,15 @@ class IPLDKnowledgeGraph:
             "relationship_count": len(self.relationships),
             "entity_types": list(self._entity_index.keys()),
             "relationship_types": list(self._relationship_index.keys()),
+            "entity_cids": {"_hamt": self._entity_map.flush()},
+            "relationship_cids": {"_hamt": self._relationship_map.flush()},
         }
 
-        # Helper function to store large data as separate block
-        def store_if_large(data, field_name):
-            data_bytes = json.dumps(data).encode()
-            if len(data_bytes) > MAX_BLOCK_SIZE:
-                # Store as separate block and return CID reference
-                cid = self.storage.store(data_bytes)
-                return {"_cid": cid, "_chunked": True}
-            return data
-
-        # Store entity and relationship data, chunking if necessary
-        root_node["entity_ids"] = store_if_large(list(self.entities.keys()), "entity_ids")
-        root_node["entity_cids"] = store_if_large(self._entity_cids, "entity_cids")
-        root_node["relationship_ids"] = store_if_large(
-            list(self.relationships.keys()), "relationship_ids"
-        )
-        root_node["relationship_cids"] = store_if_large(
-            self._relationship_cids, "relationship_cids"
-        )
-
         # Store the root node
         root_bytes = json.dumps(root_node).encode()
         self.root_cid = self.storage.store(root_bytes)
+        self._root_dirty = False
+        return self.root_cid
 
     def export_to_car(self, output_path: str) -> str:
         """
@@ -1206,7 +1241,7 @@ class IPLDKnowledgeGraph:
             raise ImportError("ipld_car module is required for CAR file export")
 
         # Make sure the root CID is updated
-        self._update_root_cid()
+        self.commit()
 
         # Collect all blocks
         blocks = {}
@@ -1216,6 +1251,11 @@ class IPLDKnowledgeGraph:
         if root_block:
             blocks[self.root_cid] = root_block
 
+        # Add the HAMT nodes of both CID maps
+        for hamt in (self._entity_map, self._relationship_map):
+            for node_cid in hamt.node_cids():
+                blocks[node_cid] = self.storage.get(node_cid)
+
         # Add all entity blocks
         for entity_id, entity_cid in self._entity_cids.items():
             entity_block = self.storage.get(entity_cid)
@@ -1290,7 +1330,9 @@ class IPLDKnowledgeGraph:
 
         # Helper function to load data that might be chunked
         def load_data(field_value):
-            """Load data, handling both inline and chunked formats."""
+            """Load data, handling HAMT, inline and chunked formats."""
+            if isinstance(field_value, dict) and field_value.get("_hamt"):
+                return dict(HAMT(storage, root_cid=field_value["_hamt"]).items())
             if isinstance(field_value, dict) and field_value.get("_chunked"):
                 # Data is stored in a separate block
                 chunked_cid = field_value.get("_cid")
@@ -1302,6 +1344,10 @@ class IPLDKnowledgeGraph:
         # Load entity and relationship CIDs, handling chunked data
         kg._entity_cids = load_data(root_node.get("entity_cids", {}))
         kg._relationship_cids = load_data(root_node.get("relationship_cids", {}))
+        kg._entity_map = _open_cid_map(storage, root_node.get("entity_cids"), kg._entity_cids)
+        kg._relationship_map = _open_cid_map(
+            storage, root_node.get("relationship_cids"), kg._relationship_cids
+        )
 
         # Load entities
         for entity_id, entity_cid in kg._entity_cids.items():
@@ -64,6 +64,7 @@ except ImportError:
 # Import optimized codec if needed
 from .optimized_codec import OptimizedEncoder, PBNode, BatchProcessor
 from .dag_pb import create_dag_node
+from .block_cache import DEFAULT_BLOCK_CACHE_BYTES, BlockCache, PackedBlockStore
 
 
 T = TypeVar("T")
@@ -138,13 +139,20 @@ class IPLDStorage:
     - Cache frequently accessed blocks for performance
     """
 
-    def __new__(cls, base_dir=None, ipfs_api="/ip4/127.0.0.1/tcp/5001"):
+    def __new__(cls, *args, **kwargs):
         """Enforce singleton pattern for IPLDStorage."""
         if not hasattr(cls, "_instance"):
             cls._instance = super(IPLDStorage, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self, base_dir=None, ipfs_api="/ip4/127.0.0.1/tcp/5001"):
+    def __init__(
+        self,
+        base_dir=None,
+        ipfs_api="/ip4/127.0.0.1/tcp/5001",
+        block_cache=None,
+        cache_max_bytes=DEFAULT_BLOCK_CACHE_BYTES,
+        spill_to_disk=True,
+    ):
         """
         Initialize a new IPLD Storage instance.
 
@@ -152,6 +160,14 @@ class IPLDStorage:
             base_dir (str, optional): Directory for temporary files. If None, a
                 temporary directory will be created.
             ipfs_api (str, optional): IPFS API endpoint. Defaults to the local node.
+            block_cache (MutableMapping, optional): Block cache to use instead of
+                the default BlockCache. Any ``cid -> bytes`` mapping works.
+            cache_max_bytes (int, optional): In-memory budget of the default
+                block cache. None disables eviction.
+            spill_to_disk (bool, optional): Whether blocks evicted from the
+                default cache are spilled to a packed file in ``base_dir``.
+                Disable only when every block is also held by IPFS, since in
+                local-only mode the cache is the sole copy of a block.
 
         Raises:
             PermissionError: If the base directory cannot be created or accessed due to insufficient permissions.
@@ -188,7 +204,18 @@ class IPLDStorage:
             raise
 
         # Block cache to avoid fetching the same block multiple times
-        self._block_cache: Dict[str, bytes] = {}
+        self._close_owned_block_cache()
+        if block_cache is None:
+            spill_store = None
+            if spill_to_disk and cache_max_bytes is not None:
+                fd, spill_path = tempfile.mkstemp(
+                    prefix="block_cache-", suffix=".pack", dir=self.base_dir
+                )
+                os.close(fd)
+                spill_store = PackedBlockStore(spill_path)
+            block_cache = BlockCache(max_bytes=cache_max_bytes, spill_store=spill_store)
+            self._owned_block_cache = block_cache
+        self._block_cache = block_cache
 
         # Schema registry for data validation
         self._schemas: Dict[str, IPLDSchema] = {}
@@ -199,6 +226,34 @@ class IPLDStorage:
         # Register some default schemas
         self._register_default_schemas()
 
+    def _close_owned_block_cache(self) -> None:
+        # The singleton is re-initialized in place; drop the previous spill file.
+        block_cache = getattr(self, "_owned_block_cache", None)
+        if block_cache is not None:
+            block_cache.close()
+        self._owned_block_cache = None
+
+    def close(self) -> None:
+        """
+        Release the default block cache and delete its spill file.
+
+        Blocks that were only held locally are gone afterwards. A custom
+        ``block_cache`` passed to the constructor is left to its owner.
+        """
+        self._close_owned_block_cache()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get block cache statistics.
+
+        Returns:
+            Dict[str, Any]: Hit/miss/eviction counters and memory/spill usage,
+                or just the block count for a custom cache without ``stats()``.
+        """
+        if hasattr(self._block_cache, "stats"):
+            return self._block_cache.stats()
+        return {"memory_blocks": len(self._block_cache)}
+
     def connect(self, ipfs_api=None):
         """
         Connect or reconnect to the IPFS daemon.
@@ -296,8 +351,9 @@ class IPLDStorage:
             raise ValueError("CID is None")
 
         # Check cache first
-        if cid in self._block_cache:
-            return self._block_cache[cid]
+        data = self._block_cache.get(cid)
+        if data is not None:
+            return data
 
         if self._ipfs_ok():
             try:
@@ -591,17 +647,14 @@ class IPLDStorage:
             as it processes blocks in parallel and minimizes overhead.
         """
         results = []
-        cache_hits = []
-        cache_misses = []
+        cache_misses = set()
 
         # Check cache first
         for cid in cids:
-            if cid in self._block_cache:
-                results.append(self._block_cache[cid])
-                cache_hits.append(cid)
-            else:
-                results.append(None)
-                cache_misses.append(cid)
+            data = self._block_cache.get(cid)
+            results.append(data)
+            if data is None:
+                cache_misses.add(cid)
 
         # If all blocks were in cache, return results
         if not cache_misses:
@@ -44,11 +44,13 @@ Features:
 import warnings
 import os
 import json
+import base64
 import numpy as np
 import tempfile
 import logging
 from typing import Dict, List, Any, Optional, Union, Tuple, Set, TypeVar, Generic
 from collections import defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass
 
 # Issue deprecation warning
@@ -63,6 +65,7 @@ warnings.warn(
 from .storage import IPLDStorage
 from .dag_pb import create_dag_node, parse_dag_node
 from .optimized_codec import OptimizedEncoder, OptimizedDecoder
+from .hamt import HAMT
 
 # Check if we have optional dependencies
 try:
@@ -83,6 +86,11 @@ except ImportError:
 VectorID = str
 
 
+def _seq_key(seq: int) -> str:
+    """HAMT key for a vector sequence number."""
+    return str(seq)
+
+
 @dataclass
 class SearchResult:
     """Represents a search result from a vector store."""
@@ -133,6 +141,14 @@ class IPLDVectorStore:
         self.metadata = []  # List of metadata dictionaries
         self.root_cid = None  # Root CID of the vector store
 
+        # Vector ID order as a HAMT keyed by sequence number, so root updates
+        # rewrite O(log N) blocks instead of the whole ID list
+        self._vector_index = HAMT(self.storage)
+        self._vector_seqs: List[int] = []  # Sequence number per vector_ids entry
+        self._next_seq = 0
+        self._batch_depth = 0
+        self._root_dirty = False
+
         # Metrics
         self.metrics = {
             "vectors_added": 0,
@@ -211,7 +227,7 @@ class IPLDVectorStore:
             vector_node = {
                 "dimension": self.dimension,
                 "metric": self.metric,
-                "vector": vector_bytes,
+                "vector": base64.b64encode(vector_bytes).decode("ascii"),
                 "metadata": meta,
             }
 
@@ -221,7 +237,7 @@ class IPLDVectorStore:
 
             # Add to in-memory collections
             self.vectors.append(vector)
-            self.vector_ids.append(vector_cid)
+            self._append_vector_id(vector_cid)
             self.metadata.append(meta)
 
         # Update the index if using FAISS
@@ -513,6 +529,7 @@ class IPLDVectorStore:
 
             # If CID changed, we need to update the vectors list
             self.vector_ids[idx] = updated_cid
+            self._vector_index.set(_seq_key(self._vector_seqs[idx]), updated_cid)
             self.metadata[idx] = metadata
 
             # Update the root CID
@@ -552,6 +569,7 @@ class IPLDVectorStore:
             del self.vectors[idx]
             del self.vector_ids[idx]
             del self.metadata[idx]
+            self._vector_index.delete(_seq_key(self._vector_seqs.pop(idx)))
 
         # Rebuild the index if using FAISS
         if HAVE_FAISS and self._index is not None:
@@ -568,19 +586,56 @@ class IPLDVectorStore:
 
         return True
 
+    def _append_vector_id(self, vector_id: VectorID) -> None:
+        self.vector_ids.append(vector_id)
+        self._vector_seqs.append(self._next_seq)
+        self._vector_index.set(_seq_key(self._next_seq), vector_id)
+        self._next_seq += 1
+
     def _update_root_cid(self):
-        """Update the root CID of the vector store."""
-        # Create IPLD node with store metadata and vector IDs
+        """Update the root CID of the vector store, unless inside batch()."""
+        if self._batch_depth:
+            self._root_dirty = True
+            return
+        self.commit()
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer root updates until the end of a block of mutations.
+
+        Yields:
+            The vector store itself
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._root_dirty:
+                self.commit()
+
+    def commit(self) -> VectorID:
+        """
+        Write the dirty vector index nodes and a new root node.
+
+        Returns:
+            str - Root CID of the vector store
+        """
+        # Create IPLD node with store metadata and the vector index root
         root_node = {
             "type": "vector_store",
             "dimension": self.dimension,
             "metric": self.metric,
             "count": len(self.vectors),
-            "vector_ids": self.vector_ids,
+            "vector_index": {"_hamt": self._vector_index.flush()},
+            "next_seq": self._next_seq,
         }
 
         # Store the root node
         self.root_cid = self.storage.store(json.dumps(root_node).encode())
+        self._root_dirty = False
+        return self.root_cid
 
     def export_to_ipld(self) -> Tuple[VectorID, Dict[VectorID, bytes]]:
         """
@@ -590,7 +645,7 @@ class IPLDVectorStore:
             tuple: (root_cid, {cid: block_data}) - Root CID and blocks
         """
         # Make sure the root CID is updated
-        self._update_root_cid()
+        self.commit()
 
         # Collect all blocks
         blocks = {}
@@ -600,6 +655,10 @@ class IPLDVectorStore:
         if root_block:
             blocks[self.root_cid] = root_block
 
+        # Add the vector index nodes
+        for node_cid in self._vector_index.node_cids():
+            blocks[node_cid] = self.storage.get(node_cid)
+
         # Add all vector blocks
         for vector_id in self.vector_ids:
             vector_block = self.storage.get(vector_id)
@@ -672,11 +731,20 @@ class IPLDVectorStore:
         # Set the root CID
         vector_store.root_cid = cid
 
-        # Load vector IDs
-        vector_ids = root_node.get("vector_ids", [])
+        # Load vector IDs, from the HAMT index or the legacy inline list
+        index_field = root_node.get("vector_index")
+        if isinstance(index_field, dict) and index_field.get("_hamt"):
+            vector_store._vector_index = HAMT(storage, root_cid=index_field["_hamt"])
+            entries = sorted((int(seq), vid) for seq, vid in vector_store._vector_index.items())
+            vector_ids = [vid for _, vid in entries]
+            vector_seqs = [seq for seq, _ in entries]
+            vector_store._next_seq = root_node.get("next_seq", len(entries))
+        else:
+            vector_ids = root_node.get("vector_ids", [])
+            vector_seqs = None
 
         # Load vectors and metadata
-        for vector_id in vector_ids:
+        for position, vector_id in enumerate(vector_ids):
             vector_bytes = storage.get(vector_id)
             if not vector_bytes:
                 logging.warning(f"Could not find vector with CID {vector_id}")
@@ -692,8 +760,6 @@ class IPLDVectorStore:
 
             # Decode base64 if necessary
             if isinstance(vector_data, str):
-                import base64
-
                 vector_data = base64.b64decode(vector_data)
 
             # Convert to numpy array
@@ -704,7 +770,11 @@ class IPLDVectorStore:
 
             # Add to in-memory collections
             vector_store.vectors.append(vector)
-            vector_store.vector_ids.append(vector_id)
+            if vector_seqs is None:
+                vector_store._append_vector_id(vector_id)
+            else:
+                vector_store.vector_ids.append(vector_id)
+                vector_store._vector_seqs.append(vector_seqs[position])
             vector_store.metadata.append(metadata)
 
         # Rebuild the index if using FAISS
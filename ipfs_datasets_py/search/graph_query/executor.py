@@ -17,6 +17,11 @@ class GraphQueryExecutor:
     def __init__(self, backend: GraphBackend):
         self._backend = backend
 
+    @property
+    def backend(self) -> GraphBackend:
+        """The graph backend this executor runs queries against."""
+        return self._backend
+
     def execute(self, ir: QueryIR, *, budgets: ExecutionBudgets | None = None) -> ExecutionResult:
         budgets = budgets or ExecutionBudgets()
         counters = ExecutionCounters()
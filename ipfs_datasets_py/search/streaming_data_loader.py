@@ -53,6 +53,10 @@ except ImportError:
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Bytes of vectors scored per tile by MemoryMappedVectorLoader.search; sized
+# so a tile plus its score block stay resident in a typical L2/L3 cache.
+DEFAULT_SEARCH_TILE_BYTES = 4 * 1024 * 1024
+
 
 class StreamingStats:
     """
@@ -2186,6 +2190,8 @@ class MemoryMappedVectorLoader:
             Useful for files with headers or metadata. Defaults to 0.
         existing_mmap (Optional[numpy.memmap], optional): Pre-existing memory map
             to wrap. Alternative to creating new map from file_path.
+        norms_path (Optional[str], optional): Sidecar file of precomputed float32
+            row norms (see compute_norms). Used by search() when present.
 
     Key Features:
     - Memory-efficient access to arbitrarily large vector datasets
@@ -2194,6 +2200,8 @@ class MemoryMappedVectorLoader:
     - Automatic file growth and vector appending capabilities
     - Operating system-level memory management and caching
     - Support for all NumPy numeric data types
+    - Zero-copy, read-only views for indexing and slicing
+    - Blocked k-NN search streaming the file in cache-sized row tiles
 
     Attributes:
         memmap (Optional[numpy.memmap]): Memory-mapped array providing vector access
@@ -2207,6 +2215,10 @@ class MemoryMappedVectorLoader:
             Get the total number of vectors in the dataset.
         __getitem__(idx) -> numpy.ndarray:
             Retrieve vector(s) by index with support for slicing.
+        search(query, top_k=10, metric="cosine", tile_rows=None) -> Tuple[numpy.ndarray, numpy.ndarray]:
+            Exact k-NN over the whole file without loading it into memory.
+        compute_norms(norms_path=None) -> str:
+            Write the row-norm sidecar file used by cosine and L2 search.
         append(vectors) -> None:
             Add new vectors to the dataset (requires write mode).
         close() -> None:
@@ -2255,6 +2267,7 @@ class MemoryMappedVectorLoader:
         mode="r",
         offset=0,
         existing_mmap=None,
+        norms_path=None,
     ):
         """
         Initialize memory-mapped vector loader with flexible configuration options.
@@ -2275,6 +2288,10 @@ class MemoryMappedVectorLoader:
                 headers or metadata sections. Must be non-negative. Defaults to 0.
             existing_mmap (Optional[numpy.memmap], optional): Pre-existing memory map
                 to wrap. When provided, file_path and dimension are ignored.
+            norms_path (Optional[str], optional): Row-norm sidecar to read if it
+                exists and to write from compute_norms(). A sidecar whose row
+                count differs from the file is ignored, and mode 'w+' deletes
+                it along with the data. Defaults to None.
 
         Raises:
             ImportError: If NumPy is not available for memory mapping operations
@@ -2290,50 +2307,62 @@ class MemoryMappedVectorLoader:
             dtype (numpy.dtype): Data type configuration for vector elements
             file_path (Optional[str]): File system path to the vector data file
             vector_size_bytes (int): Calculated size per vector for memory management
+            norms_path (Optional[str]): Row-norm sidecar path, if any
         """
         if not HAVE_NUMPY:
             raise ImportError("NumPy is required for memory-mapped vectors")
 
+        self.norms_path = norms_path
+        self._norms = None
+
         if existing_mmap is not None:
             # Use existing memory map
             self.memmap = existing_mmap
             self.dimension = existing_mmap.shape[1] if len(existing_mmap.shape) > 1 else None
             self.dtype = existing_mmap.dtype
             self.file_path = None
+            self.mode = getattr(existing_mmap, "mode", "r")
+            self.offset = getattr(existing_mmap, "offset", 0)
         elif file_path is not None and dimension is not None:
             # Create new memory map
             self.file_path = file_path
             self.dimension = dimension
             self.dtype = dtype
+            self.mode = mode
+            self.offset = offset
+            self.memmap = None
 
-            # Check if the file exists
-            file_exists = os.path.exists(file_path)
-
-            # Create an empty file if it doesn't exist and mode allows writing
-            if not file_exists and mode in ("r+", "w+"):
+            # 'w+' starts from an empty file; 'r+' creates one if missing
+            if mode == "w+" or (mode == "r+" and not os.path.exists(file_path)):
                 with open(file_path, "wb") as f:
-                    # Write an empty placeholder
-                    pass
-
-            # Create memory map
-            self.memmap = np.memmap(file_path, dtype=dtype, mode=mode, offset=offset)
-
-            # If the file exists, try to reshape the memmap
-            if file_exists:
-                # Calculate number of vectors
-                vector_size = dimension * np.dtype(dtype).itemsize
-                file_size = os.path.getsize(file_path) - offset
-                num_vectors = file_size // vector_size
-
-                # Reshape memmap
-                if num_vectors > 0:
-                    self.memmap = self.memmap.reshape((num_vectors, dimension))
+                    f.truncate(offset)
+
+            # Map existing vectors; an empty file cannot be mapped until append()
+            vector_size = dimension * np.dtype(dtype).itemsize
+            num_vectors = max(0, os.path.getsize(file_path) - offset) // vector_size
+            if num_vectors > 0:
+                self.memmap = np.memmap(
+                    file_path, dtype=dtype, mode=mode, offset=offset, shape=(num_vectors, dimension)
+                )
         else:
             raise ValueError("Either file_path and dimension, or existing_mmap must be provided")
 
         # Calculate vector size in bytes
         self.vector_size_bytes = self.dimension * np.dtype(self.dtype).itemsize
 
+        if norms_path is not None and os.path.exists(norms_path):
+            if self.file_path is not None and self.mode == "w+":
+                # The data file was just truncated, so its old norms are stale
+                os.remove(norms_path)
+            elif os.path.getsize(norms_path):
+                norms = np.memmap(norms_path, dtype=np.float32, mode="r")
+                if len(norms) == len(self):
+                    self._norms = norms
+                else:
+                    logger.warning(
+                        f"Ignoring norms sidecar {norms_path}: {len(norms)} rows for {len(self)} vectors"
+                    )
+
     def __len__(self):
         """
         Get the total number of vectors in the memory-mapped dataset.
@@ -2355,6 +2384,10 @@ class MemoryMappedVectorLoader:
         """
         Get a vector or slice of vectors.
 
+        Integer and slice indexes return read-only views into the memory map,
+        so even large slices are not copied; use ``.copy()`` to detach one.
+        Index arrays (fancy indexing) necessarily return a copy.
+
         Args:
             idx (int or slice): Index or slice to retrieve
 
@@ -2367,12 +2400,139 @@ class MemoryMappedVectorLoader:
         if self.memmap is None:
             raise RuntimeError("Memory map is not initialized")
 
-        if isinstance(idx, slice):
-            # Slice of vectors
-            return np.array(self.memmap[idx])
-        else:
-            # Single vector
-            return np.array(self.memmap[idx])
+        view = np.asarray(self.memmap[idx]).view(np.ndarray)
+        view.flags.writeable = False
+        return view
+
+    def search(self, query, top_k=10, metric="cosine", tile_rows=None):
+        """
+        Exact k-nearest-neighbour search over the memory-mapped vectors.
+
+        The file is streamed in tiles of ``tile_rows`` rows (by default
+        DEFAULT_SEARCH_TILE_BYTES worth of vectors), each scored with one
+        matmul against all queries. A running top-k buffer per query is merged
+        with each tile's argpartition candidates, so memory stays bounded by
+        the tile size regardless of file size. Row norms come from the
+        sidecar file when available (see compute_norms) and are otherwise
+        computed per tile.
+
+        Args:
+            query (numpy.ndarray): One query of shape (dimension,) or a batch
+                of shape (n_queries, dimension).
+            top_k (int, optional): Number of neighbours per query. Defaults to 10.
+            metric (str, optional): "cosine", "dot" (inner product) or "l2"
+                (Euclidean distance). Defaults to "cosine".
+            tile_rows (Optional[int], optional): Rows scored per tile.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: ``(indices, scores)``, best
+                first, shaped (k,) for one query or (n_queries, k) for a batch.
+                Scores are similarities for cosine/dot and distances for l2.
+
+        Raises:
+            RuntimeError: If the memory map is not initialized
+            ValueError: If the metric is unknown or the query dimension differs
+        """
+        if self.memmap is None:
+            raise RuntimeError("Memory map is not initialized")
+        if metric not in ("cosine", "dot", "l2"):
+            raise ValueError(f"Unknown metric '{metric}'; expected cosine, dot or l2")
+
+        queries = np.asarray(query, dtype=np.float32)
+        single = queries.ndim == 1
+        queries = np.atleast_2d(queries)
+        if queries.shape[1] != self.dimension:
+            raise ValueError(
+                f"Query dimension {queries.shape[1]} doesn't match expected dimension {self.dimension}"
+            )
+
+        total = len(self)
+        k = min(max(int(top_k), 0), total)
+        if metric == "cosine":
+            query_norms = np.linalg.norm(queries, axis=1, keepdims=True)
+            queries = np.divide(queries, query_norms, out=np.zeros_like(queries), where=query_norms > 0)
+        query_sq = np.einsum("ij,ij->i", queries, queries)[:, None]
+
+        # Keys are minimised: negated similarity, or distance for l2
+        best_keys = np.empty((len(queries), 0), dtype=np.float32)
+        best_rows = np.empty((len(queries), 0), dtype=np.int64)
+        step = max(1, int(tile_rows or DEFAULT_SEARCH_TILE_BYTES // self.vector_size_bytes))
+        for start in range(0, total if k else 0, step):
+            stop = min(start + step, total)
+            tile = np.asarray(self.memmap[start:stop], dtype=np.float32)
+            dots = queries @ tile.T
+            if metric == "dot":
+                keys = -dots
+            else:
+                norms = self._tile_norms(start, stop, tile)
+                if metric == "cosine":
+                    keys = -np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+                else:
+                    keys = np.sqrt(np.maximum(query_sq - 2.0 * dots + norms * norms, 0.0))
+
+            keys = np.concatenate([best_keys, keys], axis=1)
+            rows = np.concatenate(
+                [best_rows, np.broadcast_to(np.arange(start, stop), (len(queries), stop - start))],
+                axis=1,
+            )
+            if keys.shape[1] > k:
+                keep = np.argpartition(keys, k - 1, axis=1)[:, :k]
+                keys = np.take_along_axis(keys, keep, axis=1)
+                rows = np.take_along_axis(rows, keep, axis=1)
+            best_keys, best_rows = keys, rows
+
+        order = np.lexsort((best_rows, best_keys), axis=1) if k else best_rows
+        indices = np.take_along_axis(best_rows, order, axis=1)
+        scores = np.take_along_axis(best_keys, order, axis=1)
+        if metric != "l2":
+            scores = -scores
+        if single:
+            return indices[0], scores[0]
+        return indices, scores
+
+    def compute_norms(self, norms_path=None, tile_rows=None):
+        """
+        Compute every row's L2 norm and write them to a float32 sidecar file.
+
+        Cosine and L2 search then read norms from the sidecar instead of
+        recomputing them on every scan. append() keeps the sidecar current.
+
+        Args:
+            norms_path (Optional[str], optional): Where to write the sidecar.
+                Defaults to ``self.norms_path`` or ``<file_path>.norms``.
+            tile_rows (Optional[int], optional): Rows processed per tile.
+
+        Returns:
+            str: Path of the written sidecar file
+
+        Raises:
+            RuntimeError: If the memory map is not initialized
+            ValueError: If no path is given and the loader has no file_path
+        """
+        if self.memmap is None:
+            raise RuntimeError("Memory map is not initialized")
+        path = norms_path or self.norms_path
+        if path is None:
+            if self.file_path is None:
+                raise ValueError("norms_path is required for loaders without a file_path")
+            path = f"{self.file_path}.norms"
+
+        total = len(self)
+        step = max(1, int(tile_rows or DEFAULT_SEARCH_TILE_BYTES // self.vector_size_bytes))
+        with open(path, "wb") as f:
+            for start in range(0, total, step):
+                tile = np.asarray(self.memmap[start : start + step], dtype=np.float32)
+                f.write(np.linalg.norm(tile, axis=1).astype(np.float32).tobytes())
+
+        self.norms_path = path
+        self._norms = np.memmap(path, dtype=np.float32, mode="r") if total else None
+        return path
+
+    def _tile_norms(self, start, stop, tile):
+        """Row norms for ``tile`` as a (1, rows) array, from the sidecar if it matches the file."""
+        if self._norms is not None and len(self._norms) == len(self):
+            return np.asarray(self._norms[start:stop], dtype=np.float32)[None, :]
+        return np.linalg.norm(tile, axis=1)[None, :]
 
     def append(self, vectors):
         """
@@ -2410,10 +2570,10 @@ class MemoryMappedVectorLoader:
             Appending large batches of vectors is more efficient than appending
             individual vectors due to reduced file resize operations.
         """
-        if self.memmap is None:
-            raise RuntimeError("Memory map is not initialized")
+        if self.file_path is None:
+            raise RuntimeError("Memory map is not backed by a file that can grow")
 
-        if self.memmap.mode not in ("r+", "w+"):
+        if self.mode not in ("r+", "w+"):
             raise RuntimeError("Memory map is read-only")
 
         # Ensure vectors have the right shape
@@ -2438,18 +2598,30 @@ class MemoryMappedVectorLoader:
         new_size = current_len + vectors.shape[0]
 
         # Resize the file
-        fp = np.memmap(self.file_path, dtype=self.dtype, mode="r+")
-        fp.resize(new_size * self.vector_size_bytes)
-        del fp
+        if self.memmap is not None:
+            self.memmap.flush()
+        with open(self.file_path, "r+b") as f:
+            f.truncate(self.offset + new_size * self.vector_size_bytes)
 
         # Re-open the memory map with the new size
         self.memmap = np.memmap(
-            self.file_path, dtype=self.dtype, mode="r+", shape=(new_size, self.dimension)
+            self.file_path,
+            dtype=self.dtype,
+            mode="r+",
+            offset=self.offset,
+            shape=(new_size, self.dimension),
         )
 
         # Write the new vectors
         self.memmap[current_len:new_size] = vectors
 
+        # Keep the row-norm sidecar in step with the data file
+        if self._norms is not None and len(self._norms) == current_len:
+            norms = np.linalg.norm(np.asarray(vectors, dtype=np.float32), axis=1)
+            with open(self.norms_path, "ab") as f:
+                f.write(norms.astype(np.float32).tobytes())
+            self._norms = np.memmap(self.norms_path, dtype=np.float32, mode="r")
+
     def close(self):
         """
         Close the memory map and flush any pending changes to disk.
@@ -2465,6 +2637,7 @@ class MemoryMappedVectorLoader:
             # Delete the memmap object
             del self.memmap
             self.memmap = None
+            self._norms = None
 
     def __enter__(self):
         """
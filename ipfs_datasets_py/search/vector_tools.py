@@ -41,12 +41,43 @@ Notes:
 """
 
 import logging
-from typing import Dict, List, Optional, Any, Union
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Any, Union
 import numpy as np
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Rows scored per matmul block in VectorStore searches; bounds the temporary
+# score matrix and the float16 -> float32 upcast to a fixed size.
+SEARCH_BLOCK_ROWS = 65536
+
+_STORAGE_DTYPES = {"float32": np.float32, "float16": np.float16}
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Return ``matrix`` with unit-length rows; zero rows stay zero."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def _top_k_order(
+    scores: np.ndarray, top_k: int, tie_break: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Indices of the ``top_k`` highest scores, descending.
+
+    Ties are ordered by ``tie_break`` (default: the index itself), which keeps
+    results in insertion order like the stable sort this replaces.
+    """
+    if top_k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if top_k < len(scores):
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+        candidates = np.arange(len(scores))
+    ties = candidates if tie_break is None else tie_break[candidates]
+    return candidates[np.lexsort((ties, -scores[candidates]))]
+
 
 class VectorSimilarityCalculator:
     """
@@ -264,11 +295,25 @@ class VectorSimilarityCalculator:
             >>> calculator.batch_similarity([], [1, 0])
             []
         """
-        similarities = []
-        for vector in vectors:
-            sim = self.cosine_similarity(query_vector, vector)
-            similarities.append(sim)
-        return similarities
+        if len(vectors) == 0:
+            return []
+        try:
+            return self._cosine_scores(vectors, query_vector).tolist()
+        except (TypeError, ValueError):
+            # Ragged or non-numeric input: score pairwise so each bad vector
+            # degrades to 0.0 on its own, as cosine_similarity does
+            return [self.cosine_similarity(query_vector, vector) for vector in vectors]
+
+    def _cosine_scores(self, vectors: Any, query_vector: List[float]) -> np.ndarray:
+        """Cosine similarity of every row of ``vectors`` to the query, in one matmul."""
+        matrix = np.asarray(vectors, dtype=np.float64)
+        query = np.asarray(query_vector, dtype=np.float64)
+        if matrix.ndim != 2 or query.ndim != 1 or matrix.shape[1] != len(query):
+            raise ValueError("vectors and query_vector must share one dimension")
+        query_norm = np.linalg.norm(query)
+        if query_norm == 0:
+            return np.zeros(len(matrix))
+        return _normalize_rows(matrix) @ (query / query_norm)
 
     def find_most_similar(
         self, vectors: Dict[str, List[float]], query_vector: List[float], top_k: int = 5
@@ -319,14 +364,32 @@ class VectorSimilarityCalculator:
             >>> len(results)
             2
         """
-        similarities = []
-        for vector_id, vector in vectors.items():
-            sim = self.cosine_similarity(query_vector, vector)
-            similarities.append({"id": vector_id, "similarity": sim})
+        ids = list(vectors.keys())
+        try:
+            scores = self._cosine_scores(list(vectors.values()), query_vector)
+        except (TypeError, ValueError):
+            scores = np.array([self.cosine_similarity(query_vector, v) for v in vectors.values()])
+        return [
+            {"id": ids[i], "similarity": float(scores[i])}
+            for i in _top_k_order(scores, top_k)
+        ]
+
+
+class _StoredVectors(Mapping):
+    """Read-only ``id -> np.ndarray`` view over a VectorStore's matrix."""
+
+    def __init__(self, store: "VectorStore"):
+        self._store = store
+
+    def __getitem__(self, vector_id: str) -> np.ndarray:
+        row = self._store._rows[vector_id]
+        return self._store._matrix[row].astype(np.float64) * self._store._norms[row]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store._ids)
 
-        # Sort by similarity (descending)
-        similarities.sort(key=lambda x: x["similarity"], reverse=True)
-        return similarities[:top_k]
+    def __len__(self) -> int:
+        return len(self._store._ids)
 
 
 class VectorStore:
@@ -342,6 +405,8 @@ class VectorStore:
         dimension (int, optional): The dimensionality of vectors to be stored.
             All vectors added to the store must match this dimension.
             Defaults to 768 for compatibility with common transformer embeddings.
+        storage_dtype (str, optional): "float32" (default) or "float16". Half
+            precision halves memory at roughly 1e-3 similarity error.
 
     Key Features:
     - High-performance vector storage with automatic dimension validation
@@ -356,8 +421,10 @@ class VectorStore:
     Attributes:
         dimension (int): The required dimensionality for all vectors in the store.
             Used for validation during vector addition operations.
-        vectors (Dict[str, np.ndarray]): Internal storage mapping vector IDs to
-            their NumPy array representations for efficient numerical operations.
+        vectors (Mapping[str, np.ndarray]): Read-only view mapping vector IDs to
+            their stored vectors. Vectors live as unit-length rows of one
+            contiguous matrix, with their norms kept alongside, so a search
+            is a single matmul plus an ``argpartition`` top-k.
         metadata (Dict[str, Dict]): Associated metadata for each vector, indexed
             by vector ID for quick retrieval during search operations.
 
@@ -368,6 +435,9 @@ class VectorStore:
         search_similar(query_vector: List[float], top_k: int = 5) -> List[Dict[str, Any]]:
             Search for vectors most similar to a query vector using cosine similarity,
             returning ranked results with scores and associated metadata.
+        search_many(query_vectors: List[List[float]], top_k: int = 5) -> List[List[Dict[str, Any]]]:
+            Batched search_similar: all queries are scored in one matmul per
+            block of stored rows.
 
     Usage Example:
         # Create vector store for 768-dimensional embeddings
@@ -396,7 +466,7 @@ class VectorStore:
         - Vector IDs must be unique within the store; duplicate IDs will overwrite existing vectors
     """
 
-    def __init__(self, dimension: int = 768):
+    def __init__(self, dimension: int = 768, storage_dtype: str = "float32"):
         """
         Initialize vector store with specified dimension and empty storage containers.
 
@@ -405,17 +475,19 @@ class VectorStore:
                 stored in this instance. Must be a positive integer representing
                 the number of features or embedding dimensions. Defaults to 768
                 for compatibility with common transformer models like BERT.
+            storage_dtype (str, optional): Element type of the stored matrix,
+                "float32" or "float16". Scores are always computed in float32.
 
         Attributes initialized:
             dimension (int): The enforced dimensionality for vector validation.
-            vectors (Dict[str, np.ndarray]): Empty dictionary for storing vector IDs
-                mapped to their NumPy array representations.
+            vectors (Mapping[str, np.ndarray]): Empty read-only view of stored
+                vectors by ID.
             metadata (Dict[str, Dict]): Empty dictionary for storing vector metadata
                 indexed by vector ID for quick retrieval.
 
         Raises:
             TypeError: If dimension is not an integer
-            ValueError: If dimension is not positive
+            ValueError: If dimension is not positive or storage_dtype is unknown
 
         Examples:
             >>> store = VectorStore(dimension=512)
@@ -430,9 +502,27 @@ class VectorStore:
             >>> default_store.dimension
             768
         """
+        if storage_dtype not in _STORAGE_DTYPES:
+            raise ValueError(
+                f"storage_dtype must be one of {sorted(_STORAGE_DTYPES)}, got {storage_dtype!r}"
+            )
         self.dimension = dimension
-        self.vectors = {}
+        self.storage_dtype = storage_dtype
         self.metadata = {}
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._buffer = np.empty((0, dimension), dtype=_STORAGE_DTYPES[storage_dtype])
+        self._norms = np.empty(0, dtype=np.float64)
+
+    @property
+    def vectors(self) -> Mapping:
+        """Read-only ``id -> np.ndarray`` view of the stored vectors."""
+        return _StoredVectors(self)
+
+    @property
+    def _matrix(self) -> np.ndarray:
+        """Unit-length rows for the stored vectors, in insertion order."""
+        return self._buffer[: len(self._ids)]
 
     def add_vector(
         self, vector_id: str, vector: List[float], metadata: Optional[Dict] = None
@@ -492,7 +582,17 @@ class VectorStore:
                     "message": f"Vector dimension mismatch. Expected {self.dimension}, got {len(vector)}",
                 }
 
-            self.vectors[vector_id] = np.array(vector)
+            values = np.asarray(vector, dtype=np.float64)
+            norm = float(np.linalg.norm(values))
+            row = self._rows.get(vector_id)
+            if row is None:
+                row = len(self._ids)
+                if row == len(self._buffer):
+                    self._grow(max(16, 2 * row))
+                self._ids.append(vector_id)
+                self._rows[vector_id] = row
+            self._buffer[row] = values / norm if norm > 0 else 0.0
+            self._norms[row] = norm
             self.metadata[vector_id] = metadata or {}
             return {"status": "success", "vector_id": vector_id}
         except Exception as e:
@@ -547,27 +647,91 @@ class VectorStore:
             >>> len(results)
             2
         """
+        results = self.search_many([query_vector], top_k)
+        return results[0] if results else []
+
+    def search_many(
+        self, query_vectors: List[List[float]], top_k: int = 5
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for the most similar stored vectors for several queries at once.
+
+        All queries are normalized into one matrix and scored against each
+        block of ``SEARCH_BLOCK_ROWS`` stored rows with a single matmul; each
+        block keeps only its ``top_k`` candidates per query, so memory stays
+        bounded however many vectors are stored.
+
+        Args:
+            query_vectors (List[List[float]]): Query vectors, each with the
+                store's dimensionality.
+            top_k (int, optional): Maximum number of results per query.
+                Defaults to 5.
+
+        Returns:
+            List[List[Dict[str, Any]]]: One result list per query, in query
+                order, each shaped like :meth:`search_similar` results.
+                Empty list if the search fails.
+
+        Examples:
+            >>> store = VectorStore(dimension=2)
+            >>> store.add_vector("v1", [1.0, 0.0])
+            >>> store.add_vector("v2", [0.0, 1.0])
+            >>> [r[0]['id'] for r in store.search_many([[1.0, 0.1], [0.1, 1.0]], top_k=1)]
+            ['v1', 'v2']
+        """
         try:
-            calculator = VectorSimilarityCalculator()
-            similarities = []
-
-            for vector_id, vector in self.vectors.items():
-                similarity = calculator.cosine_similarity(query_vector, vector.tolist())
-                similarities.append(
-                    {
-                        "id": vector_id,
-                        "similarity": similarity,
-                        "metadata": self.metadata.get(vector_id, {}),
-                    }
+            queries = np.asarray(query_vectors, dtype=np.float32)
+            if queries.ndim != 2 or queries.shape[1] != self.dimension:
+                raise ValueError(
+                    f"Query dimension mismatch. Expected {self.dimension}, got {queries.shape[-1]}"
                 )
-
-            # Sort by similarity (descending) and return top_k
-            similarities.sort(key=lambda x: x["similarity"], reverse=True)
-            return similarities[:top_k]
+            queries = _normalize_rows(queries)
+            count = len(self._ids)
+            k = min(max(int(top_k), 0), count)
+            if k == 0:
+                return [[] for _ in range(len(queries))]
+
+            best_rows, best_scores = [], []
+            for start in range(0, count, SEARCH_BLOCK_ROWS):
+                block = self._matrix[start : start + SEARCH_BLOCK_ROWS].astype(np.float32, copy=False)
+                scores = queries @ block.T
+                if scores.shape[1] > k:
+                    keep = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                    scores = np.take_along_axis(scores, keep, axis=1)
+                else:
+                    keep = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+                best_rows.append(keep + start)
+                best_scores.append(scores)
+            rows = np.concatenate(best_rows, axis=1)
+            scores = np.concatenate(best_scores, axis=1)
+
+            results = []
+            for q in range(len(queries)):
+                ranked = []
+                for i in _top_k_order(scores[q], k, rows[q]):
+                    vector_id = self._ids[rows[q, i]]
+                    ranked.append(
+                        {
+                            "id": vector_id,
+                            "similarity": float(scores[q, i]),
+                            "metadata": self.metadata.get(vector_id, {}),
+                        }
+                    )
+                results.append(ranked)
+            return results
         except Exception as e:
             logger.error(f"Vector search failed: {e}")
             return []
 
+    def _grow(self, capacity: int) -> None:
+        """Reallocate the row buffer and norms to hold ``capacity`` vectors."""
+        buffer = np.empty((capacity, self.dimension), dtype=self._buffer.dtype)
+        norms = np.empty(capacity, dtype=np.float64)
+        count = len(self._ids)
+        buffer[:count] = self._buffer[:count]
+        norms[:count] = self._norms[:count]
+        self._buffer, self._norms = buffer, norms
+
 
 # Utility functions
 def create_vector_store(dimension: int = 768) -> VectorStore:
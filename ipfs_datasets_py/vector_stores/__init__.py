@@ -16,6 +16,7 @@ try:
     # Configuration
     from .config import (
         UnifiedVectorStoreConfig,
+        VectorStoreType,
         create_ipld_config,
         create_faiss_config,
         create_qdrant_config,
@@ -29,7 +30,6 @@ try:
         IPLDSearchResult,
         CollectionMetadata,
         VectorBlock,
-        VectorStoreType,
     )
 
     # Router integration
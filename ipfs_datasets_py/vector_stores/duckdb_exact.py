@@ -5,6 +5,12 @@ Authoritative vectors live in one physical table per dimension
 distance/ranking/filter queries bind results to collection generation and
 content digest. Mixed dimensions are rejected at the collection boundary —
 they cannot enter one physical table. VSS/HNSW is not used here (see DQK-022).
+
+Search runs on a vectorized NumPy scan engine when NumPy is importable: the
+``FLOAT[N]`` column is fetched once as a contiguous float32 matrix, scored with
+one batched matmul, cut to top-k with ``argpartition`` and re-ranked with the
+exact :func:`distance` so results (including ties) match the pure-Python scan,
+which remains available as ``scan_engine="python"``.
 """
 
 from __future__ import annotations
@@ -15,15 +21,25 @@ import math
 import re
 import struct
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any, Final, Mapping, Sequence, Union
 
+try:
+    import numpy as np
+
+    HAVE_NUMPY = True
+except ImportError:  # pragma: no cover - numpy is a base dependency
+    np = None  # type: ignore[assignment]
+    HAVE_NUMPY = False
+
 __all__ = [
     "DUCKDB_EXACT_SCHEMA",
     "ExactHit",
     "ExactVectorStore",
     "ExactVectorStoreError",
+    "batched_scores",
+    "candidate_rows",
     "decode_vector",
     "distance",
     "encode_vector",
@@ -34,6 +50,11 @@ __all__ = [
 DUCKDB_EXACT_SCHEMA: Final[str] = "ipfs_datasets_py/vector-stores-duckdb-exact@1"
 _SAFE_ID = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.:@+-]{0,127}$")
 _SUPPORTED_METRICS: Final[frozenset[str]] = frozenset({"l2", "cosine"})
+_SCAN_ENGINES: Final[frozenset[str]] = frozenset({"auto", "numpy", "python"})
+# Slack (in units of float32 machine epsilon per dimension) applied to the
+# k-th float32 score so every row that could tie with it under exact float64
+# re-ranking stays in the candidate set.
+_FLOAT32_SLACK: Final[float] = 4.0
 
 
 class ExactVectorStoreError(ValueError):
@@ -107,6 +128,69 @@ def distance(
     raise ExactVectorStoreError("METRIC", f"unsupported metric {metric!r}")
 
 
+def _load_metadata(raw: Any) -> dict[str, Any]:
+    meta = json.loads(raw or "{}")
+    return meta if isinstance(meta, dict) else {}
+
+
+def _matches_filter(meta: Mapping[str, Any], metadata_filter: Mapping[str, Any]) -> bool:
+    return all(meta.get(key) == value for key, value in metadata_filter.items())
+
+
+def _stack_vectors(column: Any, dimension: int) -> Any:
+    """Collapse a fetched ``FLOAT[N]`` column into one ``(rows, N)`` float32 matrix."""
+
+    if len(column) == 0:
+        return np.empty((0, dimension), dtype=np.float32)
+    matrix = np.ascontiguousarray(np.stack(column), dtype=np.float32)
+    if matrix.ndim != 2 or matrix.shape[1] != dimension:
+        # Defensive: physical type should already enforce length.
+        raise ExactVectorStoreError(
+            "DIM",
+            "stored vector dimension mismatch",
+            expected=dimension,
+            got=int(matrix.shape[-1]) if matrix.ndim else 0,
+        )
+    return matrix
+
+
+def batched_scores(matrix: Any, query: Sequence[float], metric: str) -> tuple[Any, float]:
+    """Score every row against ``query`` in float32; return ``(scores, slack)``.
+
+    Scores are monotone in the exact distance (squared L2, or cosine
+    distance) and ``slack`` bounds the float32 rounding error, so candidate
+    selection with it never drops a row the exact ranking would keep.
+    """
+
+    q = np.asarray(query, dtype=np.float32)
+    dim = matrix.shape[1]
+    eps = float(np.finfo(np.float32).eps) * _FLOAT32_SLACK * dim
+    sq_norms = np.einsum("ij,ij->i", matrix, matrix)
+    dots = matrix @ q
+    q_sq = float(q @ q)
+    if metric == "l2":
+        scores = sq_norms - 2.0 * dots + q_sq
+        scale = float(sq_norms.max()) + q_sq
+        return scores, eps * max(scale, 1.0)
+    norms = np.sqrt(sq_norms)
+    q_norm = math.sqrt(q_sq)
+    scores = np.ones(matrix.shape[0], dtype=np.float32)
+    if q_norm > 0.0:
+        nonzero = norms > 0.0
+        scores[nonzero] = 1.0 - dots[nonzero] / (norms[nonzero] * q_norm)
+    return scores, eps
+
+
+def candidate_rows(scores: Any, k: int, slack: float) -> Any:
+    """Row indices that can reach the top ``k`` once re-ranked exactly."""
+
+    n = scores.shape[0]
+    if k >= n:
+        return np.arange(n)
+    kth = float(scores[np.argpartition(scores, k - 1)[k - 1]])
+    return np.flatnonzero(scores <= kth + slack)
+
+
 @dataclass(frozen=True)
 class ExactHit:
     """One ranked exact-search hit bound to generation and content digest."""
@@ -128,10 +212,21 @@ class ExactVectorStore:
     * ``exact_vectors_d{N}`` — one table per dimension with column
       ``vector FLOAT[N]``; rows from different collections that share ``N``
       coexist, filtered by ``collection_id`` / ``generation_id`` at query time.
+
+    ``scan_engine`` selects how :meth:`search` ranks rows: ``"numpy"`` (batched
+    float32 scan), ``"python"`` (row-at-a-time reference scan) or ``"auto"``
+    (NumPy when importable).
     """
 
-    def __init__(self, path: Union[str, Path]) -> None:
+    def __init__(self, path: Union[str, Path], *, scan_engine: str = "auto") -> None:
+        if scan_engine not in _SCAN_ENGINES:
+            raise ExactVectorStoreError(
+                "ENGINE", f"unsupported scan engine {scan_engine!r}"
+            )
+        if scan_engine == "numpy" and not HAVE_NUMPY:
+            raise ExactVectorStoreError("NUMPY_REQUIRED", "numpy package is required")
         duckdb = _require_duckdb()
+        self._use_numpy = HAVE_NUMPY and scan_engine != "python"
         self._path = Path(path)
         self._path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = threading.RLock()
@@ -363,55 +458,166 @@ class ExactVectorStore:
                 )
             table = self._ensure_table(dim)
             q = [float(x) for x in query]
-            rows = self._conn.execute(
-                f"""
-                SELECT vector_id, collection_id, generation_id, content_digest,
-                       vector, metadata_json
-                FROM {table}
-                WHERE collection_id = ? AND generation_id = ?
-                """,
-                [collection_id, gen],
-            ).fetchall()
-
-            scored: list[ExactHit] = []
-            for row in rows:
-                meta = json.loads(row[5] or "{}")
-                if not isinstance(meta, dict):
-                    meta = {}
-                if metadata_filter:
-                    if any(
-                        meta.get(key) != value
-                        for key, value in metadata_filter.items()
-                    ):
-                        continue
-                # DuckDB returns FLOAT[N] as a tuple/list of floats.
-                raw = row[4]
-                if raw is None:
-                    continue
-                vec = [float(x) for x in raw]
-                if len(vec) != dim:
-                    # Defensive: physical type should already enforce length.
-                    raise ExactVectorStoreError(
-                        "DIM",
-                        "stored vector dimension mismatch",
-                        expected=dim,
-                        got=len(vec),
-                        vector_id=row[0],
-                    )
-                dist = distance(q, vec, metric=metric)
-                scored.append(
-                    ExactHit(
-                        vector_id=str(row[0]),
-                        collection_id=str(row[1]),
-                        generation_id=int(row[2]),
-                        content_digest=str(row[3]),
-                        distance=dist,
-                        metadata=meta,
-                    )
+            if self._use_numpy:
+                return self._search_numpy(
+                    table, collection_id, gen, dim, q, k, metric, metadata_filter
                 )
-            # Deterministic tie-break: distance ascending, then vector_id ascending.
-            scored.sort(key=lambda h: (h.distance, h.vector_id))
-            return scored[:k]
+            return self._search_python(
+                table, collection_id, gen, dim, q, k, metric, metadata_filter
+            )
+
+    def _search_python(
+        self,
+        table: str,
+        collection_id: str,
+        gen: int,
+        dim: int,
+        q: list[float],
+        k: int,
+        metric: str,
+        metadata_filter: Mapping[str, Any] | None,
+    ) -> list[ExactHit]:
+        rows = self._conn.execute(
+            f"""
+            SELECT vector_id, collection_id, generation_id, content_digest,
+                   vector, metadata_json
+            FROM {table}
+            WHERE collection_id = ? AND generation_id = ?
+            """,
+            [collection_id, gen],
+        ).fetchall()
+
+        scored: list[ExactHit] = []
+        for row in rows:
+            meta = _load_metadata(row[5])
+            if metadata_filter and not _matches_filter(meta, metadata_filter):
+                continue
+            # DuckDB returns FLOAT[N] as a tuple/list of floats.
+            raw = row[4]
+            if raw is None:
+                continue
+            vec = [float(x) for x in raw]
+            if len(vec) != dim:
+                # Defensive: physical type should already enforce length.
+                raise ExactVectorStoreError(
+                    "DIM",
+                    "stored vector dimension mismatch",
+                    expected=dim,
+                    got=len(vec),
+                    vector_id=row[0],
+                )
+            dist = distance(q, vec, metric=metric)
+            scored.append(
+                ExactHit(
+                    vector_id=str(row[0]),
+                    collection_id=str(row[1]),
+                    generation_id=int(row[2]),
+                    content_digest=str(row[3]),
+                    distance=dist,
+                    metadata=meta,
+                )
+            )
+        # Deterministic tie-break: distance ascending, then vector_id ascending.
+        scored.sort(key=lambda h: (h.distance, h.vector_id))
+        return scored[:k]
+
+    def _search_numpy(
+        self,
+        table: str,
+        collection_id: str,
+        gen: int,
+        dim: int,
+        q: list[float],
+        k: int,
+        metric: str,
+        metadata_filter: Mapping[str, Any] | None,
+    ) -> list[ExactHit]:
+        columns = "vector_id, vector, metadata_json" if metadata_filter else "vector_id, vector"
+        fetched = self._conn.execute(
+            f"""
+            SELECT {columns}
+            FROM {table}
+            WHERE collection_id = ? AND generation_id = ?
+            """,
+            [collection_id, gen],
+        ).fetchnumpy()
+        ids = fetched["vector_id"]
+        matrix = _stack_vectors(fetched["vector"], dim)
+        if metadata_filter:
+            keep = np.fromiter(
+                (
+                    _matches_filter(_load_metadata(raw), metadata_filter)
+                    for raw in fetched["metadata_json"]
+                ),
+                dtype=bool,
+                count=len(ids),
+            )
+            ids = ids[keep]
+            matrix = matrix[keep]
+        if len(ids) == 0:
+            return []
+
+        scores, slack = batched_scores(matrix, q, metric)
+        # Exact re-rank of the (few) candidates with the reference distance so
+        # the (distance, vector_id) order is identical to the Python scan.
+        ranked = sorted(
+            (distance(q, matrix[i].tolist(), metric=metric), str(ids[i]))
+            for i in candidate_rows(scores, k, slack)
+        )[:k]
+
+        bound = self._lookup_rows(table, collection_id, gen, [vid for _, vid in ranked])
+        return [replace(bound[vid], distance=dist) for dist, vid in ranked]
+
+    def _lookup_rows(
+        self,
+        table: str,
+        collection_id: str,
+        gen: int,
+        vector_ids: Sequence[str],
+    ) -> dict[str, ExactHit]:
+        if not vector_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in vector_ids)
+        rows = self._conn.execute(
+            f"""
+            SELECT vector_id, collection_id, generation_id, content_digest,
+                   metadata_json
+            FROM {table}
+            WHERE collection_id = ? AND generation_id = ?
+              AND vector_id IN ({placeholders})
+            """,
+            [collection_id, gen, *vector_ids],
+        ).fetchall()
+        return {
+            str(row[0]): ExactHit(
+                vector_id=str(row[0]),
+                collection_id=str(row[1]),
+                generation_id=int(row[2]),
+                content_digest=str(row[3]),
+                distance=0.0,
+                metadata=_load_metadata(row[4]),
+            )
+            for row in rows
+        }
+
+    def lookup(
+        self,
+        collection_id: str,
+        vector_ids: Sequence[str],
+    ) -> dict[str, ExactHit]:
+        """Bind ``vector_ids`` to their current-generation identity rows by ID.
+
+        Returned hits carry ``distance=0.0``; IDs that are absent from the
+        current generation are omitted. Used by derived indexes to attach
+        generation/digest/metadata without running a search.
+        """
+
+        with self._lock:
+            dim, gen = self._collection_dim(collection_id)
+            table = self._ensure_table(dim)
+            return self._lookup_rows(
+                table, collection_id, gen, list(dict.fromkeys(vector_ids))
+            )
 
     def physical_table_name(self, dimension: int) -> str:
         """Return the physical table name for a dimension (test/introspection)."""
@@ -18,15 +18,23 @@ Contract
 * **Tombstone / compaction policy**: tombstones soft-exclude IDs from results;
   the accelerated materialization may still hold them until ``compact()`` or
   ``rebuild()``. Tombstone parity and recall thresholds are explicit constants;
-  falling below either threshold forces exact-search fallback.
+  falling below the parity threshold, or below the recall threshold with
+  every IVF list already probed, forces exact-search fallback.
 * **Corruption-safe rebuild**: ``rebuild()`` clears the derived view and
   re-materializes live (non-tombstoned) rows from the exact authority mirror.
+* **Accelerated path**: an in-process IVF-flat index (k-means coarse quantizer
+  + inverted lists over a float32 matrix) built lazily per metric from the
+  materialized vectors. Hits are bound to generation/digest with one id-keyed
+  :meth:`ExactVectorStore.lookup`, and the exact recall check runs on a
+  sampled subset of queries (``recall_sample_interval``) instead of on every
+  query.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+import math
 import time
 import uuid
 from dataclasses import dataclass, field
@@ -34,11 +42,17 @@ from enum import Enum
 from typing import Any, Callable, ClassVar, Final, Mapping, Sequence
 
 from ipfs_datasets_py.vector_stores.duckdb_exact import (
+    HAVE_NUMPY,
     ExactHit,
     ExactVectorStore,
+    batched_scores,
+    candidate_rows,
     distance,
 )
 
+if HAVE_NUMPY:
+    import numpy as np
+
 try:
     # Prefer the control-plane pin (DQK-002) when available.
     from ipfs_datasets_py.duckdb_control.capabilities import (
@@ -48,6 +62,8 @@ except Exception:  # pragma: no cover - hermetic / partial installs
     _PINNED_VSS_EXTENSION_BUILD = "vss@1.5.5+core"
 
 __all__ = [
+    "DEFAULT_IVF_NPROBE",
+    "DEFAULT_RECALL_SAMPLE_INTERVAL",
     "DEFAULT_RECALL_THRESHOLD",
     "DEFAULT_TOMBSTONE_PARITY_THRESHOLD",
     "DUCKDB_VSS_SCHEMA",
@@ -72,8 +88,21 @@ DEFAULT_RECALL_THRESHOLD: Final[float] = 0.9
 # accelerated materialization (1.0 = no tombstone leakage into the live index).
 DEFAULT_TOMBSTONE_PARITY_THRESHOLD: Final[float] = 1.0
 
+# Exact recall verification runs on 1 in N accelerated queries (the first query
+# after every (re)build/compaction is always verified).
+DEFAULT_RECALL_SAMPLE_INTERVAL: Final[int] = 16
+# Minimum inverted lists probed per query by the IVF-flat accelerated path.
+DEFAULT_IVF_NPROBE: Final[int] = 16
+
 _AUTHORITY_EXACT: Final[str] = "exact"
 _SUPPORTED_METRICS: Final[frozenset[str]] = frozenset({"l2", "cosine"})
+# Below this many live vectors the IVF index keeps a single list (flat scan).
+_IVF_MIN_VECTORS_PER_LIST: Final[int] = 64
+_IVF_KMEANS_ITERATIONS: Final[int] = 10
+# The starting nprobe also covers at least 1 in N lists, so it grows with nlist.
+_IVF_PROBE_DIVISOR: Final[int] = 16
+_IVF_TRAINING_POINTS_PER_LIST: Final[int] = 256
+_IVF_ASSIGN_CHUNK_ROWS: Final[int] = 65536
 
 
 class VSSIndexError(ValueError):
@@ -202,6 +231,109 @@ class VSSSearchResult:
     health: IndexHealth
     recall_estimate: float | None = None
     tombstone_parity: float | None = None
+    # True when exact search ran for this query (fallback or recall sample).
+    recall_sampled: bool = False
+
+
+class _IVFFlatIndex:
+    """In-process IVF-flat ANN structure over a float32 matrix.
+
+    A k-means coarse quantizer (``nlist ~ sqrt(n)`` centroids) partitions the
+    rows into inverted lists; a query probes the ``nprobe`` nearest lists and
+    ranks their rows exactly. For ``cosine`` the rows are L2-normalized before
+    clustering (spherical k-means). Dropped rows stay in the lists and are
+    masked out at query time until the index is rebuilt.
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        vectors: Sequence[Sequence[float]],
+        *,
+        metric: str,
+        seed: int = 0,
+    ) -> None:
+        self.metric = metric
+        self.ids = list(ids)
+        self.matrix = np.asarray(vectors, dtype=np.float32).reshape(len(self.ids), -1)
+        self._row_of = {vid: row for row, vid in enumerate(self.ids)}
+        self.live = np.ones(len(self.ids), dtype=bool)
+        keys = self.matrix
+        if metric == "cosine":
+            norms = np.linalg.norm(keys, axis=1, keepdims=True)
+            keys = np.divide(keys, norms, out=np.zeros_like(keys), where=norms > 0)
+        nlist = max(1, int(math.sqrt(len(self.ids))))
+        nlist = min(nlist, max(1, len(self.ids) // _IVF_MIN_VECTORS_PER_LIST))
+        self.centroids, assignment = self._train(keys, nlist, seed)
+        order = np.argsort(assignment, kind="stable")
+        bounds = np.searchsorted(assignment[order], np.arange(len(self.centroids) + 1))
+        self.lists = [order[bounds[i] : bounds[i + 1]] for i in range(len(self.centroids))]
+
+    @property
+    def nlist(self) -> int:
+        return len(self.lists)
+
+    def _train(self, keys: Any, nlist: int, seed: int) -> tuple[Any, Any]:
+        n = keys.shape[0]
+        if nlist == 1:
+            return keys.mean(axis=0, keepdims=True), np.zeros(n, dtype=np.intp)
+        rng = np.random.default_rng(seed)
+        sample_size = min(n, nlist * _IVF_TRAINING_POINTS_PER_LIST)
+        sample = keys[rng.choice(n, size=sample_size, replace=False)]
+        centroids = sample[rng.choice(sample_size, size=nlist, replace=False)].copy()
+        for _ in range(_IVF_KMEANS_ITERATIONS):
+            labels = self._nearest_centroid(sample, centroids)
+            for c in range(nlist):
+                members = sample[labels == c]
+                if len(members):
+                    centroids[c] = members.mean(axis=0)
+        return centroids, self._nearest_centroid(keys, centroids)
+
+    @staticmethod
+    def _nearest_centroid(keys: Any, centroids: Any) -> Any:
+        c_sq = np.einsum("ij,ij->i", centroids, centroids)
+        labels = np.empty(keys.shape[0], dtype=np.intp)
+        for start in range(0, keys.shape[0], _IVF_ASSIGN_CHUNK_ROWS):
+            chunk = keys[start : start + _IVF_ASSIGN_CHUNK_ROWS]
+            # argmin ||x - c||^2 == argmin (||c||^2 - 2 x.c)
+            labels[start : start + len(chunk)] = np.argmin(
+                c_sq[None, :] - 2.0 * (chunk @ centroids.T), axis=1
+            )
+        return labels
+
+    def drop(self, vector_id: str) -> None:
+        row = self._row_of.get(vector_id)
+        if row is not None:
+            self.live[row] = False
+
+    def search(self, query: Sequence[float], *, k: int, nprobe: int) -> list[tuple[float, str]]:
+        """Return up to ``k`` ``(distance, vector_id)`` pairs, exact within probed lists."""
+
+        q = np.asarray(query, dtype=np.float32)
+        if self.nlist > 1:
+            probe_key = q
+            if self.metric == "cosine":
+                q_norm = float(np.linalg.norm(q))
+                probe_key = q / q_norm if q_norm > 0 else q
+            c_scores = np.einsum("ij,ij->i", self.centroids, self.centroids) - 2.0 * (
+                self.centroids @ probe_key
+            )
+            nprobe = min(max(1, nprobe), self.nlist)
+            probed = np.argpartition(c_scores, nprobe - 1)[:nprobe]
+            rows = np.concatenate([self.lists[c] for c in probed])
+        else:
+            rows = self.lists[0]
+        rows = rows[self.live[rows]]
+        if rows.size == 0:
+            return []
+        candidates = self.matrix[rows]
+        scores, slack = batched_scores(candidates, query, self.metric)
+        # Exact re-rank with the reference distance so ties and values agree
+        # with the exact authority's ordering.
+        return sorted(
+            (distance(query, candidates[i].tolist(), metric=self.metric), self.ids[rows[i]])
+            for i in candidate_rows(scores, k, slack)
+        )[:k]
 
 
 @dataclass
@@ -211,6 +343,13 @@ class VSSIndex:
     The exact store is the identity authority. This object holds a derived
     accelerated materialization (``_index_ids`` + ``_vectors`` mirror) that can
     be rebuilt or compacted without mutating identity semantics.
+
+    ``recall_sample_interval`` controls how often an accelerated query is
+    verified against exact search (1 in N, plus the first query after every
+    materialization change). ``nprobe`` is the minimum number of IVF lists
+    probed per query; the starting value scales with ``nlist``, and a sampled
+    query that misses ``recall_threshold`` doubles it (up to ``nlist``) and
+    retries against the exact hits it already has before falling back.
     """
 
     exact: ExactVectorStore
@@ -221,6 +360,8 @@ class VSSIndex:
     tombstone_parity_threshold: float = DEFAULT_TOMBSTONE_PARITY_THRESHOLD
     extension_probe: Callable[[], bool] | None = None
     extension_build: str = PINNED_VSS_EXTENSION_BUILD
+    recall_sample_interval: int = DEFAULT_RECALL_SAMPLE_INTERVAL
+    nprobe: int = DEFAULT_IVF_NPROBE
     # Soft-deleted IDs (excluded from results; may still sit in materialization).
     _tombstoned: set[str] = field(default_factory=set)
     # Derived HNSW materialization membership (may lag tombstones until compact).
@@ -233,6 +374,12 @@ class VSSIndex:
     _extension_failed: bool = False
     _stale: bool = False
     _build_count: int = 0
+    # Lazily built IVF-flat structures over the live materialization, per metric.
+    _ann: dict[str, _IVFFlatIndex] = field(default_factory=dict)
+    _queries_since_build: int = 0
+    _last_recall: float | None = None
+    # Lists probed per query, per metric; raised when a recall sample misses.
+    _probe: dict[str, int] = field(default_factory=dict)
 
     # ------------------------------------------------------------------
     # Extension capability
@@ -289,6 +436,7 @@ class VSSIndex:
         self._index_ids = list(live_ids)
         self._stale = False
         self._build_count += 1
+        self._invalidate_ann()
 
         return self._emit_build_receipt()
 
@@ -311,6 +459,7 @@ class VSSIndex:
         # Drop accelerated materialization before rebuild so a partial failure
         # cannot leave a half-corrupt index claiming HEALTHY.
         self._index_ids = []
+        self._invalidate_ann()
         if not live:
             self._build_count += 1
             return self._emit_build_receipt()
@@ -369,6 +518,8 @@ class VSSIndex:
         # health/search prefer exact fallback when parity drops below threshold.
         if vector_id in self._index_ids:
             self._stale = True
+        for ann in self._ann.values():
+            ann.drop(vector_id)
 
     def compact(self) -> VSSCompactionReceipt:
         """Purge tombstoned IDs from the accelerated materialization.
@@ -382,6 +533,7 @@ class VSSIndex:
         removed = [vid for vid in before if vid in self._tombstoned]
         self._index_ids = [vid for vid in before if vid not in self._tombstoned]
         self._stale = False
+        self._invalidate_ann()
         parity = self.tombstone_parity()
         payload = json.dumps(
             {
@@ -478,10 +630,11 @@ class VSSIndex:
     ) -> VSSSearchResult:
         """Search with automatic exact fallback when the derived index is unsafe.
 
-        Exact search is always computed as the authority baseline. Accelerated
-        results are only returned when health is HEALTHY, tombstone parity meets
-        ``tombstone_parity_threshold``, and estimated recall meets
-        ``recall_threshold``.
+        Exact search is the authority baseline: it answers every fallback and
+        verifies recall on sampled accelerated queries (see
+        ``recall_sample_interval``). Accelerated results are only returned when
+        health is HEALTHY, tombstone parity meets ``tombstone_parity_threshold``,
+        and the most recently sampled recall meets ``recall_threshold``.
         """
 
         if not isinstance(k, int) or isinstance(k, bool) or k < 1:
@@ -501,15 +654,6 @@ class VSSIndex:
         parity = self.tombstone_parity()
         health = self.health()
 
-        # Identity authority path — always available when exact store is healthy.
-        exact_hits = [
-            h
-            for h in self.exact.search(
-                self.collection_id, query, k=max(k * 2, k), metric=metric
-            )
-            if h.vector_id not in self._tombstoned
-        ][:k]
-
         must_fallback = health in {
             IndexHealth.MISSING_EXTENSION,
             IndexHealth.EXTENSION_FAILED,
@@ -520,17 +664,38 @@ class VSSIndex:
 
         if must_fallback:
             return VSSSearchResult(
-                hits=exact_hits,
+                hits=self._exact_hits(query, k=k, metric=metric),
                 used_fallback=True,
                 health=health if health is not IndexHealth.HEALTHY else IndexHealth.STALE,
                 recall_estimate=1.0,
                 tombstone_parity=parity,
+                recall_sampled=True,
             )
 
-        # Derived accelerated path (hermetic stand-in for HNSW): rank the
-        # materialization with the same distance function, post-filter tombstones.
         approx = self._accelerated_search(query, k=k, metric=metric)
+        interval = max(1, int(self.recall_sample_interval))
+        sampled = (
+            self._queries_since_build % interval == 0
+            or self._last_recall is None
+            or self._last_recall < self.recall_threshold
+        )
+        self._queries_since_build += 1
+        if not sampled:
+            return VSSSearchResult(
+                hits=approx,
+                used_fallback=False,
+                health=health,
+                recall_estimate=self._last_recall,
+                tombstone_parity=parity,
+                recall_sampled=False,
+            )
+
+        exact_hits = self._exact_hits(query, k=k, metric=metric)
         recall = self._estimate_recall(exact_hits, approx)
+        while recall < self.recall_threshold and self._raise_nprobe(metric):
+            approx = self._accelerated_search(query, k=k, metric=metric)
+            recall = self._estimate_recall(exact_hits, approx)
+        self._last_recall = recall
         if recall < self.recall_threshold:
             return VSSSearchResult(
                 hits=exact_hits,
@@ -538,6 +703,7 @@ class VSSIndex:
                 health=IndexHealth.STALE,
                 recall_estimate=recall,
                 tombstone_parity=parity,
+                recall_sampled=True,
             )
         return VSSSearchResult(
             hits=approx,
@@ -545,8 +711,63 @@ class VSSIndex:
             health=health,
             recall_estimate=recall,
             tombstone_parity=parity,
+            recall_sampled=True,
         )
 
+    def _exact_hits(
+        self,
+        query: Sequence[float],
+        *,
+        k: int,
+        metric: str,
+    ) -> list[ExactHit]:
+        """Identity-authority ranking with tombstones post-filtered."""
+
+        return [
+            h
+            for h in self.exact.search(
+                self.collection_id, query, k=max(k * 2, k), metric=metric
+            )
+            if h.vector_id not in self._tombstoned
+        ][:k]
+
+    def _invalidate_ann(self) -> None:
+        self._ann.clear()
+        self._probe.clear()
+        self._queries_since_build = 0
+        self._last_recall = None
+
+    def _ann_for(self, metric: str) -> _IVFFlatIndex | None:
+        ann = self._ann.get(metric)
+        if ann is None and self._index_ids:
+            ids = [vid for vid in self._index_ids if vid in self._vectors]
+            ann = _IVFFlatIndex(
+                ids, [self._vectors[vid] for vid in ids], metric=metric
+            )
+            for vid in self._tombstoned:
+                ann.drop(vid)
+            self._ann[metric] = ann
+        return ann
+
+    def _nprobe_for(self, metric: str, ann: _IVFFlatIndex) -> int:
+        probe = self._probe.get(metric)
+        if probe is None:
+            probe = max(1, int(self.nprobe), math.ceil(ann.nlist / _IVF_PROBE_DIVISOR))
+            probe = self._probe[metric] = min(probe, ann.nlist)
+        return probe
+
+    def _raise_nprobe(self, metric: str) -> bool:
+        """Double the lists probed for ``metric``; False once all are probed."""
+
+        ann = self._ann.get(metric)
+        if ann is None:
+            return False
+        current = self._nprobe_for(metric, ann)
+        if current >= ann.nlist:
+            return False
+        self._probe[metric] = min(ann.nlist, 2 * current)
+        return True
+
     def _accelerated_search(
         self,
         query: Sequence[float],
@@ -554,37 +775,37 @@ class VSSIndex:
         k: int,
         metric: str,
     ) -> list[ExactHit]:
-        """Rank the derived materialization (HNSW stand-in for hermetic tests)."""
+        """Rank the derived materialization through the IVF-flat index."""
 
         q = [float(x) for x in query]
-        scored: list[tuple[float, str]] = []
-        for vid in self._index_ids:
-            if vid in self._tombstoned:
-                continue
-            vec = self._vectors.get(vid)
-            if vec is None:
-                continue
-            scored.append((distance(q, vec, metric=metric), vid))
-        scored.sort(key=lambda item: (item[0], item[1]))
-        hits: list[ExactHit] = []
-        for dist, vid in scored[:k]:
-            # Bind generation/digest via a one-id exact lookup so identity fields
-            # stay consistent with the authority store.
-            authority = self.exact.search(
-                self.collection_id,
-                self._vectors[vid],
-                k=1,
-                metric=metric,
+        if HAVE_NUMPY:
+            ann = self._ann_for(metric)
+            ranked = (
+                ann.search(q, k=k, nprobe=self._nprobe_for(metric, ann))
+                if ann is not None
+                else []
             )
-            if authority and authority[0].vector_id == vid:
+        else:  # pragma: no cover - numpy is a base dependency
+            ranked = sorted(
+                (distance(q, self._vectors[vid], metric=metric), vid)
+                for vid in self._index_ids
+                if vid not in self._tombstoned and vid in self._vectors
+            )[:k]
+        # Bind generation/digest/metadata with one id-keyed authority lookup so
+        # identity fields stay consistent with the exact store.
+        authority = self.exact.lookup(self.collection_id, [vid for _, vid in ranked])
+        hits: list[ExactHit] = []
+        for dist, vid in ranked:
+            bound = authority.get(vid)
+            if bound is not None:
                 hits.append(
                     ExactHit(
                         vector_id=vid,
-                        collection_id=authority[0].collection_id,
-                        generation_id=authority[0].generation_id,
-                        content_digest=authority[0].content_digest,
+                        collection_id=bound.collection_id,
+                        generation_id=bound.generation_id,
+                        content_digest=bound.content_digest,
                         distance=dist,
-                        metadata=dict(authority[0].metadata),
+                        metadata=dict(bound.metadata),
                     )
                 )
             else:
@@ -16,7 +16,7 @@ import json
 import uuid
 import tempfile
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Set, Union
 import anyio
 
 # Pickle is not runtime metadata authority (DQK-064). CAR/IPLD remain
@@ -68,6 +68,63 @@ except ImportError:
     logger.info("ipld_car not available - CAR export/import will not be available")
 
 
+# Filters matching at most this fraction of a collection are answered by
+# scoring only the candidate rows; broader filters over-fetch from the full
+# index and retry with a larger k until top_k candidates survive.
+PREFILTER_MAX_SELECTIVITY = 0.1
+OVERFETCH_FACTOR = 1.5
+
+
+class _MetadataIndex:
+    """Inverted index over top-level metadata fields of one collection.
+
+    Maps ``field -> value -> row set``. Unhashable values (lists, dicts) are
+    kept per field in a side set and compared by equality at lookup time, so
+    candidates match :meth:`IPLDVectorStore._matches_filter` exactly.
+    """
+
+    def __init__(self):
+        self.values: Dict[str, Dict[Any, Set[int]]] = {}
+        self.unhashable: Dict[str, Set[int]] = {}
+
+    def add(self, row: int, metadata: Dict[str, Any]) -> None:
+        for key, value in (metadata or {}).items():
+            try:
+                self.values.setdefault(key, {}).setdefault(value, set()).add(row)
+            except TypeError:
+                self.unhashable.setdefault(key, set()).add(row)
+
+    def remove(self, row: int, metadata: Dict[str, Any]) -> None:
+        for key, value in (metadata or {}).items():
+            try:
+                rows = self.values.get(key, {}).get(value)
+            except TypeError:
+                self.unhashable.get(key, set()).discard(row)
+                continue
+            if rows is not None:
+                rows.discard(row)
+                if not rows:
+                    del self.values[key][value]
+
+    def candidates(
+        self, filter_dict: Dict[str, Any], metadata_list: List[Dict[str, Any]]
+    ) -> Set[int]:
+        """Return the rows whose metadata matches every filter entry."""
+        result: Optional[Set[int]] = None
+        for key, value in filter_dict.items():
+            try:
+                rows = set(self.values.get(key, {}).get(value, ()))
+            except TypeError:
+                rows = set()
+            for row in self.unhashable.get(key, ()):
+                if metadata_list[row]["metadata"].get(key) == value:
+                    rows.add(row)
+            result = rows if result is None else result & rows
+            if not result:
+                return set()
+        return result if result is not None else set()
+
+
 class IPLDVectorStore(BaseVectorStore):
     """IPLD/IPFS-native vector store with FAISS indexing.
     
@@ -153,8 +210,14 @@ class IPLDVectorStore(BaseVectorStore):
         # Indexes: collection_name -> faiss.Index
         self.indexes: Dict[str, Any] = {}
         
-        # Vectors: collection_name -> List[np.ndarray]
-        self.vectors: Dict[str, List[np.ndarray]] = {}
+        # Vectors: collection_name -> float32 matrix view, one row per vector.
+        # Rows live in a preallocated buffer that grows geometrically, so
+        # adds do not copy the whole collection and search never rebuilds it.
+        self.vectors: Dict[str, np.ndarray] = {}
+        self._buffers: Dict[str, np.ndarray] = {}
+        
+        # Metadata inverted index: collection_name -> _MetadataIndex
+        self._metadata_index: Dict[str, _MetadataIndex] = {}
         
         # Metadata: collection_name -> List[Dict]
         self.metadata: Dict[str, List[Dict[str, Any]]] = {}
@@ -196,6 +259,65 @@ class IPLDVectorStore(BaseVectorStore):
         
         return index
     
+    def _append_rows(self, name: str, vectors_np: np.ndarray) -> None:
+        """Append rows to the collection matrix, growing its buffer if needed."""
+        count = len(self.vectors[name])
+        needed = count + len(vectors_np)
+        buffer = self._buffers[name]
+        if needed > len(buffer):
+            grown = np.empty((max(needed, 2 * len(buffer), 16), buffer.shape[1]), dtype=np.float32)
+            grown[:count] = buffer[:count]
+            buffer = self._buffers[name] = grown
+        buffer[count:needed] = vectors_np
+        self.vectors[name] = buffer[:needed]
+    
+    def _remove_row(self, name: str, idx: int) -> None:
+        """Remove row ``idx`` by moving the last row into its slot.
+        
+        The per-row lists and the metadata index are updated the same way,
+        so a delete is O(1) apart from the FAISS rebuild. ``cids`` may be
+        shorter than the other lists (legacy or imported collections); rows
+        past its end simply have no CID.
+        """
+        last = len(self.vector_ids[name]) - 1
+        cids = self.cids[name]
+        index = self._metadata_index[name]
+        index.remove(idx, self.metadata[name][idx].get("metadata", {}))
+        if idx != last:
+            index.remove(last, self.metadata[name][last].get("metadata", {}))
+            index.add(idx, self.metadata[name][last].get("metadata", {}))
+            self._buffers[name][idx] = self._buffers[name][last]
+            for rows in (self.metadata[name], self.vector_ids[name]):
+                rows[idx] = rows[last]
+            if idx < len(cids):
+                cids[idx] = cids[last] if last < len(cids) else None
+        for rows in (self.metadata[name], self.vector_ids[name]):
+            del rows[last]
+        if last < len(cids):
+            del cids[last]
+        self.vectors[name] = self._buffers[name][:last]
+    
+    def _score_rows(self, name: str, query_np: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Score ``rows`` (all rows if None) against the query.
+        
+        Mirrors ``_create_faiss_index``: squared L2 distances for euclidean/l2
+        (the scale ``IndexFlatL2`` reports) and inner products otherwise.
+        """
+        matrix = self.vectors[name] if rows is None else self.vectors[name][rows]
+        if self.distance_metric in ("euclidean", "l2"):
+            diff = matrix - query_np
+            return np.einsum("ij,ij->i", diff, diff)
+        return matrix @ query_np
+    
+    def _top_k(self, scores: np.ndarray, rows: np.ndarray, top_k: int):
+        """Select the best ``top_k`` (row, score) pairs, ties broken by row."""
+        keys = scores if self.distance_metric in ("euclidean", "l2") else -scores
+        if len(keys) > top_k:
+            part = np.argpartition(keys, top_k - 1)[:top_k]
+            keys, scores, rows = keys[part], scores[part], rows[part]
+        order = np.lexsort((rows, keys))
+        return rows[order], scores[order]
+    
     async def create_collection(self, 
                                collection_name: Optional[str] = None,
                                dimension: Optional[int] = None, 
@@ -239,7 +361,9 @@ class IPLDVectorStore(BaseVectorStore):
             "root_cid": None
         }
         self.indexes[name] = self._create_faiss_index(dim, self.distance_metric)
-        self.vectors[name] = []
+        self._buffers[name] = np.empty((0, dim), dtype=np.float32)
+        self.vectors[name] = self._buffers[name]
+        self._metadata_index[name] = _MetadataIndex()
         self.metadata[name] = []
         self.cids[name] = []
         self.vector_ids[name] = []
@@ -309,6 +433,8 @@ class IPLDVectorStore(BaseVectorStore):
         del self.collections[name]
         del self.indexes[name]
         del self.vectors[name]
+        del self._buffers[name]
+        del self._metadata_index[name]
         del self.metadata[name]
         del self.cids[name]
         del self.vector_ids[name]
@@ -396,15 +522,23 @@ class IPLDVectorStore(BaseVectorStore):
         
         # Convert to numpy array
         vectors_np = np.array(vectors, dtype=np.float32)
+        if vectors_np.ndim != 2 or vectors_np.shape[1] != self.vectors[name].shape[1]:
+            raise VectorStoreError(
+                f"Embedding dimension does not match collection '{name}' "
+                f"(expected {self.vectors[name].shape[1]})"
+            )
         
         # Add to FAISS index
         if self.indexes[name] is not None and HAVE_FAISS:
             self.indexes[name].add(vectors_np)
         
         # Store vectors and metadata
-        self.vectors[name].extend(vectors)
+        first_row = len(self.vector_ids[name])
+        self._append_rows(name, vectors_np)
         self.metadata[name].extend(metadata_list)
         self.vector_ids[name].extend(ids)
+        for offset, meta in enumerate(metadata_list):
+            self._metadata_index[name].add(first_row + offset, meta.get("metadata", {}))
         
         # Store to IPLD if router available
         cids_added = []
@@ -451,6 +585,11 @@ class IPLDVectorStore(BaseVectorStore):
                     filter_dict: Optional[Dict[str, Any]] = None) -> List[SearchResult]:
         """Search for similar vectors.
         
+        Filters are resolved first against the metadata index. Selective
+        filters score only the matching rows; broad ones over-fetch from the
+        full index and retry, so up to ``top_k`` matches are always returned
+        when that many exist.
+        
         Args:
             query_vector: Query vector
             top_k: Number of results to return
@@ -465,11 +604,12 @@ class IPLDVectorStore(BaseVectorStore):
         if name not in self.collections:
             raise VectorStoreError(f"Collection '{name}' does not exist")
         
-        if not self.vectors[name]:
+        count = len(self.vector_ids[name])
+        if count == 0 or top_k <= 0:
             return []
         
         # Convert query to numpy
-        query_np = np.array(query_vector, dtype=np.float32).reshape(1, -1)
+        query_np = np.array(query_vector, dtype=np.float32).reshape(-1)
         
         # Normalize if cosine
         if self.distance_metric == "cosine":
@@ -477,40 +617,54 @@ class IPLDVectorStore(BaseVectorStore):
             if norm > 0:
                 query_np = query_np / norm
         
-        # Search using FAISS if available
-        if self.indexes[name] is not None and HAVE_FAISS:
-            distances, indices = self.indexes[name].search(query_np, min(top_k, len(self.vectors[name])))
-            distances = distances[0]
-            indices = indices[0]
+        candidates = None
+        if filter_dict:
+            candidates = self._metadata_index[name].candidates(filter_dict, self.metadata[name])
+            if not candidates:
+                return []
+        use_faiss = self.indexes[name] is not None and HAVE_FAISS
+        
+        if candidates is not None and (
+            len(candidates) <= top_k
+            or len(candidates) <= PREFILTER_MAX_SELECTIVITY * count
+            or not use_faiss
+        ):
+            # Pre-filter: score only the candidate rows
+            rows = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+            indices, distances = self._top_k(self._score_rows(name, query_np, rows), rows, top_k)
+        elif use_faiss:
+            # Over-fetch from the full index, growing k until enough
+            # candidates survive the filter
+            fetch = top_k
+            if candidates is not None:
+                fetch = int(np.ceil(top_k * count / len(candidates) * OVERFETCH_FACTOR))
+            while True:
+                fetch = min(fetch, count)
+                distances, indices = self.indexes[name].search(query_np.reshape(1, -1), fetch)
+                distances, indices = distances[0], indices[0]
+                if candidates is not None:
+                    keep = np.fromiter(
+                        (idx in candidates for idx in indices), dtype=bool, count=len(indices)
+                    )
+                    distances, indices = distances[keep], indices[keep]
+                if len(indices) >= top_k or fetch >= count:
+                    break
+                fetch *= 2
         else:
-            # Fallback to numpy similarity
-            vectors_np = np.array(self.vectors[name], dtype=np.float32)
-            if self.distance_metric == "cosine":
-                similarities = np.dot(vectors_np, query_np.T).flatten()
-                indices = np.argsort(-similarities)[:top_k]
-                distances = similarities[indices]
-            else:
-                # L2 distance
-                diff = vectors_np - query_np
-                distances_all = np.linalg.norm(diff, axis=1)
-                indices = np.argsort(distances_all)[:top_k]
-                distances = distances_all[indices]
+            indices, distances = self._top_k(
+                self._score_rows(name, query_np), np.arange(count), top_k
+            )
         
         # Create results
         results = []
         for i, (idx, score) in enumerate(zip(indices, distances)):
-            if idx < 0 or idx >= len(self.vectors[name]):
+            if idx < 0 or idx >= count:
                 continue
             
             meta = self.metadata[name][idx]
             vid = self.vector_ids[name][idx]
             cid = self.cids[name][idx] if idx < len(self.cids[name]) else None
             
-            # Apply filters if provided
-            if filter_dict:
-                if not self._matches_filter(meta.get("metadata", {}), filter_dict):
-                    continue
-            
             result = SearchResult(
                 chunk_id=vid,
                 score=float(score),
@@ -609,21 +763,17 @@ class IPLDVectorStore(BaseVectorStore):
         except ValueError:
             return False
         
-        # Remove from all lists
-        del self.vectors[name][idx]
-        del self.metadata[name][idx]
-        del self.vector_ids[name][idx]
-        if idx < len(self.cids[name]):
-            del self.cids[name][idx]
+        # Remove the row from the matrix, lists and metadata index
+        self._remove_row(name, idx)
         
         # Rebuild FAISS index
-        if self.indexes[name] is not None and HAVE_FAISS and self.vectors[name]:
-            vectors_np = np.array(self.vectors[name], dtype=np.float32)
+        if self.indexes[name] is not None and HAVE_FAISS:
             self.indexes[name] = self._create_faiss_index(
-                vectors_np.shape[1],
+                self.vectors[name].shape[1],
                 self.distance_metric
             )
-            self.indexes[name].add(vectors_np)
+            if len(self.vectors[name]):
+                self.indexes[name].add(self.vectors[name])
         
         # Update count
         self.collections[name]["metadata"].count -= 1
@@ -339,6 +339,38 @@ def test_wal_cids_remain_unchanged(tmp_path: Path) -> None:
         assert payload["phase"] == "INTENT"
 
 
+def test_sealed_segment_head_survives_restart(tmp_path: Path) -> None:
+    path = tmp_path / "walsegment.duckdb"
+    storage = _storage()
+
+    with _open_state(path) as state:
+        wal = WriteAheadLog(storage, segment_size=4)
+        state.bind_wal(wal)
+        for i in range(3):
+            cid = wal.append_phase(
+                txn_id=f"txn-seg-{i}", phase=WALPhase.COMPLETE, operations=[_op(f"old-{i}")]
+            )
+            state.note_wal_append(wal, cid)
+        checkpoint = wal.compact(wal.wal_head_cid)
+        state.note_wal_append(wal, checkpoint)
+        for i in range(2):
+            cid = wal.append_phase(
+                txn_id=f"txn-post-{i}", phase=WALPhase.COMPLETE, operations=[_op(f"new-{i}")]
+            )
+            state.note_wal_append(wal, cid)
+
+        # The fourth append sealed a segment: the saved head is that block
+        assert wal.get_stats()["segments_written"] == 1
+        assert state.get_wal_head_cid() == wal.wal_head_cid
+
+    with _open_state(path, owner_id="owner-restart", process_birth="birth-r") as state2:
+        wal2 = WriteAheadLog(storage, segment_size=4)
+        state2.bind_wal(wal2)
+        ops = wal2.recover()
+        assert [op.node_id for op in ops] == ["new-0", "new-1"]
+        assert len(list(wal2.read())) == 6
+
+
 # ---------------------------------------------------------------------------
 # Crash recovery neither loses nor duplicates committed revisions
 # ---------------------------------------------------------------------------
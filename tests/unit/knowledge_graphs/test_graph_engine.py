@@ -227,6 +227,193 @@ class TestGraphEngineBasics:
         assert relationships[0].end_node == "doc-1"
 
 
+class TestGraphEngineNodeIndexes:
+    """Test the label and opt-in property indexes behind find_nodes."""
+
+    def _people(self):
+        engine = GraphEngine()
+        alice = engine.create_node(labels=["Person"], properties={"name": "Alice", "city": "Oslo"})
+        bob = engine.create_node(labels=["Person"], properties={"name": "Bob", "city": "Rome"})
+        acme = engine.create_node(labels=["Company"], properties={"name": "Acme", "city": "Oslo"})
+        return engine, alice, bob, acme
+
+    def test_label_index_is_always_maintained(self):
+        """Test label lookups hit the index and keep creation order."""
+        engine, alice, bob, acme = self._people()
+
+        assert engine._label_index["Person"] == {alice.id, bob.id}
+        assert [n.id for n in engine.find_nodes(labels=["Company", "Person"])] == [
+            alice.id,
+            bob.id,
+            acme.id,
+        ]
+        assert engine.delete_node(bob.id)
+        assert [n.id for n in engine.find_nodes(labels=["Person"])] == [alice.id]
+
+    def test_property_index_intersects_with_labels(self):
+        """Test an opted-in property index narrows label matches."""
+        engine, alice, _, acme = self._people()
+        assert engine.create_property_index("city") is True
+        assert engine.create_property_index("city") is False
+        assert engine.list_property_indexes() == ["city"]
+
+        found = engine.find_nodes(labels=["Person"], properties={"city": "Oslo"})
+        assert [n.id for n in found] == [alice.id]
+        # Un-indexed properties are still checked on the candidates.
+        found = engine.find_nodes(properties={"city": "Oslo", "name": "Acme"})
+        assert [n.id for n in found] == [acme.id]
+
+    def test_property_index_follows_updates(self):
+        """Test update_node moves the node between property postings."""
+        engine, alice, bob, _ = self._people()
+        engine.create_property_index("city")
+
+        engine.update_node(bob.id, {"city": "Oslo"})
+        engine.update_node(alice.id, {"city": "Paris"})
+        assert [n.id for n in engine.find_nodes(properties={"city": "Oslo", "name": "Bob"})] == [
+            bob.id
+        ]
+        assert [n.id for n in engine.find_nodes(properties={"city": "Paris"})] == [alice.id]
+        assert "Rome" not in engine._property_indexes["city"]
+
+    def test_none_and_unhashable_values_fall_back_to_scan(self):
+        """Test values the index cannot answer still match correctly."""
+        engine, alice, bob, acme = self._people()
+        engine.create_property_index("tags")
+        engine.update_node(alice.id, {"tags": ["a", "b"]})
+
+        assert [n.id for n in engine.find_nodes(properties={"tags": ["a", "b"]})] == [alice.id]
+        assert [n.id for n in engine.find_nodes(properties={"tags": None})] == [bob.id, acme.id]
+
+    def test_merge_set_keeps_property_index_current(self):
+        """Test MERGE ON CREATE SET / ON MATCH SET re-index the node."""
+        engine = GraphEngine()
+        engine.create_property_index("k")
+        executor = QueryExecutor(graph_engine=engine)
+
+        executor.execute("MERGE (n:L {name: 'a'}) ON CREATE SET n.k = 1")
+        assert [n.get("name") for n in engine.find_nodes(properties={"k": 1})] == ["a"]
+
+        executor.execute("MERGE (n:L {name: 'a'}) ON MATCH SET n.k = 2")
+        assert engine.find_nodes(properties={"k": 1}) == []
+        assert [n.get("name") for n in engine.find_nodes(properties={"k": 2})] == ["a"]
+
+    def test_remove_keeps_indexes_current(self):
+        """Test REMOVE of a property or label drops the node's postings."""
+        engine, alice, _, acme = self._people()
+        engine.create_property_index("city")
+        executor = QueryExecutor(graph_engine=engine)
+
+        executor.execute("MATCH (n:Person) WHERE n.name = 'Alice' REMOVE n.city")
+        executor.execute("MATCH (n:Person) WHERE n.name = 'Bob' REMOVE n:Person")
+
+        assert [n.id for n in engine.find_nodes(properties={"city": "Oslo"})] == [acme.id]
+        assert [n.id for n in engine.find_nodes(labels=["Person"])] == [alice.id]
+        assert engine.remove_node_label("missing", "Person") is None
+
+
+class TestGraphEngineAdjacency:
+    """Test the per-node adjacency lists behind get_relationships."""
+
+    def _triangle(self):
+        engine = GraphEngine()
+        a, b, c = (engine.create_node(labels=["N"]) for _ in range(3))
+        ab = engine.create_relationship("KNOWS", a.id, b.id)
+        bc = engine.create_relationship("LIKES", b.id, c.id)
+        ca = engine.create_relationship("KNOWS", c.id, a.id)
+        loop = engine.create_relationship("KNOWS", a.id, a.id)
+        return engine, (a, b, c), (ab, bc, ca, loop)
+
+    def test_directions_and_types(self):
+        """Test out/in/both lookups filtered by relationship type."""
+        engine, (a, b, c), (ab, bc, ca, loop) = self._triangle()
+
+        assert [r.id for r in engine.get_relationships(a.id, "out")] == [ab.id, loop.id]
+        assert [r.id for r in engine.get_relationships(a.id, "in")] == [ca.id, loop.id]
+        # Self-loops are reported once and creation order is kept across types.
+        assert [r.id for r in engine.get_relationships(a.id, "both")] == [ab.id, ca.id, loop.id]
+        assert [r.id for r in engine.get_relationships(b.id, "both", "LIKES")] == [bc.id]
+        assert engine.get_relationships(b.id, "out", "KNOWS") == []
+        assert engine.get_relationships(a.id, "sideways") == []
+
+    def test_delete_relationship_updates_adjacency(self):
+        """Test deletes remove adjacency entries and prune empty buckets."""
+        engine, (a, b, _), (ab, _, ca, loop) = self._triangle()
+
+        assert engine.delete_relationship(ab.id)
+        assert engine.delete_relationship(loop.id)
+        assert engine.get_relationships(a.id, "out") == []
+        assert engine.get_relationships(b.id, "in") == []
+        assert [r.id for r in engine.get_relationships(a.id, "in")] == [ca.id]
+        assert a.id not in engine._out_adjacency
+
+    def test_partition_loader_indexes_relationships(self):
+        """Test federated partitions are traversable through the adjacency lists."""
+        from ipfs_datasets_py.knowledge_graphs.extraction.entities import Entity
+        from ipfs_datasets_py.knowledge_graphs.extraction.graph import KnowledgeGraph
+        from ipfs_datasets_py.knowledge_graphs.extraction.relationships import (
+            Relationship as KGRelationship,
+        )
+        from ipfs_datasets_py.knowledge_graphs.query.distributed import (
+            FederatedQueryExecutor,
+            GraphPartitioner,
+        )
+
+        kg = KnowledgeGraph()
+        alice = Entity(entity_id="a", name="Alice", entity_type="Person")
+        bob = Entity(entity_id="b", name="Bob", entity_type="Person")
+        kg.add_entity(alice)
+        kg.add_entity(bob)
+        kg.add_relationship(
+            KGRelationship(
+                relationship_id="r1",
+                relationship_type="KNOWS",
+                source_entity=alice,
+                target_entity=bob,
+            )
+        )
+        executor = FederatedQueryExecutor(GraphPartitioner(num_partitions=1).partition(kg))
+
+        result = executor.execute_cypher("MATCH (x:Person)-[:KNOWS]->(y) RETURN y.name AS name")
+
+        assert result.records == [{"name": "Bob"}]
+
+    def test_load_graph_rebuilds_adjacency(self):
+        """Test load_graph replaces the adjacency lists with the loaded graph."""
+
+        class _GraphStore:
+            def store(self, data, pin=True, codec="dag-json"):
+                return f"cid-{data['id']}"
+
+            def retrieve_graph(self, root_cid):
+                return {
+                    "nodes": [{"id": "x"}, {"id": "y"}],
+                    "relationships": [
+                        {"id": "r-xy", "type": "T", "start_node": "x", "end_node": "y"}
+                    ],
+                }
+
+        engine = GraphEngine(storage_backend=_GraphStore())
+        a = engine.create_node(labels=["N"])
+        engine.create_relationship("T", a.id, a.id)
+
+        assert engine.load_graph("root")
+        assert engine.get_relationships(a.id, "both") == []
+        assert [r.id for r in engine.get_relationships("y", "in", "T")] == ["r-xy"]
+
+    def test_find_paths_uses_adjacency(self):
+        """Test find_paths over a chain with a cycle."""
+        engine = GraphEngine()
+        nodes = [engine.create_node(labels=["N"]) for _ in range(5)]
+        for left, right in zip(nodes, nodes[1:]):
+            engine.create_relationship("NEXT", left.id, right.id)
+        engine.create_relationship("NEXT", nodes[2].id, nodes[0].id)
+
+        paths = engine.find_paths(nodes[0].id, nodes[4].id, max_depth=5)
+        assert [len(p) for p in paths] == [4]
+        assert engine.find_paths(nodes[0].id, nodes[4].id, max_depth=3) == []
+
+
 class TestGraphEnginePersistence:
     """Test GraphEngine with IPLD storage backend."""
 
@@ -4,7 +4,10 @@ Tests for Knowledge Graph Indexing and Constraints (Phase 5)
 
 import pytest
 from ipfs_datasets_py.knowledge_graphs.indexing import (
+    BTreeIndex,
+    IndexDefinition,
     IndexManager,
+    IndexType,
     PropertyIndex,
     LabelIndex,
     CompositeIndex,
@@ -56,6 +59,86 @@ class TestPropertyIndex:
         assert "entity_2" in results
 
 
+class TestBPlusTree:
+    """Test B+tree structure: leaf links, wide ranges, bulk loading."""
+
+    def _tree(self, max_keys):
+        definition = IndexDefinition(name="idx_n", index_type=IndexType.RANGE, properties=["n"])
+        return BTreeIndex(definition, max_keys=max_keys)
+
+    def _leaf_keys(self, index):
+        return [key for leaf in index.root.iter_leaves() for key in leaf.keys]
+
+    def test_range_spans_many_leaves(self):
+        """Test a wide range over a deep tree returns every key in order."""
+        # GIVEN a small-fanout tree with many leaves and duplicate keys
+        index = self._tree(max_keys=3)
+        for i in range(200):
+            index.insert(i % 100, f"e{i}")
+
+        # WHEN querying a range that crosses many leaves
+        results = index.range_search(10, 89)
+
+        # THEN every matching entity comes back, in key order
+        assert len(results) == 160
+        assert results[:2] == ["e10", "e110"]
+        assert results[-1] == "e189"
+        assert self._leaf_keys(index) == list(range(100))
+
+    def test_duplicates_after_split_stay_together(self):
+        """Test duplicate keys equal to a separator remain findable."""
+        # GIVEN a tree that has split around key 2
+        index = self._tree(max_keys=2)
+        for key in [1, 2, 3, 4, 5]:
+            index.insert(key, f"a{key}")
+
+        # WHEN re-inserting every key
+        for key in [1, 2, 3, 4, 5]:
+            index.insert(key, f"b{key}")
+
+        # THEN point lookups see both entries
+        for key in [1, 2, 3, 4, 5]:
+            assert sorted(index.search(key)) == [f"a{key}", f"b{key}"]
+
+    def test_bulk_load_matches_inserts(self):
+        """Test bulk loading answers queries like one-at-a-time inserts."""
+        # GIVEN the same unsorted data loaded two ways
+        data = [((i * 37) % 500, f"e{i}") for i in range(1500)]
+        inserted = self._tree(max_keys=8)
+        for key, entity_id in data:
+            inserted.insert(key, entity_id)
+        loaded = self._tree(max_keys=8)
+
+        # WHEN bulk loading
+        count = loaded.bulk_load(data)
+
+        # THEN contents, stats and lookups agree
+        assert count == 1500
+        assert not loaded.root.is_leaf
+        assert self._leaf_keys(loaded) == list(range(500))
+        assert loaded.get_stats().entry_count == 1500
+        assert loaded.get_stats().unique_keys == 500
+        for key in (0, 17, 250, 499):
+            assert sorted(loaded.search(key)) == sorted(inserted.search(key))
+        assert sorted(loaded.range_search(100, 300)) == sorted(inserted.range_search(100, 300))
+
+        # AND the bulk-loaded tree keeps accepting inserts
+        for i in range(200):
+            loaded.insert(1000 + i, f"x{i}")
+        assert loaded.range_search(1000, 1199) == [f"x{i}" for i in range(200)]
+
+    def test_bulk_load_merges_existing_entries(self):
+        """Test bulk loading into a non-empty index keeps prior entries."""
+        index = PropertyIndex("age")
+        index.insert(30, "e1")
+
+        index.bulk_load([(30, "e2"), (25, "e3")], presorted=False)
+
+        assert sorted(index.search(30)) == ["e1", "e2"]
+        assert index.search(25) == ["e3"]
+        assert index.get_stats().entry_count == 3
+
+
 class TestCompositeIndex:
     """Test composite indexing."""
 
@@ -131,6 +214,59 @@ class TestFullTextIndex:
         assert len(results) > 0
         assert all(isinstance(r[1], float) for r in results)
 
+    def test_bm25_prefers_shorter_and_more_frequent(self):
+        """Test BM25 rewards term frequency and penalizes long documents."""
+        index = FullTextIndex("text")
+        index.insert("graph graph database", "dense")
+        index.insert("graph database", "short")
+        index.insert("graph database with many other unrelated words here", "long")
+
+        ranked = [r[0] for r in index.search("graph")]
+
+        assert ranked == ["dense", "short", "long"]
+
+    def test_pruned_search_matches_exhaustive_scoring(self):
+        """Test top-k with early termination equals scoring every document."""
+        import random
+
+        # GIVEN a corpus with skewed term frequencies
+        rng = random.Random(7)
+        vocab = [f"term{i}" for i in range(40)]
+        index = FullTextIndex("text")
+        for d in range(400):
+            words = [vocab[min(int(rng.expovariate(0.15)), 39)] for _ in range(rng.randint(3, 30))]
+            index.insert(" ".join(words), f"doc{d}")
+
+        for query in ("term0 term1", "term0 term5 term30", "term2 term2 term39", "term12"):
+            # WHEN searching with a small limit
+            results = index.search(query, limit=5)
+
+            # THEN the results match a brute-force BM25 ranking
+            tokens = index._tokenize(query)
+            scored = [(doc, index._calculate_score(doc, tokens)) for doc in index.doc_lengths]
+            expected = sorted((x for x in scored if x[1] > 0), key=lambda x: (-x[1], x[0]))[:5]
+            assert [r[0] for r in results] == [e[0] for e in expected]
+            assert [r[1] for r in results] == pytest.approx([e[1] for e in expected])
+
+    def test_remove_and_reindex(self):
+        """Test deleting and updating indexed entities."""
+        # GIVEN an index with two documents
+        index = FullTextIndex("text")
+        index.insert("alpha beta", "doc_1")
+        index.insert("beta gamma", "doc_2")
+
+        # WHEN removing one and re-indexing the other with new text
+        assert index.remove("doc_1") is True
+        assert index.remove("doc_1") is False
+        index.insert("delta", "doc_2")
+
+        # THEN stale terms are gone and statistics are updated
+        assert index.search("alpha") == []
+        assert index.search("beta") == []
+        assert [r[0] for r in index.search("delta")] == ["doc_2"]
+        assert index.total_docs == 1
+        assert index.doc_frequencies == {"delta": 1}
+
 
 class TestSpatialIndex:
     """Test spatial indexing."""
@@ -174,6 +310,92 @@ class TestVectorIndex:
         assert "vec_1" in entity_ids
         assert "vec_2" in entity_ids
 
+    def test_search_matches_brute_force(self):
+        """Test matrix search ranks like exact cosine similarity."""
+        np = pytest.importorskip("numpy")
+        # GIVEN enough vectors to force the matrix to grow
+        rng = np.random.default_rng(0)
+        data = rng.standard_normal((300, 8))
+        index = VectorIndex("embedding", dimension=8)
+        for i, row in enumerate(data):
+            index.insert(row.tolist(), f"e{i}")
+
+        # WHEN searching
+        query = rng.standard_normal(8)
+        results = index.search(query.tolist(), k=5)
+
+        # THEN the top-5 and scores match a brute-force ranking
+        sims = data @ query / (np.linalg.norm(data, axis=1) * np.linalg.norm(query))
+        expected = [f"e{i}" for i in np.argsort(-sims)[:5]]
+        assert [r[0] for r in results] == expected
+        assert results[0][1] == pytest.approx(sims.max(), abs=1e-5)
+
+    def test_search_batch_matches_single_queries(self):
+        """Test batched k-NN returns the same hits as per-query search."""
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(1)
+        index = VectorIndex("embedding", dimension=4)
+        for i, row in enumerate(rng.standard_normal((50, 4))):
+            index.insert(row.tolist(), f"e{i}")
+        queries = rng.standard_normal((6, 4)).tolist()
+
+        batch = index.search_batch(queries, k=3)
+
+        assert len(batch) == 6
+        for query, hits in zip(queries, batch):
+            assert [h[0] for h in hits] == [h[0] for h in index.search(query, k=3)]
+
+    def test_remove_and_reinsert(self):
+        """Test deleted vectors disappear and their rows are reused."""
+        pytest.importorskip("numpy")
+        # GIVEN an index with three vectors
+        index = VectorIndex("embedding", dimension=3)
+        index.insert([1.0, 0.0, 0.0], "a")
+        index.insert([0.0, 1.0, 0.0], "b")
+        index.insert([0.0, 0.0, 1.0], "c")
+
+        # WHEN removing one and inserting another
+        assert index.remove("a") is True
+        assert index.remove("a") is False
+        index.insert([2.0, 0.0, 0.0], "d")
+
+        # THEN searches only see live vectors and the original scale is kept
+        hits = index.search([1.0, 0.0, 0.0], k=10)
+        assert [h[0] for h in hits][0] == "d"
+        assert "a" not in [h[0] for h in hits]
+        assert len(hits) == 3
+        assert index.get_vector("d") == [2.0, 0.0, 0.0]
+        assert index.get_stats().entry_count == 3
+
+    def test_memory_mapped_storage(self, tmp_path):
+        """Test a memory-mapped index grows on disk and answers searches."""
+        np = pytest.importorskip("numpy")
+        path = tmp_path / "vectors.f32"
+        index = VectorIndex("embedding", dimension=4, storage_path=str(path))
+        rows = np.eye(4).tolist() * 40
+        for i, row in enumerate(rows):
+            index.insert(row, f"e{i}")
+
+        hits = index.search([0.0, 0.0, 1.0, 0.0], k=2)
+
+        assert [h[0] for h in hits] == ["e2", "e6"]
+        assert path.stat().st_size >= len(rows) * 4 * 4
+
+
+    def test_memory_mapped_storage_overwrites_existing_file(self, tmp_path):
+        """Test an existing storage file is treated as scratch, not loaded."""
+        pytest.importorskip("numpy")
+        path = tmp_path / "vectors.f32"
+        path.write_bytes(b"\x01" * 8192)
+
+        index = VectorIndex("embedding", dimension=4, storage_path=str(path))
+        assert len(index) == 0
+        index.insert([1.0, 0.0, 0.0, 0.0], "a")
+
+        assert path.stat().st_size == 64 * 4 * 4
+        assert b"\x01" not in path.read_bytes()
+        assert index.search([1.0, 0.0, 0.0, 0.0], k=1)[0][0] == "a"
+
 
 class TestIndexManager:
     """Test index management."""
@@ -234,6 +456,30 @@ class TestIndexManager:
         results = idx.search("Alice")
         assert "entity_1" in results
 
+    def test_create_index_over_existing_entities(self):
+        """Test building indexes from existing entities via bulk load."""
+        # GIVEN existing entities
+        entities = [
+            {"id": f"p{i}", "type": "Person", "properties": {"age": i % 50, "name": f"n{i}"}}
+            for i in range(300)
+        ] + [{"id": "c1", "type": "Company", "properties": {"age": 10}}]
+        manager = IndexManager()
+
+        # WHEN creating indexes with the entities
+        range_name = manager.create_range_index("age", label="Person", entities=entities)
+        comp_name = manager.create_composite_index(["name", "age"], entities=entities)
+        ft_name = manager.create_fulltext_index("name")
+        added = manager.build_index(ft_name, entities)
+        manager.build_index("idx_labels", entities)
+
+        # THEN they answer like incrementally built ones
+        assert sorted(manager.get_index(range_name).search(10)) == sorted(
+            f"p{i}" for i in range(10, 300, 50)
+        )
+        assert manager.get_index(comp_name).search_composite(["n7", 7]) == ["p7"]
+        assert added == 300
+        assert manager.get_index("idx_labels").search("Company") == ["c1"]
+
 
 class TestUniqueConstraint:
     """Test unique constraints."""
@@ -352,6 +352,139 @@ class TestUnifiedQueryEngine:
         assert stats["llm_processor_enabled"] is False
 
 
+class TestCypherPlanCache:
+    """Tests for the compiled Cypher plan cache."""
+
+    def _engine(self, backend=None, **kwargs):
+        engine = UnifiedQueryEngine(backend if backend is not None else Mock(), **kwargs)
+        engine._cypher_parser = Mock()
+        engine._cypher_parser.parse.side_effect = lambda query: ("ast", query)
+        engine._cypher_compiler = Mock()
+        engine._cypher_compiler.compile.side_effect = lambda ast: [
+            {"op": "ScanLabel", "label": "Person", "variable": "n"},
+            {"op": "Filter", "expression": {"op": "=", "left": "n.name", "right": {"param": "name"}}},
+        ]
+        engine._ir_executor = Mock()
+        engine._ir_executor.execute.return_value = Mock(items=[], stats={})
+        return engine
+
+    def test_repeated_query_reuses_plan(self):
+        """GIVEN the same query text modulo whitespace WHEN executed twice THEN compile runs once."""
+        engine = self._engine()
+
+        engine.execute_cypher("MATCH (n:Person) RETURN n")
+        engine.execute_cypher("MATCH   (n:Person)\n RETURN n")
+
+        assert engine._cypher_compiler.compile.call_count == 1
+        stats = engine.get_stats()
+        assert stats["plan_cache_hits"] == 1
+        assert stats["plan_cache_misses"] == 1
+        assert stats["plan_cache_size"] == 1
+
+    def test_whitespace_inside_literals_is_significant(self):
+        """GIVEN queries differing only inside a string literal THEN they get separate plans."""
+        engine = self._engine()
+
+        engine.execute_cypher("MATCH (n) WHERE n.name = 'a b' RETURN n")
+        engine.execute_cypher("MATCH (n) WHERE n.name = 'a  b' RETURN n")
+
+        assert engine._cypher_compiler.compile.call_count == 2
+
+    def test_params_bound_at_execution_without_mutating_plan(self):
+        """GIVEN a cached plan WHEN run with different params THEN each run sees its own values."""
+        engine = self._engine()
+        query = "MATCH (n:Person) WHERE n.name = $name RETURN n"
+
+        engine.execute_cypher(query, params={"name": "Alice"})
+        engine.execute_cypher(query, params={"name": "Bob"})
+
+        first, second = (call.args[0] for call in engine._ir_executor.execute.call_args_list)
+        assert first[1]["expression"]["right"] == "Alice"
+        assert second[1]["expression"]["right"] == "Bob"
+        cached = next(iter(engine._plan_cache.values()))
+        assert cached[1]["expression"]["right"] == {"param": "name"}
+
+    def test_executor_mutation_does_not_reach_cached_plan(self):
+        """GIVEN an executor that mutates its IR WHEN a query without params repeats THEN the plan is intact."""
+        engine = self._engine()
+        engine._ir_executor.execute.side_effect = lambda ir, budgets=None: (
+            ir.append({"op": "Limit", "count": 1}) or Mock(items=[], stats={})
+        )
+
+        engine.execute_cypher("MATCH (n:Person) RETURN n")
+        engine.execute_cypher("MATCH (n:Person) RETURN n")
+
+        cached = next(iter(engine._plan_cache.values()))
+        assert len(cached) == 2
+        second = engine._ir_executor.execute.call_args_list[1].args[0]
+        assert [step["op"] for step in second] == ["ScanLabel", "Filter", "Limit"]
+
+    def test_comments_do_not_swallow_following_lines(self):
+        """GIVEN a line comment WHEN the next line differs THEN the queries get separate plans."""
+        engine = self._engine()
+
+        queries = [
+            "MATCH (n) // all nodes\nRETURN n",
+            "MATCH (n) // all nodes RETURN n",
+            "MATCH (n) /* all\n nodes */ RETURN n",
+        ]
+        for query in queries:
+            engine.execute_cypher(query)
+
+        # The third query only differs from the first in its comment.
+        parsed = [call.args[0] for call in engine._cypher_parser.parse.call_args_list]
+        assert parsed == queries[:2]
+
+    def test_lru_eviction(self):
+        """GIVEN a full cache WHEN a new query is compiled THEN the least recently used plan goes."""
+        engine = self._engine(plan_cache_size=2)
+
+        engine.execute_cypher("MATCH (a) RETURN a")
+        engine.execute_cypher("MATCH (b) RETURN b")
+        engine.execute_cypher("MATCH (a) RETURN a")
+        engine.execute_cypher("MATCH (c) RETURN c")
+        engine.execute_cypher("MATCH (a) RETURN a")
+        engine.execute_cypher("MATCH (b) RETURN b")
+
+        assert engine._cypher_compiler.compile.call_count == 4
+        assert engine.get_stats()["plan_cache_size"] == 2
+
+    def test_invalidate_plan_cache(self):
+        """GIVEN a cached plan WHEN invalidated THEN the next run recompiles."""
+        engine = self._engine()
+
+        engine.execute_cypher("MATCH (n) RETURN n")
+        engine.invalidate_plan_cache()
+        engine.execute_cypher("MATCH (n) RETURN n")
+
+        assert engine._cypher_compiler.compile.call_count == 2
+
+    def test_graph_engine_index_change_invalidates(self):
+        """GIVEN a GraphEngine backend WHEN a property index is created THEN plans are dropped."""
+        from ipfs_datasets_py.knowledge_graphs.core.graph_engine import GraphEngine
+
+        backend = GraphEngine()
+        engine = self._engine(backend=backend)
+        engine._ir_executor.backend = backend
+
+        engine.execute_cypher("MATCH (n) RETURN n")
+        engine.execute_cypher("MATCH (n) RETURN n")
+        backend.create_property_index("name")
+        engine.execute_cypher("MATCH (n) RETURN n")
+
+        assert engine._cypher_compiler.compile.call_count == 2
+
+    def test_caching_disabled(self):
+        """GIVEN enable_caching=False THEN every run compiles and nothing is stored."""
+        engine = self._engine(enable_caching=False)
+
+        engine.execute_cypher("MATCH (n) RETURN n")
+        engine.execute_cypher("MATCH (n) RETURN n")
+
+        assert engine._cypher_compiler.compile.call_count == 2
+        assert engine.get_stats()["plan_cache_size"] == 0
+
+
 class TestQueryResults:
     """Tests for result dataclasses."""
 
@@ -577,3 +577,358 @@ class TestVerifyIntegrity:
         # THEN – must not raise, must return a bool
         result = wal.verify_integrity()
         assert isinstance(result, bool)
+
+
+# ---------------------------------------------------------------------------
+# 11. Group commit: concurrent appends share batch blocks
+# ---------------------------------------------------------------------------
+
+
+class _SlowStorage(_InMemoryStorage):
+    """In-memory storage with a per-block write delay and a write counter."""
+
+    def __init__(self, delay: float = 0.005):
+        super().__init__()
+        self.delay = delay
+        self.writes = 0
+
+    def store_json(self, data: dict) -> str:
+        time.sleep(self.delay)
+        self.writes += 1
+        return super().store_json(data)
+
+
+class TestGroupCommit:
+    """Invariant: group commit batches writes without changing what read() sees."""
+
+    def _concurrent_appends(self, wal, writers: int, per_writer: int):
+        import threading
+
+        positions = {}
+        barrier = threading.Barrier(writers)
+
+        def writer(w):
+            barrier.wait()
+            for i in range(per_writer):
+                txn_id = f"txn-{w}-{i}"
+                positions[txn_id] = wal.append(_make_entry(txn_id))
+
+        threads = [threading.Thread(target=writer, args=(w,)) for w in range(writers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return positions
+
+    def test_concurrent_appends_are_batched_and_readable(self):
+        """
+        GIVEN: A group-commit WAL on slow storage
+        WHEN: 8 threads append 5 entries each
+        THEN: Fewer blocks than entries are written and read() returns every entry once
+        """
+        storage = _SlowStorage()
+        wal = WriteAheadLog(storage, group_commit=True)
+
+        positions = self._concurrent_appends(wal, writers=8, per_writer=5)
+
+        entries = list(wal.read())
+        assert sorted(e.txn_id for e in entries) == sorted(positions)
+        assert storage.writes < len(positions)
+        assert any("#" in p for p in positions.values())
+        assert wal.get_stats()["entry_count"] == 40
+        assert wal.get_stats()["batched_entries"] == 40
+        # Each writer's own entries stay in append order
+        order = [e.txn_id for e in reversed(entries)]
+        for w in range(8):
+            mine = [t for t in order if t.startswith(f"txn-{w}-")]
+            assert mine == [f"txn-{w}-{i}" for i in range(5)]
+
+    def test_batch_positions_link_and_recover(self):
+        """
+        GIVEN: A group-commit WAL with batched entries
+        WHEN: read() walks from any returned position
+        THEN: prev links resolve through batch blocks and recovery sees all ops
+        """
+        storage = _SlowStorage()
+        wal = WriteAheadLog(storage, group_commit=True)
+        positions = self._concurrent_appends(wal, writers=4, per_writer=3)
+
+        head_chain = [e.txn_id for e in wal.read()]
+        for txn_id, position in positions.items():
+            chain = [e.txn_id for e in wal.read(position)]
+            assert chain[0] == txn_id
+            assert chain == head_chain[head_chain.index(txn_id):]
+        assert len(wal.recover()) == 12
+
+    def test_single_writer_stays_unbatched(self):
+        """
+        GIVEN: A group-commit WAL with one writer
+        WHEN: Entries are appended sequentially
+        THEN: Each is stored as a plain entry with a bare CID position
+        """
+        storage = _make_storage()
+        wal = WriteAheadLog(storage, group_commit=True)
+
+        cids = [wal.append(_make_entry(f"txn-{i}", timestamp=float(i))) for i in range(3)]
+
+        assert all("#" not in cid for cid in cids)
+        assert [e.txn_id for e in wal.read()] == ["txn-2", "txn-1", "txn-0"]
+
+    def test_idempotency_and_bounds_preserved(self):
+        """
+        GIVEN: A group-commit WAL
+        WHEN: A keyed phase is re-appended and an oversized entry is appended
+        THEN: The prior position is returned and the bound is still enforced
+        """
+        from ipfs_datasets_py.knowledge_graphs.transactions.types import (
+            WALBoundExceededError,
+            WALPhase,
+        )
+
+        wal = WriteAheadLog(_make_storage(), group_commit=True, max_operations_per_entry=2)
+        first = wal.append_phase(txn_id="t1", phase=WALPhase.PREPARE, idempotency_key="k1")
+        again = wal.append_phase(txn_id="t1", phase=WALPhase.PREPARE, idempotency_key="k1")
+
+        assert again == first
+        with pytest.raises(WALBoundExceededError):
+            wal.append(_make_entry("t2", n_ops=3))
+        assert len(list(wal.read())) == 1
+
+    def test_storage_failure_reaches_every_caller(self):
+        """
+        GIVEN: A group-commit WAL whose storage fails
+        WHEN: An entry is appended
+        THEN: TransactionError is raised and the head is unchanged
+        """
+        from ipfs_datasets_py.knowledge_graphs.exceptions import TransactionError
+
+        class _FailingStorage(_InMemoryStorage):
+            def store_json(self, data):
+                raise StorageError("disk full")
+
+        wal = WriteAheadLog(_FailingStorage(), group_commit=True)
+
+        with pytest.raises(TransactionError):
+            wal.append(_make_entry("t1"))
+        assert wal.wal_head_cid is None
+
+
+class _CountingStorage(_InMemoryStorage):
+    """In-memory storage that counts block reads."""
+
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    def retrieve_json(self, cid: str) -> dict:
+        self.reads += 1
+        return super().retrieve_json(cid)
+
+
+class TestSegments:
+    """Invariant: sealing segments changes block layout, never what read() sees."""
+
+    def _segmented_wal(self, n: int, segment_size: int = 4):
+        storage = _CountingStorage()
+        wal = WriteAheadLog(storage, segment_size=segment_size)
+        for i in range(n):
+            wal.append(_make_entry(f"txn-{i:04d}", timestamp=float(1000 + i)))
+        return wal, storage
+
+    def test_sealed_segments_read_in_order(self):
+        """
+        GIVEN: A WAL with segment_size=4 and 10 appended entries
+        WHEN: The chain is read from the head
+        THEN: Two segments are sealed and all entries are returned newest first
+        """
+        wal, storage = self._segmented_wal(10)
+
+        stats = wal.get_stats()
+        assert stats["segments_written"] == 2
+        assert stats["unsealed_entries"] == 2
+
+        storage.reads = 0
+        txn_ids = [e.txn_id for e in wal.read()]
+        assert txn_ids == [f"txn-{i:04d}" for i in reversed(range(10))]
+        # 10 entries + 2 segment blocks stepped over
+        assert storage.reads == 12
+
+    def test_seal_references_entries_without_rewriting_them(self):
+        """
+        GIVEN: A WAL with segment_size=4
+        WHEN: Exactly four entries are appended
+        THEN: One segment block is written; its footer points at the
+              already-stored entries and the head moves to it
+        """
+        wal, storage = self._segmented_wal(4)
+
+        # 4 entries + 1 segment block, each entry stored once
+        assert len(storage._store) == 5
+        block = storage.retrieve_json(wal.wal_head_cid)
+        assert "entries" not in block
+        assert [row[0] for row in block["index"]] == [f"txn-{i:04d}" for i in range(4)]
+        assert block["prev_wal_cid"] == block["index"][-1][2]
+        for txn_id, _phase, position, _state in block["index"]:
+            assert storage.retrieve_json(position)["txn_id"] == txn_id
+
+    def test_history_is_index_lookup_from_footers(self):
+        """
+        GIVEN: A fresh WAL opened on a segmented chain
+        WHEN: get_transaction_history() is called twice
+        THEN: The index is built from footers once, then only matches are fetched
+        """
+        wal, storage = self._segmented_wal(12)
+        reopened = WriteAheadLog(storage, wal_head_cid=wal.wal_head_cid, segment_size=4)
+
+        storage.reads = 0
+        history = reopened.get_transaction_history("txn-0005")
+        assert [e.txn_id for e in history] == ["txn-0005"]
+        assert storage.reads == 4  # 3 segment footers + 1 entry fetch
+
+        storage.reads = 0
+        assert reopened.get_transaction_history("txn-0001")[0].txn_id == "txn-0001"
+        assert storage.reads == 1
+        assert reopened.get_transaction_history("missing") == []
+
+    def test_history_index_tracks_new_appends(self):
+        """
+        GIVEN: A WAL whose txn-id index has been built
+        WHEN: More phases are appended for a txn and a segment is sealed
+        THEN: History still returns every entry for that txn
+        """
+        wal, _ = self._segmented_wal(3)
+        wal.get_transaction_history("txn-0000")
+
+        wal.append(_make_entry("txn-0001", timestamp=2000.0))
+        wal.append(_make_entry("txn-0001", timestamp=2001.0))
+
+        history = wal.get_transaction_history("txn-0001")
+        assert [e.timestamp for e in history] == [2001.0, 2000.0, 1001.0]
+
+    def test_recover_stops_at_checkpoint(self):
+        """
+        GIVEN: A segmented WAL compacted after 6 entries, then 3 more appends
+        WHEN: recover() is called
+        THEN: Only operations after the checkpoint are replayed
+        """
+        wal, storage = self._segmented_wal(6)
+        wal.compact(wal.wal_head_cid)
+        for i in range(3):
+            wal.append(_make_entry(f"post-{i}", timestamp=float(3000 + i)))
+
+        assert wal.get_stats()["checkpoint_cid"] is not None
+        ops = wal.recover()
+        assert len(ops) == 3
+        # read() still walks through the checkpoint to the older entries
+        assert sum(1 for _ in wal.read()) == 10
+
+    def test_recover_skips_to_checkpoint_through_footers(self):
+        """
+        GIVEN: A reopened WAL with a checkpoint inside its third sealed segment
+        WHEN: recover() is called
+        THEN: Older segments are never fetched and only footer rows after the
+              checkpoint that may be committed have their entries loaded
+        """
+        from ipfs_datasets_py.knowledge_graphs.transactions.types import WALPhase
+
+        storage = _CountingStorage()
+        wal = WriteAheadLog(storage, segment_size=4)
+        for i in range(9):
+            wal.append(_make_entry(f"txn-{i:04d}", timestamp=float(1000 + i)))
+        wal.compact(wal.wal_head_cid)
+        wal.append_phase(txn_id="late", phase=WALPhase.COMPLETE, timestamp=2000.0)
+        wal.append_phase(txn_id="late-intent", phase=WALPhase.INTENT, timestamp=2001.0)
+        assert wal.get_stats()["segments_written"] == 3
+
+        reopened = WriteAheadLog(storage, wal_head_cid=wal.wal_head_cid, segment_size=4)
+        storage.reads = 0
+        assert reopened.recover() == []
+        # 1 segment footer + 1 COMPLETE entry; the INTENT row is skipped
+        assert storage.reads == 2
+
+    def test_checkpoint_is_marked_by_field_not_txn_id(self):
+        """
+        GIVEN: A user transaction whose id happens to start with "checkpoint-"
+        WHEN: recover() and plan_recovery() walk the WAL
+        THEN: It is replayed and planned like any other transaction
+        """
+        wal, storage = self._segmented_wal(2)
+        wal.append(_make_entry("checkpoint-import", timestamp=2000.0))
+
+        assert wal.get_stats()["checkpoint_cid"] is None
+        assert len(wal.recover()) == 3
+        assert "checkpoint-import" in {d.txn_id for d in wal.plan_recovery()}
+
+        marker_cid = wal.compact(wal.wal_head_cid)
+        assert storage.retrieve_json(marker_cid)["checkpoint"] is True
+        assert wal.recover() == []
+
+    def test_closing_read_outside_event_loop_is_clean(self):
+        """
+        GIVEN: A WAL read() generator paused mid-chain, outside any event loop
+        WHEN: The generator is closed early
+        THEN: GeneratorExit propagates cleanly instead of a cancellation lookup error
+        """
+        wal, _ = self._segmented_wal(3)
+        entries = wal.read()
+        assert next(entries).txn_id == "txn-0002"
+
+        entries.close()
+
+        assert next(entries, None) is None
+
+    def test_reassigning_head_resets_segment_state(self):
+        """
+        GIVEN: A segmented WAL with unsealed entries
+        WHEN: wal_head_cid is reassigned
+        THEN: Tail, index and checkpoint state are cleared
+        """
+        wal, _ = self._segmented_wal(6)
+        wal.get_transaction_history("txn-0000")
+
+        wal.wal_head_cid = None
+
+        stats = wal.get_stats()
+        assert stats["unsealed_entries"] == 0
+        assert stats["checkpoint_cid"] is None
+        assert wal.get_transaction_history("txn-0000") == []
+
+    def test_segment_size_zero_disables_sealing(self):
+        """
+        GIVEN: A WAL with segment_size=0
+        WHEN: Entries are appended
+        THEN: No segment is written and positions stay bare CIDs
+        """
+        wal, _ = self._segmented_wal(5, segment_size=0)
+
+        assert wal.get_stats()["segments_written"] == 0
+        assert "#" not in wal.wal_head_cid
+
+    def test_group_commit_seals_segments(self):
+        """
+        GIVEN: A group-commit WAL with segment_size=8
+        WHEN: 4 threads append 6 entries each
+        THEN: Segments are sealed and read() still returns all 24 entries
+        """
+        import threading
+
+        storage = _SlowStorage(delay=0.001)
+        wal = WriteAheadLog(storage, group_commit=True, segment_size=8)
+        barrier = threading.Barrier(4)
+
+        def writer(w):
+            barrier.wait()
+            for i in range(6):
+                wal.append(_make_entry(f"txn-{w}-{i}"))
+
+        threads = [threading.Thread(target=writer, args=(w,)) for w in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert wal.get_stats()["segments_written"] >= 2
+        assert sorted(e.txn_id for e in wal.read()) == sorted(
+            f"txn-{w}-{i}" for w in range(4) for i in range(6)
+        )
+        assert len(wal.recover()) == 24
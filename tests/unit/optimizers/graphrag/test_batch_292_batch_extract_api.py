@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import logging
+import pickle
+from concurrent.futures.process import BrokenProcessPool
 from unittest.mock import Mock
 
+from ipfs_datasets_py.optimizers.graphrag import ontology_generator
 from ipfs_datasets_py.optimizers.graphrag.ontology_generator import (
     Entity,
     EntityExtractionResult,
@@ -61,3 +65,88 @@ def test_batch_extract_returns_error_result_when_single_doc_fails() -> None:
     assert results[1].relationships == []
     assert results[1].confidence == 0.0
     assert results[1].errors and "bad document" in results[1].errors[0]
+
+
+def test_batch_extract_in_worker_processes_matches_thread_results() -> None:
+    generator = OntologyGenerator(use_ipfs_accelerate=False)
+    context = _context()
+    docs = [
+        "Alice Smith works at Acme Corp in Paris.",
+        "Bob Jones manages the Berlin office of Globex Inc.",
+        "Carol White must pay Acme Corp by January 5, 2024.",
+    ]
+
+    def _stable(results):
+        return [
+            (
+                [(e.type, e.text, e.confidence, e.source_span) for e in r.entities],
+                [(rel.type, rel.confidence, rel.direction) for rel in r.relationships],
+                r.confidence,
+                r.errors,
+            )
+            for r in results
+        ]
+
+    in_processes = generator.batch_extract(docs, context, max_workers=2)
+    in_threads = generator.batch_extract(docs, context, max_workers=2, use_processes=False)
+
+    assert _stable(in_processes) == _stable(in_threads)
+    assert all(r.entities for r in in_processes)
+
+
+def test_batch_extract_uses_threads_for_generators_a_worker_cannot_rebuild() -> None:
+    context = _context()
+    plain = OntologyGenerator(use_ipfs_accelerate=False)
+    with_backend = OntologyGenerator(use_ipfs_accelerate=False, llm_backend=Mock())
+    patched = OntologyGenerator(use_ipfs_accelerate=False)
+    patched.extract_entities = Mock()  # type: ignore[method-assign]
+
+    assert plain._batch_extract_worker_kwargs(context) is not None
+    assert with_backend._batch_extract_worker_kwargs(context) is None
+    assert patched._batch_extract_worker_kwargs(context) is None
+    assert plain._batch_extract_worker_kwargs(lambda: None) is None
+
+
+def test_batch_extract_workers_log_through_a_named_custom_logger() -> None:
+    context = _context()
+    named = OntologyGenerator(
+        use_ipfs_accelerate=False, logger=logging.getLogger("batch-test.custom")
+    )
+    unregistered = OntologyGenerator(
+        use_ipfs_accelerate=False, logger=logging.Logger("batch-test.unregistered")
+    )
+
+    init_kwargs = named._batch_extract_worker_kwargs(context)
+
+    assert pickle.loads(pickle.dumps(init_kwargs))["logger"] is named._log
+    assert unregistered._batch_extract_worker_kwargs(context) is None
+
+
+def test_batch_extract_falls_back_to_threads_when_the_process_pool_fails(monkeypatch) -> None:
+    generator = OntologyGenerator(use_ipfs_accelerate=False)
+    context = _context()
+    docs = ["Alice Smith works at Acme Corp in Paris.", "Bob Jones lives in Berlin."]
+    expected = generator.batch_extract(docs, context, max_workers=2, use_processes=False)
+
+    class _BrokenPool:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def map(self, *args, **kwargs):
+            raise BrokenProcessPool("worker died")
+
+    def _cannot_start(*args, **kwargs):
+        raise OSError("process pools are not available")
+
+    for pool_cls in (_BrokenPool, _cannot_start):
+        monkeypatch.setattr(ontology_generator, "ProcessPoolExecutor", pool_cls)
+        results = generator.batch_extract(docs, context, max_workers=2)
+        assert [[e.text for e in r.entities] for r in results] == [
+            [e.text for e in r.entities] for r in expected
+        ]
@@ -0,0 +1,122 @@
+"""Regression tests for one-pass verb-frame scanning and windowed co-occurrence."""
+
+from __future__ import annotations
+
+import re
+
+from ipfs_datasets_py.optimizers.graphrag.ontology_generator import (
+    Entity,
+    ExtractionConfig,
+    OntologyGenerationContext,
+    OntologyGenerator,
+)
+
+
+def _per_pattern_matches(text: str) -> list:
+    return [
+        (rel_type, m.span(), m.group(1), m.group(2))
+        for pattern, rel_type in OntologyGenerator._get_verb_patterns()
+        for m in re.finditer(pattern, text, re.IGNORECASE)
+    ]
+
+
+def _scanned_matches(text: str) -> list:
+    return [
+        (rel_type, m.span(), m.group(1), m.group(2))
+        for rel_type, m in OntologyGenerator._iter_verb_frame_matches(text)
+    ]
+
+
+def _context() -> OntologyGenerationContext:
+    return OntologyGenerationContext(
+        data_source="scaling-test",
+        data_type="text",
+        domain="general",
+        config=ExtractionConfig(),
+    )
+
+
+def test_verb_frame_scan_matches_per_pattern_finditer_on_overlapping_frames() -> None:
+    text = (
+        "Alice owns Acme employs Bob. Bob manages Carol owns Dave. "
+        "Acme must pay Bob is a partner. Widget part of Gadget belongs to Acme. "
+        "A owns B owns C"
+    )
+
+    assert _scanned_matches(text) == _per_pattern_matches(text)
+
+
+def test_verb_frame_scanner_falls_back_for_patterns_without_subject_prefix(monkeypatch) -> None:
+    monkeypatch.setattr(
+        OntologyGenerator,
+        "_verb_patterns_cache",
+        [(r"(\w+)\s+funds\s+(\w+)", "funds"), (r"\b(\w+)\s+owns?\s+(\w+)\b", "owns")],
+    )
+    monkeypatch.setattr(OntologyGenerator, "_verb_frame_scanner_cache", None)
+
+    _, scanner, _ = OntologyGenerator._get_verb_frame_scanner()
+
+    assert scanner is None
+    assert _scanned_matches("Acme funds Bob and Bob owns Widget") == [
+        ("funds", (0, 14), "Acme", "Bob"),
+        ("owns", (19, 34), "Bob", "Widget"),
+    ]
+
+
+def test_verb_frame_scanner_is_rebuilt_when_patterns_change(monkeypatch) -> None:
+    monkeypatch.setattr(OntologyGenerator, "_verb_patterns_cache", None)
+    monkeypatch.setattr(OntologyGenerator, "_verb_frame_scanner_cache", None)
+    first = OntologyGenerator._get_verb_frame_scanner()
+    assert OntologyGenerator._get_verb_frame_scanner() is first
+
+    monkeypatch.setattr(
+        OntologyGenerator, "_verb_patterns_cache", [(r"\b(\w+)\s+funds\s+(\w+)\b", "funds")]
+    )
+
+    assert OntologyGenerator._get_verb_frame_scanner() is not first
+    assert _scanned_matches("Acme funds Bob") == [("funds", (0, 14), "Acme", "Bob")]
+
+
+def test_cooccurrence_candidates_only_pair_entities_within_window() -> None:
+    generator = OntologyGenerator(use_ipfs_accelerate=False)
+    text = "Alice met Bob. " + "x" * 300 + " Carol and Dave and Alice."
+    entities = [
+        Entity(id="a", type="Person", text="Alice"),
+        Entity(id="c", type="Person", text="Carol"),
+        Entity(id="b", type="Person", text="Bob"),
+        Entity(id="z", type="Person", text="Zed"),
+        Entity(id="d", type="Person", text="Dave"),
+    ]
+
+    positions, pairs = generator._cooccurrence_candidates(entities, text.lower())
+
+    assert positions == [0, text.find("Carol"), 10, -1, text.find("Dave")]
+    # Alice is placed at her first mention, so she does not pair with Carol or Dave.
+    assert pairs == [(0, 2), (1, 4)]
+
+
+def test_sentence_index_finds_containing_span() -> None:
+    generator = OntologyGenerator(use_ipfs_accelerate=False)
+    spans = generator._get_sentence_spans("One. Two! Three?")
+
+    assert [generator._sentence_index(pos, spans) for pos in (0, 3, 4, 15)] == [0, 0, 1, 2]
+    assert generator._sentence_index(99, spans) == -1
+    assert generator._sentence_index(3, [(0, 2), (5, 9)]) == -1
+
+
+def test_infer_relationships_skips_distant_entities() -> None:
+    generator = OntologyGenerator(use_ipfs_accelerate=False)
+    text = "Alice works at Acme. " + "filler " * 60 + "Bob lives in Paris."
+    entities = [
+        Entity(id="alice", type="Person", text="Alice"),
+        Entity(id="acme", type="Organization", text="Acme"),
+        Entity(id="bob", type="Person", text="Bob"),
+        Entity(id="paris", type="Location", text="Paris"),
+    ]
+
+    rels = generator.infer_relationships(entities, _context(), data=text)
+
+    assert {frozenset((r.source_id, r.target_id)) for r in rels} == {
+        frozenset(("alice", "acme")),
+        frozenset(("bob", "paris")),
+    }
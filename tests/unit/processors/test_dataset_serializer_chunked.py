@@ -0,0 +1,134 @@
+"""Chunked columnar and tensor encodings in DatasetSerializer."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+import numpy as np
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from ipfs_datasets_py.processors.serialization.dataset_serialization import DatasetSerializer
+
+
+class _DictStorage:
+    """Content-addressed in-memory block store that counts reads."""
+
+    def __init__(self):
+        self.blocks = {}
+        self.reads = 0
+
+    def store(self, data: bytes) -> str:
+        cid = "bafk" + hashlib.sha256(data).hexdigest()[:40]
+        self.blocks[cid] = data
+        return cid
+
+    def get(self, cid: str) -> bytes:
+        self.reads += 1
+        return self.blocks[cid]
+
+    def store_json(self, obj) -> str:
+        return self.store(json.dumps(obj).encode("utf-8"))
+
+    def get_json(self, cid: str):
+        return json.loads(self.get(cid).decode("utf-8"))
+
+
+def _table(rows: int) -> "pa.Table":
+    rng = np.random.default_rng(0)
+    return pa.table(
+        {
+            "id": pa.array(np.arange(rows, dtype=np.int32)),
+            "score": pa.array(rng.random(rows)),
+            "label": pa.array([f"label-{i % 97}" for i in range(rows)]),
+            "embedding": pa.array(
+                list(rng.random((rows, 4), dtype=np.float32)), type=pa.list_(pa.float32())
+            ),
+        }
+    )
+
+
+def test_arrow_table_round_trips_in_bounded_chunks():
+    storage = _DictStorage()
+    serializer = DatasetSerializer(storage=storage)
+    table = _table(20000)
+
+    cid = serializer.serialize_arrow_table(table, max_chunk_bytes=16 * 1024)
+
+    root = storage.get_json(cid)
+    id_chunks = root["columns"]["id"]["chunks"]
+    assert len(id_chunks) > 1
+    assert id_chunks[0]["offset"] == 0 and id_chunks[1]["offset"] == id_chunks[0]["rows"]
+    assert id_chunks[1]["min"] == id_chunks[1]["offset"]
+    assert id_chunks[1]["max"] == id_chunks[1]["offset"] + id_chunks[1]["rows"] - 1
+    assert all(len(storage.blocks[c["cid"]]) < 32 * 1024 for c in id_chunks)
+    assert serializer.deserialize_arrow_table(cid).equals(table)
+
+
+def test_partial_read_fetches_only_needed_chunks():
+    storage = _DictStorage()
+    serializer = DatasetSerializer(storage=storage)
+    table = _table(20000)
+    cid = serializer.serialize_arrow_table(table, max_chunk_bytes=16 * 1024)
+    total_blocks = sum(len(c["chunks"]) for c in storage.get_json(cid)["columns"].values())
+
+    storage.reads = 0
+    part = serializer.deserialize_arrow_table(cid, columns=["label", "id"], row_range=(5000, 6000))
+
+    assert part.equals(table.select(["label", "id"]).slice(5000, 1000))
+    assert storage.reads < total_blocks // 4
+
+
+def test_legacy_single_block_columns_still_readable():
+    storage = _DictStorage()
+    serializer = DatasetSerializer(storage=storage)
+    table = pa.table({"a": pa.array([1, 2, 3], pa.int64()), "b": pa.array(["x", "y", "z"])})
+    root = {
+        "type": "arrow_table",
+        "num_rows": 3,
+        "schema": storage.store_json(serializer._schema_to_dict(table.schema)),
+        "columns": {
+            name: storage.store(serializer._serialize_column(table.column(name)))
+            for name in table.column_names
+        },
+    }
+
+    cid = storage.store_json(root)
+
+    assert serializer.deserialize_arrow_table(cid).equals(table)
+    assert serializer.deserialize_arrow_table(cid, row_range=(1, 3)).equals(table.slice(1))
+
+
+def test_vectors_stored_as_raw_tensor_blocks():
+    storage = _DictStorage()
+    serializer = DatasetSerializer(storage=storage)
+    vectors = np.random.default_rng(1).random((2000, 32), dtype=np.float32)
+    metadata = [{"i": i} for i in range(2000)]
+
+    cid = serializer.serialize_vectors(vectors, metadata, max_chunk_bytes=16 * 1024)
+
+    root = storage.get_json(cid)
+    assert root["type"] == "vector_tensor"
+    assert root["dtype"] == "<f4" and root["shape"] == [2000, 32]
+    raw_bytes = sum(len(storage.blocks[c["cid"]]) for c in root["chunks"])
+    assert raw_bytes == vectors.nbytes
+
+    restored, restored_metadata = serializer.deserialize_vectors(cid)
+    assert np.array_equal(np.vstack(restored), vectors)
+    assert restored[0].dtype == np.float32
+    assert restored_metadata == metadata
+    np.testing.assert_array_equal(
+        serializer.deserialize_vector_matrix(cid, row_range=(700, 1300)), vectors[700:1300]
+    )
+
+
+def test_ragged_vectors_fall_back_to_json():
+    serializer = DatasetSerializer(storage=_DictStorage())
+
+    cid = serializer.serialize_vectors([np.ones(2), np.ones(3)])
+
+    restored, metadata = serializer.deserialize_vectors(cid)
+    assert [v.tolist() for v in restored] == [[1.0, 1.0], [1.0, 1.0, 1.0]]
+    assert metadata is None
@@ -0,0 +1,174 @@
+"""Byte-bounded BlockCache and its use by IPLDStorage."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from ipfs_datasets_py.processors.storage.ipld.block_cache import BlockCache, PackedBlockStore
+from ipfs_datasets_py.processors.storage.ipld.storage import IPLDStorage
+
+
+def _block(i: int, size: int = 100) -> bytes:
+    return bytes([i % 256]) * size
+
+
+def test_lru_eviction_respects_byte_budget_and_recency():
+    cache = BlockCache(max_bytes=350)
+    for i in range(3):
+        cache[f"c{i}"] = _block(i)
+    assert cache.get("c0") == _block(0)  # c0 becomes most recent
+
+    cache["c3"] = _block(3)
+
+    assert "c1" not in cache
+    assert list(cache) == ["c2", "c0", "c3"]
+    stats = cache.stats()
+    assert stats["memory_bytes"] == 300 and stats["evictions"] == 1
+    assert cache.get("c1") is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+    with pytest.raises(KeyError):
+        cache["c1"]
+
+
+def test_single_oversized_block_kept_without_spill():
+    cache = BlockCache(max_bytes=50)
+
+    cache["big"] = _block(1)
+
+    assert cache["big"] == _block(1)
+    cache["next"] = _block(2)
+    assert "big" not in cache and cache["next"] == _block(2)
+
+
+def test_evicted_blocks_spill_to_packed_file_and_are_promoted(tmp_path):
+    store = PackedBlockStore(str(tmp_path / "spill.pack"))
+    cache = BlockCache(max_bytes=250, spill_store=store)
+    for i in range(10):
+        cache[f"c{i}"] = _block(i)
+
+    assert len(cache) == 10
+    assert cache.stats()["memory_bytes"] <= 250
+    assert cache["c0"] == _block(0)
+    assert cache.stats()["spill_hits"] == 1
+    assert list(cache)[:2] == ["c9", "c0"]
+
+    del cache["c5"]
+    assert "c5" not in cache and len(cache) == 9
+    assert store.file_bytes == 900  # c0..c8 spilled once, never rewritten
+    store.close()
+
+
+def test_spill_file_is_compacted_once_mostly_dead(tmp_path):
+    path = tmp_path / "spill.pack"
+    store = PackedBlockStore(str(path), compact_ratio=0.5, compact_min_bytes=500)
+    cache = BlockCache(max_bytes=100, spill_store=store)
+    for i in range(10):
+        cache[f"c{i}"] = _block(i)
+    assert store.file_bytes == 900
+
+    # Deleting spilled blocks leaves dead bytes until half the file is dead
+    for i in range(4):
+        del cache[f"c{i}"]
+    assert store.compactions == 0 and store.dead_bytes == 400
+    del cache["c4"]
+
+    assert store.compactions == 1
+    assert store.dead_bytes == 0
+    assert store.file_bytes == os.path.getsize(path) == 400
+    assert [cache[f"c{i}"] for i in range(5, 10)] == [_block(i) for i in range(5, 10)]
+    store.close()
+
+
+def test_compaction_can_be_disabled_or_forced(tmp_path):
+    store = PackedBlockStore(str(tmp_path / "spill.pack"), compact_ratio=None)
+    for i in range(6):
+        store.put(f"c{i}", _block(i))
+    for i in range(0, 6, 2):
+        store.discard(f"c{i}")
+    assert store.file_bytes == 600 and store.dead_bytes == 300
+
+    store.compact()
+
+    assert store.file_bytes == 300 and store.dead_bytes == 0
+    assert [store.get(f"c{i}") for i in (1, 3, 5)] == [_block(1), _block(3), _block(5)]
+    with pytest.raises(ValueError):
+        PackedBlockStore(str(tmp_path / "bad.pack"), compact_ratio=0)
+    store.close()
+
+
+def test_len_is_kept_without_walking_the_spill_store(tmp_path, monkeypatch):
+    store = PackedBlockStore(str(tmp_path / "spill.pack"))
+    cache = BlockCache(max_bytes=250, spill_store=store)
+    for i in range(10):
+        cache[f"c{i}"] = _block(i)
+    cache.get("c0")  # promoted, still spilled
+    cache["c1"] = _block(11)  # overwrite of a spilled-only block
+    del cache["c0"]
+    del cache["c2"]
+    cache["c3"] = _block(3)
+    expected = len(set(cache._blocks) | set(store))
+
+    monkeypatch.setattr(PackedBlockStore, "__iter__", lambda self: pytest.fail("walked"))
+
+    assert len(cache) == expected == 8
+    cache.clear()
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_close_and_finalizer_delete_the_spill_file(tmp_path):
+    closed_path = tmp_path / "closed.pack"
+    cache = BlockCache(max_bytes=100, spill_store=PackedBlockStore(str(closed_path)))
+    cache["a"] = _block(1)
+    cache["b"] = _block(2)
+    assert closed_path.exists()
+
+    cache.close()
+
+    assert not closed_path.exists()
+    assert len(cache) == 0 and cache.stats()["spilled_blocks"] == 0
+
+    dropped_path = tmp_path / "dropped.pack"
+    store = PackedBlockStore(str(dropped_path))
+    store.put("a", _block(1))
+    del store
+    assert not dropped_path.exists()
+
+
+def test_ipld_storage_close_removes_spill_file(tmp_path):
+    storage = IPLDStorage(base_dir=str(tmp_path), cache_max_bytes=1024)
+    storage._ipfs_enabled = False
+    storage.store(os.urandom(2000))
+    assert list(tmp_path.glob("block_cache-*.pack"))
+
+    storage.close()
+
+    assert not list(tmp_path.glob("block_cache-*.pack"))
+
+
+def test_ipld_storage_bounds_memory_and_keeps_lookups(tmp_path):
+    storage = IPLDStorage(base_dir=str(tmp_path), cache_max_bytes=4096)
+    storage._ipfs_enabled = False
+    payloads = [os.urandom(1000) for _ in range(50)]
+
+    cids = [storage.store(data) for data in payloads]
+
+    stats = storage.get_cache_stats()
+    assert stats["memory_bytes"] <= 4096
+    assert stats["spilled_blocks"] >= 45
+    assert [storage.get(cid) for cid in cids] == payloads
+    assert storage.get_batch(cids[:3]) == payloads[:3]
+
+
+def test_ipld_storage_accepts_custom_cache(tmp_path):
+    cache = {}
+    storage = IPLDStorage(base_dir=str(tmp_path), block_cache=cache)
+    storage._ipfs_enabled = False
+
+    cid = storage.store(b"payload")
+
+    assert cache[cid] == b"payload"
+    assert storage.get(cid) == b"payload"
+    assert storage.get_cache_stats() == {"memory_blocks": 1}
@@ -0,0 +1,141 @@
+"""HAMT-backed roots for IPLDKnowledgeGraph and the IPLD vector store."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import warnings
+
+import numpy as np
+
+from ipfs_datasets_py.processors.storage.ipld.hamt import HAMT
+from ipfs_datasets_py.processors.storage.ipld.knowledge_graph import IPLDKnowledgeGraph
+
+
+class _CountingStorage:
+    """Content-addressed in-memory block store that counts writes."""
+
+    def __init__(self):
+        self.blocks = {}
+        self.writes = 0
+        self.bytes_written = 0
+
+    def store(self, data: bytes, links=None) -> str:
+        cid = "bafk" + hashlib.sha256(data).hexdigest()[:40]
+        self.blocks[cid] = data
+        self.writes += 1
+        self.bytes_written += len(data)
+        return cid
+
+    def get(self, cid: str) -> bytes:
+        return self.blocks[cid]
+
+
+def test_hamt_root_depends_only_on_contents():
+    storage = _CountingStorage()
+    keys = [f"key-{i}" for i in range(2000)]
+
+    forward = HAMT.from_items(storage, ((k, i) for i, k in enumerate(keys)))
+    backward = HAMT.from_items(storage, ((k, i) for i, k in reversed(list(enumerate(keys)))))
+    assert forward.flush() == backward.flush()
+
+    reopened = HAMT(storage, root_cid=forward.root_cid)
+    assert reopened.get("key-1234") == 1234 and "key-9999" not in reopened
+    for key in keys[200:]:
+        assert reopened.delete(key)
+    assert not reopened.delete("key-1999")
+    smaller = HAMT.from_items(storage, ((k, i) for i, k in enumerate(keys[:200])))
+    assert reopened.flush() == smaller.flush()
+    assert dict(reopened.items()) == {k: i for i, k in enumerate(keys[:200])}
+
+
+def test_single_mutation_rewrites_logarithmic_blocks():
+    storage = _CountingStorage()
+    hamt = HAMT.from_items(storage, ((f"k{i}", "v") for i in range(5000)))
+    hamt.flush()
+    total_nodes = len(list(hamt.node_cids()))
+
+    hamt.set("extra", "v")
+    writes = storage.writes
+    hamt.flush()
+
+    assert storage.writes - writes <= 4 < total_nodes
+
+
+def test_knowledge_graph_add_cost_is_independent_of_size():
+    storage = _CountingStorage()
+    kg = IPLDKnowledgeGraph(storage=storage)
+    for i in range(3000):
+        kg.add_entity("person", f"e{i}")
+
+    before = storage.bytes_written
+    kg.add_entity("person", "late")
+
+    # The old root re-serialized every entity id and CID (~300 KB here).
+    assert storage.bytes_written - before < 16 * 1024
+    root = json.loads(storage.get(kg.root_cid))
+    assert set(root["entity_cids"]) == {"_hamt"}
+
+    loaded = IPLDKnowledgeGraph.from_cid(kg.root_cid, storage=storage)
+    assert loaded._entity_cids == kg._entity_cids
+    assert loaded.get_entity(next(iter(kg.entities))).name == "e0"
+
+
+def test_batch_commits_root_once():
+    storage = _CountingStorage()
+    kg = IPLDKnowledgeGraph(storage=storage)
+    alice = kg.add_entity("person", "alice")
+    root_before = kg.root_cid
+
+    with kg.batch():
+        people = [kg.add_entity("person", f"p{i}") for i in range(50)]
+        for person in people:
+            kg.add_relationship("knows", alice, person)
+        assert kg.root_cid == root_before
+
+    assert kg.root_cid != root_before
+    loaded = IPLDKnowledgeGraph.from_cid(kg.root_cid, storage=storage)
+    assert loaded.entity_count == 51 and loaded.relationship_count == 50
+    assert len(loaded.get_entity_relationships(alice.id)) == 50
+
+
+def test_legacy_inline_root_still_loads_and_upgrades():
+    storage = _CountingStorage()
+    kg = IPLDKnowledgeGraph(storage=storage)
+    entity = kg.add_entity("person", "legacy")
+    legacy_root = {
+        "type": "knowledge_graph",
+        "name": "old",
+        "entity_ids": [entity.id],
+        "entity_cids": {entity.id: entity.cid},
+        "relationship_ids": [],
+        "relationship_cids": {},
+    }
+    legacy_cid = storage.store(json.dumps(legacy_root).encode())
+
+    loaded = IPLDKnowledgeGraph.from_cid(legacy_cid, storage=storage)
+    loaded.add_entity("person", "new")
+
+    upgraded = json.loads(storage.get(loaded.root_cid))
+    assert "_hamt" in upgraded["entity_cids"]
+    assert IPLDKnowledgeGraph.from_cid(loaded.root_cid, storage=storage).entity_count == 2
+
+
+def test_vector_store_order_survives_round_trip():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        from ipfs_datasets_py.processors.storage.ipld.vector_store import IPLDVectorStore
+
+    storage = _CountingStorage()
+    store = IPLDVectorStore(dimension=4, metric="l2", storage=storage)
+    rng = np.random.default_rng(0)
+    with store.batch():
+        for _ in range(3):
+            store.add_vectors(list(rng.random((20, 4))), [{"i": i} for i in range(20)])
+    store.delete_vectors(store.vector_ids[5:15])
+
+    loaded = IPLDVectorStore.from_cid(store.root_cid, storage=storage)
+
+    assert loaded.vector_ids == store.vector_ids
+    assert len(loaded) == 50
+    np.testing.assert_allclose(loaded.vectors[7], store.vectors[7])
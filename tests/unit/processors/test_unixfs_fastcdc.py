@@ -0,0 +1,110 @@
+"""FastCDCChunker boundaries and locally built UnixFS DAGs."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+
+import numpy as np
+import pytest
+
+from ipfs_datasets_py.processors.ipfs.unixfs import (
+    FastCDCChunker,
+    UnixFSHandler,
+    _UnixFSBuilder,
+)
+from ipfs_datasets_py.processors.storage.ipld.car_stream import CarReader, cid_to_str, compute_cid
+
+
+def _chunker() -> FastCDCChunker:
+    return FastCDCChunker(min_size=2048, avg_size=8192, max_size=32768)
+
+
+def _chunks(chunker, data: bytes) -> list:
+    lengths = chunker.cut(None, data, end=True)
+    offsets = np.cumsum([0] + lengths)
+    return [data[offsets[i] : offsets[i + 1]] for i in range(len(lengths))]
+
+
+def test_boundaries_respect_sizes_and_cover_buffer():
+    chunker = _chunker()
+    data = np.random.default_rng(0).bytes(2 * 2**20)
+
+    lengths = chunker.cut(None, data, end=True)
+
+    assert sum(lengths) == len(data)
+    assert all(2048 <= n <= 32768 for n in lengths[:-1])
+    assert 6000 < np.mean(lengths) < 16000
+    assert FastCDCChunker().cut(None, b"", end=True) == []
+    with pytest.raises(ValueError):
+        FastCDCChunker(min_size=4096, avg_size=1024, max_size=8192)
+
+
+def test_streaming_cut_matches_one_shot():
+    chunker = _chunker()
+    data = np.random.default_rng(1).bytes(2**20)
+    expected = chunker.cut(None, data, end=True)
+
+    lengths, pending = [], b""
+    for offset in range(0, len(data), 100_000):
+        buffer = pending + data[offset : offset + 100_000]
+        cut = chunker.cut(None, buffer, end=offset + 100_000 >= len(data))
+        lengths.extend(cut)
+        pending = buffer[sum(cut) :]
+
+    assert lengths == expected and not pending
+
+
+def test_insert_only_changes_nearby_chunks():
+    chunker = _chunker()
+    data = np.random.default_rng(2).bytes(2**20)
+    edited = data[:500_000] + b"inserted bytes" + data[500_000:]
+
+    before = {hashlib.sha256(c).digest() for c in _chunks(chunker, data)}
+    after = [hashlib.sha256(c).digest() for c in _chunks(chunker, edited)]
+
+    assert sum(digest not in before for digest in after) <= 3
+
+
+def test_builder_balanced_tree_and_known_empty_directory(tmp_path):
+    blocks = {}
+
+    def put(data, codec):
+        cid = cid_to_str(compute_cid(data, codec))
+        blocks[cid] = data
+        return cid
+
+    builder = _UnixFSBuilder(put)
+    (tmp_path / "empty").mkdir()
+    assert builder.add_directory(str(tmp_path / "empty"), _chunker())[0] == (
+        "bafybeiczsscdsbs7ffqz55asqdf3smv6klcw3gofszvwlyarci47bgf354"
+    )
+
+    small = tmp_path / "small.bin"
+    small.write_bytes(b"tiny")
+    assert builder.add_file(str(small), _chunker())[0] == cid_to_str(compute_cid(b"tiny"))
+
+    big = tmp_path / "big.bin"
+    big.write_bytes(np.random.default_rng(3).bytes(3 * 2**20))
+    blocks.clear()
+    cid, tsize, filesize = builder.add_file(str(big), _chunker())
+    assert cid.startswith("bafybei") and filesize == 3 * 2**20
+    # More leaves than one node's fan-out, so the root links to inner nodes.
+    assert len(blocks) > 174 + 2
+    assert tsize == sum(map(len, blocks.values()))
+
+
+def test_write_to_car_with_fastcdc_needs_no_daemon(tmp_path):
+    source = tmp_path / "src"
+    (source / "nested").mkdir(parents=True)
+    payload = os.urandom(200_000)
+    (source / "a.bin").write_bytes(payload)
+    (source / "nested" / "b.txt").write_bytes(b"hello")
+
+    handler = UnixFSHandler()
+    root = handler.write_to_car(str(source), str(tmp_path / "out.car"), chunker=_chunker())
+
+    with CarReader(str(tmp_path / "out.car")) as reader:
+        assert reader.roots == [root]
+        raw_leaves = [data for cid, data in reader.iter_blocks() if cid.startswith("bafkrei")]
+    assert b"".join(raw_leaves[:-1]) == payload and raw_leaves[-1] == b"hello"
@@ -0,0 +1,126 @@
+"""
+Tests for MemoryMappedVectorLoader
+
+Covers zero-copy indexing, blocked k-NN search and the row-norm sidecar.
+"""
+
+import numpy as np
+import pytest
+
+from ipfs_datasets_py.search.streaming_data_loader import MemoryMappedVectorLoader
+
+
+@pytest.fixture
+def vectors():
+    return np.random.default_rng(0).standard_normal((1000, 24)).astype(np.float32)
+
+
+@pytest.fixture
+def loader(tmp_path, vectors):
+    path = str(tmp_path / "vectors.bin")
+    with MemoryMappedVectorLoader(path, dimension=24, mode="w+") as writer:
+        writer.append(vectors)
+    loader = MemoryMappedVectorLoader(path, dimension=24, mode="r")
+    yield loader
+    loader.close()
+
+
+def _reference(vectors, queries, metric, top_k):
+    if metric == "cosine":
+        scores = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)) @ (
+            queries / np.linalg.norm(queries, axis=1, keepdims=True)
+        ).T
+        return np.argsort(-scores, axis=0, kind="stable")[:top_k].T
+    if metric == "dot":
+        return np.argsort(-(vectors @ queries.T), axis=0, kind="stable")[:top_k].T
+    distances = np.linalg.norm(vectors[:, None, :] - queries[None, :, :], axis=2)
+    return np.argsort(distances, axis=0, kind="stable")[:top_k].T
+
+
+class TestMemoryMappedVectorLoader:
+    """Test zero-copy access and search."""
+
+    def test_getitem_returns_read_only_views(self, tmp_path, vectors):
+        path = str(tmp_path / "rw.bin")
+        loader = MemoryMappedVectorLoader(path, dimension=24, mode="w+")
+        loader.append(vectors[:10])
+
+        block = loader[2:8]
+        row = loader[3]
+
+        assert np.shares_memory(block, loader.memmap)
+        assert np.shares_memory(row, loader.memmap)
+        assert not block.flags.writeable and not row.flags.writeable
+        np.testing.assert_array_equal(block, vectors[2:8])
+        with pytest.raises(ValueError):
+            row[0] = 1.0
+        loader.close()
+
+    @pytest.mark.parametrize("metric", ["cosine", "dot", "l2"])
+    def test_tiled_search_matches_full_scan(self, loader, vectors, metric):
+        queries = np.random.default_rng(1).standard_normal((4, 24)).astype(np.float32)
+
+        indices, scores = loader.search(queries, top_k=7, metric=metric, tile_rows=64)
+
+        np.testing.assert_array_equal(indices, _reference(vectors, queries, metric, 7))
+        assert scores.shape == (4, 7)
+        ordered = scores if metric == "l2" else -scores
+        assert np.all(np.diff(ordered, axis=1) >= 0)
+
+    def test_single_query_and_edge_cases(self, loader, vectors):
+        indices, scores = loader.search(vectors[42], top_k=3)
+
+        assert indices.shape == (3,)
+        assert indices[0] == 42
+        assert scores[0] == pytest.approx(1.0, abs=1e-5)
+        assert len(loader.search(vectors[0], top_k=0)[0]) == 0
+        assert len(loader.search(vectors[0], top_k=5000)[0]) == 1000
+        with pytest.raises(ValueError):
+            loader.search(vectors[0], metric="hamming")
+        with pytest.raises(ValueError):
+            loader.search(np.ones(3))
+
+    def test_norm_sidecar_is_used_and_kept_current(self, tmp_path, vectors):
+        path = str(tmp_path / "normed.bin")
+        loader = MemoryMappedVectorLoader(path, dimension=24, mode="w+")
+        loader.append(vectors[:500])
+        norms_path = loader.compute_norms()
+
+        assert norms_path == f"{path}.norms"
+        loader.append(vectors[500:])
+        norms = np.fromfile(norms_path, dtype=np.float32)
+        np.testing.assert_allclose(norms, np.linalg.norm(vectors, axis=1), rtol=1e-6)
+        loader.close()
+
+        reopened = MemoryMappedVectorLoader(path, dimension=24, norms_path=norms_path)
+        query = vectors[7] * 3.0
+        indices, _ = reopened.search(query, top_k=5, tile_rows=100)
+        np.testing.assert_array_equal(indices, _reference(vectors, query[None, :], "cosine", 5)[0])
+        reopened.close()
+
+    def test_stale_norm_sidecar_is_not_used(self, tmp_path, vectors):
+        path = str(tmp_path / "stale.bin")
+        norms_path = f"{path}.norms"
+        old = MemoryMappedVectorLoader(path, dimension=24, mode="w+", norms_path=norms_path)
+        old.append(vectors * 10.0)
+        old.compute_norms()
+        old.close()
+
+        # Rewriting with w+ drops the old sidecar instead of trusting its rows
+        rewritten = MemoryMappedVectorLoader(path, dimension=24, mode="w+", norms_path=norms_path)
+        rewritten.append(vectors[:600])
+        query = vectors[11] + 0.5
+        for metric in ("cosine", "l2"):
+            indices, _ = rewritten.search(query, top_k=5, metric=metric, tile_rows=100)
+            np.testing.assert_array_equal(indices, _reference(vectors[:600], query[None, :], metric, 5)[0])
+        rewritten.close()
+
+        # A sidecar that does not match the row count is ignored on reopen
+        np.linalg.norm(vectors * 10.0, axis=1).astype(np.float32).tofile(norms_path)
+        reopened = MemoryMappedVectorLoader(path, dimension=24, norms_path=norms_path)
+        indices, scores = reopened.search(query, top_k=5, metric="l2", tile_rows=100)
+        np.testing.assert_array_equal(indices, _reference(vectors[:600], query[None, :], "l2", 5)[0])
+        np.testing.assert_allclose(
+            scores, np.linalg.norm(vectors[:600][indices] - query, axis=1), rtol=1e-4
+        )
+        reopened.close()
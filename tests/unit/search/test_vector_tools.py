@@ -0,0 +1,115 @@
+"""
+Tests for search.vector_tools
+
+Covers the matrix-backed VectorStore search paths and the vectorized
+VectorSimilarityCalculator batch helpers.
+"""
+
+import numpy as np
+import pytest
+
+from ipfs_datasets_py.search import vector_tools
+from ipfs_datasets_py.search.vector_tools import VectorSimilarityCalculator, VectorStore
+
+
+def _reference_ranking(vectors: np.ndarray, query: np.ndarray, top_k: int) -> list:
+    scores = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)) @ (
+        query / np.linalg.norm(query)
+    )
+    return list(np.argsort(-scores, kind="stable")[:top_k])
+
+
+class TestVectorSimilarityCalculator:
+    """Test the vectorized batch helpers."""
+
+    def test_batch_similarity_matches_pairwise(self):
+        calculator = VectorSimilarityCalculator()
+        vectors = [[1, 0], [0, 1], [1, 1], [-1, 0], [0, 0]]
+
+        result = calculator.batch_similarity(vectors, [1, 0])
+
+        assert result == pytest.approx([1.0, 0.0, 0.7071067811865475, -1.0, 0.0])
+        assert calculator.batch_similarity([], [1, 0]) == []
+
+    def test_batch_similarity_ragged_input_degrades_per_vector(self):
+        calculator = VectorSimilarityCalculator()
+
+        assert calculator.batch_similarity([[1, 0], [1, 2, 3]], [1, 0]) == [1.0, 0.0]
+
+    def test_find_most_similar_keeps_insertion_order_on_ties(self):
+        calculator = VectorSimilarityCalculator()
+        vectors = {"a": [0, 1], "b": [1, 0], "c": [2, 0], "d": [1, 1]}
+
+        results = calculator.find_most_similar(vectors, [1, 0], top_k=3)
+
+        assert [r["id"] for r in results] == ["b", "c", "d"]
+        assert calculator.find_most_similar({}, [1, 0]) == []
+
+
+class TestVectorStore:
+    """Test matrix-backed VectorStore search."""
+
+    def test_search_similar_matches_reference_ranking(self, monkeypatch):
+        monkeypatch.setattr(vector_tools, "SEARCH_BLOCK_ROWS", 64)
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((500, 16))
+        store = VectorStore(dimension=16)
+        for i, vector in enumerate(vectors):
+            store.add_vector(f"v{i}", vector.tolist(), {"i": i})
+
+        query = rng.standard_normal(16)
+        results = store.search_similar(query.tolist(), top_k=10)
+
+        assert [int(r["id"][1:]) for r in results] == _reference_ranking(vectors, query, 10)
+        assert results[0]["metadata"] == {"i": int(results[0]["id"][1:])}
+
+    def test_search_many_matches_single_queries(self):
+        rng = np.random.default_rng(1)
+        store = VectorStore(dimension=8)
+        for i in range(100):
+            store.add_vector(f"v{i}", rng.standard_normal(8).tolist())
+
+        queries = rng.standard_normal((5, 8)).tolist()
+        batched = store.search_many(queries, top_k=7)
+
+        single = [store.search_similar(q, top_k=7) for q in queries]
+        assert [[r["id"] for r in hits] for hits in batched] == [
+            [r["id"] for r in hits] for hits in single
+        ]
+        assert [r["similarity"] for r in batched[0]] == pytest.approx(
+            [r["similarity"] for r in single[0]], abs=1e-6
+        )
+        assert store.search_many(queries, top_k=0) == [[]] * 5
+
+    def test_overwrite_and_vectors_view(self):
+        store = VectorStore(dimension=2)
+        store.add_vector("v1", [3.0, 4.0])
+        store.add_vector("v2", [0.0, 1.0])
+        store.add_vector("v1", [1.0, 0.0])
+
+        assert len(store.vectors) == 2
+        assert list(store.vectors) == ["v1", "v2"]
+        np.testing.assert_allclose(store.vectors["v1"], [1.0, 0.0])
+        assert store.search_similar([1.0, 0.0], top_k=1)[0]["id"] == "v1"
+
+    def test_float16_storage(self):
+        rng = np.random.default_rng(2)
+        vectors = rng.standard_normal((200, 32))
+        store = VectorStore(dimension=32, storage_dtype="float16")
+        for i, vector in enumerate(vectors):
+            store.add_vector(f"v{i}", vector.tolist())
+
+        query = rng.standard_normal(32)
+        results = store.search_similar(query.tolist(), top_k=5)
+
+        assert store._matrix.dtype == np.float16
+        assert int(results[0]["id"][1:]) == _reference_ranking(vectors, query, 1)[0]
+        with pytest.raises(ValueError):
+            VectorStore(dimension=4, storage_dtype="int8")
+
+    def test_query_dimension_mismatch_returns_empty(self):
+        store = VectorStore(dimension=3)
+        store.add_vector("v1", [1.0, 0.0, 0.0])
+
+        assert store.search_similar([1.0, 0.0], top_k=1) == []
+        assert store.add_vector("v2", [1.0])["status"] == "error"
@@ -0,0 +1,262 @@
+"""KuboHTTPBackend against a local stand-in for the Kubo RPC API."""
+
+import io
+import json
+import tarfile
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ipfs_datasets_py import ipfs_backend_router
+from ipfs_datasets_py.ipfs_backend_router import KuboHTTPBackend
+from ipfs_datasets_py.knowledge_graphs.storage.ipld_store import (
+    GraphStoreError,
+    IPLDGraphStore,
+    RouterBlockBackend,
+    compute_cid_v1,
+)
+
+
+def _multipart_parts(body: bytes, content_type: str) -> list:
+    boundary = content_type.split("boundary=", 1)[1].encode()
+    parts = []
+    for part in body.split(b"--" + boundary)[1:]:
+        if part.startswith(b"--"):
+            break
+        head, _, data = part.partition(b"\r\n\r\n")
+        filename = head.split(b'filename="', 1)[1].split(b'"', 1)[0].decode()
+        parts.append((urllib.parse.unquote(filename), data[:-2]))
+    return parts
+
+
+def _multipart_files(body: bytes, content_type: str) -> list:
+    return [data for _, data in _multipart_parts(body, content_type)]
+
+
+class _FakeKubo(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status: int, data: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        state = self.server.state
+        url = urllib.parse.urlsplit(self.path)
+        params = dict(urllib.parse.parse_qsl(url.query))
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        command = url.path[len("/api/v0/") :]
+        with state["lock"]:
+            state["requests"].append(command)
+            state["clients"].add(self.client_address)
+
+        if command == "block/put":
+            lines = []
+            for data in _multipart_files(body, self.headers["Content-Type"]):
+                cid = compute_cid_v1(data, codec=params.get("cid-codec", "raw"))
+                state["blocks"][cid] = data
+                lines.append(json.dumps({"Key": cid, "Size": len(data)}))
+            self._reply(200, ("\n".join(lines) + "\n").encode())
+        elif command == "block/get" and params["arg"] in state["blocks"]:
+            self._reply(200, state["blocks"][params["arg"]])
+        elif command == "block/get":
+            self._reply(500, json.dumps({"Message": "block was not found locally"}).encode())
+        elif command == "add":
+            lines = []
+            for name, data in _multipart_parts(body, self.headers["Content-Type"]):
+                state["added"][name] = data
+                lines.append(json.dumps({"Name": name, "Hash": compute_cid_v1(data)}))
+            self._reply(200, ("\n".join(lines) + "\n").encode())
+        elif command == "get":
+            self._reply(200, state["archives"][params["arg"]])
+        elif command == "pin/add":
+            state["pins"].add(params["arg"])
+            self._reply(200, json.dumps({"Pins": [params["arg"]]}).encode())
+        else:
+            self._reply(404, b"404 page not found")
+
+
+@pytest.fixture
+def kubo():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeKubo)
+    server.daemon_threads = True
+    server.state = {
+        "lock": threading.Lock(),
+        "requests": [],
+        "clients": set(),
+        "blocks": {},
+        "pins": set(),
+        "added": {},
+        "archives": {},
+    }
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _backend(server, **kwargs) -> KuboHTTPBackend:
+    host, port = server.server_address
+    return KuboHTTPBackend(f"/ip4/{host}/tcp/{port}", **kwargs)
+
+
+def test_put_many_batches_and_get_many_reuses_connections(kubo):
+    backend = _backend(kubo, pool_size=4, batch_size=256)
+    blocks = [f"block-{i}".encode() for i in range(600)]
+
+    cids = backend.block_put_many(blocks)
+    fetched = backend.block_get_many(cids)
+    backend.close()
+
+    assert cids == [compute_cid_v1(data) for data in blocks]
+    assert fetched == blocks
+    requests = kubo.state["requests"]
+    assert requests.count("block/put") == 3 and requests.count("block/get") == 600
+    # 603 requests over keep-alive connections from a pool of four.
+    assert len(kubo.state["clients"]) <= 4
+
+
+def test_rpc_errors_surface_daemon_message(kubo):
+    backend = _backend(kubo)
+    with pytest.raises(RuntimeError, match="not found"):
+        backend.block_get(compute_cid_v1(b"missing"))
+
+    with pytest.raises(GraphStoreError) as err:
+        RouterBlockBackend(backend).get_block(compute_cid_v1(b"missing"))
+    assert err.value.code == "NOT_FOUND"
+    backend.close()
+
+
+def test_router_many_helpers_fall_back_to_single_calls():
+    class SingleCallBackend:
+        def __init__(self):
+            self.blocks = {}
+
+        def block_put(self, data, *, codec="raw"):
+            cid = compute_cid_v1(data, codec=codec)
+            self.blocks[cid] = data
+            return cid
+
+        def block_get(self, cid):
+            return self.blocks[cid]
+
+    backend = SingleCallBackend()
+    cids = ipfs_backend_router.block_put_many([b"a", b"b"], backend_instance=backend)
+
+    assert ipfs_backend_router.block_get_many(cids, backend_instance=backend) == [b"a", b"b"]
+
+
+def test_router_block_backend_put_blocks_uses_one_request(kubo):
+    blocks = [f"row-{i}".encode() for i in range(50)]
+    backend = RouterBlockBackend(_backend(kubo))
+
+    cids = backend.put_blocks(blocks, codec="raw")
+
+    assert cids == [compute_cid_v1(data) for data in blocks]
+    assert backend.get_blocks(cids) == blocks
+    assert kubo.state["requests"].count("block/put") == 1
+    backend.close()
+
+
+def test_graph_store_import_car_uses_batched_puts(kubo):
+    pytest.importorskip("ipld_car")
+    source = IPLDGraphStore.open_memory()
+    children = [source.put(f"row-{i}".encode()).cid for i in range(50)]
+    root = source.put_dag_cbor({"rows": children}).cid
+    car = source.export_car(root)
+
+    host, port = kubo.server_address
+    store = IPLDGraphStore.open_kubo_http(f"http://{host}:{port}")
+    assert store.import_car(car) == [root]
+    store.close()
+
+    assert kubo.state["requests"].count("block/put") == 2  # one per codec
+    assert root in kubo.state["pins"]
+    assert set(children) <= set(kubo.state["blocks"])
+
+
+def test_add_path_streams_files_from_disk(kubo, tmp_path, monkeypatch):
+    root = tmp_path / "docs"
+    (root / "sub").mkdir(parents=True)
+    (root / "a.txt").write_bytes(b"alpha" * 1000)
+    (root / "sub" / "b.bin").write_bytes(bytes(range(256)) * 40)
+    sent_chunks = []
+    original_iter = ipfs_backend_router._MultipartBody.__iter__
+
+    def recording_iter(body):
+        body._chunk_size = 1024
+        for chunk in original_iter(body):
+            sent_chunks.append(len(chunk))
+            yield chunk
+
+    monkeypatch.setattr(ipfs_backend_router._MultipartBody, "__iter__", recording_iter)
+    backend = _backend(kubo)
+
+    root_cid = backend.add_path(str(root))
+    backend.close()
+
+    added = kubo.state["added"]
+    assert added["docs/a.txt"] == b"alpha" * 1000
+    assert added["docs/sub/b.bin"] == bytes(range(256)) * 40
+    assert set(added) == {"docs", "docs/a.txt", "docs/sub", "docs/sub/b.bin"}
+    assert root_cid == compute_cid_v1(b"")
+    # File contents went out in chunk_size pieces, never as whole files
+    assert max(sent_chunks) <= 1024 and sum(sent_chunks) > 15000
+
+
+def test_multipart_body_length_matches_stream_and_is_reiterable(tmp_path):
+    path = tmp_path / "f.bin"
+    path.write_bytes(b"x" * 5000)
+    body = ipfs_backend_router._MultipartBody(
+        [("dir", b"", "application/x-directory"), ("dir/f.bin", str(path), "application/octet-stream")],
+        chunk_size=512,
+    )
+
+    first = b"".join(body)
+
+    assert len(first) == len(body)
+    assert b"".join(body) == first
+    assert [data for _, data in _multipart_parts(first, body.content_type)] == [b"", b"x" * 5000]
+
+
+def _tar(members: dict) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as archive:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def test_get_to_path_extracts_under_output_path(kubo, tmp_path):
+    kubo.state["archives"]["bafydir"] = _tar({"bafydir/a.txt": b"a", "bafydir/sub/b.txt": b"b"})
+    backend = _backend(kubo)
+
+    backend.get_to_path("bafydir", output_path=str(tmp_path / "out"))
+    backend.close()
+
+    assert (tmp_path / "out" / "a.txt").read_bytes() == b"a"
+    assert (tmp_path / "out" / "sub" / "b.txt").read_bytes() == b"b"
+
+
+@pytest.mark.parametrize("name", ["bafyevil/../../escaped.txt", "bafyevil//tmp/escaped.txt"])
+def test_get_to_path_rejects_members_outside_output_path(kubo, tmp_path, name):
+    kubo.state["archives"]["bafyevil"] = _tar({name: b"x"})
+    backend = _backend(kubo)
+
+    with pytest.raises(ValueError, match="outside"):
+        backend.get_to_path("bafyevil", output_path=str(tmp_path / "out" / "inner"))
+    backend.close()
+
+    assert not (tmp_path / "escaped.txt").exists()
+    assert not (tmp_path / "out" / "escaped.txt").exists()
@@ -136,3 +136,46 @@ def test_metadata_filter_and_deterministic_ties(store: ExactVectorStore) -> None
     cosine_hits = store.search("col", [1.0, 0.0], k=1, metric="cosine")
     assert cosine_hits[0].vector_id == "z-last"
     assert cosine_hits[0].distance == pytest.approx(0.0, abs=1e-5)
+
+
+@pytest.mark.parametrize("metric", ["l2", "cosine"])
+def test_numpy_scan_engine_matches_python_scan(tmp_path: Path, metric: str) -> None:
+    pytest.importorskip("numpy")
+    import random
+
+    rng = random.Random(21)
+    vectors = {
+        f"v{i:03d}": [float(rng.randint(-3, 3)) for _ in range(4)] for i in range(120)
+    }
+    # Duplicates and a zero vector force exact ties at the top-k boundary.
+    vectors["dup-a"] = list(vectors["v007"])
+    vectors["dup-b"] = list(vectors["v007"])
+    vectors["zero"] = [0.0, 0.0, 0.0, 0.0]
+    stores = {
+        engine: ExactVectorStore(tmp_path / f"{engine}.duckdb", scan_engine=engine)
+        for engine in ("numpy", "python")
+    }
+    try:
+        for s in stores.values():
+            s.create_collection("col", dimension=4)
+            for i, (vid, vals) in enumerate(vectors.items()):
+                s.upsert_vector("col", vid, vals, metadata={"odd": i % 2})
+        for query in ([1.0, 0.0, -1.0, 2.0], list(vectors["v007"]), [0.0] * 4):
+            for k in (1, 5, 17, 500):
+                for flt in (None, {"odd": 1}):
+                    got, want = (
+                        stores[engine].search(
+                            "col", query, k=k, metric=metric, metadata_filter=flt
+                        )
+                        for engine in ("numpy", "python")
+                    )
+                    assert got == want
+    finally:
+        for s in stores.values():
+            s.close()
+
+
+def test_unknown_scan_engine_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ExactVectorStoreError) as exc:
+        ExactVectorStore(tmp_path / "x.duckdb", scan_engine="gpu")
+    assert exc.value.code == "ENGINE"
@@ -245,3 +245,97 @@ def test_query_dimension_mismatch_rejected(exact: ExactVectorStore) -> None:
     with pytest.raises(VSSIndexError) as exc:
         idx.search([1.0, 0.0], k=1)
     assert exc.value.code == "DIM"
+
+
+# ---------------------------------------------------------------------------
+# IVF-flat accelerated path, id-keyed identity binding, sampled recall
+# ---------------------------------------------------------------------------
+
+
+def _grid_vectors(n: int) -> dict[str, list[float]]:
+    import random
+
+    rng = random.Random(22)
+    return {
+        f"v{i:04d}": [rng.uniform(-10.0, 10.0) for _ in range(3)] for i in range(n)
+    }
+
+
+def test_recall_check_is_sampled(
+    exact: ExactVectorStore, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    idx = VSSIndex(
+        exact=exact,
+        collection_id="col",
+        dimension=3,
+        extension_probe=lambda: True,
+        recall_sample_interval=4,
+    )
+    idx.build(_grid_vectors(50))
+    calls: list[int] = []
+    original = exact.search
+
+    def _counting_search(*args, **kwargs):
+        calls.append(kwargs.get("k", 0))
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(exact, "search", _counting_search)
+    results = [idx.search([float(i), 0.0, 0.0], k=3) for i in range(8)]
+    assert [r.recall_sampled for r in results] == [True, False, False, False] * 2
+    # Exact authority runs only for sampled queries — identity binding is an
+    # id-keyed lookup, never a per-hit search.
+    assert len(calls) == 2
+    assert all(not r.used_fallback for r in results)
+    assert all(r.recall_estimate == 1.0 for r in results)
+
+
+def test_ivf_hits_bind_identity_by_id(exact: ExactVectorStore) -> None:
+    from ipfs_datasets_py.vector_stores.duckdb_exact import vector_digest
+
+    vectors = _grid_vectors(600)
+    idx = VSSIndex(
+        exact=exact,
+        collection_id="col",
+        dimension=3,
+        extension_probe=lambda: True,
+        nprobe=2,
+    )
+    idx.build(vectors)
+    query = vectors["v0123"]
+    result = idx.search(query, k=5)
+    assert idx._ann["l2"].nlist > 1
+    assert result.hits[0].vector_id == "v0123"
+    assert result.hits[0].distance == pytest.approx(0.0, abs=1e-6)
+    for hit in result.hits:
+        assert hit.generation_id == 1
+        assert hit.content_digest == vector_digest(vectors[hit.vector_id])
+    # Tombstoned IDs are masked out of the IVF lists immediately.
+    idx.tombstone("v0123")
+    idx.compact()
+    assert "v0123" not in {h.vector_id for h in idx.search(query, k=5).hits}
+
+
+def test_low_recall_raises_nprobe_before_falling_back(exact: ExactVectorStore) -> None:
+    vectors = _grid_vectors(600)
+    idx = VSSIndex(
+        exact=exact,
+        collection_id="col",
+        dimension=3,
+        extension_probe=lambda: True,
+        nprobe=1,
+    )
+    idx.build(vectors)
+    # One list of ~67 rows cannot hold the exact top 60 of an off-centre query
+    result = idx.search([9.0, 9.0, 9.0], k=60)
+    ann = idx._ann["l2"]
+    assert ann.nlist > 1
+    assert 1 < idx._probe["l2"] <= ann.nlist
+    assert result.recall_sampled
+    assert not result.used_fallback
+    assert result.recall_estimate >= DEFAULT_RECALL_THRESHOLD
+    # The raised nprobe is kept until the next materialization change
+    probe = idx._probe["l2"]
+    idx.search([9.0, 9.0, 9.0], k=60)
+    assert idx._probe["l2"] == probe
+    idx.rebuild()
+    assert idx._probe == {}
@@ -238,6 +238,122 @@ class TestIPLDVectorStoreMetadata:
         # All results should have category A
         assert all(r.metadata.get("category") == "A" for r in results if r.metadata)
 
+    @pytest.mark.asyncio
+    async def test_selective_filter_returns_top_k(self):
+        """Test that a selective filter still fills top_k when enough rows match."""
+        config = create_ipld_config("test", 32, use_ipfs_router=False, use_embeddings_router=False)
+        store = IPLDVectorStore(config)
+        await store.create_collection("test", 32)
+
+        rng = np.random.default_rng(0)
+        embeddings = [
+            EmbeddingResult(
+                chunk_id=f"vec_{i}",
+                content=f"Doc {i}",
+                embedding=rng.standard_normal(32).tolist(),
+                metadata={"shard": i % 100, "tags": [i % 2]},
+            )
+            for i in range(1000)
+        ]
+        await store.add_embeddings(embeddings, "test")
+
+        query = rng.standard_normal(32).tolist()
+        results = await store.search(
+            query, top_k=10, collection_name="test", filter_dict={"shard": 7}
+        )
+        assert len(results) == 10
+        assert all(r.metadata["shard"] == 7 for r in results)
+
+        # Broad filters (including unhashable values) match the unfiltered ranking
+        everything = await store.search(query, top_k=1000, collection_name="test")
+        expected = [r.chunk_id for r in everything if r.metadata["tags"] == [0]][:10]
+        broad = await store.search(
+            query, top_k=10, collection_name="test", filter_dict={"tags": [0]}
+        )
+        assert [r.chunk_id for r in broad] == expected
+
+    @pytest.mark.asyncio
+    async def test_filter_index_tracks_deletes(self):
+        """Test that deleted vectors drop out of the matrix and the filter index."""
+        config = create_ipld_config("test", 16, use_ipfs_router=False, use_embeddings_router=False)
+        store = IPLDVectorStore(config)
+        await store.create_collection("test", 16)
+
+        embeddings = [
+            EmbeddingResult(
+                chunk_id=f"vec_{i}",
+                content=f"Doc {i}",
+                embedding=np.random.rand(16).tolist(),
+                metadata={"category": "A" if i % 2 else "B"},
+            )
+            for i in range(20)
+        ]
+        await store.add_embeddings(embeddings, "test")
+        for i in range(0, 20, 3):
+            assert await store.delete_by_id(f"vec_{i}", "test")
+
+        assert store.vectors["test"].shape == (13, 16)
+        results = await store.search(
+            np.random.rand(16).tolist(), top_k=20, collection_name="test",
+            filter_dict={"category": "A"},
+        )
+        assert sorted(r.chunk_id for r in results) == sorted(
+            f"vec_{i}" for i in range(20) if i % 2 and i % 3
+        )
+
+    @pytest.mark.asyncio
+    async def test_delete_with_short_cid_list(self):
+        """Test deletes in a collection whose cids list is shorter than its rows."""
+        config = create_ipld_config("test", 8, use_ipfs_router=False, use_embeddings_router=False)
+        store = IPLDVectorStore(config)
+        await store.create_collection("test", 8)
+
+        embeddings = [
+            EmbeddingResult(chunk_id=f"vec_{i}", content=f"Doc {i}", embedding=np.random.rand(8).tolist())
+            for i in range(6)
+        ]
+        await store.add_embeddings(embeddings, "test")
+        store.cids["test"] = ["cid_0", "cid_1", "cid_2"]
+
+        assert await store.delete_by_id("vec_5", "test")
+        assert await store.delete_by_id("vec_1", "test")
+        assert await store.delete_by_id("vec_0", "test")
+
+        assert store.vector_ids["test"] == ["vec_3", "vec_4", "vec_2"]
+        assert store.cids["test"] == [None, None, "cid_2"]
+        assert store.vectors["test"].shape == (3, 8)
+
+    @pytest.mark.asyncio
+    async def test_l2_filtered_scores_match_unfiltered(self):
+        """Test a pre-filtered L2 hit scores the same as in an unfiltered search."""
+        config = create_ipld_config(
+            "test", 8, distance_metric="l2", use_ipfs_router=False, use_embeddings_router=False
+        )
+        store = IPLDVectorStore(config)
+        await store.create_collection("test", 8)
+
+        embeddings = [
+            EmbeddingResult(
+                chunk_id=f"vec_{i}",
+                content=f"Doc {i}",
+                embedding=np.full(8, float(i)).tolist(),
+                metadata={"category": "B" if i == 3 else "A"}
+            )
+            for i in range(20)
+        ]
+        await store.add_embeddings(embeddings, "test")
+
+        query = np.zeros(8).tolist()
+        unfiltered = await store.search(query, top_k=20, collection_name="test")
+        filtered = await store.search(
+            query, top_k=5, collection_name="test", filter_dict={"category": "B"}
+        )
+
+        expected = next(r.score for r in unfiltered if r.chunk_id == "vec_3")
+        assert [r.chunk_id for r in filtered] == ["vec_3"]
+        assert filtered[0].score == pytest.approx(expected)
+        assert expected == pytest.approx(72.0)
+
     @pytest.mark.asyncio
     async def test_get_collection_info(self):
         """Test getting collection information."""
@@ -14,8 +14,13 @@ from ipfs_datasets_py.logic.TDFOL import (
     Variable,
     BinaryFormula,
     LogicOperator,
+    create_disjunction,
     create_implication,
+    create_negation,
+    create_obligation,
+    create_permission,
 )
+from ipfs_datasets_py.logic.TDFOL.inference_rules.deontic import ContraryToDutyRule
 from ipfs_datasets_py.logic.TDFOL.tdfol_prover import ProofStatus
 
 
@@ -281,5 +286,125 @@ class TestForwardChainingApplyRules:
         assert len(new_formulas) == 0
 
 
+class _CountingModusPonens:
+    """Modus ponens that records every premise pair it is offered."""
+
+    name = "CountingModusPonens"
+    premise_shapes = (None, LogicOperator.IMPLIES)
+
+    def __init__(self):
+        self.calls = []
+
+    def can_apply(self, *formulas):
+        self.calls.append(formulas)
+        return (
+            len(formulas) == 2
+            and formulas[1].operator == LogicOperator.IMPLIES
+            and formulas[1].left == formulas[0]
+        )
+
+    def apply(self, *formulas):
+        return formulas[1].right
+
+
+class TestForwardChainingSemiNaive:
+    """Tests for semi-naive evaluation and rule indexing."""
+
+    @staticmethod
+    def _chain_kb(length):
+        kb = TDFOLKnowledgeBase()
+        preds = [Predicate(f"P{i}", (Constant("a"),)) for i in range(length + 1)]
+        kb.add_axiom(preds[0])
+        for left, right in zip(preds, preds[1:]):
+            kb.add_axiom(create_implication(left, right))
+        return kb, preds
+
+    def test_long_chain_is_proved(self):
+        # GIVEN an implication chain longer than the old 20-formula pairing cap
+        kb, preds = self._chain_kb(25)
+        strategy = ForwardChainingStrategy()
+
+        # WHEN proving the end of the chain
+        result = strategy.prove(preds[-1], kb, timeout_ms=2000)
+
+        # THEN it is proved, ending with a modus ponens step
+        assert result.is_proved()
+        assert result.proof_steps[-1].formula == preds[-1]
+        assert result.proof_steps[-1].rule_name == "ModusPonens"
+
+    def test_each_premise_pair_is_tried_once(self):
+        # GIVEN a counting rule indexed on an implication second premise
+        kb, preds = self._chain_kb(10)
+        rule = _CountingModusPonens()
+        strategy = ForwardChainingStrategy(rules=[rule])
+
+        # WHEN proving the end of the chain
+        result = strategy.prove(preds[-1], kb)
+
+        # THEN no pair is offered twice and the second premise is always an implication
+        assert result.is_proved()
+        assert len(rule.calls) == len(set(rule.calls))
+        assert all(pair[1].operator == LogicOperator.IMPLIES for pair in rule.calls)
+
+    def test_apply_rules_only_joins_frontier(self):
+        # GIVEN a derived set whose old part has already been saturated
+        p, q = Predicate("P", ()), Predicate("Q", ())
+        rule = _CountingModusPonens()
+        strategy = ForwardChainingStrategy(rules=[rule])
+        old = [p, create_implication(p, q)]
+
+        # WHEN the frontier holds a formula no rule can use
+        new = strategy._apply_rules([Predicate("R", ())], old + [Predicate("R", ())], [])
+
+        # THEN the old pair P, P → Q is not re-joined
+        assert new == []
+        assert (p, create_implication(p, q)) not in rule.calls
+
+    def test_max_derived_stops_search(self):
+        # GIVEN a chain that needs more derivations than allowed
+        kb, preds = self._chain_kb(10)
+        strategy = ForwardChainingStrategy(max_derived=3)
+
+        # WHEN proving the end of the chain
+        result = strategy.prove(preds[-1], kb)
+
+        # THEN the search stops without a proof
+        assert result.status == ProofStatus.UNKNOWN
+        assert "3 formulas" in result.message
+
+    def test_introduction_rule_with_premise_outside_goal(self):
+        # GIVEN P(A) is only reachable from O(A), and P(A) is not a subformula of P(A ∨ B)
+        a, b = Predicate("A", ()), Predicate("B", ())
+        kb = TDFOLKnowledgeBase()
+        kb.add_axiom(create_obligation(a))
+        kb.add_axiom(b)
+        goal = create_permission(create_disjunction(a, b))
+
+        # WHEN proving P(A ∨ B)
+        result = ForwardChainingStrategy().prove(goal, kb, timeout_ms=5000)
+
+        # THEN permission strengthening is still applied to the derived P(A)
+        assert result.is_proved()
+        assert result.proof_steps[-1].rule_name == "PermissionStrengthening"
+
+    def test_three_premise_rule_is_applied(self):
+        # GIVEN a violated obligation and a reparation formula
+        a, r = Predicate("A", ()), Predicate("R", ())
+        kb = TDFOLKnowledgeBase()
+        kb.add_axiom(create_obligation(a))
+        kb.add_axiom(create_negation(a))
+        kb.add_axiom(r)
+        strategy = ForwardChainingStrategy(rules=[ContraryToDutyRule()])
+
+        # WHEN proving the reparation obligation
+        result = strategy.prove(create_obligation(r), kb, timeout_ms=2000)
+
+        # THEN the contrary-to-duty rule fires on all three premises
+        assert result.is_proved()
+        step = result.proof_steps[-1]
+        assert step.rule_name == "ContraryToDuty"
+        assert step.premises == [create_obligation(a), create_negation(a), r]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -228,6 +228,43 @@ class TestKnowledgeBase:
         # THEN it should include both
         assert predicates == {"P", "Q"}
 
+    def test_fingerprint_is_order_independent(self):
+        """Test that the KB fingerprint ignores insertion order."""
+        # GIVEN two knowledge bases with the same formulas in different orders
+        p, q = Predicate("P", ()), Predicate("Q", ())
+        first, second = TDFOLKnowledgeBase(), TDFOLKnowledgeBase()
+        first.add_axiom(p)
+        first.add_axiom(q)
+        second.add_axiom(q)
+        second.add_axiom(p)
+
+        # THEN their fingerprints match, and match a KB built in one go
+        assert first.fingerprint == second.fingerprint
+        assert TDFOLKnowledgeBase(axioms=[q, p]).fingerprint == first.fingerprint
+
+    def test_fingerprint_tracks_changes(self):
+        """Test that the fingerprint changes with axioms, theorems and direct edits."""
+        # GIVEN a knowledge base with one axiom
+        kb = TDFOLKnowledgeBase()
+        p = Predicate("P", ())
+        kb.add_axiom(p)
+        seen = {kb.fingerprint}
+
+        # WHEN the same formula is added as a theorem
+        kb.add_theorem(p)
+        # THEN the fingerprint differs from the axiom-only one
+        assert kb.fingerprint not in seen
+        seen.add(kb.fingerprint)
+
+        # WHEN the axiom list is appended to directly
+        kb.axioms.append(Predicate("Q", ()))
+        # THEN the fingerprint is recomputed
+        assert kb.fingerprint not in seen
+        incremental = kb.fingerprint
+        kb.add_axiom(Predicate("R", ()))
+        rebuilt = TDFOLKnowledgeBase(axioms=list(kb.axioms), theorems=list(kb.theorems))
+        assert kb.fingerprint == rebuilt.fingerprint != incremental
+
 
 class TestComplexFormulas:
     """Test complex combined formulas."""
@@ -200,6 +200,27 @@ class TestTDFOLProofCache:
         stats = cache.get_stats()
         assert stats["hits"] >= 1
 
+    def test_prover_cache_key_follows_kb_fingerprint(self):
+        """Test the prover keys cache entries on the KB fingerprint."""
+        from ipfs_datasets_py.logic.TDFOL import TDFOLKnowledgeBase
+
+        clear_global_proof_cache()
+        p, q = Predicate("P", ()), Predicate("Q", ())
+        kb = TDFOLKnowledgeBase()
+        kb.add_axiom(p)
+        kb.add_axiom(q)
+        prover = TDFOLProver(kb, enable_cache=True)
+
+        result = prover.prove(q, timeout_ms=1000)
+
+        cache = get_global_proof_cache()
+        assert cache.get(q, kb_fingerprint=kb.fingerprint) is result
+        # Same axioms in another order share the entry; a changed KB does not.
+        reordered = TDFOLKnowledgeBase(axioms=[q, p])
+        assert cache.get(q, kb_fingerprint=reordered.fingerprint) is result
+        kb.add_axiom(Predicate("R", ()))
+        assert cache.get(q, kb_fingerprint=kb.fingerprint) is None
+
     def test_prover_without_cache(self):
         """Test TDFOLProver works without cache."""
         from ipfs_datasets_py.logic.TDFOL import create_implication, TDFOLKnowledgeBase
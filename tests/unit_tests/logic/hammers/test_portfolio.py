@@ -19,6 +19,9 @@ These tests cover:
   (command, input digest, raw output digest, solver trace) — all exercised
   against an injected fake process runner so these tests never depend on a
   real Z3/CVC5/Vampire/E installation.
+- :class:`SolverPortfolioRuntime`: the long-lived batch runtime's shared
+  concurrency bound across simultaneous runs, scratch-file reuse,
+  cancellation of losing stub solver scripts, and lifecycle errors.
 - The security invariant that translated theorem content is never placed
   into a subprocess argv, only into a temporary file whose path appears in
   the command.
@@ -56,6 +59,7 @@ from ipfs_datasets_py.logic.hammers.portfolio import (
     PortfolioAttemptSpec,
     PortfolioRunResult,
     SolverPortfolio,
+    SolverPortfolioRuntime,
     SolverProcessOutcome,
     build_solver_input_text,
     parse_smtlib_verdict,
@@ -120,6 +124,17 @@ def _make_fake_executable(path) -> str:
     return path
 
 
+def _make_stub_solver(path, body: str) -> str:
+    """Create an executable ``/bin/sh`` stub solver at ``path`` running
+    ``body`` (``$1`` is the input file path) and return its path."""
+
+    path = str(path)
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write(f"#!/bin/sh\n{body}\n")
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC | stat.S_IXGRP | stat.S_IXOTH)
+    return path
+
+
 def _allow_policy(*solvers: str, timeout_seconds: float = 30.0) -> HammerPolicy:
     return HammerPolicy(timeout_seconds=timeout_seconds, allowed_solvers=list(solvers))
 
@@ -750,6 +765,183 @@ class TestSolverPortfolioRun:
         assert not hasattr(PortfolioRunResult, "verified")
 
 
+# ---------------------------------------------------------------------------
+# SolverPortfolioRuntime
+# ---------------------------------------------------------------------------
+
+
+def _stub_z3_runner(command, *, budget, cancel_event=None):
+    # The runtime passes z3 its input path last (``-smt2 -T:N path``).
+    return run_bounded_solver_process(
+        [command[0], command[-1]], budget=budget, cancel_event=cancel_event
+    )
+
+
+class TestSolverPortfolioRuntime:
+    def test_runs_stub_solver_across_goals_reusing_one_input_file(self, tmp_path):
+        stub = _make_stub_solver(tmp_path / "z3", 'grep -q "assert" "$1" && echo unsat')
+        policy = PortfolioPolicy(
+            hammer_policy=_allow_policy("z3"), executable_overrides={"z3": stub}
+        )
+        with SolverPortfolioRuntime(
+            policy,
+            max_concurrent_processes=1,
+            process_runner=_stub_z3_runner,
+            version_prober=lambda *_: "stub",
+        ) as runtime:
+            results = [
+                runtime.run(
+                    f"req-{i}",
+                    [
+                        PortfolioAttemptSpec(
+                            translation=_smt_translation(translation_id=f"t-{i}"),
+                            solver_name="z3",
+                        )
+                    ],
+                )
+                for i in range(3)
+            ]
+            input_paths = {
+                evidence.command[-1]
+                for result in results
+                for evidence in result.evidence.values()
+            }
+            scratch_dir = os.path.dirname(next(iter(input_paths)))
+            assert os.listdir(scratch_dir) != []
+
+        assert [result.attempts[0].verdict for result in results] == [SolverVerdict.UNSAT] * 3
+        assert len(input_paths) == 1
+        assert next(iter(input_paths)).endswith(".smt2")
+        assert not os.path.exists(scratch_dir)
+
+    def test_bounds_concurrency_across_simultaneous_runs(self, tmp_path):
+        fake_z3 = _make_fake_executable(tmp_path / "z3")
+        policy = PortfolioPolicy(
+            hammer_policy=_allow_policy("z3"),
+            executable_overrides={"z3": fake_z3},
+            max_parallel_processes=4,
+        )
+        state = {"current": 0, "max": 0}
+        lock = threading.Lock()
+
+        def _runner(command, *, budget, cancel_event=None):
+            with lock:
+                state["current"] += 1
+                state["max"] = max(state["max"], state["current"])
+            time.sleep(0.02)
+            with lock:
+                state["current"] -= 1
+            return SolverProcessOutcome(command=command, stdout="unknown\n")
+
+        results = {}
+        with SolverPortfolioRuntime(
+            policy,
+            max_concurrent_processes=2,
+            process_runner=_runner,
+            version_prober=lambda *_: None,
+        ) as runtime:
+
+            def _client(client: int) -> None:
+                attempts = [
+                    PortfolioAttemptSpec(
+                        translation=_smt_translation(translation_id=f"t-{client}-{i}"),
+                        solver_name="z3",
+                    )
+                    for i in range(3)
+                ]
+                results[client] = runtime.run(f"req-{client}", attempts)
+
+            clients = [threading.Thread(target=_client, args=(c,)) for c in range(4)]
+            for thread in clients:
+                thread.start()
+            for thread in clients:
+                thread.join()
+
+        assert sorted(len(result.attempts) for result in results.values()) == [3, 3, 3, 3]
+        assert state["max"] <= 2
+
+    def test_keeps_each_run_within_the_policy_process_budget(self, tmp_path):
+        fake_z3 = _make_fake_executable(tmp_path / "z3")
+        policy = PortfolioPolicy(
+            hammer_policy=_allow_policy("z3"),
+            executable_overrides={"z3": fake_z3},
+            max_parallel_processes=1,
+        )
+        state = {"current": 0, "max": 0}
+        lock = threading.Lock()
+
+        def _runner(command, *, budget, cancel_event=None):
+            with lock:
+                state["current"] += 1
+                state["max"] = max(state["max"], state["current"])
+            time.sleep(0.02)
+            with lock:
+                state["current"] -= 1
+            return SolverProcessOutcome(command=command, stdout="unknown\n")
+
+        with SolverPortfolioRuntime(
+            policy, max_concurrent_processes=4, process_runner=_runner
+        ) as runtime:
+            attempts = [
+                PortfolioAttemptSpec(
+                    translation=_smt_translation(translation_id=f"t-{i}"), solver_name="z3"
+                )
+                for i in range(4)
+            ]
+            result = runtime.run("req-1", attempts)
+
+        assert len(result.attempts) == 4
+        assert state["max"] == 1
+
+    def test_cancels_losing_stub_solver_on_first_conclusive_verdict(self, tmp_path):
+        slow_z3 = _make_stub_solver(tmp_path / "z3", "sleep 20; echo unknown")
+        fast_cvc5 = _make_stub_solver(tmp_path / "cvc5", "echo unsat")
+        policy = PortfolioPolicy(
+            hammer_policy=_allow_policy("z3", "cvc5"),
+            executable_overrides={"z3": slow_z3, "cvc5": fast_cvc5},
+        )
+        attempts = [
+            PortfolioAttemptSpec(
+                translation=_smt_translation(translation_id="t-z3"), solver_name="z3"
+            ),
+            PortfolioAttemptSpec(
+                translation=_smt_translation(translation_id="t-cvc5"), solver_name="cvc5"
+            ),
+        ]
+        with SolverPortfolioRuntime(policy, version_prober=lambda *_: None) as runtime:
+            start = time.monotonic()
+            result = runtime.run("req-1", attempts)
+            elapsed = time.monotonic() - start
+
+        by_solver = {a.solver_name: a for a in result.attempts}
+        assert by_solver["cvc5"].verdict is SolverVerdict.UNSAT
+        assert by_solver["z3"].verdict is SolverVerdict.UNKNOWN
+        assert result.cancelled_attempt_ids == [by_solver["z3"].attempt_id]
+        assert elapsed < 10.0
+
+    def test_rejects_per_run_parent_lease_and_runs_after_close(self, tmp_path):
+        fake_z3 = _make_fake_executable(tmp_path / "z3")
+        policy = PortfolioPolicy(
+            hammer_policy=_allow_policy("z3"), executable_overrides={"z3": fake_z3}
+        )
+        runtime = SolverPortfolioRuntime(
+            policy, process_runner=lambda command, **_: SolverProcessOutcome(command=command)
+        )
+        attempts = [PortfolioAttemptSpec(translation=_smt_translation(), solver_name="z3")]
+        with pytest.raises(ValueError):
+            runtime.run("req-1", attempts, parent_lease="lease-1")
+        runtime.close()
+        runtime.close()
+        assert runtime.closed
+        with pytest.raises(RuntimeError):
+            runtime.run("req-1", attempts)
+
+    def test_rejects_non_positive_concurrency(self):
+        policy = PortfolioPolicy(hammer_policy=_allow_policy("z3"))
+        with pytest.raises(ValueError):
+            SolverPortfolioRuntime(policy, max_concurrent_processes=0)
+
+
 # ---------------------------------------------------------------------------
 # run_bounded_solver_process
 # ---------------------------------------------------------------------------
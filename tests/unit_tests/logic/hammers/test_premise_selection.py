@@ -23,6 +23,9 @@ These tests cover:
   calls.
 - `select_premises_for_theorem` is a convenience wrapper that builds the
   goal from an existing corpus entry and self-excludes it.
+- `PremiseIndex` scores only premises sharing a feature with the goal,
+  reproduces `score_candidates`' scores and order for them under the
+  default weighting, and stays consistent across incremental add/remove.
 - `PremiseSelectionResult` / `ExcludedPremise` round-trip via
   `to_dict`/`from_dict` and enforce their own invariants (rank order,
   matching corpus revision, disjoint selected/excluded sets, no duplicate
@@ -39,10 +42,12 @@ from ipfs_datasets_py.logic.hammers.corpus import CorpusManifest, CorpusSource
 from ipfs_datasets_py.logic.hammers.models import HammerPolicy, ITPKind, PremiseRecord
 from ipfs_datasets_py.logic.hammers.premise_selection import (
     DETERMINISTIC_BASELINE_METHOD,
+    DETERMINISTIC_IDF_METHOD,
     ExcludedPremise,
     GoalFeatures,
     InvalidTopKError,
     PremiseExclusionReason,
+    PremiseIndex,
     PremiseSelectionError,
     PremiseSelectionResult,
     PremiseSelectionWeights,
@@ -53,6 +58,7 @@ from ipfs_datasets_py.logic.hammers.premise_selection import (
     select_premises,
     select_premises_for_theorem,
 )
+from ipfs_datasets_py.logic.hammers.premise_selection import _expand_imports_one_hop
 
 
 # ---------------------------------------------------------------------------
@@ -551,6 +557,153 @@ class TestSelectPremisesForTheorem:
             select_premises_for_theorem(manifest, "does-not-exist", top_k=5)
 
 
+# ---------------------------------------------------------------------------
+# PremiseIndex
+# ---------------------------------------------------------------------------
+
+
+def add_unrelated_premise(manifest: CorpusManifest) -> CorpusManifest:
+    manifest.add_theorem(
+        theorem_id="Unrelated.thm",
+        corpus_id="mathlib4",
+        statement="theorem unrelated : Xyzzy.plugh = Xyzzy.plugh",
+        imports=["Some.Other.Module"],
+    )
+    return manifest
+
+
+class TestPremiseIndex:
+    def test_matches_score_candidates_on_touched_premises(self):
+        manifest = add_unrelated_premise(populate_manifest(make_manifest()))
+        goal = make_goal()
+        index = PremiseIndex.from_manifest(manifest)
+        indexed = score_candidates(goal, manifest, index=index)
+        baseline = score_candidates(goal, manifest)
+        assert indexed == [c for c in baseline if c.theorem_id in {i.theorem_id for i in indexed}]
+        assert "Unrelated.thm" not in {c.theorem_id for c in indexed}
+        assert {c.theorem_id for c in baseline} - {c.theorem_id for c in indexed} == {
+            "Unrelated.thm"
+        }
+
+    def test_graph_expansion_matches_manifest_scan(self):
+        manifest = populate_manifest(make_manifest())
+        index = PremiseIndex.from_manifest(manifest)
+        goal_imports = frozenset(["Mathlib.Algebra.Group.Defs", "Mathlib.Data.List.Basic"])
+        assert index.expand_imports(goal_imports) == _expand_imports_one_hop(
+            goal_imports, manifest
+        )
+
+    def test_incremental_add_and_remove_match_rebuild(self):
+        manifest = populate_manifest(make_manifest())
+        index = PremiseIndex(
+            entry for entry in manifest.iter_theorems() if entry.theorem_id != "Nat.add_assoc"
+        )
+        index.add(manifest.get_theorem("Nat.add_assoc"))
+        goal = make_goal()
+        assert index.score(goal) == PremiseIndex.from_manifest(manifest).score(goal)
+
+        assert index.remove("Nat.add_comm") is True
+        assert index.remove("Nat.add_comm") is False
+        assert "Nat.add_comm" not in index
+        assert len(index) == len(manifest.entries) - 1
+        assert "Nat.add_comm" not in {c.theorem_id for c in index.score(goal)}
+
+    def test_top_candidates_is_prefix_of_score(self):
+        manifest = populate_manifest(make_manifest())
+        index = PremiseIndex.from_manifest(manifest)
+        goal = make_goal()
+        assert index.top_candidates(goal, 2) == index.score(goal)[:2]
+        top = index.top_candidates(goal, 2, exclude_theorem_ids=["Nat.add_comm"])
+        assert "Nat.add_comm" not in {c.theorem_id for c in top}
+
+    @pytest.mark.parametrize("weighting", ["jaccard", "idf"])
+    def test_pruned_top_candidates_are_exact(self, weighting):
+        manifest = make_manifest()
+        for i in range(200):
+            symbols = " ".join(f"fn_{(i * j) % 37}" for j in range(1, 4 + i % 4))
+            manifest.add_theorem(
+                theorem_id=f"P{i:03d}",
+                corpus_id="mathlib4",
+                statement=f"theorem p{i} : {['Nat', 'List', 'Set'][i % 3]}.x = {symbols}",
+                imports=[f"Module{i % 11}", f"Hub{i % 11 // 4}"],
+            )
+        index = PremiseIndex.from_manifest(manifest, weighting=weighting)
+        for i in range(0, 200, 17):
+            goal = GoalFeatures.from_theorem_entry(manifest.get_theorem(f"P{i:03d}"))
+            expected = [c for c in index.score(goal) if c.theorem_id != goal.theorem_id]
+            assert index.top_candidates(goal, 5) == expected[:5]
+
+    def test_idf_weighting_favours_rare_shared_symbols(self):
+        manifest = make_manifest()
+        for i in range(8):
+            manifest.add_theorem(
+                theorem_id=f"Common.{i}",
+                corpus_id="mathlib4",
+                statement=f"theorem common_{i} : common_fn x = common_fn x",
+            )
+        manifest.add_theorem(
+            theorem_id="Common.shared",
+            corpus_id="mathlib4",
+            statement="theorem shared : common_fn x = common_fn x",
+        )
+        manifest.add_theorem(
+            theorem_id="Rare.shared",
+            corpus_id="mathlib4",
+            statement="theorem shared : rare_fn x = rare_fn x",
+        )
+        goal = GoalFeatures.from_statement("theorem goal : common_fn (rare_fn x) = y")
+        jaccard = {c.theorem_id: c.score for c in PremiseIndex.from_manifest(manifest).score(goal)}
+        idf = PremiseIndex.from_manifest(manifest, weighting="idf").score(goal)
+        # Plain Jaccard cannot tell one shared symbol from another...
+        assert jaccard["Rare.shared"] == jaccard["Common.shared"]
+        # ...IDF weighting ranks the premise sharing the rare one first.
+        assert idf[0].theorem_id == "Rare.shared"
+
+    @pytest.mark.parametrize("weighting", ["jaccard", "idf"])
+    @pytest.mark.parametrize("zeroed", ["symbol_weight", "type_weight", "graph_weight"])
+    def test_zero_weight_feature_kinds(self, weighting, zeroed):
+        manifest = add_unrelated_premise(populate_manifest(make_manifest()))
+        goal = make_goal()
+        weights = PremiseSelectionWeights(**{zeroed: 0.0})
+        index = PremiseIndex.from_manifest(manifest, weighting=weighting)
+        ranked = index.score(goal, weights=weights)
+        assert ranked
+        assert index.top_candidates(goal, 2, weights=weights) == ranked[:2]
+        result = select_premises(manifest, goal, top_k=2, weights=weights, index=index)
+        assert [p.premise_id for p in result.selected] == [c.theorem_id for c in ranked[:2]]
+
+    def test_select_premises_through_index(self):
+        manifest = add_unrelated_premise(populate_manifest(make_manifest()))
+        goal = make_goal()
+        index = PremiseIndex.from_manifest(manifest)
+        result = select_premises(manifest, goal, top_k=2, index=index)
+        baseline = select_premises(manifest, goal, top_k=2)
+        assert [p.premise_id for p in result.selected] == [
+            p.premise_id for p in baseline.selected
+        ]
+        assert result.selection_method == DETERMINISTIC_BASELINE_METHOD
+        assert "Unrelated.thm" not in {item.premise_id for item in result.excluded}
+
+        idf_index = PremiseIndex.from_manifest(manifest, weighting="idf")
+        idf_result = select_premises(manifest, goal, top_k=2, index=idf_index)
+        assert idf_result.selection_method == DETERMINISTIC_IDF_METHOD
+        assert {p.selection_method for p in idf_result.selected} == {DETERMINISTIC_IDF_METHOD}
+
+    def test_rejects_candidates_with_index(self):
+        manifest = populate_manifest(make_manifest())
+        with pytest.raises(PremiseSelectionError):
+            score_candidates(
+                make_goal(),
+                manifest,
+                candidates=manifest.iter_theorems(),
+                index=PremiseIndex.from_manifest(manifest),
+            )
+
+    def test_rejects_unknown_weighting(self):
+        with pytest.raises(PremiseSelectionError):
+            PremiseIndex(weighting="bm25")
+
+
 # ---------------------------------------------------------------------------
 # ExcludedPremise / PremiseSelectionResult serialization & validation
 # ---------------------------------------------------------------------------
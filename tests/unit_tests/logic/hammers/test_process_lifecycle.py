@@ -170,6 +170,30 @@ def test_external_cancellation_cleans_group(tmp_path: Path) -> None:
     _wait_dead(result.pid or -1)
 
 
+def test_cancellation_is_polled_between_heartbeats(tmp_path: Path) -> None:
+    cancelled = threading.Event()
+    with ProcessSupervisor(
+        state_directory=tmp_path,
+        heartbeat_interval_seconds=5.0,
+        cancel_poll_interval_seconds=0.01,
+        recover=False,
+    ) as supervisor:
+        handle = supervisor.launch(
+            [PYTHON, "-c", "import time; time.sleep(60)"],
+            kind=ProcessKind.SMT,
+            limits=_limits(10),
+            cancel_event=cancelled,
+        )
+        time.sleep(0.1)
+        started = time.monotonic()
+        cancelled.set()
+        result = handle.wait(3)
+        assert result.cancelled
+        assert time.monotonic() - started < 1.0
+    with pytest.raises(ValueError):
+        ProcessSupervisor(state_directory=tmp_path, cancel_poll_interval_seconds=0, recover=False)
+
+
 class _FakeLease:
     def __init__(self) -> None:
         self.cancelled = False
@@ -6,7 +6,11 @@ Tests batch processing functionality end-to-end.
 
 import pytest
 import asyncio
+import functools
+import math
+import warnings
 from ipfs_datasets_py.logic.batch_processing import (
+    BatchProcessor,
     FOLBatchProcessor,
     ChunkedBatchProcessor,
     BatchResult,
@@ -149,6 +153,177 @@ class TestChunkedBatchProcessorIntegration:
         assert result.successful == 100
 
 
+class TestBatchProcessorStream:
+    """Tests for the backpressured streaming API."""
+
+    @pytest.mark.asyncio
+    async def test_in_flight_items_never_exceed_window(self):
+        """
+        GIVEN: A long lazy input and a slow consumer
+        WHEN: Streaming with a window of 4
+        THEN: No more than 4 items are pulled ahead of the consumer
+        """
+        processor = BatchProcessor(max_concurrency=2, show_progress=False)
+        state = {"pulled": 0, "consumed": 0, "max_ahead": 0}
+
+        def lazy_items():
+            for i in range(200):
+                state["pulled"] += 1
+                state["max_ahead"] = max(state["max_ahead"], state["pulled"] - state["consumed"])
+                yield i
+
+        async def double(item):
+            await asyncio.sleep(0)
+            return item * 2
+
+        async with processor.stream(lazy_items(), double, window=4) as outcomes:
+            async for outcome in outcomes:
+                state["consumed"] += 1
+                await asyncio.sleep(0)
+
+        assert state["consumed"] == 200
+        assert state["max_ahead"] <= 4
+
+    @pytest.mark.asyncio
+    async def test_ordered_stream_keeps_input_order(self):
+        """
+        GIVEN: Items whose processing time varies
+        WHEN: Streaming with ordered=True
+        THEN: Outcomes come back in input order
+        """
+        processor = BatchProcessor(max_concurrency=4, show_progress=False)
+
+        async def jittered(item):
+            await asyncio.sleep(0.001 * (item % 4))
+            return item
+
+        async with processor.stream(range(30), jittered, window=6, ordered=True) as outcomes:
+            indices = [outcome["index"] async for outcome in outcomes]
+
+        assert indices == list(range(30))
+
+    @pytest.mark.asyncio
+    async def test_unordered_stream_yields_fast_items_first(self):
+        """
+        GIVEN: A slow first item and fast later items
+        WHEN: Streaming in completion order
+        THEN: The slow item is not first, and every item is yielded once
+        """
+        processor = BatchProcessor(max_concurrency=4, show_progress=False)
+
+        async def slow_head(item):
+            await asyncio.sleep(0.05 if item == 0 else 0)
+            return item
+
+        async with processor.stream(range(4), slow_head) as outcomes:
+            results = [outcome["result"] async for outcome in outcomes]
+
+        assert results[0] != 0
+        assert sorted(results) == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_item_errors_are_reported_and_input_errors_reraised(self):
+        """
+        GIVEN: A function failing on one item and an input that fails midway
+        WHEN: Streaming
+        THEN: The item error is an outcome and the input error is raised after
+        """
+        processor = BatchProcessor(max_concurrency=2, show_progress=False)
+
+        def failing_input():
+            yield from range(3)
+            raise OSError("input went away")
+
+        async def fail_on_one(item):
+            if item == 1:
+                raise ValueError("bad item")
+            return item
+
+        outcomes_seen = []
+        with pytest.raises(OSError):
+            async with processor.stream(failing_input(), fail_on_one) as outcomes:
+                async for outcome in outcomes:
+                    outcomes_seen.append(outcome)
+
+        assert len(outcomes_seen) == 3
+        failed = [outcome for outcome in outcomes_seen if not outcome["success"]]
+        assert failed == [{"success": False, "error": "bad item", "index": 1}]
+
+    @pytest.mark.asyncio
+    async def test_sync_function_runs_in_process_pool(self):
+        """
+        GIVEN: A picklable CPU-bound function and use_process_pool=True
+        WHEN: Streaming
+        THEN: Results come back from the worker processes
+        """
+        processor = BatchProcessor(max_concurrency=2, use_process_pool=True, show_progress=False)
+
+        async with processor.stream(range(10), math.factorial, ordered=True) as outcomes:
+            results = [outcome["result"] async for outcome in outcomes]
+
+        assert results == [math.factorial(i) for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_fol_convert_stream_accepts_async_iterable(self):
+        """
+        GIVEN: Texts produced by an async generator
+        WHEN: Streaming FOL conversion
+        THEN: Every text is converted
+        """
+        processor = FOLBatchProcessor(max_concurrency=3)
+
+        async def texts():
+            for sentence in ["All humans are mortal", "Dogs are animals", "Cats are mammals"]:
+                yield sentence
+
+        async with processor.convert_stream(texts(), use_nlp=False, ordered=True) as outcomes:
+            converted = [outcome async for outcome in outcomes]
+
+        assert [outcome["index"] for outcome in converted] == [0, 1, 2]
+        assert all(outcome["success"] for outcome in converted)
+
+    @pytest.mark.asyncio
+    async def test_async_callables_are_awaited(self):
+        """
+        GIVEN: An async __call__ object, an async partial and a lambda returning a coroutine
+        WHEN: Each is passed to process_batch_async
+        THEN: Results are the awaited values and no coroutine is left unawaited
+        """
+        processor = BatchProcessor(max_concurrency=2, show_progress=False)
+
+        async def scale(item, factor=1):
+            await asyncio.sleep(0)
+            return item * factor
+
+        class Scaler:
+            async def __call__(self, item):
+                return await scale(item, factor=3)
+
+        funcs = [Scaler(), functools.partial(scale, factor=3), lambda item: scale(item, factor=3)]
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            for func in funcs:
+                result = await processor.process_batch_async([1, 2, 3], func)
+                assert result.successful == 3
+                assert sorted(result.results) == [3, 6, 9]
+
+    @pytest.mark.asyncio
+    async def test_rejects_empty_window(self):
+        """
+        GIVEN: A window of zero
+        WHEN: Opening a stream
+        THEN: ValueError is raised
+        """
+        processor = BatchProcessor(show_progress=False)
+
+        async def identity(item):
+            return item
+
+        with pytest.raises(ValueError):
+            async with processor.stream([1], identity, window=0):
+                pass
+
+
 class TestBatchProcessingPerformance:
     """Performance tests for batch processing."""
 